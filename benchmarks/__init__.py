@@ -0,0 +1 @@
+"""titiler micro-benchmarks."""
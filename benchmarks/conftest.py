@@ -0,0 +1,41 @@
+"""``pytest`` configuration for the micro-benchmarks."""
+
+import os
+
+import numpy
+import pytest
+from rio_tiler.io import Reader
+from rio_tiler.models import ImageData
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORE_FIXTURES = os.path.join(ROOT_DIR, "src", "titiler", "core", "tests", "fixtures")
+XARRAY_FIXTURES = os.path.join(
+    ROOT_DIR, "src", "titiler", "xarray", "tests", "fixtures"
+)
+
+COG = os.path.join(CORE_FIXTURES, "cog.tif")
+COG_TILE = (87, 48, 8)
+
+
+@pytest.fixture(scope="session")
+def cog_tile() -> ImageData:
+    """A 256x256 tile (uint16, masked) from the `cog.tif` fixture."""
+    x, y, z = COG_TILE
+    with Reader(COG) as src:
+        return src.tile(x, y, z)
+
+
+@pytest.fixture(scope="session")
+def random_image():
+    """Create random (float32) images."""
+
+    def _create(nbands: int, size: int = 256) -> ImageData:
+        rng = numpy.random.default_rng(0)
+        arr = rng.uniform(0, 1000, (nbands, size, size)).astype("float32")
+        return ImageData(
+            numpy.ma.MaskedArray(arr),
+            crs="epsg:3857",
+            bounds=(0, 0, size * 10, size * 10),
+        )
+
+    return _create
@@ -0,0 +1,297 @@
+"""titiler.core micro-benchmarks."""
+
+import asyncio
+import tracemalloc
+import warnings
+from contextlib import AsyncExitStack
+
+import attr
+import numpy
+import pytest
+from fastapi.dependencies.utils import solve_dependencies
+from fastapi.routing import APIRoute
+from rio_tiler.colormap import apply_cmap, cmap
+from rio_tiler.errors import InvalidDatatypeWarning
+from rio_tiler.utils import linear_rescale
+from starlette.requests import Request
+
+from titiler.core import validation
+from titiler.core.algorithm import algorithms
+from titiler.core.colormap import apply_colormap, compile_colormap
+from titiler.core.dependencies import RenderingParams
+from titiler.core.factory import TilerFactory
+from titiler.core.resources.enums import ImageType
+from titiler.core.utils import render_image, rescale_array
+
+from .conftest import COG, COG_TILE
+
+
+@pytest.mark.parametrize("output_format", list(ImageType))
+def test_render_image(benchmark, cog_tile, output_format):
+    """Encode a tile."""
+    benchmark.group = "render_image"
+    image = cog_tile
+    if output_format in [ImageType.jpeg, ImageType.jpg, ImageType.webp]:
+        image = attr.evolve(cog_tile, array=cog_tile.array.copy())
+        image.rescale(((0, 1000),))
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", InvalidDatatypeWarning)
+        content, _ = benchmark(render_image, image, output_format=output_format)
+
+    assert content
+
+
+def _peak_memory(func, *args, **kwargs) -> int:
+    """Peak memory (in bytes) allocated by a function call."""
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak
+
+
+def _rescale_array_per_band(array, mask, in_range, out_range=((0, 255),)):
+    """Per-band rescaling (titiler<=2.2 implementation), used as reference."""
+    array = array.copy()
+    nbands = array.shape[0]
+    in_range = in_range if len(in_range) == nbands else in_range * nbands
+    out_range = out_range if len(out_range) == nbands else out_range * nbands
+    for bdx in range(nbands):
+        array[bdx] = numpy.where(
+            mask[bdx],
+            linear_rescale(
+                array[bdx], in_range=in_range[bdx], out_range=out_range[bdx]
+            ),
+            0,
+        )
+
+    return array.astype("uint8")
+
+
+@pytest.mark.parametrize("nbands", [1, 3])
+@pytest.mark.parametrize(
+    "implementation",
+    [rescale_array, _rescale_array_per_band],
+    ids=["vectorized", "per-band"],
+)
+def test_rescale_array(benchmark, random_image, nbands, implementation):
+    """Rescale a 512x512 (float32) array to uint8."""
+    benchmark.group = f"rescale_array ({nbands} bands)"
+    image = random_image(nbands, 512)
+    args = (image.data, image.array.mask == False, ((0, 1000),))  # noqa: E712
+
+    benchmark.extra_info["peak_memory"] = _peak_memory(implementation, *args)
+    out = benchmark(implementation, *args)
+    assert out.dtype == numpy.uint8
+
+
+def _render_with_image_rescale(image, **kwargs):
+    """Rescale the ImageData (in place) before rendering, used as reference."""
+    image.rescale(kwargs.pop("rescale"))
+    return render_image(image, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "implementation",
+    [render_image, _render_with_image_rescale],
+    ids=["fused", "ImageData.rescale"],
+)
+def test_render_image_rescale(benchmark, random_image, implementation):
+    """Rescale and encode a 512x512x3 (float32) image to PNG."""
+    benchmark.group = "render_image (rescale)"
+    image = random_image(3, 512)
+    kwargs = {"output_format": ImageType.png, "rescale": [(0, 1000)]}
+
+    def setup():
+        return (attr.evolve(image, array=image.array.copy()),), dict(kwargs)
+
+    args, options = setup()
+    benchmark.extra_info["peak_memory"] = _peak_memory(implementation, *args, **options)
+    content, _ = benchmark.pedantic(implementation, setup=setup, rounds=20)
+    assert content
+
+
+COLORMAPS = {
+    "lut": cmap.get("viridis"),
+    "discrete": {i: (i, i, i, 255) for i in range(0, 256, 8)},
+    "intervals": [((i, i + 8), (i, i, i, 255)) for i in range(0, 256, 8)],
+}
+
+
+@pytest.mark.parametrize("kind", list(COLORMAPS))
+@pytest.mark.parametrize(
+    "implementation",
+    [apply_colormap, apply_cmap],
+    ids=["compiled", "rio-tiler"],
+)
+def test_colormap(benchmark, kind, implementation):
+    """Apply a colormap on a 512x512 (uint8) array."""
+    benchmark.group = f"colormap ({kind})"
+    colormap = COLORMAPS[kind]
+    if implementation is apply_colormap:
+        colormap = compile_colormap(colormap)
+
+    data = numpy.random.default_rng(0).integers(0, 256, (1, 512, 512), dtype="uint8")
+    arr, _ = benchmark(implementation, data, colormap)
+    assert arr.shape == (3, 512, 512)
+
+
+@pytest.mark.parametrize("name", algorithms.list())
+def test_algorithm(benchmark, random_image, name):
+    """Apply an algorithm on a 256x256 image (with buffer)."""
+    benchmark.group = "algorithm"
+    algorithm = algorithms.get(name)()
+    nbands = algorithm.input_nbands or 3
+    size = 256 + 2 * algorithm.halo
+
+    def setup():
+        return (random_image(nbands, size),), {}
+
+    out = benchmark.pedantic(algorithm, setup=setup, rounds=50)
+    assert out.width == 256
+
+
+def _hillshade_gradient(img, azimuth=45, angle_altitude=45.0, buffer=1):
+    """`numpy.gradient` (float64) hillshade (titiler<=2.2 implementation), used as reference."""
+    x, y = numpy.gradient(img.array[0])
+    slope = numpy.pi / 2.0 - numpy.arctan(numpy.sqrt(x * x + y * y))
+    aspect = numpy.arctan2(-x, y)
+    azimuthrad = numpy.deg2rad(360.0 - azimuth)
+    altituderad = numpy.deg2rad(angle_altitude)
+    shaded = numpy.sin(altituderad) * numpy.sin(slope) + numpy.cos(
+        altituderad
+    ) * numpy.cos(slope) * numpy.cos(azimuthrad - aspect)
+    data = 255 * (shaded + 1) / 2
+    data[data < 0] = 0
+    return data[buffer:-buffer, buffer:-buffer].astype("uint8")
+
+
+def _slope_gradient(img, buffer=1):
+    """`numpy.gradient` (float64) slope (titiler<=2.2 implementation), used as reference."""
+    x, y = numpy.gradient(img.array[0])
+    x /= abs(img.transform[0])
+    y /= abs(img.transform[4])
+    slope = numpy.rad2deg(numpy.arctan(numpy.sqrt(x * x + y * y)))
+    return slope[buffer:-buffer, buffer:-buffer].astype("float32")
+
+
+@pytest.mark.parametrize(
+    "name,reference",
+    [("hillshade", _hillshade_gradient), ("slope", _slope_gradient)],
+    ids=["hillshade", "slope"],
+)
+@pytest.mark.parametrize("implementation", ["terrain", "numpy.gradient"])
+def test_terrain(benchmark, random_image, name, reference, implementation):
+    """Terrain kernels vs `numpy.gradient` (float64) on a 512x512 (+1 pixel halo) image."""
+    benchmark.group = f"terrain-{name}"
+    image = random_image(1, 514)
+    func = algorithms.get(name)() if implementation == "terrain" else reference
+    out = benchmark(func, image)
+    shape = out.array.shape[1:] if implementation == "terrain" else out.shape
+    assert shape == (512, 512)
+
+
+def _tile_route(factory: TilerFactory) -> APIRoute:
+    for route in factory.router.routes:
+        if isinstance(route, APIRoute) and route.name == "tile":
+            return route
+
+    raise ValueError("tile endpoint not found")
+
+
+def test_tile_dependencies(benchmark):
+    """Resolve the `tile` endpoint's dependencies (no data read)."""
+    benchmark.group = "endpoint"
+    route = _tile_route(TilerFactory())
+    x, y, z = COG_TILE
+    query = (
+        f"url={COG}&bidx=1&rescale=0,1000&color_formula=gamma+R+1.5"
+        "&colormap_name=viridis&algorithm=hillshade&algorithm_params=%7B%22azimuth%22%3A30%7D"
+    )
+
+    async def solve():
+        async with AsyncExitStack() as stack:
+            request = Request(
+                {
+                    "type": "http",
+                    "method": "GET",
+                    "path": f"/tiles/WebMercatorQuad/{z}/{x}/{y}.png",
+                    "query_string": query.encode(),
+                    "headers": [],
+                    "path_params": {
+                        "tileMatrixSetId": "WebMercatorQuad",
+                        "z": str(z),
+                        "x": str(x),
+                        "y": str(y),
+                        "format": "png",
+                    },
+                    # exit stacks set by FastAPI's request handler
+                    "fastapi_astack": stack,
+                    "fastapi_inner_astack": stack,
+                    "fastapi_function_astack": stack,
+                }
+            )
+            return await solve_dependencies(
+                request=request,
+                dependant=route.dependant,
+                async_exit_stack=stack,
+                embed_body_fields=False,
+            )
+
+    loop = asyncio.new_event_loop()
+    try:
+        solved = benchmark(lambda: loop.run_until_complete(solve()))
+    finally:
+        loop.close()
+
+    assert not solved.errors
+
+
+@pytest.mark.parametrize("cached", [True, False], ids=["cached", "cold"])
+def test_query_dependencies(benchmark, cached):
+    """Parse the rendering query parameters of a tile request."""
+    benchmark.group = "endpoint (query parsing)"
+    rescale = ["0,1000", "0,2000", "0,3000"]
+    color_formula = "gamma RGB 1.5 sigmoidal RGB 10 0.3"
+
+    def parse():
+        if not cached:
+            validation._validate_rescale.cache_clear()
+            validation._validate_color_formula.cache_clear()
+
+        # BeforeValidators then dependency, as called by FastAPI
+        return RenderingParams(
+            rescale=validation.validate_rescale(rescale),
+            color_formula=validation.validate_color_formula(color_formula),
+        )
+
+    render = benchmark(parse)
+    assert render.rescale == [(0, 1000), (0, 2000), (0, 3000)]
+
+
+@pytest.mark.parametrize(
+    "algorithm,params,steps",
+    [
+        ("hillshade", '{"azimuth": 30}', 0),
+        ("hillshade|cast", '[{"azimuth": 30}, {"data_type": "uint8"}]', 2),
+    ],
+    ids=["algorithm", "pipeline"],
+)
+def test_algorithm_dependency(benchmark, algorithm, params, steps):
+    """Create the algorithm of a tile request from its query parameters."""
+    benchmark.group = "endpoint (algorithm)"
+    post_process = algorithms.dependency
+
+    def parse():
+        # BeforeValidator then dependency, as called by FastAPI
+        return post_process(
+            algorithm=algorithm,
+            algorithm_params=validation.validate_json(params),
+        )
+
+    algo = benchmark(parse)
+    assert len(getattr(algo, "steps", [])) == steps
@@ -0,0 +1,131 @@
+"""titiler.mosaic micro-benchmarks."""
+
+from typing import Any
+
+import attr
+import numpy
+import pytest
+from cogeo_mosaic.backends import FileBackend
+from cogeo_mosaic.mosaic import MosaicJSON
+from fastapi import FastAPI
+from rio_tiler.constants import WEB_MERCATOR_TMS, WGS84_CRS
+from rio_tiler.io import Reader
+from rio_tiler.mosaic.backend import BaseBackend
+from starlette.testclient import TestClient
+
+from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
+from titiler.mosaic.backends import CachedMosaicBackend
+from titiler.mosaic.errors import MOSAIC_STATUS_CODES
+from titiler.mosaic.factory import MosaicTilerFactory
+from titiler.mosaic.index import MosaicIndexBackend, write_index
+
+from .conftest import COG, COG_TILE
+
+
+@attr.s
+class RepeatBackend(BaseBackend):
+    """Mosaic made of the same COG repeated `input` times."""
+
+    def __attrs_post_init__(self):
+        """Set mosaic bounds and zooms from the COG."""
+        with Reader(COG) as src:
+            self.bounds = src.get_geographic_bounds(WGS84_CRS)
+            self.minzoom = src.minzoom
+            self.maxzoom = src.maxzoom
+
+        self.crs = WGS84_CRS
+
+    def assets_for_tile(self, x: int, y: int, z: int, **kwargs: Any) -> list[str]:
+        """Retrieve assets for tile."""
+        return [COG] * int(self.input)
+
+    def assets_for_point(self, lng: float, lat: float, **kwargs: Any) -> list[str]:
+        """Retrieve assets for point."""
+        return [COG] * int(self.input)
+
+    def assets_for_bbox(self, *args: Any, **kwargs: Any) -> list[str]:
+        """Retrieve assets for bbox."""
+        return [COG] * int(self.input)
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Mosaic application."""
+    app = FastAPI()
+    app.include_router(MosaicTilerFactory(backend=RepeatBackend).router)
+    add_exception_handlers(app, DEFAULT_STATUS_CODES)
+    add_exception_handlers(app, MOSAIC_STATUS_CODES)
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("nassets", [1, 4, 16])
+def test_mosaic_tile(benchmark, client, nassets):
+    """Render a mosaic tile (every asset is read using `pixel_selection=mean`)."""
+    benchmark.group = "mosaic tile"
+    x, y, z = COG_TILE
+
+    def tile():
+        return client.get(
+            f"/tiles/WebMercatorQuad/{z}/{x}/{y}.png",
+            params={
+                "url": str(nassets),
+                "pixel_selection": "mean",
+                "rescale": "0,1000",
+            },
+        )
+
+    response = benchmark(tile)
+    assert response.status_code == 200
+
+
+@pytest.fixture(scope="module")
+def large_mosaic():
+    """MosaicJSON with 2000 quadkeys (zoom 10) of 2 assets."""
+    rng = numpy.random.default_rng(0)
+    tiles = {}
+    for x, y in rng.integers(0, 2**10, (2000, 2)):
+        quadkey = WEB_MERCATOR_TMS.quadkey(int(x), int(y), 10)
+        tiles[quadkey] = [f"{quadkey}-{i}.tif" for i in range(2)]
+
+    return MosaicJSON(
+        mosaicjson="0.0.3",
+        minzoom=10,
+        maxzoom=14,
+        quadkey_zoom=10,
+        bounds=(-180, -85, 180, 85),
+        tiles=tiles,
+    )
+
+
+@pytest.mark.parametrize(
+    "lookup",
+    [
+        ("assets_for_tile", (300, 400, 12)),
+        ("assets_for_tile", (18, 25, 5)),
+        ("assets_for_bbox", (-2.0, -2.0, 2.0, 2.0)),
+    ],
+    ids=["tile (z12)", "tile (z5)", "bbox"],
+)
+@pytest.mark.parametrize(
+    "backend",
+    [CachedMosaicBackend, MosaicIndexBackend, FileBackend],
+    ids=["cached", "memory-mapped", "cogeo-mosaic"],
+)
+def test_mosaic_assets(benchmark, tmp_path_factory, large_mosaic, backend, lookup):
+    """Find the assets of a tile or bbox in a large mosaic."""
+    method, args = lookup
+    benchmark.group = f"mosaic assets ({method}{args})"
+    if backend is MosaicIndexBackend:
+        src_path, options = str(tmp_path_factory.mktemp("index") / "mosaic.index"), {}
+        write_index(large_mosaic, src_path)
+    else:
+        src_path, options = "mosaic.json", {"mosaic_def": large_mosaic}
+
+    with backend(src_path, **options) as mosaic:
+        if index := getattr(mosaic, "index", None):
+            benchmark.extra_info["nbytes"] = index.nbytes
+
+        # cogeo-mosaic hashes the whole mosaic definition for each quadkey
+        assets = benchmark.pedantic(getattr(mosaic, method), args=args, rounds=3)
+
+    assert isinstance(assets, list)
@@ -0,0 +1,32 @@
+"""titiler.xarray micro-benchmarks."""
+
+import os
+
+import pytest
+
+from titiler.xarray.io import get_variable, open_zarr
+
+from .conftest import XARRAY_FIXTURES
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    """Open the 3D (time, y, x) Zarr fixture."""
+    with open_zarr(os.path.join(XARRAY_FIXTURES, "dataset_3d.zarr")) as ds:
+        yield ds
+
+
+@pytest.mark.parametrize(
+    "sel",
+    [
+        None,
+        ["time=2022-01-01"],
+        ["time=nearest::2022-01-01T12:00:00"],
+    ],
+    ids=["no-selection", "exact", "nearest"],
+)
+def test_get_variable(benchmark, dataset, sel):
+    """Extract a DataArray from the Dataset."""
+    benchmark.group = "get_variable"
+    da = benchmark(get_variable, dataset, "dataset", sel=sel)
+    assert da.ndim in [2, 3]
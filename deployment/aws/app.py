@@ -35,6 +35,7 @@ class StackSettings(BaseSettings):
         "PYTHONWARNINGS": "ignore",
         "VSI_CACHE": "TRUE",
         "VSI_CACHE_SIZE": "5000000",  # 5 MB (per file-handle)
+        "TITILER_API_LAZY": "TRUE",  # import the endpoints' modules on the first request
     }
 
     # S3 bucket names where TiTiler could do HEAD and GET Requests
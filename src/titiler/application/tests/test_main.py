@@ -21,3 +21,86 @@ def test_health(app):
 
     response = app.get("/api.html")
     assert response.status_code == 200
+
+
+def test_lazy(monkeypatch):
+    """Should add the dataset endpoints on the first request."""
+    import importlib
+    import os
+
+    from starlette.testclient import TestClient
+
+    from titiler.application import main
+
+    from .conftest import DATA_DIR
+
+    monkeypatch.setenv("TITILER_API_LAZY", "TRUE")
+    monkeypatch.setenv("TITILER_API_DISABLE_ZARR", "TRUE")
+    try:
+        importlib.reload(main)
+        assert set(main.lazy_routers.loaders) == {"/cog", "/stac", "/mosaicjson"}
+        client = TestClient(main.app)
+
+        response = client.get("/healthz")
+        assert response.status_code == 200
+        assert set(main.lazy_routers.loaders) == {"/cog", "/stac", "/mosaicjson"}
+
+        response = client.get(
+            "/cog/info", params={"url": os.path.join(DATA_DIR, "cog.tif")}
+        )
+        assert response.status_code == 200
+        assert set(main.lazy_routers.loaders) == {"/stac", "/mosaicjson"}
+
+        # mosaic errors handlers are added with the endpoints
+        response = client.get("/mosaicjson/info", params={"url": "nowhere.json"})
+        assert response.status_code == 424
+
+        # conformance classes of all the dataset endpoints are listed
+        response = client.get("/conformance")
+        assert response.status_code == 200
+        assert not main.lazy_routers.loaders
+        conforms_to = response.json()["conformsTo"]
+        assert "http://www.opengis.net/spec/ogcapi-tiles-1/1.0/conf/core" in conforms_to
+
+        response = client.get("/api")
+        assert response.status_code == 200
+        assert "/stac/info" in response.json()["paths"]
+
+    finally:
+        monkeypatch.delenv("TITILER_API_LAZY")
+        monkeypatch.delenv("TITILER_API_DISABLE_ZARR")
+        importlib.reload(main)
+
+
+def test_mosaic_cache(monkeypatch):
+    """Should use the CachedMosaicBackend for the mosaic endpoints."""
+    import importlib
+    import os
+
+    from starlette.testclient import TestClient
+
+    from titiler.application import main
+    from titiler.mosaic.cache import mosaic_cache
+
+    from .conftest import DATA_DIR
+
+    monkeypatch.setenv("TITILER_API_MOSAIC_CACHE", "TRUE")
+    monkeypatch.setenv("TITILER_API_DISABLE_ZARR", "TRUE")
+    try:
+        importlib.reload(main)
+        mosaic_cache.clear()
+        client = TestClient(main.app)
+
+        mosaic = os.path.join(DATA_DIR, "mosaic.json")
+        for _ in range(2):
+            response = client.get("/mosaicjson/info", params={"url": mosaic})
+            assert response.status_code == 200
+
+        # the parsed mosaic is kept in the shared cache
+        assert [entry["src_path"] for entry in mosaic_cache.entries()] == [mosaic]
+
+    finally:
+        monkeypatch.delenv("TITILER_API_MOSAIC_CACHE")
+        monkeypatch.delenv("TITILER_API_DISABLE_ZARR")
+        importlib.reload(main)
+        mosaic_cache.clear()
@@ -2,16 +2,14 @@
 
 import json
 import logging
+from collections.abc import Callable
 from logging import config as log_config
-from typing import Annotated, Literal
+from typing import Annotated, Any, Literal
 
 import jinja2
 import rasterio
-from cogeo_mosaic.backends import MosaicBackend as MosaicJSONBackend
-from cogeo_mosaic.errors import MosaicAuthError, MosaicError, MosaicNotFoundError
 from fastapi import Depends, FastAPI, HTTPException, Query, Security
 from fastapi.security.api_key import APIKeyQuery
-from rio_tiler.io import Reader, STACReader
 from starlette import status
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
@@ -21,15 +19,11 @@ from starlette_cramjam.middleware import CompressionMiddleware
 from titiler.application import __version__ as titiler_version
 from titiler.application.settings import ApiSettings
 from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
-from titiler.core.factory import (
-    AlgorithmFactory,
-    ColorMapFactory,
-    MultiBaseTilerFactory,
-    TilerFactory,
-    TMSFactory,
-)
+from titiler.core.factory import AlgorithmFactory, ColorMapFactory, TMSFactory
 from titiler.core.middleware import (
     CacheControlMiddleware,
+    LazyRouterMiddleware,
+    LazyRouters,
     LoggerMiddleware,
     LowerCaseQueryStringMiddleware,
     TotalTimeMiddleware,
@@ -37,14 +31,7 @@ from titiler.core.middleware import (
 from titiler.core.models.OGC import Conformance, Landing
 from titiler.core.resources.enums import MediaType
 from titiler.core.utils import accept_media_type, create_html_response, update_openapi
-from titiler.extensions import (
-    cogValidateExtension,
-    cogViewerExtension,
-    stacExtension,
-    stacRenderExtension,
-    stacViewerExtension,
-    wmtsExtension,
-)
+from titiler.core.warmup import warmup
 
 logging.getLogger("botocore.credentials").disabled = True
 logging.getLogger("botocore.utils").disabled = True
@@ -121,8 +108,33 @@ TITILER_CONFORMS_TO = {
 
 
 ###############################################################################
-# Simple Dataset endpoints (e.g Cloud Optimized GeoTIFF)
-if not api_settings.disable_cog:
+# Dataset endpoints
+# In `lazy` mode, the modules of each group of endpoints are imported and the endpoints
+# are added on the first request to their prefix (or to the OpenAPI document)
+lazy_routers = LazyRouters()
+
+
+def include_endpoints(prefix: str, loader: Callable[[FastAPI], Any]) -> Any:
+    """Add the endpoints to the application (or register them in `lazy` mode)."""
+    if api_settings.lazy:
+        lazy_routers.register(prefix, loader)
+        return None
+
+    return loader(app)
+
+
+def cog_endpoints(app: FastAPI) -> Any:
+    """Simple Dataset endpoints (e.g Cloud Optimized GeoTIFF)."""
+    from rio_tiler.io import Reader
+
+    from titiler.core.factory import TilerFactory
+    from titiler.extensions import (
+        cogValidateExtension,
+        cogViewerExtension,
+        stacExtension,
+        wmtsExtension,
+    )
+
     cog = TilerFactory(
         reader=Reader,
         router_prefix="/cog",
@@ -145,9 +157,20 @@ if not api_settings.disable_cog:
 
     TITILER_CONFORMS_TO.update(cog.conforms_to)
 
-###############################################################################
-# STAC endpoints
-if not api_settings.disable_stac:
+    return cog
+
+
+def stac_endpoints(app: FastAPI) -> Any:
+    """STAC endpoints."""
+    from rio_tiler.io import STACReader
+
+    from titiler.core.factory import MultiBaseTilerFactory
+    from titiler.extensions import (
+        stacRenderExtension,
+        stacViewerExtension,
+        wmtsExtension,
+    )
+
     stac = MultiBaseTilerFactory(
         reader=STACReader,
         router_prefix="/stac",
@@ -166,16 +189,27 @@ if not api_settings.disable_stac:
 
     TITILER_CONFORMS_TO.update(stac.conforms_to)
 
-###############################################################################
-# Mosaic endpoints
-if not api_settings.disable_mosaic:
+    return stac
+
+
+def mosaic_endpoints(app: FastAPI) -> Any:
+    """Mosaic endpoints."""
+    from cogeo_mosaic.backends import MosaicBackend as MosaicJSONBackend
+    from cogeo_mosaic.errors import MosaicAuthError, MosaicError, MosaicNotFoundError
+
     from titiler.mosaic.errors import MOSAIC_STATUS_CODES
     from titiler.mosaic.extensions.mosaicjson import MosaicJSONExtension
     from titiler.mosaic.extensions.wmts import wmtsExtension as mosaic_wmtsExtension
     from titiler.mosaic.factory import MosaicTilerFactory
 
+    backend: Any = MosaicJSONBackend
+    if api_settings.mosaic_cache:
+        from titiler.mosaic.backends import CachedMosaicBackend
+
+        backend = CachedMosaicBackend
+
     mosaic = MosaicTilerFactory(
-        backend=MosaicJSONBackend,  # type: ignore
+        backend=backend,
         router_prefix="/mosaicjson",
         extensions=[
             MosaicJSONExtension(),
@@ -202,10 +236,11 @@ if not api_settings.disable_mosaic:
 
     TITILER_CONFORMS_TO.update(mosaic.conforms_to)
 
+    return mosaic
 
-###############################################################################
-# Zarr endpoints
-if not api_settings.disable_zarr:
+
+def zarr_endpoints(app: FastAPI) -> Any:
+    """Zarr endpoints."""
     from titiler.xarray.extensions import DatasetMetadataExtension, ValidateExtension
     from titiler.xarray.factory import TilerFactory as XarrayTilerFactory
 
@@ -226,6 +261,21 @@ if not api_settings.disable_zarr:
 
     TITILER_CONFORMS_TO.update(md.conforms_to)
 
+    return md
+
+
+if not api_settings.disable_cog:
+    cog = include_endpoints("/cog", cog_endpoints)
+
+if not api_settings.disable_stac:
+    stac = include_endpoints("/stac", stac_endpoints)
+
+if not api_settings.disable_mosaic:
+    mosaic = include_endpoints("/mosaicjson", mosaic_endpoints)
+
+if not api_settings.disable_zarr:
+    md = include_endpoints("/zarr", zarr_endpoints)
+
 
 ###############################################################################
 # TileMatrixSets endpoints
@@ -354,6 +404,15 @@ if api_settings.debug:
 if api_settings.lower_case_query_parameters:
     app.add_middleware(LowerCaseQueryStringMiddleware)
 
+# Should be the last middleware
+if api_settings.lazy:
+    app.add_middleware(LazyRouterMiddleware, routers=lazy_routers)
+
+###############################################################################
+# Warm-up the TMS, colormaps and algorithms registries. When the module is imported
+# before forking the workers (e.g `gunicorn --preload`), the workers share them.
+startup = warmup(freeze=True) if api_settings.warmup else None
+
 
 @app.get(
     "/healthz",
@@ -377,6 +436,9 @@ def application_health_check():
 
         versions.update({"zarr": zarr.__version__, "xarray": xarray.__version__})
 
+    if startup:
+        return {"versions": versions, "warmup": startup}
+
     return {"versions": versions}
 
 
@@ -517,6 +579,11 @@ def conformance(
         Conformance classes which the server conforms to.
 
     """
+    # In `lazy` mode, the conformance classes of the dataset endpoints
+    # are only registered when their modules are loaded
+    if lazy_routers.loaders:
+        lazy_routers.load(request.app, list(lazy_routers.loaders))
+
     data = {"conformsTo": sorted(TITILER_CONFORMS_TO)}
 
     if f:
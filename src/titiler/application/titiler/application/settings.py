@@ -34,8 +34,20 @@ class ApiSettings(BaseSettings):
 
     lower_case_query_parameters: bool = False
 
+    # use `titiler.mosaic.backends.CachedMosaicBackend` for the mosaic endpoints, to
+    # re-use the parsed MosaicJSON documents (see `TITILER_MOSAIC_CACHE_*` settings)
+    mosaic_cache: bool = False
+
+    # import the modules and add the cog/stac/mosaic/zarr endpoints on the first
+    # request to their prefix (or to the OpenAPI document)
+    lazy: bool = False
+
     telemetry_enabled: bool = False
 
+    # load the TMS, colormaps and algorithms when the application is imported
+    # (e.g in the gunicorn master with `--preload`), see `titiler.core.warmup`
+    warmup: bool = False
+
     # an API key required to access any endpoint, passed via the ?access_token= query parameter
     global_access_token: str | None = None
 
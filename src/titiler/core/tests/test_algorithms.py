@@ -4,13 +4,15 @@ import json
 
 import numpy
 import pytest
-from fastapi import Depends, FastAPI
+from fastapi import Depends, FastAPI, HTTPException
+from pydantic import ValidationError
+from rasterio.crs import CRS
 from rasterio.io import MemoryFile
 from rio_tiler.models import ImageData
 from starlette.responses import Response
 from starlette.testclient import TestClient
 
-from titiler.core.algorithm import BaseAlgorithm
+from titiler.core.algorithm import Algorithms, BaseAlgorithm, Pipeline
 from titiler.core.algorithm import algorithms as default_algorithms
 
 
@@ -150,15 +152,15 @@ def test_hillshade():
     """test hillshade."""
     algo = default_algorithms.get("hillshade")()
 
-    arr = numpy.random.randint(0, 5000, (1, 262, 262), dtype="uint16")
+    arr = numpy.random.randint(0, 5000, (1, 258, 258), dtype="uint16")
     img = ImageData(arr)
     out = algo(img)
     assert out.array.shape == (1, 256, 256)
     assert out.array.dtype == "uint8"
 
     arr = numpy.ma.MaskedArray(
-        numpy.random.randint(0, 5000, (1, 262, 262), dtype="uint16"),
-        mask=numpy.zeros((1, 262, 262), dtype="bool"),
+        numpy.random.randint(0, 5000, (1, 258, 258), dtype="uint16"),
+        mask=numpy.zeros((1, 258, 258), dtype="bool"),
     )
     arr.mask[0, 0:100, 0:100] = True
 
@@ -173,15 +175,15 @@ def test_slope():
     """test slope."""
     algo = default_algorithms.get("slope")()
 
-    arr = numpy.random.randint(0, 5000, (1, 262, 262), dtype="uint16")
+    arr = numpy.random.randint(0, 5000, (1, 258, 258), dtype="uint16")
     img = ImageData(arr)
     out = algo(img)
     assert out.array.shape == (1, 256, 256)
     assert out.array.dtype == "float32"
 
     arr = numpy.ma.MaskedArray(
-        numpy.random.randint(0, 5000, (1, 262, 262), dtype="uint16"),
-        mask=numpy.zeros((1, 262, 262), dtype="bool"),
+        numpy.random.randint(0, 5000, (1, 258, 258), dtype="uint16"),
+        mask=numpy.zeros((1, 258, 258), dtype="bool"),
     )
     arr.mask[0, 0:100, 0:100] = True
 
@@ -192,6 +194,146 @@ def test_slope():
     assert out.array[0, 0, 0] is numpy.ma.masked
 
 
+@pytest.mark.parametrize("name", ["hillshade", "slope"])
+@pytest.mark.parametrize("buffer", [0, 1, 3])
+def test_dem_gradient(name, buffer):
+    """Should match numpy.gradient results and crop the halo."""
+    algo = default_algorithms.get(name)(buffer=buffer)
+    assert algo.halo == buffer
+
+    arr = numpy.random.uniform(0, 5000, (1, 64, 64)).astype("float32")
+    img = ImageData(arr, crs=CRS.from_epsg(3857), bounds=(0, 0, 640, 640))
+    out = algo(img)
+    assert out.array.shape == (1, 64 - 2 * buffer, 64 - 2 * buffer)
+    assert out.bounds == (
+        buffer * 10.0,
+        buffer * 10.0,
+        640 - buffer * 10.0,
+        640 - buffer * 10.0,
+    )
+
+    x, y = numpy.gradient(arr[0].astype("float64"))
+    if buffer:
+        x = x[buffer:-buffer, buffer:-buffer]
+        y = y[buffer:-buffer, buffer:-buffer]
+
+    if name == "slope":
+        dx, dy = x / 10.0, y / 10.0
+        expected = numpy.rad2deg(numpy.arctan(numpy.sqrt(dx * dx + dy * dy)))
+        numpy.testing.assert_allclose(out.array.data[0], expected, atol=1e-3)
+    else:
+        slope = numpy.pi / 2.0 - numpy.arctan(numpy.sqrt(x * x + y * y))
+        aspect = numpy.arctan2(-x, y)
+        azimuthrad = numpy.deg2rad(360.0 - 45)
+        altituderad = numpy.deg2rad(45.0)
+        shaded = numpy.sin(altituderad) * numpy.sin(slope) + numpy.cos(
+            altituderad
+        ) * numpy.cos(slope) * numpy.cos(azimuthrad - aspect)
+        expected = (255 * (shaded + 1) / 2).clip(0).astype("uint8")
+        # float32 rounding can change the integer part by 1
+        assert numpy.abs(out.array.data[0].astype("int16") - expected).max() <= 1
+
+    # masked pixels and their neighbors are masked
+    arr = numpy.ma.MaskedArray(arr, mask=numpy.zeros(arr.shape, dtype="bool"))
+    arr.mask[0, 10, 10] = True
+    out = algo(ImageData(arr))
+    assert out.array[0, 10 - buffer, 10 - buffer] is numpy.ma.masked
+    assert out.array[0, 11 - buffer, 10 - buffer] is numpy.ma.masked
+    assert out.array[0, 12 - buffer, 10 - buffer] is not numpy.ma.masked
+
+
+def _plane_image(size: int = 32) -> ImageData:
+    """Plane sloping down to the east (10m pixels, z = -x)."""
+    cols = numpy.arange(size, dtype="float32") * 10.0
+    arr = numpy.tile(1000.0 - cols, (size, 1))[None].astype("float32")
+    return ImageData(arr, crs=CRS.from_epsg(3857), bounds=(0, 0, size * 10, size * 10))
+
+
+def test_terrain_algorithms():
+    """test terrain analysis algorithms."""
+    img = _plane_image()
+
+    out = default_algorithms.get("slope")()(img)
+    assert out.array.shape == (1, 30, 30)
+    numpy.testing.assert_allclose(out.array.data, 45.0, rtol=1e-5)
+
+    out = default_algorithms.get("slope")(unit="percent")(img)
+    assert out.array.dtype == "float32"
+    numpy.testing.assert_allclose(out.array.data, 100.0, rtol=1e-5)
+    assert default_algorithms.get("slope")(unit="percent").output_max is None
+
+    out = default_algorithms.get("aspect")()(img)
+    assert out.array.dtype == "float32"
+    numpy.testing.assert_allclose(out.array.data, 90.0, rtol=1e-5)
+
+    # slope facing north (z decreases with the row index)
+    arr = numpy.ascontiguousarray(numpy.rot90(img.array.data[0], 1))[None]
+    out = default_algorithms.get("aspect")()(ImageData(arr))
+    numpy.testing.assert_allclose(out.array.data, 0.0, atol=1e-5)
+
+    # flat areas are masked
+    out = default_algorithms.get("aspect")()(ImageData(numpy.ones((1, 8, 8))))
+    assert out.array.mask.all()
+
+    out = default_algorithms.get("tri")()(img)
+    numpy.testing.assert_allclose(out.array.data, numpy.sqrt(6 * 10.0**2), rtol=1e-5)
+
+    out = default_algorithms.get("roughness")()(img)
+    numpy.testing.assert_allclose(out.array.data, 20.0, rtol=1e-5)
+
+    # plane has no curvature
+    out = default_algorithms.get("curvature")()(img)
+    numpy.testing.assert_allclose(out.array.data, 0.0, atol=1e-3)
+
+    # hill top is upwardly convex
+    x, y = numpy.meshgrid(numpy.arange(-16, 16), numpy.arange(-16, 16))
+    arr = (1000.0 - (x * x + y * y)).astype("float32")[None]
+    img = ImageData(arr, crs=CRS.from_epsg(3857), bounds=(0, 0, 32, 32))
+    out = default_algorithms.get("curvature")()(img)
+    numpy.testing.assert_allclose(out.array.data, 400.0, rtol=1e-5)
+
+    # multidirectional hillshade lights every side of the hill
+    out = default_algorithms.get("hillshade")(multidirectional=True)(img)
+    assert out.array.shape == (1, 30, 30)
+    assert out.array.dtype == "uint8"
+    single = default_algorithms.get("hillshade")()(img)
+    assert out.array.data.min() > single.array.data.min()
+
+
+@pytest.mark.parametrize("name", ["hillshade", "slope"])
+def test_terrain_numexpr(monkeypatch, name):
+    """numexpr and numpy backends should return the same output."""
+    from titiler.core.algorithm import terrain
+
+    if terrain.numexpr is None:
+        pytest.skip("numexpr is not installed")
+
+    arr = numpy.random.uniform(0, 5000, (1, 64, 64)).astype("float32")
+    img = ImageData(arr, crs=CRS.from_epsg(3857), bounds=(0, 0, 640, 640))
+    algo = default_algorithms.get(name)()
+    out = algo(img)
+
+    monkeypatch.setattr(terrain, "numexpr", None)
+    expected = algo(img)
+    numpy.testing.assert_allclose(
+        out.array.data.astype("float32"),
+        expected.array.data.astype("float32"),
+        atol=1,
+    )
+
+
+def test_algorithm_halo():
+    """Should sum the halo of the pipeline's steps."""
+    assert default_algorithms.get("terrarium")().halo == 0
+    pipeline = Pipeline(
+        steps=[
+            default_algorithms.get("hillshade")(buffer=2),
+            default_algorithms.get("slope")(),
+        ]
+    )
+    assert pipeline.halo == 3
+
+
 def test_contours():
     """test contours."""
     algo = default_algorithms.get("contours")()
@@ -418,3 +560,173 @@ def test_grayscale_algorithm():
     img = ImageData(arr)
     with pytest.raises(ValueError):
         out = algo(img)
+
+
+@pytest.mark.parametrize(
+    "names",
+    [
+        ["normalizedIndex", "ceil"],
+        ["normalizedIndex", "floor", "cast"],
+        ["ceil", "floor"],
+        ["max", "cast"],
+        ["terrarium", "grayscale", "bitonal"],
+    ],
+)
+def test_pipeline(names):
+    """Should return the same output as applying the algorithms one by one."""
+    arr = numpy.ma.MaskedArray(
+        numpy.random.uniform(-50, 200, (2, 256, 256)).astype("float32"),
+        mask=numpy.zeros((2, 256, 256), dtype="bool"),
+    )
+    arr.mask[:, 1:100, 1:100] = True
+    img = ImageData(arr[0:1] if names[0] == "terrarium" else arr)
+    data = img.array.copy()
+
+    steps = [default_algorithms.get(name)() for name in names]
+    pipeline = Pipeline(steps=steps)
+    assert pipeline.input_nbands == steps[0].input_nbands
+    assert pipeline.output_dtype == steps[-1].output_dtype
+
+    out = pipeline(img)
+    expected = img
+    for step in steps:
+        expected = step(expected)
+
+    numpy.testing.assert_array_equal(out.array.data, expected.array.data)
+    numpy.testing.assert_array_equal(out.array.mask, expected.array.mask)
+    assert out.array.dtype == expected.array.dtype
+    assert out.band_descriptions == expected.band_descriptions
+
+    # input is not modified
+    numpy.testing.assert_array_equal(img.array.data, data.data)
+
+
+def test_pipeline_metadata():
+    """Should check steps compatibility."""
+    pipeline = Pipeline(
+        steps=[
+            default_algorithms.get("normalizedIndex")(),
+            default_algorithms.get("max")(),
+        ]
+    )
+    assert pipeline.input_nbands == 2
+    assert pipeline.output_nbands == 1
+    assert pipeline.output_dtype == "float32"
+    assert pipeline.output_min == [-1.0]
+
+    with pytest.raises(ValidationError):
+        Pipeline(steps=[])
+
+    # hillshade expects 1 band
+    with pytest.raises(ValidationError):
+        Pipeline(
+            steps=[
+                default_algorithms.get("terrarium")(),
+                default_algorithms.get("hillshade")(),
+            ]
+        )
+
+    with pytest.raises(ValidationError):
+        Pipeline(
+            steps=[
+                default_algorithms.get("hillshade")(),
+                default_algorithms.get("cast")(output_dtype="nope"),
+            ]
+        )
+
+
+def test_pipeline_dependency():
+    """Should create Pipeline from `|` separated algorithm names."""
+    app = FastAPI()
+
+    @app.get("/")
+    def main(algorithm=Depends(default_algorithms.dependency)):
+        """endpoint."""
+        if isinstance(algorithm, Pipeline):
+            return [step.model_dump() for step in algorithm.steps]
+
+        return algorithm.model_dump()
+
+    client = TestClient(app)
+    response = client.get("/", params={"algorithm": "hillshade"})
+    assert response.json()["azimuth"] == 45
+
+    response = client.get("/", params={"algorithm": "normalizedIndex|ceil"})
+    assert response.status_code == 200
+    assert [step["title"] for step in response.json()] == [
+        "Normalized Difference Index",
+        "Round data to the smallest integer",
+    ]
+
+    response = client.get(
+        "/",
+        params={
+            "algorithm": "hillshade|cast",
+            "algorithm_params": json.dumps([{"azimuth": 90}, None]),
+        },
+    )
+    assert response.status_code == 200
+    assert response.json()[0]["azimuth"] == 90
+
+    response = client.get("/", params={"algorithm": "hillshade|nope"})
+    assert response.status_code == 422
+
+    response = client.get("/", params={"algorithm": "hillshade|"})
+    assert response.status_code == 422
+
+    response = client.get(
+        "/",
+        params={
+            "algorithm": "hillshade|cast",
+            "algorithm_params": json.dumps({"azimuth": 90}),
+        },
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        "/",
+        params={
+            "algorithm": "hillshade|cast",
+            "algorithm_params": json.dumps([{"azimuth": 900}, None]),
+        },
+    )
+    assert response.status_code == 400
+
+    response = client.get("/", params={"algorithm": "terrarium|hillshade"})
+    assert response.status_code == 400
+
+    # step parameters should be JSON objects
+    response = client.get(
+        "/",
+        params={"algorithm": "hillshade|cast", "algorithm_params": json.dumps([1, 2])},
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        "/", params={"algorithm": "hillshade", "algorithm_params": json.dumps([1])}
+    )
+    assert response.status_code == 400
+
+
+def test_dependency_new_instances():
+    """Each call to the dependency should create new algorithms."""
+    algorithms = default_algorithms.register({"multiply": Multiply})
+    assert isinstance(algorithms, Algorithms)
+    post_process = algorithms.dependency
+
+    assert post_process(algorithm=None) is None
+
+    params = json.dumps({"azimuth": 30})
+    algo = post_process(algorithm="hillshade", algorithm_params=params)
+    algo.azimuth = 90
+    assert post_process(algorithm="hillshade", algorithm_params=params).azimuth == 30
+
+    pipeline = post_process(algorithm="hillshade|cast")
+    assert isinstance(pipeline, Pipeline)
+    pipeline.steps.clear()
+    assert len(post_process(algorithm="hillshade|cast").steps) == 2
+
+    with pytest.raises(HTTPException):
+        post_process(
+            algorithm="hillshade", algorithm_params=json.dumps({"azimuth": 400})
+        )
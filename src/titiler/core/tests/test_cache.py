@@ -0,0 +1,166 @@
+"""Test titiler.core.cache."""
+
+import os
+import time
+
+import morecantile
+from fastapi import FastAPI
+from rio_tiler.io import Reader
+from starlette.testclient import TestClient
+
+from titiler.core.cache import LRUCache, ReaderCache, freeze
+from titiler.core.factory import TilerFactory
+
+from .conftest import DATA_DIR
+
+COG = os.path.join(DATA_DIR, "cog.tif")
+
+
+def test_freeze():
+    """Should return the same key for equivalent values."""
+    assert freeze({"a": 1, "b": [1, 2]}) == freeze({"b": [1, 2], "a": 1})
+    assert freeze({"a": 1}) != freeze({"a": 2})
+    hash(freeze({"a": {"b": {1, 2}}, "c": [{"d": None}]}))
+    # sets with mixed types
+    assert freeze({1, "a", None}) == freeze({None, "a", 1})
+    assert freeze({"a": {1, "a"}}) != freeze({"a": {1, "b"}})
+
+    # models keys are computed once and kept by the copies
+    tms = morecantile.tms.get("WebMercatorQuad")
+    key = freeze(tms)
+    assert key == freeze(morecantile.tms.get("WebMercatorQuad"))
+    assert freeze(tms.model_copy(deep=True)) is key
+    assert key != freeze(morecantile.tms.get("WorldCRS84Quad"))
+    assert "_titiler_cache_key" not in tms.model_dump_json()
+
+
+def test_lru_cache():
+    """Should evict least recently used items."""
+    evicted = []
+    cache = LRUCache(maxsize=2, on_evict=lambda k, v: evicted.append(k))
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert evicted == ["b"]
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["evictions"] == 1
+
+    assert cache.pop("a") == 1
+    assert evicted == ["b"]
+
+    cache.clear()
+    assert len(cache) == 0
+    assert evicted == ["b", "c"]
+
+
+def test_lru_cache_maxbytes():
+    """Should not cache items larger than maxbytes."""
+    cache = LRUCache(maxsize=None, maxbytes=4)
+    cache.set("a", b"aa")
+    cache.set("b", b"bb")
+    assert cache.nbytes == 4
+
+    # too large, the previous value is removed
+    cache.set("a", b"aaaaa")
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.nbytes == 2
+
+    cache.set("c", b"cc")
+    cache.set("d", b"dd")
+    assert "b" not in cache
+    assert cache.nbytes == 4
+
+
+def test_lru_cache_ttl():
+    """Should expire items."""
+    cache = LRUCache(maxsize=2, ttl=0.01)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
+
+
+def test_reader_cache():
+    """Should re-use opened readers."""
+    cache = ReaderCache(maxsize=2)
+
+    with cache.open(Reader, COG) as src:
+        first = src
+        assert src.dataset and not src.dataset.closed
+
+    assert cache.stats()["misses"] == 1
+    assert cache.stats()["size"] == 1
+
+    with cache.open(Reader, COG) as src:
+        assert src is first
+        # Concurrent access should not share the same instance
+        with cache.open(Reader, COG) as src2:
+            assert src2 is not first
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 2
+
+    # Different options means a different reader
+    with cache.open(Reader, COG, options={"nodata": 1}) as src:
+        assert src is not first
+
+    stats = cache.stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+    cache.clear()
+    assert cache.stats()["size"] == 0
+    assert first.dataset.closed
+
+
+def test_reader_cache_ttl():
+    """Should close expired readers."""
+    cache = ReaderCache(ttl=0.01)
+    with cache.open(Reader, COG) as src:
+        first = src
+
+    time.sleep(0.02)
+    with cache.open(Reader, COG) as src:
+        assert src is not first
+
+    assert first.dataset.closed
+    assert cache.stats()["evictions"] == 1
+
+
+def test_factory_reader_cache():
+    """Should use the reader cache in the factory endpoints."""
+    reader_cache = ReaderCache()
+    endpoints = TilerFactory(reader_cache=reader_cache)
+
+    app = FastAPI()
+    app.include_router(endpoints.router)
+    client = TestClient(app)
+
+    response = client.get(f"/info?url={COG}")
+    assert response.status_code == 200
+    assert reader_cache.stats()["misses"] == 1
+
+    response = client.get(f"/tiles/WebMercatorQuad/8/87/48?url={COG}")
+    assert response.status_code == 200
+    # the `tms` option is part of the cache key
+    assert reader_cache.stats()["misses"] == 2
+
+    response = client.get(f"/tiles/WebMercatorQuad/8/87/47?url={COG}")
+    assert response.status_code == 200
+    response = client.get(f"/info?url={COG}")
+    assert response.status_code == 200
+
+    stats = reader_cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
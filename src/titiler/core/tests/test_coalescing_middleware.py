@@ -0,0 +1,173 @@
+"""Test titiler.core.middleware.RequestCoalescingMiddleware."""
+
+import asyncio
+
+import httpx2 as httpx
+import pytest
+from fastapi import FastAPI
+from starlette.responses import Response, StreamingResponse
+
+from titiler.core.middleware import (
+    CacheControlMiddleware,
+    RequestCoalescingMiddleware,
+    SingleFlight,
+)
+
+
+def test_coalescing_middleware():
+    """Should collapse identical concurrent requests."""
+    calls = []
+    group = SingleFlight()
+
+    app = FastAPI()
+
+    @app.get("/tiles/{z}/{x}/{y}")
+    async def tiles(z: int, x: int, y: int, url: str):
+        """tiles."""
+        calls.append((z, x, y, url))
+        await asyncio.sleep(0.1)
+        return Response(f"{z}-{x}-{y}".encode(), media_type="image/png")
+
+    @app.get("/error")
+    async def error():
+        """error."""
+        calls.append("error")
+        await asyncio.sleep(0.1)
+        raise ValueError("something went wrong")
+
+    app.add_middleware(
+        RequestCoalescingMiddleware,
+        group=group,
+        include_path={r".*/tiles/", r"/error"},
+    )
+    app.add_middleware(CacheControlMiddleware, cachecontrol="public")
+
+    async def main():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+            return await asyncio.gather(
+                *[client.get("/tiles/1/2/3?url=a.tif") for _ in range(5)],
+                client.get("/tiles/1/2/3?URL=a.tif"),
+                client.get("/tiles/1/2/3?url=b.tif"),
+            )
+
+    responses = asyncio.run(main())
+    assert all(r.status_code == 200 for r in responses)
+    assert all(r.content == b"1-2-3" for r in responses)
+    # headers are not duplicated by outer middlewares
+    assert all(r.headers.get_list("cache-control") == ["public"] for r in responses)
+
+    assert len(calls) == 2
+    assert group.stats() == {"calls": 2, "coalesced": 5, "failures": 0, "inflight": 0}
+
+    # Sequential requests are not coalesced
+    asyncio.run(main())
+    assert len(calls) == 4
+
+    async def errors():
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+            return await asyncio.gather(*[client.get("/error") for _ in range(3)])
+
+    calls.clear()
+    responses = asyncio.run(errors())
+    assert all(r.status_code == 500 for r in responses)
+    assert calls == ["error"]
+    assert group.stats()["failures"] == 1
+
+
+def test_coalescing_middleware_passthrough():
+    """Should not coalesce other paths, requests with credentials and streams."""
+    calls = []
+    group = SingleFlight()
+
+    app = FastAPI()
+
+    @app.get("/tiles/{z}/{x}/{y}")
+    async def tiles(z: int, x: int, y: int):
+        """tiles."""
+        calls.append("tiles")
+        await asyncio.sleep(0.1)
+        return Response(f"{z}-{x}-{y}".encode(), media_type="image/png")
+
+    @app.get("/info")
+    async def info():
+        """info."""
+        calls.append("info")
+        await asyncio.sleep(0.1)
+        return {"ok": True}
+
+    @app.get("/tiles/stream")
+    async def stream():
+        """stream."""
+        calls.append("stream")
+
+        async def lines():
+            for i in range(3):
+                await asyncio.sleep(0.05)
+                yield f"{i}\n".encode()
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    app.add_middleware(RequestCoalescingMiddleware, group=group)
+
+    async def main(path, headers=None):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+            return await asyncio.gather(
+                *[client.get(path, headers=headers) for _ in range(3)]
+            )
+
+    # not included
+    responses = asyncio.run(main("/info"))
+    assert all(r.json() == {"ok": True} for r in responses)
+    assert calls == ["info"] * 3
+
+    # credentials
+    calls.clear()
+    for headers in [{"Authorization": "Bearer token"}, {"Cookie": "session=1"}]:
+        responses = asyncio.run(main("/tiles/1/2/3", headers=headers))
+        assert all(r.content == b"1-2-3" for r in responses)
+    assert calls == ["tiles"] * 6
+    assert group.stats()["calls"] == 0
+
+    # streaming responses
+    calls.clear()
+    responses = asyncio.run(main("/tiles/stream"))
+    assert all(r.content == b"0\n1\n2\n" for r in responses)
+    assert calls == ["stream"] * 3
+    assert group.stats()["coalesced"] == 2
+
+
+def test_single_flight_cancelled():
+    """Should run the function when the in-flight call is cancelled."""
+    group = SingleFlight()
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "result"
+
+    async def main():
+        leader = asyncio.ensure_future(group.do("key", func))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(group.do("key", func))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+
+        return await follower
+
+    result, shared = asyncio.run(main())
+    assert result == "result"
+    assert not shared
+    assert len(calls) == 2
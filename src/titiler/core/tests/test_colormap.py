@@ -0,0 +1,89 @@
+"""test titiler.core.colormap."""
+
+import warnings
+
+import numpy
+import pytest
+from rio_tiler.colormap import apply_cmap, cmap
+from rio_tiler.errors import InvalidFormat
+
+from titiler.core.colormap import (
+    DiscreteColorMap,
+    IntervalsColorMap,
+    LUTColorMap,
+    apply_colormap,
+    compile_colormap,
+)
+
+discrete = {0: (1, 2, 3, 4), 1: (5, 6, 7, 8), 100: (9, 9, 9, 9), 1000: (1, 1, 1, 1)}
+discrete_float = {0.1: (1, 2, 3, 4), 1: (5, 6, 7, 8), 2.5: (9, 9, 9, 9)}
+intervals = [
+    ((0, 10), (1, 1, 1, 255)),
+    # overlapping interval
+    ((5, 20.5), (2, 2, 2, 255)),
+    ((0.1, 0.2), (3, 3, 3, 3)),
+    # empty interval
+    ((100, 50), (4, 4, 4, 4)),
+    ((200, 1e9), (5, 5, 5, 5)),
+]
+
+
+@pytest.mark.parametrize(
+    "colormap,compiled",
+    [
+        (cmap.get("viridis"), LUTColorMap),
+        (discrete, DiscreteColorMap),
+        (discrete_float, DiscreteColorMap),
+        (intervals, IntervalsColorMap),
+    ],
+)
+@pytest.mark.parametrize(
+    "dtype", ["uint8", "int8", "uint16", "int16", "int32", "float32", "float64"]
+)
+def test_apply_colormap(colormap, compiled, dtype):
+    """Should return the same output as rio-tiler's apply_cmap."""
+    rng = numpy.random.default_rng(0)
+    data = (rng.random((1, 64, 64)) * 300 - 20).astype(dtype)
+    if data.dtype.kind == "f":
+        data[0, 0, :5] = [numpy.nan, 0.1, 0.2, 2.5, -0.0]
+
+    cm = compile_colormap(colormap)
+    assert isinstance(cm, compiled)
+    assert cm == colormap
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", UserWarning)
+        expected_data, expected_alpha = apply_cmap(data, colormap)
+        arr, alpha = apply_colormap(data, cm)
+
+    assert arr.dtype == expected_data.dtype
+    numpy.testing.assert_array_equal(arr, expected_data)
+    numpy.testing.assert_array_equal(alpha, expected_alpha)
+
+
+def test_compile_colormap():
+    """Should compile colormaps only once."""
+    cm = compile_colormap(cmap.get("viridis"))
+    assert compile_colormap(cm) is cm
+    assert cm.lut.shape == (256, 4)
+    assert cm.lut.dtype == numpy.uint8
+    assert tuple(cm.lut[1]) == (68, 2, 85, 255)
+
+    assert compile_colormap(None) is None
+    assert compile_colormap({}) == {}
+
+    # Invalid colormaps are not compiled
+    invalid = {0: (0, 0, 0)}
+    assert compile_colormap(invalid) is invalid
+
+    # Non-compiled colormaps are compiled on the fly
+    data = numpy.zeros((1, 4, 4), dtype="uint8")
+    arr, alpha = apply_colormap(data, {0: (1, 2, 3, 255)})
+    assert arr[:, 0, 0].tolist() == [1, 2, 3]
+    assert alpha[0, 0] == 255
+
+    with pytest.raises(InvalidFormat):
+        apply_colormap(numpy.zeros((2, 4, 4), dtype="uint8"), cm)
+
+    with pytest.warns(UserWarning):
+        apply_colormap(numpy.zeros((1, 4, 4), dtype="uint16"), cm)
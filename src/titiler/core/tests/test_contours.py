@@ -0,0 +1,187 @@
+"""test titiler.core.contours."""
+
+import struct
+
+import numpy
+import pytest
+from rasterio.crs import CRS
+from rasterio.transform import from_origin
+
+from titiler.core.contours import (
+    contour_levels,
+    encode_mvt,
+    isolines,
+    simplify,
+    to_geojson,
+)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value, shift = 0, 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, pos
+
+
+def _decode(data: bytes) -> list[tuple[int, object]]:
+    """Decode protobuf message fields (varint, 64-bit and length-delimited)."""
+    fields = []
+    pos = 0
+    while pos < len(data):
+        key, pos = _read_varint(data, pos)
+        number, wire_type = key >> 3, key & 0x7
+        if wire_type == 0:
+            value, pos = _read_varint(data, pos)
+        elif wire_type == 1:
+            value = struct.unpack("<d", data[pos : pos + 8])[0]
+            pos += 8
+        else:
+            size, pos = _read_varint(data, pos)
+            value = data[pos : pos + size]
+            pos += size
+        fields.append((number, value))
+
+    return fields
+
+
+def _cone(size: int = 32) -> numpy.ndarray:
+    """Cone centered on the array (value = distance to the center)."""
+    y, x = numpy.mgrid[0:size, 0:size]
+    center = (size - 1) / 2
+    return numpy.hypot(x - center, y - center)
+
+
+def test_contour_levels():
+    """Should return levels between min and max."""
+    numpy.testing.assert_array_equal(contour_levels(3, 27, 10), [10, 20])
+    numpy.testing.assert_array_equal(contour_levels(3, 27, 10, base=5), [5, 15, 25])
+    numpy.testing.assert_array_equal(contour_levels(-10, 10, 10), [-10, 0, 10])
+    assert not len(contour_levels(11, 19, 10))
+
+
+def test_isolines():
+    """Should create closed rings around a cone."""
+    data = _cone()
+    lines = isolines(data, [5.0, 10.0])
+    assert list(lines) == [5.0, 10.0]
+    for level, rings in lines.items():
+        assert len(rings) == 1
+        ring = rings[0]
+        # closed ring
+        numpy.testing.assert_array_equal(ring[0], ring[-1])
+        # pixel centers are at +0.5
+        dist = numpy.hypot(ring[:, 0] - 16, ring[:, 1] - 16)
+        numpy.testing.assert_allclose(dist, level, atol=0.1)
+
+    # Plane: one open line crossing the array
+    data = numpy.tile(numpy.arange(10, dtype="float64"), (10, 1))
+    lines = isolines(data, [4.25])
+    assert len(lines[4.25]) == 1
+    line = lines[4.25][0]
+    assert len(line) == 10
+    numpy.testing.assert_allclose(line[:, 0], 4.75)
+    assert sorted(line[:, 1].tolist()) == [i + 0.5 for i in range(10)]
+
+    # No crossing
+    assert not isolines(data, [100])
+
+    # masked pixels are skipped
+    mask = numpy.zeros(data.shape, dtype="bool")
+    mask[4:6, :] = True
+    lines = isolines(data, [4.25], mask=mask)
+    assert len(lines[4.25]) == 2
+    assert sum(len(line) for line in lines[4.25]) == 8
+
+
+@pytest.mark.parametrize(
+    "level,expected",
+    [
+        # center (0.5) above the level: low corners (top-right, bottom-left) are isolated
+        (0.5, [[1.0, 0.5], [1.5, 1.0]]),
+        # center below the level: high corners (top-left, bottom-right) are isolated
+        (0.6, [[0.5, 0.9], [0.9, 0.5]]),
+    ],
+)
+def test_isolines_saddle(level, expected):
+    """Should resolve saddles with the center value."""
+    data = numpy.array([[1.0, 0.0], [0.0, 1.0]])
+    lines = isolines(data, [level])[level]
+    assert len(lines) == 2
+    assert any(
+        numpy.allclose(sorted(line.tolist()), sorted(expected)) for line in lines
+    )
+
+
+def test_simplify():
+    """Should remove points closer than the tolerance."""
+    line = numpy.array([[0, 0], [1, 0.1], [2, -0.1], [3, 5], [4, 6], [5, 7]], "f8")
+    numpy.testing.assert_array_equal(simplify(line, 0), line)
+    numpy.testing.assert_array_equal(
+        simplify(line, 0.5), [[0, 0], [2, -0.1], [3, 5], [5, 7]]
+    )
+
+    ring = isolines(_cone(), [10.0])[10.0][0]
+    simplified = simplify(ring, 0.5)
+    assert 4 < len(simplified) < len(ring)
+    numpy.testing.assert_array_equal(simplified[0], simplified[-1])
+
+
+def test_encode_mvt():
+    """Should encode isolines as MVT."""
+    assert encode_mvt({}) == b""
+    assert encode_mvt({10.0: []}) == b""
+
+    lines = {
+        10.0: [numpy.array([[0, 0], [10, 0], [10, 10.2]])],
+        20.0: [numpy.array([[1, 1], [1, 1]]), numpy.array([[5, 5], [6, 6]])],
+    }
+    tile = _decode(encode_mvt(lines, extent=512))
+    assert len(tile) == 1
+    number, layer = tile[0]
+    assert number == 3
+
+    layer = _decode(layer)
+    assert (15, 2) in layer
+    assert (1, b"contours") in layer
+    assert (3, b"elevation") in layer
+    assert (5, 512) in layer
+
+    values = [_decode(v)[0][1] for n, v in layer if n == 4]
+    assert values == [10.0, 20.0]
+
+    features = [dict(_decode(v)) for n, v in layer if n == 2]
+    assert len(features) == 2
+    assert features[0][3] == 2  # LineString
+
+    # MoveTo(1) (0, 0), LineTo(2) (+10, 0) (0, +10)
+    geometry = features[0][4]
+    assert list(geometry) == [9, 0, 0, 18, 20, 0, 0, 20]
+
+    # repeated points are removed (the first line is skipped)
+    geometry = features[1][4]
+    assert list(geometry) == [9, 10, 10, 10, 2, 2]
+
+
+def test_to_geojson():
+    """Should convert pixel coordinates to geographic coordinates."""
+    lines = {10.0: [numpy.array([[0, 0], [10, 0]]), numpy.array([[0, 5], [0, 10]])]}
+    transform = from_origin(0, 10, 1, 1)
+
+    fc = to_geojson(lines, transform, CRS.from_epsg(4326))
+    assert fc["type"] == "FeatureCollection"
+    assert len(fc["features"]) == 1
+    feat = fc["features"][0]
+    assert feat["properties"] == {"elevation": 10.0}
+    assert feat["geometry"]["type"] == "MultiLineString"
+    assert feat["geometry"]["coordinates"] == [
+        [[0.0, 10.0], [10.0, 10.0]],
+        [[0.0, 5.0], [0.0, 0.0]],
+    ]
+
+    fc = to_geojson(lines, transform, CRS.from_epsg(3857))
+    coords = fc["features"][0]["geometry"]["coordinates"]
+    assert coords[0][1][0] == pytest.approx(10 / 111319.49, abs=1e-6)
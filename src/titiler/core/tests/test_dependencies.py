@@ -7,10 +7,12 @@ from typing import Annotated, Literal
 from fastapi import Depends, FastAPI, Path
 from morecantile import tms
 from rasterio.crs import CRS
+from rio_tiler.colormap import cmap as default_cmap
 from rio_tiler.types import ColorMapType
 from starlette.testclient import TestClient
 
 from titiler.core import dependencies
+from titiler.core.colormap import DiscreteColorMap, IntervalsColorMap, LUTColorMap
 from titiler.core.resources.responses import JSONResponse
 
 
@@ -144,6 +146,25 @@ def test_cmap():
     assert response.status_code == 400  # this can only be validated via exception
 
 
+def test_cmap_cache():
+    """Should compile and cache colormaps."""
+    deps = dependencies.create_colormap_dependency(default_cmap)
+
+    cm = deps(colormap_name="viridis")
+    assert isinstance(cm, LUTColorMap)
+    assert deps(colormap_name="viridis") is cm
+
+    custom = json.dumps({1: [68, 1, 84, 255]})
+    cm = deps(colormap=custom)
+    assert isinstance(cm, DiscreteColorMap)
+    assert deps(colormap=custom) is cm
+
+    custom = json.dumps([([1, 2], [0, 0, 0, 255])])
+    cm = deps(colormap=custom)
+    assert isinstance(cm, IntervalsColorMap)
+    assert deps(colormap=custom) is cm
+
+
 def test_default():
     """test default dep behavior."""
 
@@ -396,7 +417,7 @@ def test_algo():
 
     response = client.get("/?algorithm=hillshade")
     assert response.json()["azimuth"] == 45
-    assert response.json()["buffer"] == 3
+    assert response.json()["buffer"] == 1
     assert response.json()["input_nbands"] == 1
 
     response = client.get(
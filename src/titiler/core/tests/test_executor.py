@@ -0,0 +1,121 @@
+"""Test titiler.core.executor."""
+
+import asyncio
+import os
+import threading
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from starlette.testclient import TestClient
+
+from titiler.core.executor import EndpointExecutor
+from titiler.core.factory import TilerFactory
+
+from .conftest import DATA_DIR
+
+COG = os.path.join(DATA_DIR, "cog.tif")
+
+
+def test_executor_backpressure():
+    """Should reject calls when the executor is saturated."""
+    executor = EndpointExecutor(max_workers=1, max_queue_size=1, retry_after=2)
+    event = threading.Event()
+
+    def blocking():
+        event.wait(5)
+        return threading.current_thread().name
+
+    async def main():
+        tasks = [asyncio.ensure_future(executor.run(blocking)) for _ in range(2)]
+        await asyncio.sleep(0.1)
+
+        with pytest.raises(HTTPException) as exc:
+            await executor.run(blocking)
+
+        assert exc.value.status_code == 503
+        assert exc.value.headers == {"Retry-After": "2"}
+
+        stats = executor.stats()
+        assert stats["active"] == 1
+        assert stats["queued"] == 1
+        assert stats["rejected"] == 1
+
+        event.set()
+        return await asyncio.gather(*tasks)
+
+    names = asyncio.run(main())
+    assert all(name.startswith("titiler") for name in names)
+
+    stats = executor.stats()
+    assert stats["completed"] == 2
+    assert stats["active"] == 0
+    assert stats["queued"] == 0
+    assert "blocking" in stats["cpu_time"]
+
+    executor.shutdown()
+
+
+def test_executor_cancel():
+    """Should count cancelled calls as pending until their thread returns."""
+    executor = EndpointExecutor(max_workers=1, max_queue_size=1)
+    event = threading.Event()
+
+    async def main():
+        running = asyncio.ensure_future(executor.run(event.wait, 5))
+        queued = asyncio.ensure_future(executor.run(event.wait, 5))
+        await asyncio.sleep(0.1)
+
+        running.cancel()
+        queued.cancel()
+        await asyncio.sleep(0.1)
+
+        # the queued call never started, the running one is still in its thread
+        assert executor.pending == 1
+        assert executor.stats()["active"] == 1
+
+    asyncio.run(main())
+
+    event.set()
+    executor.shutdown()
+    assert executor.pending == 0
+    assert executor.stats()["active"] == 0
+
+
+def test_factory_executor():
+    """Should run endpoints in the executor."""
+    executor = EndpointExecutor(max_workers=2)
+    endpoints = TilerFactory(
+        executor=executor,
+        executor_scopes=[
+            {"path": "/tiles/{tileMatrixSetId}/{z}/{x}/{y}", "method": "GET"},
+            {"path": "/tiles/{tileMatrixSetId}/{z}/{x}/{y}.{format}", "method": "GET"},
+        ],
+    )
+
+    app = FastAPI()
+    app.include_router(endpoints.router)
+    client = TestClient(app)
+
+    response = client.get(f"/tiles/WebMercatorQuad/8/87/48.png?url={COG}")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+
+    response = client.get(f"/info?url={COG}")
+    assert response.status_code == 200
+
+    stats = executor.stats()
+    assert stats["completed"] == 1
+    assert list(stats["cpu_time"]) == ["tile"]
+
+    # Executor saturated
+    executor.max_queue_size = 0
+    executor.pending = 2
+    response = client.get(f"/tiles/WebMercatorQuad/8/87/48.png?url={COG}")
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+    # Other endpoints are not affected
+    response = client.get(f"/info?url={COG}")
+    assert response.status_code == 200
+
+    executor.shutdown()
@@ -4,7 +4,10 @@ import json
 import math
 import os
 import pathlib
+import tarfile
+import time
 import warnings
+from contextlib import contextmanager
 from dataclasses import dataclass
 from enum import Enum
 from io import BytesIO
@@ -17,6 +20,7 @@ import httpx2 as httpx
 import morecantile
 import numpy
 import pytest
+import rasterio
 from attrs import define
 from fastapi import Depends, FastAPI, HTTPException, Path, Query, security, status
 from morecantile.defaults import TileMatrixSets
@@ -30,8 +34,10 @@ from starlette.testclient import TestClient
 
 from titiler.core import dependencies
 from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
+from titiler.core.executor import AssetReadLimiter
 from titiler.core.factory import (
     AlgorithmFactory,
+    AssetReadSettings,
     BaseFactory,
     ColorMapFactory,
     MultiBaseTilerFactory,
@@ -646,6 +652,31 @@ def test_TilerFactory():
     assert meta["dtype"] == "uint8"
     assert meta["count"] == 3
 
+    # The algorithm's halo is added to the tile buffer
+    response = client.get(
+        f"/tiles/WebMercatorQuad/8/87/48.tif?url={DATA_DIR}/cog.tif&algorithm=hillshade"
+    )
+    assert response.status_code == 200
+    meta = parse_img(response.content)
+    assert meta["width"] == 256
+    assert meta["height"] == 256
+
+    response = client.get(
+        f"/tiles/WebMercatorQuad/8/87/48.tif?url={DATA_DIR}/cog.tif&algorithm=hillshade&buffer=2"
+    )
+    assert response.status_code == 200
+    meta = parse_img(response.content)
+    assert meta["width"] == 260
+    assert meta["height"] == 260
+
+    response = client.get(
+        f"/bbox/-56.228,72.715,-54.547,73.188/100x100.tif?url={DATA_DIR}/cog.tif&algorithm=slope"
+    )
+    assert response.status_code == 200
+    meta = parse_img(response.content)
+    assert meta["width"] == 100
+    assert meta["height"] == 100
+
     # OGC Tileset
     response = client.get(f"/tiles?url={DATA_DIR}/cog.tif")
     assert response.status_code == 200
@@ -1072,6 +1103,81 @@ class BandFileReader(MultiBandReader):
         return os.path.join(self.input, f"{band}.tif")
 
 
+@contextmanager
+def slow_env(**kwargs):
+    """rasterio Env with a slow asset read."""
+    with rasterio.Env(**kwargs):
+        time.sleep(0.05)
+        yield
+
+
+@attr.s
+class SlowSTACReader(STACReader):
+    """STAC Reader with slow asset reads."""
+
+    ctx = attr.ib(default=slow_env)
+
+
+@patch("rio_tiler.io.rasterio.rasterio")
+def test_MultiBaseTilerFactory_asset_threads(rio):
+    """Should limit the number of concurrent asset reads."""
+    rio.open = mock_rasterio_open
+
+    limiter = AssetReadLimiter(max_reads=2)
+    stac = MultiBaseTilerFactory(
+        reader=SlowSTACReader,
+        asset_threads=3,
+        asset_read_limiter=limiter,
+    )
+    app = FastAPI()
+    app.include_router(stac.router)
+    client = TestClient(app)
+
+    params = {"url": f"{DATA_DIR}/item.json", "assets": ["B01", "B09", "B01"]}
+    response = client.get("/preview.tif", params=params)
+    assert response.status_code == 200
+    stats = limiter.stats()
+    assert stats["completed"] == 3
+    assert stats["peak"] == 2
+    assert stats["active"] == 0
+
+    # One asset read at a time in a request
+    limiter = AssetReadLimiter(max_reads=4)
+    stac = MultiBaseTilerFactory(
+        reader=SlowSTACReader,
+        asset_threads=1,
+        asset_read_limiter=limiter,
+    )
+    app = FastAPI()
+    app.include_router(stac.router)
+    client = TestClient(app)
+
+    response = client.get("/tiles/WebMercatorQuad/9/289/207", params=params)
+    assert response.status_code == 200
+    response = client.get("/point/23.8,32.0", params=params)
+    assert response.status_code == 200
+    assert limiter.stats()["peak"] == 1
+    assert limiter.stats()["completed"] == 6
+
+    # No process limit
+    stac = MultiBaseTilerFactory(reader=STACReader, asset_read_limiter=None)
+    app = FastAPI()
+    app.include_router(stac.router)
+    client = TestClient(app)
+    response = client.get("/preview.tif", params=params)
+    assert response.status_code == 200
+
+
+def test_asset_read_settings(monkeypatch):
+    """Should read the asset reads settings from TITILER_ASSET_ environment variables."""
+    monkeypatch.setenv("TITILER_ASSET_CONCURRENCY", "2")
+    monkeypatch.setenv("TITILER_ASSET_MAX_READS", "8")
+    monkeypatch.setenv("ASSET_MAX_READS", "1")
+    settings = AssetReadSettings()
+    assert settings.concurrency == 2
+    assert settings.max_reads == 8
+
+
 def test_TMSFactory():
     """test TMSFactory."""
 
@@ -1882,3 +1988,374 @@ def test_optional_headers():
         projjson_crs = json.loads(headers["content-crs-json"])
         assert projjson_crs["type"] == "ProjectedCRS"
         assert CRS.from_user_input(projjson_crs).to_epsg() == 32621
+
+
+def test_TilerFactory_contours():
+    """Test /contours/{tileMatrixSetId}/{z}/{x}/{y} endpoint."""
+    cog = TilerFactory()
+    assert not any(route.path.startswith("/contours") for route in cog.router.routes)
+
+    cog = TilerFactory(add_contours=True, max_contour_levels=100)
+    app = FastAPI()
+    app.include_router(cog.router)
+    add_exception_handlers(app, DEFAULT_STATUS_CODES)
+    client = TestClient(app)
+
+    response = client.get(
+        f"/contours/WebMercatorQuad/8/87/48?url={DATA_DIR}/cog.tif&interval=100"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.mapbox-vector-tile"
+    assert response.content
+    mvt = response.content
+
+    response = client.get(
+        f"/contours/WebMercatorQuad/8/87/48.pbf?url={DATA_DIR}/cog.tif&interval=100"
+    )
+    assert response.headers["content-type"] == "application/x-protobuf"
+    assert response.content == mvt
+
+    # less simplification, bigger tile
+    response = client.get(
+        f"/contours/WebMercatorQuad/8/87/48.mvt?url={DATA_DIR}/cog.tif&interval=100&tolerance=0"
+    )
+    assert len(response.content) > len(mvt)
+
+    response = client.get(
+        f"/contours/WebMercatorQuad/8/87/48.geojson?url={DATA_DIR}/cog.tif&interval=100"
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/geo+json"
+    fc = response.json()
+    assert fc["type"] == "FeatureCollection"
+    assert fc["features"]
+    levels = [feat["properties"]["elevation"] for feat in fc["features"]]
+    assert all(level % 100 == 0 for level in levels)
+    assert levels == sorted(levels)
+
+    # lines are in the tile bounds (+/- 1 pixel)
+    bounds = morecantile.tms.get("WebMercatorQuad").bounds(87, 48, 8)
+    for feat in fc["features"]:
+        for line in feat["geometry"]["coordinates"]:
+            for lon, lat in line:
+                assert bounds.left - 0.01 < lon < bounds.right + 0.01
+                assert bounds.bottom - 0.01 < lat < bounds.top + 0.01
+
+    # Too many levels
+    response = client.get(
+        f"/contours/WebMercatorQuad/8/87/48?url={DATA_DIR}/cog.tif&interval=1"
+    )
+    assert response.status_code == 400
+
+    # Multiple bands
+    response = client.get(
+        f"/contours/WebMercatorQuad/8/87/48?url={DATA_DIR}/cog.tif&interval=100&bidx=1&bidx=1"
+    )
+    assert response.status_code == 400
+
+    response = client.get(f"/contours/WebMercatorQuad/8/87/48?url={DATA_DIR}/cog.tif")
+    assert response.status_code == 422
+
+
+def test_TilerFactory_batch():
+    """Test /tiles/{tileMatrixSetId}/batch endpoint."""
+    cog = TilerFactory()
+    assert not any(
+        route.path == "/tiles/{tileMatrixSetId}/batch" for route in cog.router.routes
+    )
+
+    cog = TilerFactory(add_batch=True, max_batch_tiles=10, batch_threads=2)
+    app = FastAPI()
+    app.include_router(cog.router)
+    add_exception_handlers(app, DEFAULT_STATUS_CODES)
+    client = TestClient(app)
+
+    response = client.post(
+        f"/tiles/WebMercatorQuad/batch?url={DATA_DIR}/cog.tif&format=png",
+        json={"tiles": [[8, 87, 48], [8, 87, 47], [8, 87, 48], [8, 0, 0]]},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-tar"
+    with tarfile.open(fileobj=BytesIO(response.content)) as tar:
+        assert sorted(tar.getnames()) == ["8/87/47.png", "8/87/48.png"]
+        content = tar.extractfile("8/87/48.png").read()
+
+    response = client.get(f"/tiles/WebMercatorQuad/8/87/48.png?url={DATA_DIR}/cog.tif")
+    assert content == response.content
+
+    response = client.post(
+        f"/tiles/WebMercatorQuad/batch?url={DATA_DIR}/cog.tif",
+        json={"minzoom": 5, "maxzoom": 6, "bbox": [-61.2, 72.3, -52.4, 74.6]},
+    )
+    assert response.status_code == 200
+    with tarfile.open(fileobj=BytesIO(response.content)) as tar:
+        names = tar.getnames()
+        assert len(names) == 10
+        assert all(name.startswith(("5/", "6/")) for name in names)
+
+    # Too many tiles
+    response = client.post(
+        f"/tiles/WebMercatorQuad/batch?url={DATA_DIR}/cog.tif",
+        json={"minzoom": 5, "maxzoom": 9, "bbox": [-61.2, 72.3, -52.4, 74.6]},
+    )
+    assert response.status_code == 400
+
+    # Invalid body
+    response = client.post(
+        f"/tiles/WebMercatorQuad/batch?url={DATA_DIR}/cog.tif",
+        json={"minzoom": 5},
+    )
+    assert response.status_code == 422
+
+    # Errors are listed in the archive
+    response = client.post(
+        f"/tiles/WebMercatorQuad/batch?url={DATA_DIR}/cog.tif&bidx=10",
+        json={"tiles": [[8, 87, 48]]},
+    )
+    assert response.status_code == 200
+    with tarfile.open(fileobj=BytesIO(response.content)) as tar:
+        assert tar.getnames() == ["errors.json"]
+        assert "8/87/48" in json.loads(tar.extractfile("errors.json").read())
+
+
+def test_TilerFactory_statistics_stream():
+    """Test streamed POST /statistics."""
+
+    calls = {"feature": 0, "part": 0}
+
+    @attr.s
+    class CountingReader(Reader):
+        """Count feature/part calls."""
+
+        def feature(self, *args, **kwargs):
+            """Count feature calls."""
+            calls["feature"] += 1
+            return super().feature(*args, **kwargs)
+
+        def part(self, *args, **kwargs):
+            """Count part calls."""
+            calls["part"] += 1
+            return super().part(*args, **kwargs)
+
+    features = []
+    for i in range(6):
+        for j in range(4):
+            x, y = -58 + i * 0.2, 73 + j * 0.1
+            features.append(
+                {
+                    "type": "Feature",
+                    "properties": {"id": f"{i}-{j}"},
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [
+                            [
+                                [x, y],
+                                [x + 0.15, y],
+                                [x + 0.15, y + 0.08],
+                                [x, y + 0.08],
+                                [x, y],
+                            ]
+                        ],
+                    },
+                }
+            )
+    fc = {"type": "FeatureCollection", "features": features}
+
+    cog = TilerFactory(reader=CountingReader, statistics_threads=2)
+    app = FastAPI()
+    app.include_router(cog.router)
+    client = TestClient(app)
+
+    for params in [{}, {"dst_crs": "epsg:32621"}]:
+        response = client.post(
+            "/statistics", params={"url": f"{DATA_DIR}/cog.tif", **params}, json=fc
+        )
+        assert response.status_code == 200
+        expected = {
+            feat["properties"]["id"]: feat["properties"]["statistics"]
+            for feat in response.json()["features"]
+        }
+
+        calls.update({"feature": 0, "part": 0})
+        response = client.post(
+            "/statistics",
+            params={"url": f"{DATA_DIR}/cog.tif", "f": "ndjson", **params},
+            json=fc,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/ndjson"
+        results = [json.loads(line) for line in response.text.splitlines()]
+        assert len(results) == 24
+        assert {
+            feat["properties"]["id"]: feat["properties"]["statistics"]
+            for feat in results
+        } == expected
+
+        if params:
+            # Features are grouped when reading in the dataset's CRS
+            assert calls["feature"] + calls["part"] < 24
+        else:
+            assert calls["feature"] == 24
+
+    response = client.post(
+        "/statistics",
+        params={"url": f"{DATA_DIR}/cog.tif"},
+        headers={"accept": "application/geo+json-seq"},
+        json=features[0],
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/geo+json-seq"
+    assert response.text.startswith("\x1e")
+    assert json.loads(response.text[1:])["properties"]["statistics"]["b1"]
+
+    # Errors are reported in the feature properties
+    response = client.post(
+        "/statistics",
+        params={"url": f"{DATA_DIR}/cog.tif", "f": "ndjson", "bidx": 10},
+        json=features[0],
+    )
+    assert response.status_code == 200
+    assert "error" in json.loads(response.text)["properties"]
+
+
+def _assert_statistics_equal(stats, expected):
+    """Compare statistics (with float tolerance)."""
+    assert stats.keys() == expected.keys()
+    for band, band_stats in stats.items():
+        for key, value in band_stats.items():
+            if key == "histogram":
+                assert value == expected[band][key]
+            else:
+                assert value == pytest.approx(
+                    expected[band][key], rel=1e-5, abs=1e-9, nan_ok=True
+                )
+
+
+def test_TilerFactory_zonal_statistics():
+    """Test POST /zonal_statistics."""
+
+    calls = {"feature": 0, "part": 0}
+
+    @attr.s
+    class CountingReader(Reader):
+        """Count feature/part calls."""
+
+        def feature(self, *args, **kwargs):
+            """Count feature calls."""
+            calls["feature"] += 1
+            return super().feature(*args, **kwargs)
+
+        def part(self, *args, **kwargs):
+            """Count part calls."""
+            calls["part"] += 1
+            return super().part(*args, **kwargs)
+
+    features = []
+    for i in range(6):
+        for j in range(4):
+            # Overlapping features
+            x, y = -58 + i * 0.1, 73 + j * 0.05
+            features.append(
+                {
+                    "type": "Feature",
+                    "properties": {"id": f"{i}-{j}"},
+                    "geometry": {
+                        "type": "Polygon",
+                        "coordinates": [
+                            [
+                                [x, y],
+                                [x + 0.15, y],
+                                [x + 0.15, y + 0.08],
+                                [x, y],
+                            ]
+                        ],
+                    },
+                }
+            )
+    fc = {"type": "FeatureCollection", "features": features}
+
+    cog = TilerFactory(reader=CountingReader)
+    assert not any(route.path == "/zonal_statistics" for route in cog.router.routes)
+
+    cog = TilerFactory(reader=CountingReader, add_zonal_statistics=True)
+    app = FastAPI()
+    app.include_router(cog.router)
+    client = TestClient(app)
+
+    for params in [
+        {"dst_crs": "epsg:32621"},
+        {"dst_crs": "epsg:32621", "categorical": True, "c": [1, 2]},
+        {"dst_crs": "epsg:32621", "histogram_bins": 4, "p": [10, 50]},
+    ]:
+        response = client.post(
+            "/statistics", params={"url": f"{DATA_DIR}/cog.tif", **params}, json=fc
+        )
+        assert response.status_code == 200
+        expected = response.json()["features"]
+
+        calls.update({"feature": 0, "part": 0})
+        response = client.post(
+            "/zonal_statistics",
+            params={"url": f"{DATA_DIR}/cog.tif", **params},
+            json=fc,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/geo+json"
+        results = response.json()["features"]
+        assert len(results) == 24
+        # The area covering all the features is read once
+        assert calls == {"feature": 0, "part": 1}
+
+        for feat, expected_feat in zip(results, expected, strict=True):
+            assert feat["properties"]["id"] == expected_feat["properties"]["id"]
+            _assert_statistics_equal(
+                feat["properties"]["statistics"],
+                expected_feat["properties"]["statistics"],
+            )
+
+    response = client.post(
+        "/zonal_statistics",
+        params={"url": f"{DATA_DIR}/cog.tif", "max_size": 64},
+        json=features[0],
+    )
+    assert response.status_code == 200
+    resp = response.json()
+    assert resp["type"] == "Feature"
+    assert resp["properties"]["statistics"]["b1"]["valid_pixels"] < 64 * 64
+
+    # Areas larger than `max_zonal_statistics_pixels` are read in groups
+    cog = TilerFactory(
+        reader=CountingReader,
+        add_zonal_statistics=True,
+        max_zonal_statistics_pixels=200 * 200,
+    )
+    app = FastAPI()
+    app.include_router(cog.router)
+    add_exception_handlers(app, DEFAULT_STATUS_CODES)
+    client = TestClient(app)
+
+    params = {"url": f"{DATA_DIR}/cog.tif", "dst_crs": "epsg:32621"}
+    calls.update({"feature": 0, "part": 0})
+    response = client.post("/zonal_statistics", params=params, json=fc)
+    assert response.status_code == 200
+    results = response.json()["features"]
+    assert calls["part"] > 1
+
+    response = client.post("/statistics", params=params, json=fc)
+    expected = response.json()["features"]
+    for feat, expected_feat in zip(results, expected, strict=True):
+        assert feat["properties"]["id"] == expected_feat["properties"]["id"]
+        _assert_statistics_equal(
+            feat["properties"]["statistics"],
+            expected_feat["properties"]["statistics"],
+        )
+
+    # Resampled output larger than `max_zonal_statistics_pixels`
+    for extra in [{"max_size": 256}, {"height": 300, "width": 300}]:
+        response = client.post("/zonal_statistics", params={**params, **extra}, json=fc)
+        assert response.status_code == 400
+
+    response = client.post(
+        "/zonal_statistics", params={**params, "max_size": 128}, json=fc
+    )
+    assert response.status_code == 200
@@ -0,0 +1,36 @@
+"""Test titiler.core.importtime."""
+
+import pytest
+
+from titiler.core.importtime import main, parse_importtime, profile_imports
+
+output = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        420 |   io
+import time:      1000 |       1420 | mymodule
+"""
+
+
+def test_parse_importtime():
+    """Should parse python -X importtime output."""
+    imports = parse_importtime(output)
+    assert [imp.name for imp in imports] == ["_io", "io", "mymodule"]
+    assert [imp.level for imp in imports] == [2, 1, 0]
+    assert imports[-1].self_time == 1000
+    assert imports[-1].cumulative_time == 1420
+
+
+def test_profile_imports(capsys):
+    """Should profile the import of a module."""
+    imports = profile_imports("json", env={"PYTHONWARNINGS": "ignore"})
+    assert "json" in [imp.name for imp in imports if imp.level == 0]
+
+    with pytest.raises(RuntimeError):
+        profile_imports("titiler.core.nonexistent")
+
+    assert main(["json", "--top", "2", "--sort", "self"]) == 0
+    out = capsys.readouterr().out.splitlines()
+    assert out[0].startswith("json: ")
+    assert len(out) == 4
+
+    assert main(["titiler.core.nonexistent"]) == 1
@@ -0,0 +1,98 @@
+"""Test titiler.core.middleware.LazyRouterMiddleware."""
+
+from fastapi import APIRouter, FastAPI
+from starlette.responses import JSONResponse
+from starlette.testclient import TestClient
+
+from titiler.core.middleware import (
+    CacheControlMiddleware,
+    LazyRouterMiddleware,
+    LazyRouters,
+)
+
+
+class CustomError(Exception):
+    """Custom error."""
+
+
+def test_lazy_router_middleware():
+    """Should add the endpoints on the first request."""
+    calls = []
+
+    def loader(prefix: str, fail: bool = False):
+        def _load(app: FastAPI):
+            calls.append(prefix)
+            if fail and calls.count(prefix) == 1:
+                raise ValueError("something went wrong")
+
+            router = APIRouter()
+
+            @router.get("/info")
+            def info():
+                """info."""
+                return {"prefix": prefix}
+
+            @router.get("/error")
+            def error():
+                """error."""
+                raise CustomError("custom error")
+
+            app.include_router(router, prefix=prefix)
+            app.add_exception_handler(
+                CustomError,
+                lambda request, exc: JSONResponse({"detail": str(exc)}, 424),
+            )
+
+        return _load
+
+    routers = LazyRouters()
+    routers.register("/a", loader("/a"))
+    routers.register("/b/", loader("/b", fail=True))
+    routers.register("/c", loader("/c"))
+
+    app = FastAPI()
+
+    @app.get("/healthz")
+    def healthz():
+        """healthz."""
+        return {"ping": "pong"}
+
+    app.add_middleware(CacheControlMiddleware, cachecontrol="public")
+    app.add_middleware(LazyRouterMiddleware, routers=routers)
+
+    client = TestClient(app, raise_server_exceptions=False)
+
+    response = client.get("/healthz")
+    assert response.status_code == 200
+    assert not calls
+
+    response = client.get("/a/info")
+    assert response.status_code == 200
+    assert response.json() == {"prefix": "/a"}
+    assert response.headers["cache-control"] == "public"
+    assert calls == ["/a"]
+    assert list(routers.loaded) == ["/a"]
+
+    # the exception handlers are added
+    response = client.get("/a/error")
+    assert response.status_code == 424
+
+    response = client.get("/aa/info")
+    assert response.status_code == 404
+    assert calls == ["/a"]
+
+    # loader is called again after an error
+    response = client.get("/b/info")
+    assert response.status_code == 500
+    assert "/b" in routers.loaders
+
+    response = client.get("/b/info")
+    assert response.status_code == 200
+    assert calls == ["/a", "/b", "/b"]
+
+    # all the endpoints are added for the OpenAPI document
+    response = client.get("/openapi.json")
+    assert response.status_code == 200
+    assert "/c/info" in response.json()["paths"]
+    assert not routers.loaders
+    assert calls == ["/a", "/b", "/b", "/c"]
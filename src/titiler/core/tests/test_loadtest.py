@@ -0,0 +1,188 @@
+"""Test titiler.core.loadtest."""
+
+import asyncio
+import json
+import os
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from morecantile import tms
+
+from titiler.core.executor import EndpointExecutor
+from titiler.core.factory import TilerFactory
+from titiler.core.loadtest import (
+    ASGITarget,
+    HTTPTarget,
+    TraceGenerator,
+    load_target,
+    main,
+    replay,
+    sweep,
+)
+from titiler.core.seed import create_app
+
+from .conftest import DATA_DIR
+
+COG = os.path.join(DATA_DIR, "cog.tif")
+COG_BOUNDS = (-61.287, 15.537, -60.876, 16.079)
+
+# Factory used by the load test
+cog = TilerFactory(executor=EndpointExecutor(max_workers=4))
+
+
+def test_trace_generator():
+    """Should create reproducible sessions with hot tiles."""
+    wm = tms.get("WebMercatorQuad")
+    options = {"tms": wm, "bounds": COG_BOUNDS, "minzoom": 5, "maxzoom": 9}
+
+    sessions = TraceGenerator(seed=1, **options).sessions(50)
+    assert sessions == TraceGenerator(seed=1, **options).sessions(50)
+    assert sessions != TraceGenerator(seed=2, **options).sessions(50)
+
+    for session in sessions:
+        # viewport of the first view
+        assert len(session) >= 4
+        # tiles are not requested twice in a session
+        assert len(set(session)) == len(session)
+        assert all(5 <= tile.z <= 9 for tile in session)
+        for tile in session:
+            matrix = wm.matrix(tile.z)
+            assert 0 <= tile.x < matrix.matrixWidth
+            assert 0 <= tile.y < matrix.matrixHeight
+
+    # Zipf distribution: a few tiles are requested by most of the sessions
+    counts = Counter(tile for session in sessions for tile in session)
+    assert counts.most_common(1)[0][1] > 10
+
+    # No pan
+    generator = TraceGenerator(pan_probability=0, zoom_burst=1, seed=1, **options)
+    for session in generator.sessions(10):
+        zooms = [tile.z for tile in session]
+        assert len(set(zooms)) > 1
+
+
+def test_replay():
+    """Should replay sessions against an in-process application."""
+    generator = TraceGenerator(
+        tms.get("WebMercatorQuad"), COG_BOUNDS, minzoom=6, maxzoom=8, seed=0
+    )
+    sessions = generator.sessions(4)
+    target = ASGITarget(create_app(cog), executors=[cog.executor])
+
+    result = asyncio.run(
+        replay(
+            target,
+            sessions,
+            concurrency=4,
+            query_string=f"url={COG}&rescale=0,1000",
+            max_requests=30,
+        )
+    )
+    assert result["concurrency"] == 4
+    assert result["requests"] == 30
+    assert sum(result["status"].values()) == 30
+    assert result["errors"] == 0
+    assert result["error_rate"] == 0
+    assert result["throughput"] > 0
+    assert result["latency"]["p50"] <= result["latency"]["p99"]
+    assert result["latency"]["p99"] <= result["latency"]["max"]
+    assert result["cpu_time"]["tile"] > 0
+    assert result["process_cpu_time"] > 0
+
+    results = sweep(
+        target,
+        sessions,
+        [1, 2],
+        query_string="url=not_a_file.tif",
+        max_requests=5,
+    )
+    assert [r["concurrency"] for r in results] == [1, 2]
+    assert all(r["errors"] == 5 for r in results)
+    assert all(r["error_rate"] == 1 for r in results)
+
+
+class TileHandler(BaseHTTPRequestHandler):
+    """Return an empty 200 response for zoom 7 and 404 otherwise."""
+
+    def do_GET(self):
+        """GET."""
+        self.send_response(200 if "/7/" in self.path else 404)
+        self.end_headers()
+        self.wfile.write(b"tile")
+
+    def log_message(self, *args):
+        """Silence logs."""
+        pass
+
+
+def test_replay_http():
+    """Should replay sessions against an HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TileHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    target = HTTPTarget(f"http://127.0.0.1:{server.server_port}")
+    try:
+        sessions = TraceGenerator(
+            tms.get("WebMercatorQuad"), COG_BOUNDS, minzoom=6, maxzoom=8, seed=0
+        ).sessions(4)
+        result = asyncio.run(replay(target, sessions, concurrency=8))
+    finally:
+        target.close()
+        server.shutdown()
+
+    assert result["requests"] == sum(map(len, sessions))
+    assert set(result["status"]) == {"200", "404"}
+    # 404 responses are not errors
+    assert result["errors"] == 0
+    assert "cpu_time" not in result
+
+
+def test_load_target():
+    """Should create targets."""
+    target = load_target("tests.test_loadtest:cog")
+    assert isinstance(target, ASGITarget)
+    assert target.executors == [cog.executor]
+
+    target = load_target("http://127.0.0.1:8000")
+    assert isinstance(target, HTTPTarget)
+    target.close()
+
+    with pytest.raises(ValueError):
+        load_target("tests.test_loadtest")
+
+    with pytest.raises(ValueError):
+        load_target("tests.test_loadtest:COG")
+
+
+def test_loadtest_cli(tmp_path, capsys):
+    """Should run a concurrency sweep."""
+    output = tmp_path / "results.json"
+    assert (
+        main(
+            [
+                "tests.test_loadtest:cog",
+                "--query",
+                f"url={COG}&rescale=0,1000",
+                "--maxzoom",
+                "7",
+                "--sessions",
+                "2",
+                "--steps",
+                "2",
+                "--concurrency",
+                "1,4",
+                "--requests",
+                "10",
+                "--output",
+                str(output),
+            ]
+        )
+        == 0
+    )
+    results = json.loads(output.read_text())
+    assert [r["concurrency"] for r in results] == [1, 4]
+    assert all(r["requests"] == 10 for r in results)
+    assert "concurrency=4" in capsys.readouterr().err
@@ -7,9 +7,10 @@ import pytest
 from rasterio.io import MemoryFile
 from rio_tiler.errors import InvalidDatatypeWarning
 from rio_tiler.models import ImageData
+from rio_tiler.utils import linear_rescale
 
 from titiler.core.resources.enums import ImageType
-from titiler.core.utils import render_image
+from titiler.core.utils import render_image, rescale_array
 
 
 def test_rendering():
@@ -158,3 +159,118 @@ def test_rendering_auto_dtype():
             with mem.open() as dst:
                 assert dst.count == 2
                 assert dst.dtypes == ("uint8", "uint8")
+
+
+def _rescale_array_per_band(array, mask, in_range, out_range, out_dtype):
+    """Reference (per band) implementation of `rescale_array`."""
+    array = array.copy()
+    nbands = array.shape[0]
+    in_range = in_range if len(in_range) == nbands else in_range * nbands
+    out_range = out_range if len(out_range) == nbands else out_range * nbands
+    for bdx in range(nbands):
+        array[bdx] = numpy.where(
+            mask[bdx],
+            linear_rescale(
+                array[bdx], in_range=in_range[bdx], out_range=out_range[bdx]
+            ),
+            0,
+        )
+
+    return array.astype(out_dtype)
+
+
+@pytest.mark.parametrize(
+    "dtype", ["uint8", "int8", "uint16", "int16", "uint32", "float32", "float64"]
+)
+@pytest.mark.parametrize(
+    "in_range,out_range,out_dtype",
+    [
+        (((0, 1000),), ((0, 255),), "uint8"),
+        (((-10, 10), (0, 1), (5, 7.5)), ((0, 255),), "uint8"),
+        (((0.1, 0.3),), ((0, 1000),), "uint16"),
+        (((0, 1000),), ((-1, 1),), "float32"),
+        (((0, 100),), ((0, 1000),), "uint8"),
+    ],
+)
+def test_rescale_array(dtype, in_range, out_range, out_dtype):
+    """rescale_array should match the per-band implementation."""
+    rng = numpy.random.default_rng(0)
+    if numpy.issubdtype(dtype, numpy.integer):
+        info = numpy.iinfo(dtype)
+        arr = rng.integers(max(info.min, -200), min(info.max, 1200), (3, 64, 64))
+    else:
+        arr = rng.uniform(-200, 1200, (3, 64, 64))
+
+    arr = arr.astype(dtype)
+    mask = rng.random((3, 64, 64)) > 0.2
+    original = arr.copy()
+
+    with warnings.catch_warnings():
+        # int8 overflow in the reference implementation
+        warnings.simplefilter("ignore", RuntimeWarning)
+        expected = _rescale_array_per_band(arr, mask, in_range, out_range, out_dtype)
+
+    out = rescale_array(arr, mask, in_range, out_range, out_dtype)
+    assert out.dtype == expected.dtype
+    numpy.testing.assert_array_equal(out, expected)
+    # input is not modified
+    numpy.testing.assert_array_equal(arr, original)
+
+    # 2D mask is used for all the bands
+    out = rescale_array(arr, mask[0], in_range, out_range, out_dtype)
+    numpy.testing.assert_array_equal(
+        out,
+        rescale_array(arr, numpy.stack([mask[0]] * 3), in_range, out_range, out_dtype),
+    )
+
+
+@pytest.mark.parametrize(
+    "output_format", [ImageType.png, ImageType.jpeg, ImageType.tif, ImageType.npy]
+)
+@pytest.mark.parametrize("alpha", [False, True])
+def test_render_image_rescale(output_format, alpha):
+    """Rescaling in render_image should match ImageData.rescale."""
+    rng = numpy.random.default_rng(0)
+    arr = numpy.ma.MaskedArray(
+        rng.integers(0, 1200, (3, 256, 256)).astype("uint16"),
+        mask=rng.random((3, 256, 256)) > 0.9,
+    )
+    alpha_mask = (
+        numpy.where(rng.random((256, 256)) > 0.5, 65535, 0).astype("uint16")
+        if alpha
+        else None
+    )
+
+    def _image():
+        return ImageData(arr.copy(), alpha_mask=alpha_mask)
+
+    image = _image()
+    content, _ = render_image(
+        image, output_format=output_format, rescale=[(0, 1000), (0, 500), (0, 10)]
+    )
+    # input image is not modified
+    assert image.array.dtype == "uint16"
+
+    reference = _image()
+    reference.rescale([(0, 1000), (0, 500), (0, 10)])
+    expected, _ = render_image(reference, output_format=output_format)
+    assert content == expected
+
+
+def test_render_image_invalid_dtype_mask():
+    """Invalid pixels should only be set to 0 where the mask is invalid."""
+    arr = numpy.full((1, 256, 256), 1000, dtype="uint16")
+    mask = numpy.zeros((1, 256, 256), dtype="bool")
+    # first row is partially masked
+    mask[0, 0, 0:128] = True
+
+    content, _ = render_image(
+        ImageData(numpy.ma.MaskedArray(arr, mask=mask)),
+        output_format=ImageType.jpeg,
+    )
+    with MemoryFile(content) as mem:
+        with mem.open() as dst:
+            data = dst.read(1)
+
+    # JPEG compression: values are close to the rescaled value (1000 / 65535 * 255)
+    assert data[128:, 0:128].min() > 0
@@ -0,0 +1,167 @@
+"""Test titiler.core.seed."""
+
+import json
+import os
+import sqlite3
+
+import pytest
+from fastapi import FastAPI
+from morecantile import tms
+from starlette.testclient import TestClient
+
+from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
+from titiler.core.factory import MBTilesFactory, TilerFactory
+from titiler.core.seed import (
+    DirectoryWriter,
+    MBTilesWriter,
+    TileSeeder,
+    import_factory,
+    main,
+)
+
+from .conftest import DATA_DIR
+
+COG = os.path.join(DATA_DIR, "cog.tif")
+
+# Factory used by the seeding processes
+cog = TilerFactory()
+
+
+def test_import_factory():
+    """Should import factory."""
+    assert import_factory("tests.test_seed:cog") is cog
+
+    with pytest.raises(ValueError):
+        import_factory("tests.test_seed")
+
+    with pytest.raises(ValueError):
+        import_factory("tests.test_seed:COG")
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_seed_mbtiles(processes, tmp_path):
+    """Should render tiles in a MBTiles archive and resume."""
+    seeder = TileSeeder(
+        "tests.test_seed:cog",
+        params=[("url", COG), ("rescale", "0,1000")],
+        processes=processes,
+    )
+    bounds = seeder.tilejson()["bounds"]
+    tiles = list(seeder.tiles(6, 8, bounds))
+    # One tile outside the dataset
+    tiles.append(seeder.tms.tile(0, 0, 8))
+
+    path = str(tmp_path / "cog.mbtiles")
+    wm = tms.get("WebMercatorQuad")
+    with MBTilesWriter(path, tms=wm, metadata={"format": "png"}) as writer:
+        stats = seeder.run(writer, tiles)
+
+    assert stats == {
+        "rendered": len(tiles) - 1,
+        "skipped": 0,
+        "empty": 1,
+        "failed": 0,
+    }
+
+    with sqlite3.connect(path) as db:
+        (count,) = db.execute("SELECT count(*) FROM tiles").fetchone()
+        assert count == len(tiles) - 1
+        # rows are stored with a bottom-left origin
+        tile = tiles[0]
+        (data,) = db.execute(
+            "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+            (tile.z, tile.x, 2**tile.z - 1 - tile.y),
+        ).fetchone()
+
+    client = TestClient(_app(cog))
+    response = client.get(
+        f"/tiles/WebMercatorQuad/{tile.z}/{tile.x}/{tile.y}.png",
+        params={"url": COG, "rescale": "0,1000"},
+    )
+    assert response.content == bytes(data)
+
+    # Resume
+    with MBTilesWriter(path, tms=wm) as writer:
+        stats = seeder.run(writer, tiles)
+
+    assert stats["skipped"] == len(tiles) - 1
+    assert stats["rendered"] == 0
+
+
+def test_seed_directory(tmp_path):
+    """Should render tiles in a directory."""
+    seeder = TileSeeder(
+        "tests.test_seed:cog",
+        tile_format="webp",
+        params=[("url", COG)],
+    )
+    tiles = list(seeder.tiles(7, 7, seeder.tilejson()["bounds"]))
+
+    writer = DirectoryWriter(str(tmp_path), extension="webp")
+    stats = seeder.run(writer, tiles)
+    assert stats["rendered"] == len(tiles)
+    for tile in tiles:
+        assert (tmp_path / str(tile.z) / str(tile.x) / f"{tile.y}.webp").exists()
+
+    assert writer.done() == {(t.z, t.x, t.y) for t in tiles}
+
+    # Tile endpoint errors
+    seeder = TileSeeder("tests.test_seed:cog", params=[("url", "not_a_file.tif")])
+    stats = seeder.run(DirectoryWriter(str(tmp_path / "errors"), "png"), tiles)
+    assert stats["failed"] == len(tiles)
+
+
+def test_seed_cli(tmp_path, capsys):
+    """Should seed tiles using the dataset's TileJSON."""
+    path = str(tmp_path / "cog.mbtiles")
+    assert (
+        main(
+            [
+                "tests.test_seed:cog",
+                path,
+                "--query",
+                f"url={COG}&rescale=0,1000",
+                "--maxzoom",
+                "6",
+                "--processes",
+                "1",
+            ]
+        )
+        == 0
+    )
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["rendered"] > 0
+    assert stats["failed"] == 0
+
+    mbtiles = MBTilesFactory(src_path=path)
+    assert mbtiles.metadata()["minzoom"] == "5"
+    # one connection per thread
+    assert mbtiles._connect() is mbtiles._connect()
+
+    client = TestClient(_app(mbtiles))
+
+    response = client.get("/tilejson.json")
+    assert response.status_code == 200
+    tilejson = response.json()
+    assert tilejson["minzoom"] == 5
+    assert tilejson["maxzoom"] == 6
+    assert tilejson["tiles"][0].endswith("/tiles/{z}/{x}/{y}")
+
+    with sqlite3.connect(path) as db:
+        z, x, row = db.execute(
+            "SELECT zoom_level, tile_column, tile_row FROM tiles"
+        ).fetchone()
+
+    response = client.get(f"/tiles/{z}/{x}/{2**z - 1 - row}")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/png"
+
+    response = client.get("/tiles/6/0/0")
+    assert response.status_code == 404
+
+
+def _app(factory) -> FastAPI:
+    app = FastAPI()
+    app.include_router(factory.router)
+    add_exception_handlers(app, DEFAULT_STATUS_CODES)
+    return app
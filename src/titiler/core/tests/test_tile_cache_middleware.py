@@ -0,0 +1,185 @@
+"""Test titiler.core.middleware.TileCacheMiddleware."""
+
+import os
+import time
+
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from titiler.core.cache import (
+    CachedResponse,
+    FileResponseCache,
+    KeyValueResponseCache,
+    MemoryResponseCache,
+)
+from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
+from titiler.core.factory import TilerFactory
+from titiler.core.middleware import TileCacheMiddleware, canonical_request_key
+
+from .conftest import DATA_DIR
+
+COG = os.path.join(DATA_DIR, "cog.tif")
+
+
+class DictClient:
+    """Local stand-in for a Key/Value store client."""
+
+    def __init__(self):
+        """Init store."""
+        self.store = {}
+
+    def get(self, name):
+        """Get value."""
+        value, expires = self.store.get(name, (None, None))
+        if expires is not None and expires < time.time():
+            return None
+        return value
+
+    def set(self, name, value, ex=None):
+        """Set value."""
+        self.store[name] = (value, time.time() + ex if ex else None)
+
+
+def test_canonical_request_key():
+    """Should create the same key for equivalent requests."""
+
+    def scope(path, query=b"", headers=None):
+        return {
+            "type": "http",
+            "method": "GET",
+            "path": path,
+            "query_string": query,
+            "headers": headers or [],
+        }
+
+    assert canonical_request_key(
+        scope("/tiles/1/2/3.png", b"url=a.tif&Rescale=0,10")
+    ) == canonical_request_key(scope("/tiles/1/2/3.png", b"rescale=0,10&url=a.tif"))
+
+    # values are case-sensitive
+    assert canonical_request_key(
+        scope("/tiles/1/2/3.png", b"url=A.tif")
+    ) != canonical_request_key(scope("/tiles/1/2/3.png", b"url=a.tif"))
+
+    # Accept header is only used when the path has no extension
+    png = [(b"accept", b"image/png")]
+    jpeg = [(b"accept", b"image/jpeg")]
+    assert canonical_request_key(
+        scope("/tiles/1/2/3.png", headers=png)
+    ) == canonical_request_key(scope("/tiles/1/2/3.png", headers=jpeg))
+    assert canonical_request_key(
+        scope("/tiles/1/2/3", headers=png)
+    ) != canonical_request_key(scope("/tiles/1/2/3", headers=jpeg))
+
+
+@pytest.mark.parametrize(
+    "cache",
+    [
+        lambda tmp_path: MemoryResponseCache(),
+        lambda tmp_path: FileResponseCache(directory=str(tmp_path)),
+        lambda tmp_path: KeyValueResponseCache(client=DictClient(), ttl=60),
+    ],
+)
+def test_tile_cache_middleware(cache, tmp_path):
+    """Should cache image responses."""
+    cache = cache(tmp_path)
+
+    endpoints = TilerFactory()
+    app = FastAPI()
+    app.include_router(endpoints.router)
+    add_exception_handlers(app, DEFAULT_STATUS_CODES)
+    app.add_middleware(TileCacheMiddleware, cache=cache)
+    client = TestClient(app)
+
+    response = client.get(f"/tiles/WebMercatorQuad/8/87/48.png?url={COG}")
+    assert response.status_code == 200
+    assert response.headers["x-cache"] == "MISS"
+    body = response.content
+    headers = response.headers
+
+    response = client.get(f"/tiles/WebMercatorQuad/8/87/48.png?URL={COG}")
+    assert response.status_code == 200
+    assert response.headers["x-cache"] == "HIT"
+    assert response.content == body
+    assert response.headers["content-type"] == "image/png"
+    assert response.headers["content-bbox"] == headers["content-bbox"]
+    assert response.headers["content-crs"] == headers["content-crs"]
+
+    # Not an image
+    response = client.get(f"/info?url={COG}")
+    assert response.status_code == 200
+    assert "x-cache" not in response.headers
+
+    # Errors are not cached
+    response = client.get(f"/tiles/WebMercatorQuad/8/0/0.png?url={COG}")
+    assert response.status_code == 404
+    assert "x-cache" not in response.headers
+
+    # Requests with credentials are not cached
+    for headers in [{"Authorization": "Bearer token"}, {"Cookie": "session=1"}]:
+        response = client.get(
+            f"/tiles/WebMercatorQuad/8/87/48.png?url={COG}", headers=headers
+        )
+        assert response.status_code == 200
+        assert "x-cache" not in response.headers
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+
+
+class BrokenClient:
+    """Unreachable Key/Value store."""
+
+    def get(self, name):
+        """Get value."""
+        raise ConnectionError("connection refused")
+
+    def set(self, name, value, ex=None):
+        """Set value."""
+        raise ConnectionError("connection refused")
+
+
+def test_tile_cache_middleware_backend_error():
+    """Should handle cache backend errors as cache misses."""
+    endpoints = TilerFactory()
+    app = FastAPI()
+    app.include_router(endpoints.router)
+    app.add_middleware(
+        TileCacheMiddleware, cache=KeyValueResponseCache(client=BrokenClient())
+    )
+    client = TestClient(app)
+
+    for _ in range(2):
+        response = client.get(f"/tiles/WebMercatorQuad/8/87/48.png?url={COG}")
+        assert response.status_code == 200
+        assert response.headers["x-cache"] == "MISS"
+
+
+def test_memory_response_cache_maxbytes():
+    """Should evict responses when reaching maxbytes."""
+    cache = MemoryResponseCache(maxbytes=100)
+    cache.set("a", CachedResponse(200, [], b"0" * 60))
+    cache.set("b", CachedResponse(200, [], b"0" * 60))
+    assert cache.get("a") is None
+    assert cache.get("b")
+    assert cache.stats()["nbytes"] == 60
+
+    # Bigger than maxbytes
+    cache.set("c", CachedResponse(200, [], b"0" * 200))
+    assert cache.get("c") is None
+    assert cache.get("b")
+
+
+def test_file_response_cache_ttl(tmp_path):
+    """Should expire responses."""
+    cache = FileResponseCache(directory=str(tmp_path), ttl=60)
+    response = CachedResponse(200, [(b"content-type", b"image/png")], b"data")
+    cache.set("a", response)
+    assert cache.get("a") == response
+
+    path = cache.path("a")
+    assert path.startswith(str(tmp_path))
+    os.utime(path, (time.time() - 120, time.time() - 120))
+    assert cache.get("a") is None
+    assert not os.path.exists(path)
@@ -0,0 +1,54 @@
+"""Test titiler.core.warmup."""
+
+import gc
+import pathlib
+
+import morecantile
+from morecantile.defaults import TileMatrixSets, default_tms
+from rio_tiler.colormap import ColorMaps, cmap
+
+from titiler.core.algorithm import algorithms
+from titiler.core.dependencies import create_colormap_dependency
+from titiler.core.warmup import warmup
+
+
+def test_warmup():
+    """Should materialize the registries."""
+    supported_tms = TileMatrixSets(
+        {
+            "WebMercatorQuad": default_tms["WebMercatorQuad"],
+            "WGS1984Quad": default_tms["WGS1984Quad"],
+        }
+    )
+    supported_colormaps = ColorMaps(
+        {name: cmap.data[name] for name in ["viridis", "cfastie", "rplumbo"]}
+    )
+    colormap_dependency = create_colormap_dependency(supported_colormaps)
+
+    report = warmup(
+        supported_tms=supported_tms,
+        supported_colormaps=supported_colormaps,
+        supported_algorithms=algorithms,
+        colormap_dependencies=[colormap_dependency],
+    )
+    assert report["tilematrixsets"]["count"] == 2
+    assert report["colormaps"]["count"] == 3
+    assert report["algorithms"]["count"] == len(algorithms.list())
+    assert report["duration"] >= report["colormaps"]["duration"]
+    assert gc.get_freeze_count() == 0
+
+    # TMS are parsed and the cached properties are copied with the TMS
+    for tms in supported_tms.tilematrixsets.values():
+        assert isinstance(tms, morecantile.TileMatrixSet)
+        assert "xy_bbox" in tms.__dict__
+
+    assert "rasterio_crs" in supported_tms.get("WGS1984Quad").__dict__
+
+    # Colormaps are loaded and compiled
+    assert not any(
+        isinstance(c, pathlib.Path | str) for c in supported_colormaps.data.values()
+    )
+    assert colormap_dependency.preload() == 3
+    assert colormap_dependency(colormap_name="viridis") is colormap_dependency(
+        colormap_name="viridis"
+    )
@@ -1,8 +1,9 @@
 """titiler.core.algorithm."""
 
 import json
+import re
 from copy import copy
-from typing import Annotated, Literal
+from typing import Annotated
 
 import attr
 from fastapi import HTTPException, Query
@@ -12,17 +13,33 @@ from titiler.core.algorithm.base import (  # noqa
     AlgorithmMetadata,
     AlgorithmtList,
     BaseAlgorithm,
+    ElementwiseAlgorithm,
+)
+from titiler.core.algorithm.dem import (
+    TRI,
+    Aspect,
+    Contours,
+    Curvature,
+    HillShade,
+    Roughness,
+    Slope,
+    TerrainRGB,
+    Terrarium,
 )
-from titiler.core.algorithm.dem import Contours, HillShade, Slope, TerrainRGB, Terrarium
 from titiler.core.algorithm.image import ToBitonal, ToGrayScale
 from titiler.core.algorithm.index import NormalizedIndex
 from titiler.core.algorithm.math import _Max, _Mean, _Median, _Min, _Std, _Sum, _Var
 from titiler.core.algorithm.ops import CastToInt, Ceil, Floor
+from titiler.core.algorithm.pipeline import Pipeline
 from titiler.core.validation import validate_json
 
 default_algorithms: dict[str, type[BaseAlgorithm]] = {
     "hillshade": HillShade,
     "slope": Slope,
+    "aspect": Aspect,
+    "tri": TRI,
+    "roughness": Roughness,
+    "curvature": Curvature,
     "contours": Contours,
     "normalizedIndex": NormalizedIndex,
     "terrarium": Terrarium,
@@ -73,24 +90,65 @@ class Algorithms:
 
     @property
     def dependency(self):
-        """FastAPI PostProcess dependency."""
+        """FastAPI PostProcess dependency.
+
+        Multiple algorithms can be applied one after the other with `|` separated
+        names (e.g `algorithm=terrarium|cast`), and a list of parameters (one per
+        algorithm) in `algorithm_params`.
+
+        """
+        name = "|".join(re.escape(name) for name in self.data)
+        pattern = f"^(?:{name})(?:\\|(?:{name}))*$"
 
         def post_process(
             algorithm: Annotated[
-                Literal[tuple(self.data.keys())],
-                Query(description="Algorithm name"),
+                str | None,
+                Query(
+                    description="Algorithm name, or `|` separated names of the algorithms to apply one after the other.",
+                    pattern=pattern,
+                ),
             ] = None,
             algorithm_params: Annotated[
                 str | None,
                 BeforeValidator(validate_json),
-                Query(description="Algorithm parameter"),
+                Query(
+                    description="Algorithm parameter (or list of parameters for multiple algorithms)."
+                ),
             ] = None,
         ) -> BaseAlgorithm | None:
             """Data Post-Processing options."""
-            kwargs = json.loads(algorithm_params) if algorithm_params else {}
+            kwargs = json.loads(algorithm_params) if algorithm_params else None
             if algorithm:
+                names = algorithm.split("|")
                 try:
-                    return self.get(algorithm)(**kwargs)
+                    if len(names) == 1:
+                        if not isinstance(kwargs, dict | None):
+                            raise HTTPException(
+                                status_code=400,
+                                detail="`algorithm_params` should be a JSON object.",
+                            )
+
+                        return self.get(algorithm)(**(kwargs or {}))
+
+                    params = kwargs if kwargs is not None else [None] * len(names)
+                    if not isinstance(params, list) or len(params) != len(names):
+                        raise HTTPException(
+                            status_code=400,
+                            detail=f"`algorithm_params` should be a list of {len(names)} parameters.",
+                        )
+
+                    if not all(isinstance(p, dict | None) for p in params):
+                        raise HTTPException(
+                            status_code=400,
+                            detail="Each algorithm's parameters should be a JSON object (or null).",
+                        )
+
+                    return Pipeline(
+                        steps=[
+                            self.get(name)(**(p or {}))
+                            for name, p in zip(names, params, strict=True)
+                        ]
+                    )
 
                 except ValidationError as e:
                     raise HTTPException(status_code=400, detail=str(e)) from e
@@ -3,6 +3,7 @@
 import abc
 from collections.abc import Sequence
 
+import numpy
 from pydantic import BaseModel
 from rio_tiler.models import ImageData
 
@@ -25,12 +26,59 @@ class BaseAlgorithm(BaseModel, metaclass=abc.ABCMeta):
 
     model_config = {"extra": "allow"}
 
+    @property
+    def halo(self) -> int:
+        """Number of pixels needed (and cropped) on each side of the output.
+
+        Tile and part endpoints add it to the `buffer` used to read the data.
+
+        """
+        return 0
+
     @abc.abstractmethod
     def __call__(self, img: ImageData) -> ImageData:
         """Apply algorithm"""
         ...
 
 
+class ElementwiseAlgorithm(BaseAlgorithm):
+    """Algorithm computing each pixel from the same pixel of the input bands.
+
+    Element-wise algorithms only transform the data array. When they are adjacent
+    in a `Pipeline`, they are applied one after the other on the array, without
+    creating intermediate ImageData, and can update the previous step's array in place.
+
+    """
+
+    @abc.abstractmethod
+    def apply(
+        self, data: numpy.ma.MaskedArray, inplace: bool = False
+    ) -> numpy.ma.MaskedArray:
+        """Apply algorithm on a data array.
+
+        The input array is only modified when `inplace=True` (it might still not
+        be updated in place, e.g. when the output dtype is different).
+
+        """
+        ...
+
+    def band_descriptions(self, names: list[str]) -> list[str]:
+        """Output band descriptions."""
+        return names
+
+    def __call__(self, img: ImageData) -> ImageData:
+        """Apply algorithm"""
+        return ImageData(
+            self.apply(img.array),
+            assets=img.assets,
+            crs=img.crs,
+            bounds=img.bounds,
+            band_descriptions=self.band_descriptions(img.band_descriptions),
+            metadata=img.metadata,
+            cutline_mask=img.cutline_mask,
+        )
+
+
 class AlgorithmMetadata(BaseModel):
     """Algorithm metadata."""
 
@@ -1,18 +1,79 @@
 """titiler.core.algorithm DEM."""
 
+from typing import Literal
+
 import numpy
-from pydantic import Field
+from pydantic import Field, model_validator
 from rasterio import windows
 from rio_tiler.colormap import apply_cmap, cmap
 from rio_tiler.models import ImageData
+from rio_tiler.types import BBox
 from rio_tiler.utils import linear_rescale
 
+from titiler.core.algorithm import terrain
 from titiler.core.algorithm.base import BaseAlgorithm
 
-__all__ = ["HillShade", "Slope", "Contours", "Terrarium", "TerrainRGB"]
+__all__ = [
+    "HillShade",
+    "Slope",
+    "Aspect",
+    "TRI",
+    "Roughness",
+    "Curvature",
+    "Contours",
+    "Terrarium",
+    "TerrainRGB",
+]
+
+
+def _crop_bounds(img: ImageData, buffer: int) -> BBox:
+    """Bounds of the image cropped by `buffer` pixels on each side."""
+    if not buffer:
+        return img.bounds
+
+    window = windows.Window(
+        col_off=buffer,
+        row_off=buffer,
+        width=img.width - 2 * buffer,
+        height=img.height - 2 * buffer,
+    )
+    return windows.bounds(window, img.transform)
+
+
+class _TerrainAlgorithm(BaseAlgorithm):
+    """Terrain analysis base class (3x3 window algorithms)."""
+
+    # parameters
+    buffer: int = Field(
+        1, ge=0, le=99, description="Number of pixels cropped on each side"
+    )
+
+    # metadata
+    input_nbands: int = 1
+    output_nbands: int = 1
+    output_dtype: str = "float32"
+
+    @property
+    def halo(self) -> int:
+        """Number of pixels cropped on each side."""
+        return self.buffer
+
+    def _image(
+        self, img: ImageData, data: numpy.ndarray, mask: numpy.ndarray, name: str
+    ) -> ImageData:
+        """Create output image."""
+        return ImageData(
+            numpy.ma.MaskedArray(
+                data.astype(self.output_dtype, copy=False)[None], mask=mask[None]
+            ),
+            assets=img.assets,
+            crs=img.crs,
+            bounds=_crop_bounds(img, self.buffer),
+            band_descriptions=[name],
+        )
 
 
-class HillShade(BaseAlgorithm):
+class HillShade(_TerrainAlgorithm):
     """Hillshade."""
 
     title: str = "Hillshade"
@@ -21,101 +82,143 @@ class HillShade(BaseAlgorithm):
     # parameters
     azimuth: int = Field(45, ge=0, le=360)
     angle_altitude: float = Field(45.0, ge=-90.0, le=90.0)
-    buffer: int = Field(3, ge=0, le=99)
     z_exaggeration: float = Field(1.0, ge=1e-6, le=1e6)
+    multidirectional: bool = Field(
+        False,
+        description="Combine hillshades from multiple azimuths (`azimuth` is ignored).",
+    )
 
     # metadata
-    input_nbands: int = 1
-    output_nbands: int = 1
     output_dtype: str = "uint8"
 
     def __call__(self, img: ImageData) -> ImageData:
         """Create hillshade from DEM dataset."""
-        x, y = numpy.gradient(img.array[0])
-        x *= self.z_exaggeration
-        y *= self.z_exaggeration
-        slope = numpy.pi / 2.0 - numpy.arctan(numpy.sqrt(x * x + y * y))
-        aspect = numpy.arctan2(-x, y)
-        azimuth = 360.0 - self.azimuth
-        azimuthrad = numpy.deg2rad(azimuth)
-        altituderad = numpy.deg2rad(self.angle_altitude)
-        shaded = numpy.sin(altituderad) * numpy.sin(slope) + numpy.cos(
-            altituderad
-        ) * numpy.cos(slope) * numpy.cos(azimuthrad - aspect)
-        data = 255 * (shaded + 1) / 2
-        data[data < 0] = 0  # set hillshade values to min of 0.
-
-        bounds = img.bounds
-        if self.buffer:
-            data = data[self.buffer : -self.buffer, self.buffer : -self.buffer]
-
-            window = windows.Window(
-                col_off=self.buffer,
-                row_off=self.buffer,
-                width=data.shape[1],
-                height=data.shape[0],
+        z, mask = terrain.neighborhood(img, self.buffer)
+        drow, dcol = terrain.gradient(z)
+        if self.z_exaggeration != 1.0:
+            drow *= self.z_exaggeration
+            dcol *= self.z_exaggeration
+
+        if self.multidirectional:
+            data = terrain.multidirectional_hillshade(
+                drow, dcol, altitude=self.angle_altitude
+            )
+        else:
+            data = terrain.hillshade(
+                drow, dcol, azimuth=self.azimuth, altitude=self.angle_altitude
             )
-            bounds = windows.bounds(window, img.transform)
 
-        return ImageData(
-            data.astype(self.output_dtype),
-            assets=img.assets,
-            crs=img.crs,
-            bounds=bounds,
-            band_descriptions=["hillshade"],
-        )
+        return self._image(img, data, terrain.stencil_mask(mask), "hillshade")
 
 
-class Slope(BaseAlgorithm):
+class Slope(_TerrainAlgorithm):
     """Slope calculation."""
 
     title: str = "Slope"
-    description: str = "Calculate degrees of slope from DEM dataset."
+    description: str = "Calculate degrees (or percent) of slope from DEM dataset."
 
     # parameters
-    buffer: int = Field(3, ge=0, le=99, description="Buffer size for edge effects")
     z_exaggeration: float = Field(1.0, ge=1e-6, le=1e6)
+    unit: Literal["degrees", "percent"] = "degrees"
 
     # metadata
-    input_nbands: int = 1
-    output_nbands: int = 1
-    output_dtype: str = "float32"
     output_min: list[float] = [0.0]
-    output_max: list[float] = [90.0]
+    output_max: list[float] | None = [90.0]
+
+    @model_validator(mode="after")
+    def percent_range(self):
+        """Slope in percent has no maximum."""
+        if self.unit == "percent":
+            self.output_max = None
+
+        return self
 
     def __call__(self, img: ImageData) -> ImageData:
         """Calculate degrees slope from DEM dataset."""
-        # Get the pixel size from the transform
-        pixel_size_x = abs(img.transform[0])
-        pixel_size_y = abs(img.transform[4])
-
-        x, y = numpy.gradient(img.array[0])
-        x *= self.z_exaggeration
-        y *= self.z_exaggeration
-        dx = x / pixel_size_x
-        dy = y / pixel_size_y
-
-        slope = numpy.rad2deg(numpy.arctan(numpy.sqrt(dx * dx + dy * dy)))
-
-        bounds = img.bounds
-        if self.buffer:
-            slope = slope[self.buffer : -self.buffer, self.buffer : -self.buffer]
-
-            window = windows.Window(
-                col_off=self.buffer,
-                row_off=self.buffer,
-                width=slope.shape[1],
-                height=slope.shape[0],
-            )
-            bounds = windows.bounds(window, img.transform)
+        z, mask = terrain.neighborhood(img, self.buffer)
+        drow, dcol = terrain.gradient(
+            z, xres=abs(img.transform[0]), yres=abs(img.transform[4])
+        )
+        if self.z_exaggeration != 1.0:
+            drow *= self.z_exaggeration
+            dcol *= self.z_exaggeration
 
-        return ImageData(
-            slope.astype(self.output_dtype),
-            assets=img.assets,
-            crs=img.crs,
-            bounds=bounds,
-            band_descriptions=["slope"],
+        data = terrain.slope(drow, dcol, percent=self.unit == "percent")
+        return self._image(img, data, terrain.stencil_mask(mask), "slope")
+
+
+class Aspect(_TerrainAlgorithm):
+    """Aspect calculation."""
+
+    title: str = "Aspect"
+    description: str = "Calculate the direction of the slope (degrees clockwise from north) from DEM dataset."
+
+    # metadata
+    output_min: list[float] = [0.0]
+    output_max: list[float] = [360.0]
+
+    def __call__(self, img: ImageData) -> ImageData:
+        """Calculate aspect from DEM dataset."""
+        z, mask = terrain.neighborhood(img, self.buffer)
+        drow, dcol = terrain.gradient(z)
+        mask = terrain.stencil_mask(mask)
+        mask |= (drow == 0) & (dcol == 0)
+
+        data = terrain.aspect(drow, dcol)
+        return self._image(img, data, mask, "aspect")
+
+
+class TRI(_TerrainAlgorithm):
+    """Terrain Ruggedness Index."""
+
+    title: str = "Terrain Ruggedness Index"
+    description: str = (
+        "Calculate the Terrain Ruggedness Index (Riley) from DEM dataset."
+    )
+
+    # metadata
+    output_min: list[float] = [0.0]
+
+    def __call__(self, img: ImageData) -> ImageData:
+        """Calculate TRI from DEM dataset."""
+        z, mask = terrain.neighborhood(img, self.buffer)
+        data = terrain.tri(z)
+        return self._image(img, data, terrain.stencil_mask(mask, diagonal=True), "tri")
+
+
+class Roughness(_TerrainAlgorithm):
+    """Roughness."""
+
+    title: str = "Roughness"
+    description: str = (
+        "Calculate the largest elevation difference in a 3x3 window from DEM dataset."
+    )
+
+    # metadata
+    output_min: list[float] = [0.0]
+
+    def __call__(self, img: ImageData) -> ImageData:
+        """Calculate roughness from DEM dataset."""
+        z, mask = terrain.neighborhood(img, self.buffer)
+        data = terrain.roughness(z)
+        return self._image(
+            img, data, terrain.stencil_mask(mask, diagonal=True), "roughness"
+        )
+
+
+class Curvature(_TerrainAlgorithm):
+    """Curvature."""
+
+    title: str = "Curvature"
+    description: str = "Calculate the curvature (positive values are upwardly convex) from DEM dataset."
+
+    def __call__(self, img: ImageData) -> ImageData:
+        """Calculate curvature from DEM dataset."""
+        z, mask = terrain.neighborhood(img, self.buffer)
+        data = terrain.curvature(
+            z, xres=abs(img.transform[0]), yres=abs(img.transform[4])
         )
+        return self._image(img, data, terrain.stencil_mask(mask), "curvature")
 
 
 class Contours(BaseAlgorithm):
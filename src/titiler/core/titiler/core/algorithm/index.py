@@ -3,14 +3,13 @@
 from collections.abc import Sequence
 
 import numpy
-from rio_tiler.models import ImageData
 
-from titiler.core.algorithm.base import BaseAlgorithm
+from titiler.core.algorithm.base import ElementwiseAlgorithm
 
 __all__ = ["NormalizedIndex"]
 
 
-class NormalizedIndex(BaseAlgorithm):
+class NormalizedIndex(ElementwiseAlgorithm):
     """Normalized Difference Index."""
 
     title: str = "Normalized Difference Index"
@@ -23,18 +22,15 @@ class NormalizedIndex(BaseAlgorithm):
     output_min: Sequence[float] = [-1.0]
     output_max: Sequence[float] = [1.0]
 
-    def __call__(self, img: ImageData) -> ImageData:
+    def apply(
+        self, data: numpy.ma.MaskedArray, inplace: bool = False
+    ) -> numpy.ma.MaskedArray:
         """Normalized difference."""
-        b1 = img.array[0].astype("float32")
-        b2 = img.array[1].astype("float32")
+        b1 = data[0].astype("float32", copy=False)
+        b2 = data[1].astype("float32", copy=False)
         arr = numpy.ma.MaskedArray((b2 - b1) / (b2 + b1), dtype=self.output_dtype)
-        bnames = img.band_descriptions
-        return ImageData(
-            arr,
-            assets=img.assets,
-            crs=img.crs,
-            bounds=img.bounds,
-            band_descriptions=[
-                f"({bnames[1]} - {bnames[0]}) / ({bnames[1]} + {bnames[0]})"
-            ],
-        )
+        return arr.reshape((1, *arr.shape))
+
+    def band_descriptions(self, names: list[str]) -> list[str]:
+        """Output band descriptions."""
+        return [f"({names[1]} - {names[0]}) / ({names[1]} + {names[0]})"]
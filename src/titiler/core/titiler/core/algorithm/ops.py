@@ -3,14 +3,24 @@
 from collections.abc import Sequence
 
 import numpy
-from rio_tiler.models import ImageData
 
-from titiler.core.algorithm.base import BaseAlgorithm
+from titiler.core.algorithm.base import ElementwiseAlgorithm
 
 __all__ = ["CastToInt", "Ceil", "Floor"]
 
 
-class CastToInt(BaseAlgorithm):
+def _round(
+    func: numpy.ufunc, data: numpy.ma.MaskedArray, inplace: bool
+) -> numpy.ma.MaskedArray:
+    """Round data and cast it to uint8."""
+    if inplace and data.dtype.kind == "f":
+        func(data.data, out=data.data)
+        return data.astype("uint8")
+
+    return func(data).astype("uint8")
+
+
+class CastToInt(ElementwiseAlgorithm):
     """Cast data to Integer."""
 
     title: str = "Cast data to Integer"
@@ -21,20 +31,14 @@ class CastToInt(BaseAlgorithm):
     output_min: Sequence[int] = [0]
     output_max: Sequence[int] = [255]
 
-    def __call__(self, img: ImageData) -> ImageData:
+    def apply(
+        self, data: numpy.ma.MaskedArray, inplace: bool = False
+    ) -> numpy.ma.MaskedArray:
         """Cast Data."""
-        return ImageData(
-            img.array.astype("uint8"),
-            assets=img.assets,
-            crs=img.crs,
-            bounds=img.bounds,
-            band_descriptions=img.band_descriptions,
-            metadata=img.metadata,
-            cutline_mask=img.cutline_mask,
-        )
-
-
-class Ceil(BaseAlgorithm):
+        return data.astype("uint8")
+
+
+class Ceil(ElementwiseAlgorithm):
     """Round data to the smallest integer."""
 
     title: str = "Round data to the smallest integer"
@@ -45,20 +49,14 @@ class Ceil(BaseAlgorithm):
     output_min: Sequence[int] = [0]
     output_max: Sequence[int] = [255]
 
-    def __call__(self, img: ImageData) -> ImageData:
+    def apply(
+        self, data: numpy.ma.MaskedArray, inplace: bool = False
+    ) -> numpy.ma.MaskedArray:
         """Cast Data."""
-        return ImageData(
-            numpy.ceil(img.array).astype("uint8"),
-            assets=img.assets,
-            crs=img.crs,
-            bounds=img.bounds,
-            band_descriptions=img.band_descriptions,
-            metadata=img.metadata,
-            cutline_mask=img.cutline_mask,
-        )
-
-
-class Floor(BaseAlgorithm):
+        return _round(numpy.ceil, data, inplace)
+
+
+class Floor(ElementwiseAlgorithm):
     """Round data to the largest integer."""
 
     title: str = "Round data to the largest integer"
@@ -69,14 +67,8 @@ class Floor(BaseAlgorithm):
     output_min: Sequence[int] = [0]
     output_max: Sequence[int] = [255]
 
-    def __call__(self, img: ImageData) -> ImageData:
+    def apply(
+        self, data: numpy.ma.MaskedArray, inplace: bool = False
+    ) -> numpy.ma.MaskedArray:
         """Cast Data."""
-        return ImageData(
-            numpy.floor(img.array).astype("uint8"),
-            assets=img.assets,
-            crs=img.crs,
-            bounds=img.bounds,
-            band_descriptions=img.band_descriptions,
-            metadata=img.metadata,
-            cutline_mask=img.cutline_mask,
-        )
+        return _round(numpy.floor, data, inplace)
@@ -0,0 +1,112 @@
+"""titiler.core.algorithm Pipeline."""
+
+from collections.abc import Sequence
+
+import numpy
+from pydantic import model_validator
+from rio_tiler.models import ImageData
+
+from titiler.core.algorithm.base import BaseAlgorithm, ElementwiseAlgorithm
+
+__all__ = ["Pipeline"]
+
+
+class Pipeline(BaseAlgorithm):
+    """Apply algorithms one after the other.
+
+    The number of bands expected by each step is checked against the output of
+    the previous one, and the output dtypes are validated, when the pipeline is
+    created. Adjacent element-wise steps
+    (see `ElementwiseAlgorithm`) are applied on the data array and can update
+    the array created by the previous step in place.
+
+    """
+
+    title: str = "Pipeline"
+    description: str = "Apply algorithms one after the other."
+
+    # parameters
+    steps: list[BaseAlgorithm]
+
+    @model_validator(mode="after")
+    def check_steps(self):
+        """Check steps compatibility and set the pipeline's metadata."""
+        if not self.steps:
+            raise ValueError("Pipeline needs at least one algorithm.")
+
+        nbands = self.steps[0].input_nbands
+        dtype: str | None = None
+        vmin: Sequence | None = None
+        vmax: Sequence | None = None
+        for i, step in enumerate(self.steps):
+            if step.input_nbands is not None:
+                if nbands is not None and nbands != step.input_nbands:
+                    raise ValueError(
+                        f"Step {i} ({step.__class__.__name__}) expects {step.input_nbands} band(s) but previous step returns {nbands}."
+                    )
+
+                nbands = step.input_nbands
+
+            nbands = step.output_nbands if step.output_nbands is not None else nbands
+
+            if step.output_min is not None or step.output_max is not None:
+                vmin, vmax = step.output_min, step.output_max
+            elif step.output_dtype is not None:
+                vmin, vmax = None, None
+
+            if step.output_dtype is not None:
+                try:
+                    numpy.dtype(step.output_dtype)
+                except TypeError as e:
+                    raise ValueError(
+                        f"Step {i} ({step.__class__.__name__}) has an invalid output dtype: {step.output_dtype}."
+                    ) from e
+
+                dtype = step.output_dtype
+
+        self.input_nbands = self.steps[0].input_nbands
+        self.output_nbands = nbands
+        self.output_dtype = dtype
+        self.output_min = vmin
+        self.output_max = vmax
+
+        return self
+
+    @property
+    def halo(self) -> int:
+        """Number of pixels cropped by all the steps."""
+        return sum(step.halo for step in self.steps)
+
+    def __call__(self, img: ImageData) -> ImageData:
+        """Apply algorithms."""
+        i = 0
+        while i < len(self.steps):
+            if not isinstance(self.steps[i], ElementwiseAlgorithm):
+                img = self.steps[i](img)
+                i += 1
+                continue
+
+            # The input image's array is not modified, but the arrays
+            # created by the element-wise steps can be
+            data = img.array
+            names = img.band_descriptions
+            inplace = False
+            while i < len(self.steps) and isinstance(
+                step := self.steps[i], ElementwiseAlgorithm
+            ):
+                data = step.apply(data, inplace=inplace)
+                names = step.band_descriptions(names)
+                inplace = True
+                i += 1
+
+            img = ImageData(
+                data,
+                assets=img.assets,
+                crs=img.crs,
+                bounds=img.bounds,
+                band_descriptions=names,
+                metadata=img.metadata,
+                cutline_mask=img.cutline_mask,
+            )
+
+        return img
@@ -0,0 +1,300 @@
+"""titiler.core.algorithm terrain analysis kernels.
+
+The kernels take float32 elevation arrays with a 1 pixel halo (see `neighborhood`)
+and return float32 arrays without the halo. They use precomputed trigonometric
+constants and in-place ufuncs to limit the number of temporary arrays.
+
+When `numexpr` is installed (selected at import), the hillshade and slope
+expressions are evaluated by numexpr in one multi-threaded pass.
+
+"""
+
+import math
+from collections.abc import Sequence
+
+import numpy
+from rio_tiler.models import ImageData
+
+try:
+    import numexpr
+except ImportError:  # pragma: nocover
+    numexpr = None  # type: ignore
+
+__all__ = [
+    "neighborhood",
+    "stencil_mask",
+    "gradient",
+    "hillshade",
+    "multidirectional_hillshade",
+    "slope",
+    "aspect",
+    "tri",
+    "roughness",
+    "curvature",
+]
+
+# (row, col) offsets of the 8 neighbors in a 3x3 window
+NEIGHBORS = [(0, 0), (0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+# Azimuths used for multidirectional hillshade (same as GDAL)
+MULTIDIRECTIONAL_AZIMUTHS = [225, 270, 315, 360]
+
+
+def _shift(z: numpy.ndarray, row: int, col: int) -> numpy.ndarray:
+    """View of the (row, col) neighbor of each pixel in a 3x3 window."""
+    height, width = z.shape
+    return z[row : height - 2 + row, col : width - 2 + col]
+
+
+def neighborhood(img: ImageData, buffer: int) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """First band (float32) and mask of the image with a 1 pixel halo around the output.
+
+    The output is the image cropped by `buffer` pixels on each side. When `buffer`
+    is 0, the edges are extended by odd reflection, which gives the same one-sided
+    differences as `numpy.gradient`.
+
+    """
+    data = img.array.data[0]
+    mask = numpy.ma.getmaskarray(img.array)[0]
+    if buffer:
+        crop = slice(buffer - 1, -(buffer - 1) or None)
+        return data[crop, crop].astype("float32", copy=False), mask[crop, crop]
+
+    data = numpy.pad(
+        data.astype("float32", copy=False), 1, mode="reflect", reflect_type="odd"
+    )
+    return data, numpy.pad(mask, 1, mode="edge")
+
+
+def stencil_mask(mask: numpy.ndarray, diagonal: bool = False) -> numpy.ndarray:
+    """Mask pixels if themselves or one of their neighbors are masked.
+
+    Only the 4 direct neighbors are used, unless `diagonal=True`.
+
+    """
+    out = _shift(mask, 1, 1).copy()
+    for row, col in NEIGHBORS:
+        if diagonal or row == 1 or col == 1:
+            out |= _shift(mask, row, col)
+
+    return out
+
+
+def gradient(
+    z: numpy.ndarray, xres: float = 1.0, yres: float = 1.0
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Gradients along the rows and the columns (central differences, like `numpy.gradient`)."""
+    drow = _shift(z, 2, 1) - _shift(z, 0, 1)
+    drow *= 0.5 / yres
+    dcol = _shift(z, 1, 2) - _shift(z, 1, 0)
+    dcol *= 0.5 / xres
+    return drow, dcol
+
+
+def hillshade(
+    drow: numpy.ndarray,
+    dcol: numpy.ndarray,
+    azimuth: float = 45.0,
+    altitude: float = 45.0,
+) -> numpy.ndarray:
+    """Hillshade (0 -> 255).
+
+    `cos(zenith) * cos(slope) + sin(zenith) * sin(slope) * cos(azimuth - aspect)`
+    expanded from the gradients, which does not need any trigonometric function
+    per pixel: `(sin(alt) + cos(alt) * (cos(az) * dcol - sin(az) * drow)) / sqrt(1 + drow² + dcol²)`
+
+    """
+    azimuthrad = math.radians(360.0 - azimuth)
+    altituderad = math.radians(altitude)
+    sin_alt = math.sin(altituderad)
+    a = math.cos(altituderad) * math.cos(azimuthrad)
+    b = -math.cos(altituderad) * math.sin(azimuthrad)
+
+    if numexpr is not None:
+        shaded = numexpr.evaluate(
+            "((s + a * dcol + b * drow) / sqrt(one + drow * drow + dcol * dcol) + one) * k",
+            local_dict={
+                "drow": drow,
+                "dcol": dcol,
+                "s": numpy.float32(sin_alt),
+                "a": numpy.float32(a),
+                "b": numpy.float32(b),
+                "one": numpy.float32(1.0),
+                "k": numpy.float32(127.5),
+            },
+        )
+
+    else:
+        norm = numpy.multiply(drow, drow)
+        tmp = numpy.multiply(dcol, dcol)
+        norm += tmp
+        norm += 1.0
+        numpy.sqrt(norm, out=norm)
+
+        shaded = numpy.multiply(dcol, a)
+        numpy.multiply(drow, b, out=tmp)
+        shaded += tmp
+        shaded += sin_alt
+        shaded /= norm
+
+        # 255 * (shaded + 1) / 2
+        shaded += 1.0
+        shaded *= 127.5
+
+    numpy.maximum(shaded, 0.0, out=shaded)
+    return shaded
+
+
+def multidirectional_hillshade(
+    drow: numpy.ndarray,
+    dcol: numpy.ndarray,
+    altitude: float = 45.0,
+    azimuths: Sequence[float] = MULTIDIRECTIONAL_AZIMUTHS,
+) -> numpy.ndarray:
+    """Multidirectional hillshade (0 -> 255).
+
+    Combination of the hillshades from multiple azimuths, weighted by
+    `sin²(aspect - azimuth)` (Mark, 1992), so every slope is lit from the side.
+
+    """
+    altituderad = math.radians(altitude)
+    sin_alt = math.sin(altituderad)
+    cos_alt = math.cos(altituderad)
+
+    # squared gradient norm
+    g2 = numpy.multiply(drow, drow)
+    tmp = numpy.multiply(dcol, dcol)
+    g2 += tmp
+    flat = g2 == 0
+
+    shaded = numpy.zeros_like(g2)
+    weights = numpy.zeros_like(g2)
+    q = numpy.empty_like(g2)
+    w = numpy.empty_like(g2)
+    for azimuth in azimuths:
+        azimuthrad = math.radians(360.0 - azimuth)
+
+        # q = gradient norm * cos(azimuth - aspect)
+        numpy.multiply(dcol, math.cos(azimuthrad), out=q)
+        numpy.multiply(drow, math.sin(azimuthrad), out=tmp)
+        q -= tmp
+
+        # w = sin²(azimuth - aspect) = 1 - q² / g2 (1 for flat pixels)
+        numpy.multiply(q, q, out=w)
+        numpy.divide(w, g2, out=w, where=~flat)
+        numpy.subtract(1.0, w, out=w)
+        weights += w
+
+        q *= cos_alt
+        q += sin_alt
+        q *= w
+        shaded += q
+
+    shaded /= weights
+
+    g2 += 1.0
+    numpy.sqrt(g2, out=g2)
+    shaded /= g2
+
+    shaded += 1.0
+    shaded *= 127.5
+    numpy.maximum(shaded, 0.0, out=shaded)
+    return shaded
+
+
+def slope(
+    drow: numpy.ndarray, dcol: numpy.ndarray, percent: bool = False
+) -> numpy.ndarray:
+    """Slope in degrees (0 -> 90) or in percent."""
+    if numexpr is not None:
+        expr = "sqrt(drow * drow + dcol * dcol) * k"
+        if not percent:
+            expr = "arctan(sqrt(drow * drow + dcol * dcol)) * k"
+
+        return numexpr.evaluate(
+            expr,
+            local_dict={
+                "drow": drow,
+                "dcol": dcol,
+                "k": numpy.float32(100.0 if percent else 180.0 / math.pi),
+            },
+        )
+
+    out = numpy.multiply(drow, drow)
+    out += numpy.multiply(dcol, dcol)
+    numpy.sqrt(out, out=out)
+    if percent:
+        out *= 100.0
+        return out
+
+    numpy.arctan(out, out=out)
+    return numpy.rad2deg(out, out=out)
+
+
+def aspect(drow: numpy.ndarray, dcol: numpy.ndarray) -> numpy.ndarray:
+    """Direction of the slope in degrees, clockwise from north (0 -> 360).
+
+    Rows are expected to go from north to south. Flat pixels return `0`.
+
+    """
+    # downslope vector: (east, north) = (-dcol, drow)
+    out = numpy.arctan2(numpy.negative(dcol), drow)
+    numpy.rad2deg(out, out=out)
+    out += 360.0
+    return numpy.mod(out, 360.0, out=out)
+
+
+def tri(z: numpy.ndarray) -> numpy.ndarray:
+    """Terrain Ruggedness Index (Riley et al., 1999).
+
+    Square root of the sum of the squared differences between a pixel and its 8 neighbors.
+
+    """
+    center = _shift(z, 1, 1)
+    out = numpy.zeros(center.shape, dtype="float32")
+    tmp = numpy.empty_like(out)
+    for row, col in NEIGHBORS:
+        numpy.subtract(_shift(z, row, col), center, out=tmp)
+        tmp *= tmp
+        out += tmp
+
+    return numpy.sqrt(out, out=out)
+
+
+def roughness(z: numpy.ndarray) -> numpy.ndarray:
+    """Roughness: largest elevation difference in the 3x3 window of each pixel."""
+    center = _shift(z, 1, 1)
+    vmax = center.copy()
+    vmin = center.copy()
+    for row, col in NEIGHBORS:
+        neighbor = _shift(z, row, col)
+        numpy.maximum(vmax, neighbor, out=vmax)
+        numpy.minimum(vmin, neighbor, out=vmin)
+
+    vmax -= vmin
+    return vmax
+
+
+def curvature(z: numpy.ndarray, xres: float = 1.0, yres: float = 1.0) -> numpy.ndarray:
+    """Curvature (Zevenbergen & Thorne, 1987).
+
+    `-2 * (D + E) * 100`, with `D` and `E` the second derivatives along the rows and
+    the columns. Positive values are upwardly convex.
+
+    """
+    center = _shift(z, 1, 1)
+
+    # E * yres²
+    e = _shift(z, 0, 1) + _shift(z, 2, 1)
+    e *= 0.5
+    e -= center
+
+    # D * xres²
+    d = _shift(z, 1, 0) + _shift(z, 1, 2)
+    d *= 0.5
+    d -= center
+
+    d *= -200.0 / (xres * xres)
+    e *= -200.0 / (yres * yres)
+    d += e
+    return d
@@ -0,0 +1,558 @@
+"""titiler.core caches."""
+
+from __future__ import annotations
+
+import abc
+import hashlib
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from typing import Any, ClassVar, Generic, Protocol, TypeVar
+
+from attrs import define, field
+from pydantic import BaseModel
+from rasterio.errors import RasterioError
+from rio_tiler.io import BaseReader, MultiBaseReader
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+_MODEL_KEY = "_titiler_cache_key"
+
+
+def freeze(value: Any) -> Hashable:
+    """Convert a value to a hashable representation usable as a cache key."""
+    if isinstance(value, dict):
+        return tuple(
+            sorted(((str(k), freeze(v)) for k, v in value.items()), key=lambda i: i[0])
+        )
+
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset(freeze(v) for v in value)
+
+    if isinstance(value, BaseModel):
+        # The key is stored in the model's `__dict__` (like cached properties),
+        # so it is only computed once and is kept by the copies of the model
+        # (e.g TileMatrixSets.get returns a copy of the registered TMS).
+        # Models should then not be modified after being used in a key.
+        key = value.__dict__.get(_MODEL_KEY)
+        if key is None:
+            key = (type(value).__name__, value.model_dump_json())
+            value.__dict__[_MODEL_KEY] = key
+
+        return key
+
+    try:
+        hash(value)
+        return value
+    except TypeError:
+        return repr(value)
+
+
+def _sizeof(value: Any) -> int:
+    """Default size of a cached item."""
+    return len(value)
+
+
+@define
+class LRUCache(Generic[K, V]):
+    """Thread-safe Least Recently Used cache with optional Time To Live.
+
+    Attributes:
+        maxsize (int): Maximum number of items in the cache.
+        ttl (float, optional): Number of seconds an item stays valid after being set.
+        on_evict (Callable, optional): Function called with `(key, value)` when an item is evicted or expires.
+        maxbytes (int, optional): Maximum size (in bytes) of the items in the cache.
+        getsizeof (Callable, optional): Function returning the size of an item. Defaults to `len`.
+
+    """
+
+    maxsize: int | None = 128
+    ttl: float | None = None
+    on_evict: Callable[[K, V], None] | None = None
+    maxbytes: int | None = None
+    getsizeof: Callable[[V], int] = field(default=_sizeof)
+
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    evictions: int = field(init=False, default=0)
+    nbytes: int = field(init=False, default=0)
+
+    _data: OrderedDict = field(init=False, factory=OrderedDict)
+    _lock: threading.RLock = field(init=False, factory=threading.RLock)
+
+    def _size(self, value: V) -> int:
+        return self.getsizeof(value) if self.maxbytes is not None else 0
+
+    def _full(self) -> bool:
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            return True
+
+        return self.maxbytes is not None and self.nbytes > self.maxbytes
+
+    def _evict(self, key: K, value: V):
+        self.evictions += 1
+        if self.on_evict is not None:
+            try:
+                self.on_evict(key, value)
+            except Exception as e:  # noqa
+                logger.warning(f"Error while evicting {key} from cache: {e}")
+
+    def get(self, key: K, default: V | None = None) -> V | None:
+        """Get item from the cache."""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+
+            value, expires, size = item
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                self.nbytes -= size
+                self._evict(key, value)
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: K, value: V):
+        """Add item to the cache."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        size = self._size(value)
+        with self._lock:
+            if self.maxbytes is not None and size > self.maxbytes:
+                # the item can't be cached, but the previous value is outdated
+                if (item := self._data.pop(key, None)) is not None:
+                    self.nbytes -= item[2]
+
+                return
+
+            if key in self._data:
+                self.nbytes -= self._data[key][2]
+                self._data.move_to_end(key)
+
+            self._data[key] = (value, expires, size)
+            self.nbytes += size
+            while self._full():
+                k, (v, _, s) = self._data.popitem(last=False)
+                self.nbytes -= s
+                self._evict(k, v)
+
+    def pop(self, key: K, default: V | None = None) -> V | None:
+        """Remove item from the cache (without calling `on_evict`)."""
+        with self._lock:
+            item = self._data.pop(key, None)
+            if item is None:
+                return default
+
+            self.nbytes -= item[2]
+            return item[0]
+
+    def clear(self):
+        """Evict all items."""
+        with self._lock:
+            while self._data:
+                k, (v, _, _) = self._data.popitem(last=False)
+                self._evict(k, v)
+
+            self.nbytes = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "nbytes": self.nbytes,
+                "maxbytes": self.maxbytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def items(self) -> list[tuple[K, V]]:
+        """List items in the cache (from least to most recently used)."""
+        with self._lock:
+            return [(key, item[0]) for key, item in self._data.items()]
+
+    def __len__(self) -> int:
+        """Number of items in the cache."""
+        return len(self._data)
+
+    def __contains__(self, key: Any) -> bool:
+        """Check if key is in the cache (without updating its position)."""
+        return key in self._data
+
+
+def _close(src_dst: Any):
+    """Close a Reader instance."""
+    src_dst.__exit__(None, None, None)
+
+
+@define
+class ReaderCache:
+    """Cache of opened Reader instances.
+
+    GDAL dataset handles are not thread-safe, so a Reader instance is never
+    shared between concurrent requests: instances are *checked out* of the
+    cache for the duration of a request and returned to it afterward. When
+    multiple requests read the same dataset at the same time, multiple
+    instances are created and all of them are kept (up to `maxsize`).
+
+    Readers are identified by the reader class, the input path, the reader
+    options and the GDAL environment used to open the dataset.
+
+    Attributes:
+        maxsize (int): Maximum number of idle Reader instances to keep. Defaults to `32`.
+        ttl (float, optional): Number of seconds an idle Reader instance stays valid. Defaults to `300`.
+
+    """
+
+    maxsize: int = 32
+    ttl: float | None = 300
+
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    evictions: int = field(init=False, default=0)
+
+    _idle: OrderedDict = field(init=False, factory=OrderedDict)
+    _size: int = field(init=False, default=0)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def _checkout(self, key: Hashable) -> Any | None:
+        """Get an idle reader for key."""
+        to_close = []
+        src_dst = None
+        now = time.monotonic()
+        with self._lock:
+            instances = self._idle.get(key)
+            while instances:
+                reader, expires = instances.pop()
+                self._size -= 1
+                if expires is not None and expires < now:
+                    self.evictions += 1
+                    to_close.append(reader)
+                    continue
+
+                src_dst = reader
+                break
+
+            if key in self._idle and not self._idle[key]:
+                del self._idle[key]
+
+            if src_dst is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        for reader in to_close:
+            _close(reader)
+
+        return src_dst
+
+    def _release(self, key: Hashable, src_dst: Any):
+        """Return reader to the idle pool."""
+        to_close = []
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._idle.setdefault(key, []).append((src_dst, expires))
+            self._idle.move_to_end(key)
+            self._size += 1
+
+            while self._size > self.maxsize:
+                oldest_key = next(iter(self._idle))
+                instances = self._idle[oldest_key]
+                reader, _ = instances.pop(0)
+                if not instances:
+                    del self._idle[oldest_key]
+
+                self._size -= 1
+                self.evictions += 1
+                to_close.append(reader)
+
+        for reader in to_close:
+            _close(reader)
+
+    @contextmanager
+    def open(
+        self,
+        reader: type[BaseReader] | type[MultiBaseReader],
+        src_path: Any,
+        env: dict | None = None,
+        **kwargs: Any,
+    ) -> Iterator[Any]:
+        """Get a Reader instance from the cache or create a new one."""
+        key = (reader, freeze(src_path), freeze(kwargs), freeze(env or {}))
+
+        src_dst = self._checkout(key)
+        if src_dst is None:
+            src_dst = reader(src_path, **kwargs)
+
+        try:
+            yield src_dst
+
+        # If rasterio raised an error, the dataset handle might be
+        # in a bad state so we don't want to keep it.
+        except RasterioError:
+            _close(src_dst)
+            raise
+
+        except BaseException:
+            self._release(key, src_dst)
+            raise
+
+        else:
+            self._release(key, src_dst)
+
+    def clear(self):
+        """Close all idle readers."""
+        with self._lock:
+            instances = [
+                reader for readers in self._idle.values() for (reader, _) in readers
+            ]
+            self._idle.clear()
+            self._size = 0
+
+        for reader in instances:
+            _close(reader)
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                "size": self._size,
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+@define(frozen=True)
+class CachedResponse:
+    """Encoded HTTP response."""
+
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+    def dumps(self) -> bytes:
+        """Serialize response to bytes."""
+        meta = json.dumps(
+            {
+                "status": self.status,
+                "headers": [
+                    [k.decode("latin-1"), v.decode("latin-1")] for k, v in self.headers
+                ],
+            }
+        ).encode()
+        return struct.pack("<I", len(meta)) + meta + self.body
+
+    @classmethod
+    def loads(cls, data: bytes) -> CachedResponse:
+        """Deserialize response from bytes."""
+        (size,) = struct.unpack("<I", data[:4])
+        meta = json.loads(data[4 : 4 + size])
+        return cls(
+            status=meta["status"],
+            headers=[
+                (k.encode("latin-1"), v.encode("latin-1")) for k, v in meta["headers"]
+            ],
+            body=data[4 + size :],
+        )
+
+    def __len__(self) -> int:
+        """Approximate size of the response in memory."""
+        return len(self.body) + sum(len(k) + len(v) for k, v in self.headers)
+
+
+@define
+class BaseResponseCache(metaclass=abc.ABCMeta):
+    """Response Cache backend.
+
+    Backends with blocking operations (I/O) should set `blocking = True`, so that
+    the middleware runs them in a threadpool.
+
+    """
+
+    blocking: ClassVar[bool] = True
+
+    @abc.abstractmethod
+    def get(self, key: str) -> CachedResponse | None:
+        """Get response from the cache."""
+        ...
+
+    @abc.abstractmethod
+    def set(self, key: str, value: CachedResponse):
+        """Add response to the cache."""
+        ...
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        return {}
+
+
+@define
+class MemoryResponseCache(BaseResponseCache):
+    """In-process LRU response cache, bounded by its size in bytes.
+
+    Attributes:
+        maxbytes (int): Maximum size of the cached responses. Defaults to 64MB.
+        ttl (float, optional): Number of seconds a response stays valid.
+
+    """
+
+    maxbytes: int = 64 * 1024 * 1024
+    ttl: float | None = None
+
+    blocking: ClassVar[bool] = False
+    _cache: LRUCache[str, CachedResponse] = field(init=False)
+
+    def __attrs_post_init__(self):
+        """Create LRU Cache."""
+        self._cache = LRUCache(maxsize=None, maxbytes=self.maxbytes, ttl=self.ttl)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get response from the cache."""
+        return self._cache.get(key)
+
+    def set(self, key: str, value: CachedResponse):
+        """Add response to the cache."""
+        self._cache.set(key, value)
+
+    def clear(self):
+        """Remove all responses."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        return self._cache.stats()
+
+
+@define
+class FileResponseCache(BaseResponseCache):
+    """On-disk response cache.
+
+    Responses are stored in a sharded directory tree
+    (`{directory}/{hash[:2]}/{hash[2:4]}/{hash}`) to avoid too many files in one directory.
+
+    Attributes:
+        directory (str): Cache root directory.
+        ttl (float, optional): Number of seconds a response stays valid (based on file modification time).
+
+    """
+
+    directory: str
+    ttl: float | None = None
+
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+
+    def path(self, key: str) -> str:
+        """Get file path for a key."""
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, digest[:2], digest[2:4], digest)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get response from the cache."""
+        path = self.path(key)
+        try:
+            if self.ttl is not None and os.path.getmtime(path) + self.ttl < time.time():
+                os.remove(path)
+                self.misses += 1
+                return None
+
+            with open(path, "rb") as f:
+                data = f.read()
+
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return CachedResponse.loads(data)
+
+    def set(self, key: str, value: CachedResponse):
+        """Add response to the cache."""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write in a temporary file first so readers never see partial files
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(value.dumps())
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        return {"hits": self.hits, "misses": self.misses}
+
+
+class KeyValueClient(Protocol):
+    """Minimal Key/Value store client interface (e.g `redis.Redis`)."""
+
+    def get(self, name: str) -> bytes | None:
+        """Get value."""
+        ...
+
+    def set(self, name: str, value: bytes, ex: int | None = None) -> Any:
+        """Set value with an optional expiration time (in seconds)."""
+        ...
+
+
+@define
+class KeyValueResponseCache(BaseResponseCache):
+    """External Key/Value store response cache.
+
+    Works with any client implementing `get(name)` and `set(name, value, ex=None)` (e.g `redis.Redis`).
+
+    Attributes:
+        client (KeyValueClient): Key/Value store client.
+        prefix (str): Prefix to add to the keys. Defaults to `titiler:`.
+        ttl (int, optional): Number of seconds a response stays valid.
+
+    """
+
+    client: KeyValueClient
+    prefix: str = "titiler:"
+    ttl: int | None = None
+
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+
+    def get(self, key: str) -> CachedResponse | None:
+        """Get response from the cache."""
+        data = self.client.get(self.prefix + key)
+        if data is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return CachedResponse.loads(data)
+
+    def set(self, key: str, value: CachedResponse):
+        """Add response to the cache."""
+        self.client.set(self.prefix + key, value.dumps(), ex=self.ttl)
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        return {"hits": self.hits, "misses": self.misses}
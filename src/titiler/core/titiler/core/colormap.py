@@ -0,0 +1,223 @@
+"""Compiled colormaps."""
+
+import abc
+import warnings
+from collections.abc import Sequence
+
+import numpy
+from rio_tiler.colormap import apply_cmap
+from rio_tiler.errors import InvalidFormat
+from rio_tiler.types import ColorMapType, DataMaskType
+
+
+def _cast_values(values: Sequence, dtype: numpy.dtype) -> numpy.ndarray:
+    """Cast colormap keys or breakpoints to the type used to compare them with the data.
+
+    Python scalars are `weakly` typed when compared with a numpy array (NEP 50):
+    they are compared using the array's float type, while integers arrays are compared
+    with floats using `float64`.
+    """
+    if numpy.issubdtype(dtype, numpy.floating):
+        return numpy.array(values, dtype=dtype)
+
+    if all(isinstance(v, int) for v in values):
+        return numpy.array(values, dtype="int64")
+
+    return numpy.array(values, dtype="float64")
+
+
+def _colors(colors: Sequence) -> numpy.ndarray:
+    """Create a (n, 4) uint8 array of RGBA colors."""
+    arr = numpy.zeros((len(colors), 4), dtype="uint8")
+    for i, color in enumerate(colors):
+        arr[i] = numpy.array(color)
+
+    return arr
+
+
+def _apply(table: numpy.ndarray, indexes: numpy.ndarray) -> DataMaskType:
+    """Create RGB and Alpha arrays from a (4, n) colors table."""
+    data = numpy.take(table, indexes, axis=1)
+    return data[:-1], data[-1]
+
+
+class LUTColorMap(dict):
+    """GDAL Color Table (256 entries) compiled to a (256, 4) lookup table."""
+
+    def __init__(self, colormap: dict):
+        """Create the lookup table."""
+        super().__init__(colormap)
+        lut = numpy.zeros((256, 4), dtype="uint8")
+        for i, color in colormap.items():
+            lut[int(i)] = numpy.array(color)
+
+        # (4, 256) contiguous table, so indexing returns a (4, h, w) array
+        self.table = numpy.ascontiguousarray(lut.T)
+
+    @property
+    def lut(self) -> numpy.ndarray:
+        """(256, 4) lookup table."""
+        return self.table.T
+
+    def apply(self, data: numpy.ndarray) -> DataMaskType:
+        """Apply colormap on data."""
+        if data.dtype != numpy.uint8:
+            warnings.warn(
+                f"Input array is of type {data.dtype} and `will be converted to Int in order to apply the ColorMap.",
+                UserWarning,
+                stacklevel=2,
+            )
+            data = data.astype(numpy.uint8)
+
+        return _apply(self.table, data[0])
+
+
+class _SortedColorMap(metaclass=abc.ABCMeta):
+    """Colormap applied with a binary search in sorted keys or breakpoints."""
+
+    colors: numpy.ndarray
+
+    def __init__(self, *args, **kwargs):
+        """Create the colors table."""
+        super().__init__(*args, **kwargs)
+        self._tables: dict[numpy.dtype, tuple[numpy.ndarray, numpy.ndarray]] = {}
+        self._luts: dict[numpy.dtype, numpy.ndarray] = {}
+
+    @abc.abstractmethod
+    def _table(self, dtype: numpy.dtype) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Sorted values and (4, n + 1) colors table for a data type."""
+        ...
+
+    @abc.abstractmethod
+    def _indexes(self, values: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Colors table and column indexes for values."""
+        ...
+
+    def apply(self, data: numpy.ndarray) -> DataMaskType:
+        """Apply colormap on data."""
+        dtype = data.dtype
+        if dtype.kind in "ui" and dtype.itemsize <= 2:
+            # 8 and 16 bits integers: lookup table with the colors of every values
+            udtype = numpy.dtype(f"uint{dtype.itemsize * 8}")
+            if dtype not in self._luts:
+                values = numpy.arange(2 ** (dtype.itemsize * 8), dtype=udtype)
+                table, indexes = self._indexes(values.view(dtype))
+                self._luts[dtype] = numpy.take(table, indexes, axis=1)
+
+            return _apply(self._luts[dtype], data[0].view(udtype))
+
+        return _apply(*self._indexes(data[0]))
+
+
+class DiscreteColorMap(_SortedColorMap, dict):
+    """Discrete ColorMap compiled to sorted keys."""
+
+    def __init__(self, colormap: dict):
+        """Create the colors table."""
+        super().__init__(colormap)
+        self.colors = _colors(list(colormap.values()))
+
+    def _table(self, dtype: numpy.dtype) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Sorted keys and (4, n + 1) colors table for a data type."""
+        if dtype not in self._tables:
+            keys = _cast_values(list(self.keys()), dtype)
+            # Last color wins when keys are equal once casted
+            keys, last = numpy.unique(keys[::-1], return_index=True)
+            last = len(self) - 1 - last
+            # Last column is used for values not in the colormap
+            table = numpy.zeros((4, len(keys) + 1), dtype="uint8")
+            table[:, :-1] = self.colors[last].T
+            self._tables[dtype] = (keys, table)
+
+        return self._tables[dtype]
+
+    def _indexes(self, values: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Colors table and column indexes for values."""
+        keys, table = self._table(values.dtype)
+        indexes = numpy.searchsorted(keys, values).clip(max=len(keys) - 1)
+        indexes[keys[indexes] != values] = len(keys)
+        return table, indexes
+
+
+class IntervalsColorMap(_SortedColorMap, list):
+    """Intervals ColorMap compiled to sorted breakpoints."""
+
+    def __init__(self, colormap: Sequence):
+        """Create the colors table."""
+        super().__init__(colormap)
+        self.colors = _colors([color for _, color in colormap])
+
+    def _table(self, dtype: numpy.dtype) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Sorted breakpoints and (4, n + 1) colors table for a data type.
+
+        Values between breakpoints `i` and `i + 1` have the color of the last
+        interval covering `[breaks[i], breaks[i + 1])`.
+        """
+        if dtype not in self._tables:
+            bounds = _cast_values([v for (k, _) in self for v in k[:2]], dtype)
+            breaks = numpy.unique(bounds)
+            edges = numpy.searchsorted(breaks, bounds).reshape(-1, 2)
+
+            # Last two columns are used for values outside the breakpoints
+            table = numpy.zeros((4, len(breaks) + 1), dtype="uint8")
+            for (start, stop), color in zip(edges, self.colors, strict=True):
+                table[:, start:stop] = color[:, None]
+
+            self._tables[dtype] = (breaks, table)
+
+        return self._tables[dtype]
+
+    def _indexes(self, values: numpy.ndarray) -> tuple[numpy.ndarray, numpy.ndarray]:
+        """Colors table and column indexes for values."""
+        breaks, table = self._table(values.dtype)
+        # values lower than the first breakpoint get index -1 (last column)
+        return table, numpy.searchsorted(breaks, values, side="right") - 1
+
+
+CompiledColorMap = LUTColorMap | DiscreteColorMap | IntervalsColorMap
+
+
+def compile_colormap(colormap: ColorMapType) -> ColorMapType:
+    """Compile a colormap to a numpy lookup table or sorted breakpoints.
+
+    The compiled colormap is still a `dict` (or `list` for intervals), so it can be
+    used anywhere a rio-tiler ColorMap is expected. If the colormap cannot be compiled
+    (e.g invalid colors), it is returned unchanged.
+    """
+    if isinstance(colormap, CompiledColorMap) or not colormap:
+        return colormap
+
+    try:
+        if isinstance(colormap, Sequence):
+            return IntervalsColorMap(colormap)
+
+        if (
+            len(colormap) != 256
+            or max(colormap) >= 256
+            or min(colormap) < 0
+            or any(isinstance(k, float) for k in colormap)
+        ):
+            return DiscreteColorMap(colormap)
+
+        return LUTColorMap(colormap)
+
+    except (ValueError, TypeError):
+        return colormap
+
+
+def apply_colormap(data: numpy.ndarray, colormap: ColorMapType) -> DataMaskType:
+    """Apply colormap on data.
+
+    Same output as `rio_tiler.colormap.apply_cmap`, using a single lookup for
+    compiled colormaps.
+    """
+    if data.shape[0] > 1:
+        raise InvalidFormat("Source data must be 1 band")
+
+    if not isinstance(colormap, CompiledColorMap):
+        colormap = compile_colormap(colormap)
+
+    if isinstance(colormap, CompiledColorMap):
+        return colormap.apply(data)
+
+    return apply_cmap(data, colormap)
@@ -0,0 +1,382 @@
+"""titiler.core vector contours.
+
+Isolines are created with a marching squares pass on the pixel centers, joined
+into lines, simplified (Douglas-Peucker) and encoded as Mapbox Vector Tile or
+GeoJSON features.
+
+"""
+
+import math
+import struct
+from collections.abc import Sequence
+
+import numpy
+from rasterio.crs import CRS
+from rasterio.transform import Affine
+from rasterio.warp import transform as transform_coords
+from rio_tiler.constants import WGS84_CRS
+
+__all__ = [
+    "contour_levels",
+    "isolines",
+    "simplify",
+    "encode_mvt",
+    "to_geojson",
+]
+
+# Cell edges: top (0), right (1), bottom (2), left (3)
+# Segments (pair of crossed edges) for each marching squares case, with the case
+# index built from the corners above the level: tl (1), tr (2), br (4), bl (8).
+# Saddles (5 and 10) are resolved with the cell's center value.
+SEGMENTS: dict[int, list[tuple[int, int]]] = {
+    1: [(3, 0)],
+    2: [(0, 1)],
+    3: [(3, 1)],
+    4: [(1, 2)],
+    6: [(0, 2)],
+    7: [(3, 2)],
+    8: [(2, 3)],
+    9: [(0, 2)],
+    11: [(1, 2)],
+    12: [(3, 1)],
+    13: [(0, 1)],
+    14: [(3, 0)],
+}
+SADDLES: dict[int, tuple[list[tuple[int, int]], list[tuple[int, int]]]] = {
+    # (center above the level, center below the level)
+    5: ([(0, 1), (2, 3)], [(3, 0), (1, 2)]),
+    10: ([(3, 0), (1, 2)], [(0, 1), (2, 3)]),
+}
+
+# Mapbox Vector Tile geometry commands
+MVT_MOVE_TO = 1
+MVT_LINE_TO = 2
+MVT_LINESTRING = 2
+
+
+def contour_levels(
+    vmin: float, vmax: float, interval: float, base: float = 0.0
+) -> numpy.ndarray:
+    """Contour levels (`base + n * interval`) between vmin and vmax."""
+    start = math.ceil((vmin - base) / interval)
+    stop = math.floor((vmax - base) / interval)
+    return base + interval * numpy.arange(start, stop + 1, dtype="float64")
+
+
+def _edge_points(
+    data: numpy.ndarray,
+    level: float,
+    rows: numpy.ndarray,
+    cols: numpy.ndarray,
+    edge: int,
+) -> tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Interpolated crossing point (x, y) and unique key of a cell edge."""
+    width = data.shape[1]
+    if edge == 0:  # top
+        r0, c0, r1, c1 = rows, cols, rows, cols + 1
+    elif edge == 1:  # right
+        r0, c0, r1, c1 = rows, cols + 1, rows + 1, cols + 1
+    elif edge == 2:  # bottom
+        r0, c0, r1, c1 = rows + 1, cols, rows + 1, cols + 1
+    else:  # left
+        r0, c0, r1, c1 = rows, cols, rows + 1, cols
+
+    v0 = data[r0, c0]
+    t = (level - v0) / (data[r1, c1] - v0)
+    # pixel centers are at (col + 0.5, row + 0.5)
+    x = c0 + 0.5 + t * (c1 - c0)
+    y = r0 + 0.5 + t * (r1 - r0)
+
+    # horizontal edges have even keys, vertical edges odd keys
+    key = 2 * (r0 * width + c0) + (c0 == c1)
+    return x, y, key
+
+
+def _join(starts: list[int], ends: list[int]) -> list[list[int]]:
+    """Join segments (pairs of edge keys) into lines."""
+    neighbors: dict[int, list[int]] = {}
+    for a, b in zip(starts, ends):
+        neighbors.setdefault(a, []).append(b)
+        neighbors.setdefault(b, []).append(a)
+
+    lines = []
+    visited: set[int] = set()
+    # open lines start from an end point, then only rings are left
+    ends_first = [k for k, n in neighbors.items() if len(n) == 1]
+    for start in ends_first + list(neighbors):
+        if start in visited:
+            continue
+
+        line = [start]
+        visited.add(start)
+        current = start
+        while True:
+            following = [k for k in neighbors[current] if k not in visited]
+            if not following:
+                if len(line) > 2 and start in neighbors[current]:
+                    line.append(start)
+                break
+
+            current = following[0]
+            visited.add(current)
+            line.append(current)
+
+        lines.append(line)
+
+    return lines
+
+
+def isolines(
+    data: numpy.ndarray,
+    levels: Sequence[float],
+    mask: numpy.ndarray | None = None,
+) -> dict[float, list[numpy.ndarray]]:
+    """Create isolines from a 2D array with marching squares.
+
+    Args:
+        data (numpy.ndarray): 2D array.
+        levels (sequence of float): Values of the isolines.
+        mask (numpy.ndarray, optional): 2D boolean array, `True` for invalid pixels.
+
+    Returns:
+        dict: lines, as (N, 2) arrays of `(x, y)` coordinates in pixel space, for each level.
+
+    """
+    data = numpy.asarray(data, dtype="float64")
+    valid = numpy.ones((data.shape[0] - 1, data.shape[1] - 1), dtype="bool")
+    if mask is not None:
+        valid &= ~(mask[:-1, :-1] | mask[:-1, 1:] | mask[1:, 1:] | mask[1:, :-1])
+
+    output: dict[float, list[numpy.ndarray]] = {}
+    for level in levels:
+        above = data >= level
+        case = (
+            above[:-1, :-1] * numpy.uint8(1)
+            + above[:-1, 1:] * numpy.uint8(2)
+            + above[1:, 1:] * numpy.uint8(4)
+            + above[1:, :-1] * numpy.uint8(8)
+        )
+        rows, cols = numpy.nonzero(valid & (case != 0) & (case != 15))
+        if not len(rows):
+            continue
+
+        cases = case[rows, cols]
+
+        segments: list[tuple[numpy.ndarray, numpy.ndarray, int, int]] = []
+        for idx, pairs in SEGMENTS.items():
+            sel = cases == idx
+            if sel.any():
+                segments.extend((rows[sel], cols[sel], a, b) for a, b in pairs)
+
+        for idx, (center_above, center_below) in SADDLES.items():
+            sel = cases == idx
+            if not sel.any():
+                continue
+
+            r, c = rows[sel], cols[sel]
+            center = (
+                data[r, c] + data[r, c + 1] + data[r + 1, c] + data[r + 1, c + 1]
+            ) / 4
+            ca = center >= level
+            segments.extend((r[ca], c[ca], a, b) for a, b in center_above)
+            segments.extend((r[~ca], c[~ca], a, b) for a, b in center_below)
+
+        xs, ys, keys, starts, ends = [], [], [], [], []
+        for r, c, a, b in segments:
+            xa, ya, ka = _edge_points(data, level, r, c, a)
+            xb, yb, kb = _edge_points(data, level, r, c, b)
+            xs.extend([xa, xb])
+            ys.extend([ya, yb])
+            keys.extend([ka, kb])
+            starts.append(ka)
+            ends.append(kb)
+
+        all_keys = numpy.concatenate(keys)
+        points = numpy.stack([numpy.concatenate(xs), numpy.concatenate(ys)], axis=1)
+        index = dict(zip(all_keys.tolist(), range(len(all_keys))))
+
+        output[float(level)] = [
+            points[[index[k] for k in line]]
+            for line in _join(
+                numpy.concatenate(starts).tolist(), numpy.concatenate(ends).tolist()
+            )
+            if len(line) > 1
+        ]
+
+    return output
+
+
+def simplify(line: numpy.ndarray, tolerance: float) -> numpy.ndarray:
+    """Simplify a line with the Douglas-Peucker algorithm."""
+    if tolerance <= 0 or len(line) < 3:
+        return line
+
+    keep = numpy.zeros(len(line), dtype="bool")
+    keep[0] = keep[-1] = True
+
+    stack = [(0, len(line) - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+
+        start, end = line[first], line[last]
+        points = line[first + 1 : last]
+        dx, dy = end - start
+        norm = math.hypot(dx, dy)
+        if norm == 0:
+            # closed ring: distance to the start point
+            dist = numpy.hypot(*(points - start).T)
+        else:
+            dist = numpy.abs(
+                dx * (start[1] - points[:, 1]) - dy * (start[0] - points[:, 0])
+            )
+            dist /= norm
+
+        i = int(numpy.argmax(dist))
+        if dist[i] > tolerance:
+            i += first + 1
+            keep[i] = True
+            stack.extend([(first, i), (i, last)])
+
+    return line[keep]
+
+
+def _varint(value: int) -> bytes:
+    """Encode protobuf varint."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def _key(number: int, wire_type: int) -> bytes:
+    """Encode protobuf field key."""
+    return _varint((number << 3) | wire_type)
+
+
+def _message(number: int, data: bytes) -> bytes:
+    """Encode protobuf length-delimited field."""
+    return _key(number, 2) + _varint(len(data)) + data
+
+
+def _packed(number: int, values: Sequence[int]) -> bytes:
+    """Encode protobuf packed repeated varint field."""
+    return _message(number, b"".join(_varint(v) for v in values))
+
+
+def _zigzag(value: int) -> int:
+    """Zigzag encoding of signed integer."""
+    return (value << 1) ^ (value >> 31)
+
+
+def _mvt_geometry(lines: Sequence[numpy.ndarray]) -> list[int]:
+    """Encode lines as MVT geometry commands."""
+    commands: list[int] = []
+    cx, cy = 0, 0
+    for line in lines:
+        coords = numpy.rint(line).astype("int64")
+        # remove repeated points
+        repeated = numpy.all(coords[1:] == coords[:-1], axis=1)
+        coords = coords[numpy.concatenate([[True], ~repeated])]
+        if len(coords) < 2:
+            continue
+
+        for i, (x, y) in enumerate(coords.tolist()):
+            if i == 0:
+                commands.append((1 << 3) | MVT_MOVE_TO)
+            elif i == 1:
+                commands.append(((len(coords) - 1) << 3) | MVT_LINE_TO)
+
+            commands.extend([_zigzag(x - cx), _zigzag(y - cy)])
+            cx, cy = x, y
+
+    return commands
+
+
+def encode_mvt(
+    features: dict[float, list[numpy.ndarray]],
+    layer_name: str = "contours",
+    property_name: str = "elevation",
+    extent: int = 4096,
+) -> bytes:
+    """Encode isolines as a Mapbox Vector Tile (one MultiLineString feature per level).
+
+    Lines coordinates are expected in the tile's `extent` space.
+
+    """
+    feats = []
+    values: list[bytes] = []
+    for fid, (level, lines) in enumerate(features.items()):
+        geometry = _mvt_geometry(lines)
+        if not geometry:
+            continue
+
+        feats.append(
+            _key(1, 0)
+            + _varint(fid + 1)
+            + _packed(2, [0, len(values)])
+            + _key(3, 0)
+            + _varint(MVT_LINESTRING)
+            + _packed(4, geometry)
+        )
+        values.append(_message(4, _key(3, 1) + struct.pack("<d", level)))
+
+    if not feats:
+        return b""
+
+    layer = (
+        _key(15, 0)
+        + _varint(2)
+        + _message(1, layer_name.encode())
+        + b"".join(_message(2, f) for f in feats)
+        + _message(3, property_name.encode())
+        + b"".join(values)
+        + _key(5, 0)
+        + _varint(extent)
+    )
+    return _message(3, layer)
+
+
+def to_geojson(
+    features: dict[float, list[numpy.ndarray]],
+    transform: Affine,
+    crs: CRS,
+    property_name: str = "elevation",
+    dst_crs: CRS = WGS84_CRS,
+    precision: int = 6,
+) -> dict:
+    """Convert isolines to a GeoJSON FeatureCollection (one MultiLineString per level).
+
+    Lines coordinates are expected in the pixel space of the array `transform`.
+
+    """
+    feats = []
+    for level, lines in features.items():
+        if not lines:
+            continue
+
+        coords = numpy.concatenate(lines)
+        xs, ys = transform * (coords[:, 0], coords[:, 1])
+        if crs != dst_crs:
+            xs, ys = transform_coords(crs, dst_crs, xs, ys)
+
+        xy = numpy.round(numpy.stack([xs, ys], axis=1), precision)
+        splits = numpy.cumsum([len(line) for line in lines])[:-1]
+        feats.append(
+            {
+                "type": "Feature",
+                "geometry": {
+                    "type": "MultiLineString",
+                    "coordinates": [part.tolist() for part in numpy.split(xy, splits)],
+                },
+                "properties": {property_name: level},
+            }
+        )
+
+    return {"type": "FeatureCollection", "features": feats}
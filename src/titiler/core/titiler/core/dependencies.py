@@ -1,5 +1,6 @@
 """Common dependency."""
 
+import functools
 import json
 from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
@@ -13,9 +14,16 @@ from rasterio.crs import CRS
 from rio_tiler.colormap import ColorMaps
 from rio_tiler.colormap import cmap as default_cmap
 from rio_tiler.colormap import parse_color
-from rio_tiler.types import AssetType, AssetWithOptions, RIOResampling, WarpResampling
+from rio_tiler.types import (
+    AssetType,
+    AssetWithOptions,
+    ColorMapType,
+    RIOResampling,
+    WarpResampling,
+)
 from starlette.requests import Request
 
+from titiler.core.colormap import compile_colormap
 from titiler.core.resources.enums import ImageType, MediaType
 from titiler.core.utils import accept_media_type
 from titiler.core.validation import (
@@ -27,8 +35,33 @@ from titiler.core.validation import (
 )
 
 
-def create_colormap_dependency(cmap: ColorMaps) -> Callable:
-    """Create Colormap Dependency."""
+def create_colormap_dependency(cmap: ColorMaps, maxsize: int = 128) -> Callable:
+    """Create Colormap Dependency.
+
+    Colormaps are compiled (see `titiler.core.colormap.compile_colormap`) and cached,
+    by name and by custom colormap JSON (up to `maxsize` entries). Returned colormaps
+    are shared between requests and should not be modified.
+
+    All the registered colormaps can be compiled ahead of the first request with the
+    dependency's `preload()` method (see `titiler.core.warmup`).
+    """
+
+    @functools.lru_cache(maxsize=None)
+    def _get(name: str) -> ColorMapType:
+        return compile_colormap(cmap.get(name))
+
+    @functools.lru_cache(maxsize=maxsize)
+    def _parse(colormap: str) -> ColorMapType:
+        c = json.loads(
+            colormap,
+            object_hook=lambda x: {int(k): parse_color(v) for k, v in x.items()},
+        )
+
+        # Make sure to match colormap type
+        if isinstance(c, Sequence):
+            c = [(tuple(inter), parse_color(v)) for (inter, v) in c]
+
+        return compile_colormap(c)
 
     def deps(
         colormap_name: Annotated[  # type: ignore
@@ -40,22 +73,11 @@ def create_colormap_dependency(cmap: ColorMaps) -> Callable:
         ] = None,
     ):
         if colormap_name:
-            return cmap.get(colormap_name)
+            return _get(colormap_name)
 
         if colormap:
             try:
-                c = json.loads(
-                    colormap,
-                    object_hook=lambda x: {
-                        int(k): parse_color(v) for k, v in x.items()
-                    },
-                )
-
-                # Make sure to match colormap type
-                if isinstance(c, Sequence):
-                    c = [(tuple(inter), parse_color(v)) for (inter, v) in c]
-
-                return c
+                return _parse(colormap)
             except json.JSONDecodeError as e:
                 raise HTTPException(
                     status_code=400, detail="Could not parse the colormap value."
@@ -63,6 +85,16 @@ def create_colormap_dependency(cmap: ColorMaps) -> Callable:
 
         return None
 
+    def preload() -> int:
+        """Compile all the registered colormaps."""
+        names = cmap.list()
+        for name in names:
+            _get(name)
+
+        return len(names)
+
+    deps.preload = preload  # type: ignore [attr-defined]
+
     return deps
 
 
@@ -284,6 +316,12 @@ class DatasetParams(DefaultDependency):
 RescaleType = list[tuple[float, float]]
 
 
+@functools.lru_cache(maxsize=512)
+def _parse_rescale(value: str) -> tuple[float, ...]:
+    """Parse `min,max` rescale value (cached)."""
+    return tuple(map(float, value.split(",")))
+
+
 @dataclass
 class RenderingParams(DefaultDependency):
     """Image Rendering options."""
@@ -312,12 +350,7 @@ class RenderingParams(DefaultDependency):
         if self.rescale:
             rescale_array = []
             for r in self.rescale:
-                parsed = tuple(
-                    map(
-                        float,
-                        r.split(","),
-                    )
-                )
+                parsed = _parse_rescale(r)
                 assert len(parsed) == 2, (
                     f"Invalid rescale values: {self.rescale}, should be of form ['min,max', 'min,max'] or [[min,max], [min, max]]"
                 )
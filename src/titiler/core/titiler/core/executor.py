@@ -0,0 +1,208 @@
+"""titiler.core endpoint executor."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import functools
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from attrs import define, field
+from fastapi import HTTPException
+from starlette import status
+
+
+@define
+class EndpointExecutor:
+    """Dedicated ThreadPool executor for blocking endpoints.
+
+    By default, FastAPI runs `def` endpoints in Starlette's shared threadpool
+    (40 threads), meaning slow read (e.g. from S3) for tile requests can starve
+    every other endpoints. Endpoints wrapped with the `EndpointExecutor` become
+    `async` and their blocking work is sent to the executor's own threadpool.
+
+    When the number of pending calls (running + queued) reaches `max_workers + max_queue_size`,
+    new calls are rejected with a `503 Service Unavailable` response and a `Retry-After` header.
+
+    Attributes:
+        max_workers (int, optional): Number of threads. Defaults to ThreadPoolExecutor's default.
+        max_queue_size (int, optional): Maximum number of calls waiting for a thread. Defaults to `None` (no limit).
+        retry_after (int): Value of the `Retry-After` header (in seconds) set when the executor is saturated. Defaults to `1`.
+        thread_name_prefix (str): ThreadPool threads name prefix.
+
+    """
+
+    max_workers: int | None = None
+    max_queue_size: int | None = None
+    retry_after: int = 1
+    thread_name_prefix: str = "titiler"
+
+    pending: int = field(init=False, default=0)
+    active: int = field(init=False, default=0)
+    completed: int = field(init=False, default=0)
+    rejected: int = field(init=False, default=0)
+    cpu_time: dict[str, float] = field(init=False, factory=dict)
+
+    _pool: ThreadPoolExecutor = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self):
+        """Create the ThreadPool."""
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix=self.thread_name_prefix,
+        )
+        self.max_workers = self._pool._max_workers
+
+    def _acquire(self):
+        with self._lock:
+            if (
+                self.max_queue_size is not None
+                and self.pending >= self.max_workers + self.max_queue_size
+            ):
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Server is busy, please retry later.",
+                    headers={"Retry-After": str(self.retry_after)},
+                )
+
+            self.pending += 1
+
+    def _release(self):
+        with self._lock:
+            self.pending -= 1
+
+    def _run(self, name: str, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run function and record its CPU time."""
+        with self._lock:
+            self.active += 1
+
+        t0 = time.thread_time()
+        try:
+            return func(*args, **kwargs)
+
+        finally:
+            elapsed = time.thread_time() - t0
+            with self._lock:
+                self.active -= 1
+                self.pending -= 1
+                self.completed += 1
+                self.cpu_time[name] = self.cpu_time.get(name, 0.0) + elapsed
+
+    async def run(self, func: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run a blocking function in the executor.
+
+        The call is counted as pending until the thread returns, even when the
+        awaiting task is cancelled (e.g. client disconnect) while it is running.
+
+        """
+        self._acquire()
+        ctx = contextvars.copy_context()
+        name = getattr(func, "__name__", repr(func))
+        try:
+            future = self._pool.submit(ctx.run, self._run, name, func, *args, **kwargs)
+        except BaseException:
+            self._release()
+            raise
+
+        # calls cancelled before starting never reach `_run`
+        future.add_done_callback(lambda f: f.cancelled() and self._release())
+        return await asyncio.wrap_future(future)
+
+    def wrap(self, func: Callable) -> Callable:
+        """Wrap a blocking function into a coroutine function using the executor."""
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return await self.run(func, *args, **kwargs)
+
+        return wrapper
+
+    def stats(self) -> dict[str, Any]:
+        """Executor statistics."""
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue_size": self.max_queue_size,
+                "active": self.active,
+                "queued": self.pending - self.active,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "cpu_time": dict(self.cpu_time),
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Shutdown the ThreadPool."""
+        self._pool.shutdown(wait=wait)
+
+
+@define
+class AssetReadLimiter:
+    """Limit the number of concurrent asset reads in the process.
+
+    `MultiBaseReader` methods read each asset in a thread (up to rio-tiler's `MAX_THREADS`
+    threads per call). A limiter shared by all the requests caps the total number of
+    in-flight asset reads, so a few requests with many assets cannot exhaust the
+    connection pool. Reads waiting for a slot are blocked.
+
+    Attributes:
+        max_reads (int): Maximum number of concurrent asset reads.
+
+    """
+
+    max_reads: int
+
+    active: int = field(init=False, default=0)
+    waiting: int = field(init=False, default=0)
+    peak: int = field(init=False, default=0)
+    completed: int = field(init=False, default=0)
+
+    _semaphore: threading.BoundedSemaphore = field(init=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self):
+        """Create the Semaphore."""
+        self._semaphore = threading.BoundedSemaphore(self.max_reads)
+
+    @contextlib.contextmanager
+    def limit(self) -> Iterator[None]:
+        """Wait for a free slot and hold it."""
+        with self._lock:
+            self.waiting += 1
+
+        try:
+            self._semaphore.acquire()
+        finally:
+            with self._lock:
+                self.waiting -= 1
+
+        try:
+            with self._lock:
+                self.active += 1
+                self.peak = max(self.peak, self.active)
+
+            yield
+
+        finally:
+            with self._lock:
+                self.active -= 1
+                self.completed += 1
+
+            self._semaphore.release()
+
+    def stats(self) -> dict[str, Any]:
+        """Limiter statistics."""
+        with self._lock:
+            return {
+                "max_reads": self.max_reads,
+                "active": self.active,
+                "waiting": self.waiting,
+                "peak": self.peak,
+                "completed": self.completed,
+            }
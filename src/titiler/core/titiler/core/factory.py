@@ -2,15 +2,23 @@
 
 import abc
 import base64
+import contextlib
+import inspect
 import json
 import logging
+import math
 import os
+import sqlite3
+import threading
 import warnings
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import AbstractContextManager
 from typing import Annotated, Any, Literal
 from urllib.parse import urlencode
+from urllib.request import pathname2url
 
 import jinja2
+import morecantile
 import numpy
 import rasterio
 from attrs import define, field
@@ -22,15 +30,20 @@ from morecantile import TileMatrixSet
 from morecantile import tms as morecantile_tms
 from morecantile.defaults import TileMatrixSets
 from pydantic import Field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from rasterio.crs import CRS
+from rasterio.features import bounds as featureBounds
+from rasterio.warp import transform_bounds
 from rio_tiler.colormap import ColorMaps
 from rio_tiler.colormap import cmap as default_cmap
-from rio_tiler.constants import WGS84_CRS
+from rio_tiler.constants import MAX_THREADS, WGS84_CRS
+from rio_tiler.errors import TileOutsideBounds
 from rio_tiler.io import BaseReader, MultiBaseReader, Reader
 from rio_tiler.models import ImageData, Info
-from rio_tiler.types import ColorMapType
+from rio_tiler.types import BBox, ColorMapType
 from rio_tiler.utils import CRS_to_uri
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, Response
+from starlette.responses import HTMLResponse, Response, StreamingResponse
 from starlette.routing import Match, NoMatchFound
 from starlette.routing import Route as APIRoute
 from starlette.routing import compile_path, replace_params
@@ -43,6 +56,14 @@ from titiler.core.algorithm import (
     BaseAlgorithm,
 )
 from titiler.core.algorithm import algorithms as available_algorithms
+from titiler.core.cache import ReaderCache
+from titiler.core.contours import (
+    contour_levels,
+    encode_mvt,
+    isolines,
+    simplify,
+    to_geojson,
+)
 from titiler.core.dependencies import (
     AssetsExprParams,
     AssetsParams,
@@ -63,6 +84,9 @@ from titiler.core.dependencies import (
     StatisticsParams,
     TileParams,
 )
+from titiler.core.errors import BadRequestError
+from titiler.core.executor import AssetReadLimiter, EndpointExecutor
+from titiler.core.models.common import TileBatch
 from titiler.core.models.mapbox import TileJSON
 from titiler.core.models.OGC import TileMatrixSetList, TileSet, TileSetList
 from titiler.core.models.responses import (
@@ -76,17 +100,30 @@ from titiler.core.models.responses import (
     Statistics,
     StatisticsGeoJSON,
 )
-from titiler.core.resources.enums import ImageType, MediaType, OptionalHeader
-from titiler.core.resources.responses import GeoJSONResponse, JSONResponse
+from titiler.core.resources.enums import (
+    ImageType,
+    MediaType,
+    OptionalHeader,
+    VectorType,
+)
+from titiler.core.resources.responses import GeoJSONResponse, JSONResponse, dumps
 from titiler.core.routing import EndpointScope
 from titiler.core.telemetry import factory_trace
 from titiler.core.utils import (
     accept_media_type,
+    add_algorithm_halo,
     bounds_to_geometry,
+    clip_to_feature,
     create_html_response,
+    group_bounds,
+    media_type_to_extension,
     render_image,
+    tar_stream,
+    threaded_batch,
     tms_limits,
+    zonal_statistics,
 )
+from titiler.core.warmup import warmup_tms
 
 jinja2_env = jinja2.Environment(
     autoescape=jinja2.select_autoescape(["html"]),
@@ -94,6 +131,22 @@ jinja2_env = jinja2.Environment(
 )
 DEFAULT_TEMPLATES = Jinja2Templates(env=jinja2_env)
 
+
+class AssetReadSettings(BaseSettings):
+    """Default MultiBaseTilerFactory asset reads settings."""
+
+    concurrency: int = MAX_THREADS
+    max_reads: int = MAX_THREADS
+
+    model_config = SettingsConfigDict(
+        env_prefix="TITILER_ASSET_", env_file=".env", extra="ignore"
+    )
+
+
+asset_read_settings = AssetReadSettings()
+ASSET_THREADS = asset_read_settings.concurrency
+asset_read_limiter = AssetReadLimiter(max_reads=asset_read_settings.max_reads)
+
 img_endpoint_params: dict[str, Any] = {
     "responses": {
         200: {
@@ -135,6 +188,8 @@ class BaseFactory(metaclass=abc.ABCMeta):
         router (fastapi.APIRouter): Application router to register endpoints to.
         router_prefix (str): prefix where the router will be mounted in the application.
         route_dependencies (list): Additional routes dependencies to add after routes creations.
+        executor (titiler.core.executor.EndpointExecutor, optional): Dedicated executor to run the blocking (`def`) endpoints in.
+        executor_scopes (list, optional): Endpoints to run in the `executor`. Defaults to all the blocking endpoints.
 
     """
 
@@ -160,6 +215,10 @@ class BaseFactory(metaclass=abc.ABCMeta):
 
     enable_telemetry: bool = field(default=False)
 
+    # Run blocking endpoints in a dedicated executor instead of starlette's threadpool
+    executor: EndpointExecutor | None = field(default=None)
+    executor_scopes: list[EndpointScope] | None = field(default=None)
+
     templates: Jinja2Templates = DEFAULT_TEMPLATES
 
     def __attrs_post_init__(self):
@@ -182,6 +241,9 @@ class BaseFactory(metaclass=abc.ABCMeta):
         if self.enable_telemetry:
             self.add_telemetry()
 
+        if self.executor is not None:
+            self.add_executor(self.executor, scopes=self.executor_scopes)
+
     @abc.abstractmethod
     def register_routes(self):
         """Register Routes."""
@@ -257,6 +319,33 @@ class BaseFactory(metaclass=abc.ABCMeta):
             if isinstance(route, APIRoute):
                 route.endpoint = factory_trace(route.endpoint, factory_instance=self)
 
+    def add_executor(
+        self,
+        executor: EndpointExecutor,
+        *,
+        scopes: list[EndpointScope] | None = None,
+    ):
+        """Run blocking endpoints in a dedicated executor.
+
+        Wraps the `def` endpoints (matching `scopes` if provided) into `async`
+        functions which send the work to the executor's threadpool.
+
+        """
+        for route in self.router.routes:
+            if not isinstance(route, APIRoute):
+                continue
+
+            if inspect.iscoroutinefunction(route.endpoint):
+                continue
+
+            if scopes is not None and not any(
+                route.matches({"type": "http", **scope})[0] == Match.FULL
+                for scope in scopes
+            ):
+                continue
+
+            route.endpoint = executor.wrap(route.endpoint)
+
 
 @define(kw_only=True)
 class TilerFactory(BaseFactory):
@@ -279,11 +368,21 @@ class TilerFactory(BaseFactory):
         colormap_dependency (Callable): Endpoint dependency defining ColorMap options (e.g colormap_name).
         render_dependency (titiler.core.dependencies.DefaultDependency): Endpoint dependency defining image rendering options (e.g add_mask).
         environment_dependency (Callable): Endpoint dependency to define GDAL environment at runtime.
+        reader_cache (titiler.core.cache.ReaderCache, optional): Cache of opened reader instances, shared between endpoints.
         supported_tms (morecantile.defaults.TileMatrixSets): TileMatrixSets object holding the supported TileMatrixSets.
         templates (Jinja2Templates): Jinja2 templates.
         add_preview (bool): add `/preview` endpoints. Defaults to True.
         add_part (bool): add `/bbox` and `/feature` endpoints. Defaults to True.
         add_viewer (bool): add `/map.html` endpoints. Defaults to True.
+        add_batch (bool): add `/tiles/{tileMatrixSetId}/batch` endpoint. Defaults to False.
+        add_zonal_statistics (bool): add `POST /zonal_statistics` endpoint. Defaults to False.
+        add_contours (bool): add `/contours/{tileMatrixSetId}/{z}/{x}/{y}` vector contours endpoint. Defaults to False.
+        max_batch_tiles (int): Maximum number of tiles per batch request. Defaults to 1000.
+        batch_threads (int): Number of threads (each with its own opened dataset) used in batch requests.
+        statistics_threads (int): Number of threads (each with its own opened dataset) used in streamed `POST /statistics` requests.
+        statistics_group_size (int): Maximum size (in dataset's pixels) of the area read at once for a group of nearby features in streamed `POST /statistics` requests. Set to `0` to read each feature individually.
+        max_zonal_statistics_pixels (int): Maximum number of pixels (width x height) read at once in `POST /zonal_statistics` requests. When reading the data at full resolution, larger areas are split into groups of nearby features, otherwise a `400` error is returned. Defaults to 4096 x 4096.
+        max_contour_levels (int): Maximum number of contour levels per tile. Defaults to 1000.
 
     """
 
@@ -325,6 +424,9 @@ class TilerFactory(BaseFactory):
     # GDAL ENV dependency
     environment_dependency: Callable[..., dict] = field(default=lambda: {})
 
+    # Opened Readers cache
+    reader_cache: ReaderCache | None = field(default=None)
+
     # TileMatrixSet dependency
     supported_tms: TileMatrixSets = morecantile_tms
 
@@ -341,6 +443,23 @@ class TilerFactory(BaseFactory):
     add_part: bool = True
     add_viewer: bool = True
     add_ogc_maps: bool = False
+    add_batch: bool = False
+    add_zonal_statistics: bool = False
+    add_contours: bool = False
+
+    # Batch tiles options
+    max_batch_tiles: int = 1000
+    batch_threads: int = MAX_THREADS
+
+    # Streamed GeoJSON statistics options
+    statistics_threads: int = MAX_THREADS
+    statistics_group_size: int = 1024
+
+    # Zonal statistics options
+    max_zonal_statistics_pixels: int = 4096 * 4096
+
+    # Vector contours options
+    max_contour_levels: int = 1000
 
     conforms_to: set[str] = field(
         factory=lambda: {
@@ -365,6 +484,11 @@ class TilerFactory(BaseFactory):
         the class method and register them after the class initialization.
 
         """
+        if self.reader_cache is not None:
+            # Compute the cache keys of the registered TMS once (they are kept
+            # by the TMS copies used in the requests)
+            warmup_tms(self.supported_tms)
+
         # Default Routes
         # (/info, /statistics, /tiles, /tilejson.json, and /point)
         self.info()
@@ -386,6 +510,31 @@ class TilerFactory(BaseFactory):
         if self.add_ogc_maps:
             self.ogc_maps()
 
+        if self.add_batch:
+            self.batch()
+
+        if self.add_zonal_statistics:
+            self.zonal_statistics()
+
+        if self.add_contours:
+            self.contours()
+
+    def open_reader(
+        self,
+        src_path: Any,
+        env: dict | None = None,
+        **kwargs: Any,
+    ) -> AbstractContextManager:
+        """Open the dataset with the factory's reader.
+
+        If `reader_cache` is set, an already opened reader instance will be used if available.
+
+        """
+        if self.reader_cache is not None:
+            return self.reader_cache.open(self.reader, src_path, env=env, **kwargs)
+
+        return self.reader(src_path, **kwargs)
+
     ############################################################################
     # /info
     ############################################################################
@@ -407,7 +556,9 @@ class TilerFactory(BaseFactory):
         ):
             """Return dataset's basic info."""
             with rasterio.Env(**env):
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     return src_dst.info()
 
         @self.router.get(
@@ -431,7 +582,9 @@ class TilerFactory(BaseFactory):
         ):
             """Return dataset's basic info as a GeoJSON feature."""
             with rasterio.Env(**env):
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     bounds = src_dst.get_geographic_bounds(crs or WGS84_CRS)
                     geometry = bounds_to_geometry(bounds)
 
@@ -474,7 +627,9 @@ class TilerFactory(BaseFactory):
         ):
             """Get Dataset statistics."""
             with rasterio.Env(**env):
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     image = src_dst.preview(
                         **layer_params.as_dict(),
                         **image_params.as_dict(),
@@ -504,6 +659,7 @@ class TilerFactory(BaseFactory):
             operation_id=f"{self.operation_prefix}postStatisticsForGeoJSON",
         )
         def geojson_statistics(
+            request: Request,
             geojson: Annotated[
                 FeatureCollection | Feature,
                 Body(description="GeoJSON Feature or FeatureCollection."),
@@ -520,14 +676,61 @@ class TilerFactory(BaseFactory):
             stats_params=Depends(self.stats_dependency),
             histogram_params=Depends(self.histogram_dependency),
             env=Depends(self.environment_dependency),
+            f: Annotated[
+                Literal["geojson", "ndjson", "geojsonseq"] | None,
+                Query(
+                    description="Response MediaType. Defaults to endpoint's default or value defined in `accept` header. `ndjson` and `geojsonseq` stream the features as they are processed."
+                ),
+            ] = None,
         ):
             """Get Statistics from a geojson feature or featureCollection."""
             fc = geojson
             if isinstance(fc, Feature):
                 fc = FeatureCollection(type="FeatureCollection", features=[geojson])
 
+            if f:
+                output_type = MediaType[f]
+            else:
+                accepted_media = [
+                    MediaType.geojson,
+                    MediaType.ndjson,
+                    MediaType.geojsonseq,
+                ]
+                output_type = (
+                    accept_media_type(request.headers.get("accept", ""), accepted_media)
+                    or MediaType.geojson
+                )
+
+            if output_type in [MediaType.ndjson, MediaType.geojsonseq]:
+                features = self._stream_statistics(
+                    fc.features,
+                    src_path=src_path,
+                    env=env,
+                    reader_options=reader_params.as_dict(),
+                    shape_crs=coord_crs or WGS84_CRS,
+                    dst_crs=dst_crs,
+                    read_options={
+                        **layer_params.as_dict(),
+                        **dataset_params.as_dict(),
+                    },
+                    image_options=image_params.as_dict(),
+                    post_process=post_process,
+                    cover_scale=cover_scale,
+                    stats_options={
+                        **stats_params.as_dict(),
+                        "hist_options": histogram_params.as_dict(),
+                    },
+                )
+                prefix = "\x1e" if output_type == MediaType.geojsonseq else ""
+                return StreamingResponse(
+                    (f"{prefix}{feature}\n" for feature in features),
+                    media_type=output_type.value,
+                )
+
             with rasterio.Env(**env):
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     for feature in fc.features:
                         shape = feature.model_dump(exclude_none=True)
                         image = src_dst.feature(
@@ -561,6 +764,282 @@ class TilerFactory(BaseFactory):
 
             return fc.features[0] if isinstance(geojson, Feature) else fc
 
+    def zonal_statistics(self):
+        """Register /zonal_statistics endpoint."""
+
+        @self.router.post(
+            "/zonal_statistics",
+            response_model=StatisticsGeoJSON,
+            response_model_exclude_none=True,
+            response_class=GeoJSONResponse,
+            responses={
+                200: {
+                    "content": {"application/geo+json": {}},
+                    "description": "Return dataset's statistics from feature or featureCollection.",
+                }
+            },
+            operation_id=f"{self.operation_prefix}postZonalStatisticsForGeoJSON",
+        )
+        def geojson_zonal_statistics(
+            geojson: Annotated[
+                FeatureCollection | Feature,
+                Body(description="GeoJSON Feature or FeatureCollection."),
+            ],
+            src_path=Depends(self.path_dependency),
+            reader_params=Depends(self.reader_dependency),
+            coord_crs=Depends(CoordCRSParams),
+            dst_crs=Depends(DstCRSParams),
+            layer_params=Depends(self.layer_dependency),
+            dataset_params=Depends(self.dataset_dependency),
+            image_params=Depends(self.img_part_dependency),
+            post_process=Depends(self.process_dependency),
+            cover_scale=Depends(CoverScaleParams),
+            stats_params=Depends(self.stats_dependency),
+            histogram_params=Depends(self.histogram_dependency),
+            env=Depends(self.environment_dependency),
+        ):
+            """Get Statistics from a geojson feature or featureCollection.
+
+            The area covering all the features is read once (optionally at a
+            lower resolution using `max_size`, `height` or `width` options) and
+            the statistics for all the features are computed at once.
+
+            """
+            fc = geojson
+            if isinstance(fc, Feature):
+                fc = FeatureCollection(type="FeatureCollection", features=[geojson])
+
+            shape_crs = coord_crs or WGS84_CRS
+            shapes = [feature.model_dump(exclude_none=True) for feature in fc.features]
+            bounds = [featureBounds(shape) for shape in shapes]
+
+            stats: list[dict] = [{} for _ in shapes]
+            with rasterio.Env(**env):
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
+                    groups = self._zonal_groups(
+                        src_dst, bounds, shape_crs, image_params.as_dict()
+                    )
+                    for group in groups:
+                        image = src_dst.part(
+                            (
+                                min(bounds[ix][0] for ix in group),
+                                min(bounds[ix][1] for ix in group),
+                                max(bounds[ix][2] for ix in group),
+                                max(bounds[ix][3] for ix in group),
+                            ),
+                            dst_crs=dst_crs or shape_crs,
+                            bounds_crs=shape_crs,
+                            align_bounds_with_dataset=True,
+                            **layer_params.as_dict(),
+                            **image_params.as_dict(),
+                            **dataset_params.as_dict(),
+                        )
+
+                        if post_process:
+                            image = post_process(image)
+
+                        group_stats = zonal_statistics(
+                            image,
+                            [shapes[ix] for ix in group],
+                            shape_crs,
+                            cover_scale=cover_scale,
+                            **stats_params.as_dict(),
+                            hist_options=histogram_params.as_dict(),
+                        )
+                        for ix, feature_stats in zip(group, group_stats, strict=True):
+                            stats[ix] = feature_stats
+
+            for feature, feature_stats in zip(fc.features, stats, strict=True):
+                feature.properties = feature.properties or {}
+                feature.properties.update({"statistics": feature_stats})
+
+            return fc.features[0] if isinstance(geojson, Feature) else fc
+
+    def _zonal_groups(
+        self,
+        src_dst: BaseReader,
+        bounds: Sequence[BBox],
+        shape_crs: CRS,
+        image_options: dict,
+    ) -> list[list[int]]:
+        """Groups of features read at once in `POST /zonal_statistics` requests.
+
+        All the features are read at once, unless the area covering them is larger
+        than `max_zonal_statistics_pixels`. In that case, when reading the data at
+        full resolution, nearby features are grouped so each read stays within the
+        limit (larger features are read on their own).
+
+        """
+        everything = [list(range(len(bounds)))]
+        height = image_options.get("height")
+        width = image_options.get("width")
+        max_size = image_options.get("max_size")
+
+        if height and width:
+            npixels = height * width
+        elif max_size and not (height or width):
+            npixels = max_size * max_size
+        else:
+            transform = getattr(src_dst, "transform", None)
+            if transform is None or not src_dst.crs:
+                return everything
+
+            res_x, res_y = abs(transform.a), abs(transform.e)
+            pixel_bounds = []
+            for bbox in bounds:
+                minx, miny, maxx, maxy = transform_bounds(
+                    shape_crs, src_dst.crs, *bbox, densify_pts=21
+                )
+                pixel_bounds.append(
+                    (minx / res_x, miny / res_y, maxx / res_x, maxy / res_y)
+                )
+
+            npixels = (
+                max(b[2] for b in pixel_bounds) - min(b[0] for b in pixel_bounds)
+            ) * (max(b[3] for b in pixel_bounds) - min(b[1] for b in pixel_bounds))
+
+            # Full resolution: read groups of nearby features
+            if npixels > self.max_zonal_statistics_pixels and not (height or width):
+                return group_bounds(
+                    pixel_bounds, math.sqrt(self.max_zonal_statistics_pixels)
+                )
+
+        if npixels > self.max_zonal_statistics_pixels:
+            raise BadRequestError(
+                f"Output image size ({int(npixels)} pixels) exceeds the maximum allowed ({self.max_zonal_statistics_pixels} pixels)."
+            )
+
+        return everything
+
+    def _stream_statistics(  # noqa: C901
+        self,
+        features: Sequence[Feature],
+        *,
+        src_path: Any,
+        env: dict,
+        reader_options: dict,
+        shape_crs: Any,
+        dst_crs: Any,
+        read_options: dict,
+        image_options: dict,
+        post_process: BaseAlgorithm | None,
+        cover_scale: int,
+        stats_options: dict,
+    ) -> Iterator[str]:
+        """Compute features statistics and yield them (as JSON) as soon as they are computed.
+
+        Features are processed in parallel (`statistics_threads`). When the
+        output CRS is the dataset's CRS, nearby features are grouped and read
+        at once (`statistics_group_size`). Features are not returned in the input order.
+
+        """
+
+        def _open():
+            return self.open_reader(src_path, env=env, **reader_options)
+
+        def _statistics(image: ImageData, feature: Feature, shape: dict) -> str:
+            coverage_array = image.get_coverage_array(
+                shape,
+                shape_crs=shape_crs,
+                cover_scale=cover_scale,
+            )
+
+            if post_process:
+                image = post_process(image)
+
+            stats = image.statistics(**stats_options, coverage=coverage_array)
+            feature = feature.model_copy()
+            feature.properties = {**(feature.properties or {}), "statistics": stats}
+            return dumps(feature.model_dump(exclude_none=True))
+
+        def _error(feature: Feature, error: Exception) -> str:
+            logger.warning(f"Could not compute statistics for feature: {error}")
+            feature = feature.model_copy()
+            feature.properties = {**(feature.properties or {}), "error": str(error)}
+            return dumps(feature.model_dump(exclude_none=True))
+
+        def _group_statistics(src_dst: BaseReader, group: list[int]) -> list[str]:
+            shapes = [features[ix].model_dump(exclude_none=True) for ix in group]
+
+            # Single feature: same as non-streaming mode
+            if len(group) == 1:
+                image = src_dst.feature(
+                    shapes[0],
+                    shape_crs=shape_crs,
+                    dst_crs=dst_crs,
+                    align_bounds_with_dataset=True,
+                    **read_options,
+                    **image_options,
+                )
+                return [_statistics(image, features[group[0]], shapes[0])]
+
+            # Read the area covering all the features at once
+            bounds = [featureBounds(shape) for shape in shapes]
+            group_image = src_dst.part(
+                (
+                    min(b[0] for b in bounds),
+                    min(b[1] for b in bounds),
+                    max(b[2] for b in bounds),
+                    max(b[3] for b in bounds),
+                ),
+                dst_crs=dst_crs or shape_crs,
+                bounds_crs=shape_crs,
+                align_bounds_with_dataset=True,
+                **read_options,
+            )
+
+            results = []
+            for ix, shape in zip(group, shapes, strict=True):
+                try:
+                    image = clip_to_feature(group_image, shape, shape_crs)
+                    results.append(_statistics(image, features[ix], shape))
+                except Exception as e:  # noqa
+                    results.append(_error(features[ix], e))
+
+            return results
+
+        groups = [[ix] for ix in range(len(features))]
+        # Grouping features gives the same results as individual reads only
+        # when reading the data in its own grid (no reprojection/resampling).
+        if self.statistics_group_size and not any(image_options.values()):
+            with rasterio.Env(**env):
+                with _open() as src_dst:
+                    transform = getattr(src_dst, "transform", None)
+                    if (
+                        transform is not None
+                        and src_dst.crs
+                        and src_dst.crs == (dst_crs or shape_crs)
+                    ):
+                        res_x, res_y = abs(transform.a), abs(transform.e)
+                        bounds = []
+                        for feature in features:
+                            minx, miny, maxx, maxy = transform_bounds(
+                                shape_crs,
+                                src_dst.crs,
+                                *featureBounds(feature.model_dump(exclude_none=True)),
+                                densify_pts=21,
+                            )
+                            bounds.append(
+                                (minx / res_x, miny / res_y, maxx / res_x, maxy / res_y)
+                            )
+
+                        groups = group_bounds(bounds, self.statistics_group_size)
+
+        for group, result in threaded_batch(
+            _open,
+            _group_statistics,
+            groups,
+            threads=self.statistics_threads,
+            env=env,
+        ):
+            if isinstance(result, Exception):
+                for ix in group:
+                    yield _error(features[ix], result)
+            else:
+                yield from result
+
     ############################################################################
     # /tileset
     ############################################################################
@@ -598,7 +1077,9 @@ class TilerFactory(BaseFactory):
         ):
             """Retrieve a list of available raster tilesets for the specified dataset."""
             with rasterio.Env(**env):
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     bounds = src_dst.get_geographic_bounds(crs or WGS84_CRS)
 
             collection_bbox = {
@@ -733,8 +1214,8 @@ class TilerFactory(BaseFactory):
             """Retrieve the raster tileset metadata for the specified dataset and tiling scheme (tile matrix set)."""
             tms = self.supported_tms.get(tileMatrixSetId)
             with rasterio.Env(**env):
-                with self.reader(
-                    src_path, tms=tms, **reader_params.as_dict()
+                with self.open_reader(
+                    src_path, env=env, tms=tms, **reader_params.as_dict()
                 ) as src_dst:
                     bounds = src_dst.get_geographic_bounds(tms.rasterio_geographic_crs)
                     minzoom = minzoom if minzoom is not None else src_dst.minzoom
@@ -912,15 +1393,15 @@ class TilerFactory(BaseFactory):
             tms = self.supported_tms.get(tileMatrixSetId)
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(
-                    src_path, tms=tms, **reader_params.as_dict()
+                with self.open_reader(
+                    src_path, env=env, tms=tms, **reader_params.as_dict()
                 ) as src_dst:
                     image = src_dst.tile(
                         x,
                         y,
                         z,
                         tilesize=tilesize,
-                        **tile_params.as_dict(),
+                        **add_algorithm_halo(tile_params.as_dict(), post_process),
                         **layer_params.as_dict(),
                         **dataset_params.as_dict(),
                     )
@@ -948,6 +1429,270 @@ class TilerFactory(BaseFactory):
 
             return Response(content, media_type=media_type, headers=headers)
 
+    ############################################################################
+    # /tiles/{tileMatrixSetId}/batch
+    ############################################################################
+    def batch(self):  # noqa: C901
+        """Register /tiles/{tileMatrixSetId}/batch endpoint."""
+
+        @self.router.post(
+            "/tiles/{tileMatrixSetId}/batch",
+            operation_id=f"{self.operation_prefix}getTileBatch",
+            response_class=StreamingResponse,
+            responses={
+                200: {
+                    "content": {MediaType.tar.value: {}},
+                    "description": "Return a TAR archive of tiles (`{z}/{x}/{y}.{format}`).",
+                }
+            },
+        )
+        def batch(
+            tiles: Annotated[TileBatch, Body(description="Tiles to create.")],
+            tileMatrixSetId: Annotated[
+                Literal[tuple(self.supported_tms.list())],
+                Path(
+                    description="Identifier selecting one of the TileMatrixSetId supported."
+                ),
+            ],
+            format: Annotated[
+                ImageType | None,
+                Query(
+                    description="Default will be automatically defined if the output image needs a mask (png) or not (jpeg)."
+                ),
+            ] = None,
+            tilesize: Annotated[
+                int | None,
+                Query(gt=0, description="Tilesize in pixels."),
+            ] = None,
+            src_path=Depends(self.path_dependency),
+            reader_params=Depends(self.reader_dependency),
+            tile_params=Depends(self.tile_dependency),
+            layer_params=Depends(self.layer_dependency),
+            dataset_params=Depends(self.dataset_dependency),
+            post_process=Depends(self.process_dependency),
+            colormap=Depends(self.colormap_dependency),
+            render_params=Depends(self.render_dependency),
+            env=Depends(self.environment_dependency),
+        ):
+            """Create multiple map tiles from a dataset.
+
+            Tiles outside the dataset bounds are skipped. If other errors happen,
+            an `errors.json` file listing the failed tiles is added to the archive.
+
+            """
+            tms = self.supported_tms.get(tileMatrixSetId)
+            try:
+                tile_list = tiles.get_tiles(tms, self.max_batch_tiles)
+            except ValueError as e:
+                raise BadRequestError(str(e)) from e
+
+            def _tile(
+                src_dst: BaseReader, tile: morecantile.Tile
+            ) -> tuple[bytes, str] | None:
+                try:
+                    image = src_dst.tile(
+                        tile.x,
+                        tile.y,
+                        tile.z,
+                        tilesize=tilesize,
+                        **add_algorithm_halo(tile_params.as_dict(), post_process),
+                        **layer_params.as_dict(),
+                        **dataset_params.as_dict(),
+                    )
+                except TileOutsideBounds:
+                    return None
+
+                if post_process:
+                    image = post_process(image)
+
+                return self.render_func(
+                    image,
+                    output_format=format,
+                    colormap=colormap or getattr(src_dst, "colormap", None),
+                    **render_params.as_dict(),
+                )
+
+            def _files():
+                errors = {}
+                for tile, result in threaded_batch(
+                    lambda: self.open_reader(
+                        src_path, env=env, tms=tms, **reader_params.as_dict()
+                    ),
+                    _tile,
+                    tile_list,
+                    threads=self.batch_threads,
+                    env=env,
+                ):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Could not create tile {tile}: {result}")
+                        errors[f"{tile.z}/{tile.x}/{tile.y}"] = str(result)
+                    elif result is not None:
+                        content, media_type = result
+                        ext = media_type_to_extension(media_type)
+                        yield f"{tile.z}/{tile.x}/{tile.y}.{ext}", content
+
+                if errors:
+                    yield "errors.json", json.dumps(errors).encode()
+
+            return StreamingResponse(
+                tar_stream(_files()),
+                media_type=MediaType.tar.value,
+            )
+
+    ############################################################################
+    # /contours
+    ############################################################################
+    def contours(self):  # noqa: C901
+        """Register /contours endpoint."""
+
+        @self.router.get(
+            "/contours/{tileMatrixSetId}/{z}/{x}/{y}",
+            operation_id=f"{self.operation_prefix}getContours",
+            responses={
+                200: {
+                    "content": {
+                        MediaType.mvt.value: {},
+                        MediaType.pbf.value: {},
+                        MediaType.geojson.value: {},
+                    },
+                    "description": "Return contour lines as Mapbox Vector Tile or GeoJSON.",
+                }
+            },
+            response_class=Response,
+        )
+        @self.router.get(
+            "/contours/{tileMatrixSetId}/{z}/{x}/{y}.{format}",
+            operation_id=f"{self.operation_prefix}getContoursWithFormat",
+            responses={
+                200: {
+                    "content": {
+                        MediaType.mvt.value: {},
+                        MediaType.pbf.value: {},
+                        MediaType.geojson.value: {},
+                    },
+                    "description": "Return contour lines as Mapbox Vector Tile or GeoJSON.",
+                }
+            },
+            response_class=Response,
+        )
+        def contours(
+            z: Annotated[
+                int,
+                Path(
+                    description="Identifier (Z) selecting one of the scales defined in the TileMatrixSet and representing the scaleDenominator the tile.",
+                ),
+            ],
+            x: Annotated[
+                int,
+                Path(
+                    description="Column (X) index of the tile on the selected TileMatrix. It cannot exceed the MatrixHeight-1 for the selected TileMatrix.",
+                ),
+            ],
+            y: Annotated[
+                int,
+                Path(
+                    description="Row (Y) index of the tile on the selected TileMatrix. It cannot exceed the MatrixWidth-1 for the selected TileMatrix.",
+                ),
+            ],
+            tileMatrixSetId: Annotated[
+                Literal[tuple(self.supported_tms.list())],
+                Path(
+                    description="Identifier selecting one of the TileMatrixSetId supported."
+                ),
+            ],
+            interval: Annotated[
+                float,
+                Query(gt=0, description="Elevation interval between contour lines."),
+            ],
+            format: Annotated[
+                VectorType,
+                Field(description="Output format. Defaults to Mapbox Vector Tile."),
+            ] = VectorType.mvt,
+            base: Annotated[
+                float,
+                Query(description="Elevation of one of the contour lines."),
+            ] = 0.0,
+            tolerance: Annotated[
+                float,
+                Query(
+                    ge=0,
+                    description="Simplification tolerance, in tile pixels (the tolerance in the dataset's units depends on the zoom level).",
+                ),
+            ] = 0.5,
+            tilesize: Annotated[
+                int | None,
+                Query(gt=0, description="Tilesize in pixels."),
+            ] = None,
+            extent: Annotated[
+                int,
+                Query(gt=0, description="Mapbox Vector Tile extent."),
+            ] = 4096,
+            src_path=Depends(self.path_dependency),
+            reader_params=Depends(self.reader_dependency),
+            layer_params=Depends(self.layer_dependency),
+            dataset_params=Depends(self.dataset_dependency),
+            env=Depends(self.environment_dependency),
+        ):
+            """Create vector contour lines for a tile.
+
+            Contours are created with marching squares on the tile with a 1 pixel
+            buffer, so the lines of neighboring tiles connect.
+
+            """
+            tms = self.supported_tms.get(tileMatrixSetId)
+            with rasterio.Env(**env):
+                logger.info(f"opening data with reader: {self.reader}")
+                with self.open_reader(
+                    src_path, env=env, tms=tms, **reader_params.as_dict()
+                ) as src_dst:
+                    image = src_dst.tile(
+                        x,
+                        y,
+                        z,
+                        tilesize=tilesize,
+                        buffer=1,
+                        **layer_params.as_dict(),
+                        **dataset_params.as_dict(),
+                    )
+
+            if image.count != 1:
+                raise BadRequestError(
+                    "Contours can only be created from one band (use `bidx` or `expression`)."
+                )
+
+            mask = numpy.ma.getmaskarray(image.array)[0]
+            data = image.array.data[0]
+
+            lines: dict[float, list[numpy.ndarray]] = {}
+            if not mask.all():
+                values = data[~mask]
+                levels = contour_levels(
+                    float(values.min()), float(values.max()), interval, base
+                )
+                if len(levels) > self.max_contour_levels:
+                    raise BadRequestError(
+                        f"Too many contour levels ({len(levels)}), maximum is {self.max_contour_levels}. Use a larger `interval`."
+                    )
+
+                lines = {
+                    level: [simplify(line, tolerance) for line in level_lines]
+                    for level, level_lines in isolines(data, levels, mask).items()
+                }
+
+            if format == VectorType.geojson:
+                return GeoJSONResponse(to_geojson(lines, image.transform, image.crs))
+
+            # tile pixels (without buffer) to MVT extent
+            scale = extent / (image.width - 2)
+            content = encode_mvt(
+                {
+                    level: [(line - 1) * scale for line in level_lines]
+                    for level, level_lines in lines.items()
+                },
+                extent=extent,
+            )
+            return Response(content, media_type=format.mediatype)
+
     def tilejson(self):  # noqa: C901
         """Register /tilejson.json endpoint."""
 
@@ -1023,8 +1768,8 @@ class TilerFactory(BaseFactory):
             tms = self.supported_tms.get(tileMatrixSetId)
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(
-                    src_path, tms=tms, **reader_params.as_dict()
+                with self.open_reader(
+                    src_path, env=env, tms=tms, **reader_params.as_dict()
                 ) as src_dst:
                     body = {
                         "bounds": src_dst.get_geographic_bounds(
@@ -1158,7 +1903,9 @@ class TilerFactory(BaseFactory):
             """Get Point value for a dataset."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     pts = src_dst.point(
                         lon,
                         lat,
@@ -1216,7 +1963,9 @@ class TilerFactory(BaseFactory):
             """Create preview of a dataset."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     image = src_dst.preview(
                         **layer_params.as_dict(),
                         **image_params.as_dict(exclude_none=False),
@@ -1290,13 +2039,15 @@ class TilerFactory(BaseFactory):
             """Create image from a bbox."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     image = src_dst.part(
                         [minx, miny, maxx, maxy],
                         dst_crs=dst_crs,
                         bounds_crs=coord_crs or WGS84_CRS,
                         **layer_params.as_dict(),
-                        **image_params.as_dict(),
+                        **add_algorithm_halo(image_params.as_dict(), post_process),
                         **dataset_params.as_dict(),
                     )
                     dst_colormap = getattr(src_dst, "colormap", None)
@@ -1362,13 +2113,15 @@ class TilerFactory(BaseFactory):
             """Create image from a geojson feature."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     image = src_dst.feature(
                         geojson.model_dump(exclude_none=True),
                         shape_crs=coord_crs or WGS84_CRS,
                         dst_crs=dst_crs,
                         **layer_params.as_dict(),
-                        **image_params.as_dict(),
+                        **add_algorithm_halo(image_params.as_dict(), post_process),
                         **dataset_params.as_dict(),
                     )
                     dst_colormap = getattr(src_dst, "colormap", None)
@@ -1438,7 +2191,9 @@ class TilerFactory(BaseFactory):
             """OGC Maps API."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     if ogc_params.bbox is not None:
                         image = src_dst.part(
                             ogc_params.bbox,
@@ -1499,10 +2254,20 @@ class MultiBaseTilerFactory(TilerFactory):
         a requirement arguments (https://github.com/cogeotiff/rio-tiler/blob/main/rio_tiler/io/base.py#L365).
         This means we have to update the /info and /metadata endpoints in order to add the `assets` dependency.
 
+    Attributes:
+        asset_threads (int): Maximum number of assets read in parallel in a request (up to rio-tiler's `MAX_THREADS`). Defaults to `TITILER_ASSET_CONCURRENCY` environment variable or `MAX_THREADS`.
+        asset_read_limiter (titiler.core.executor.AssetReadLimiter, optional): Limit of concurrent asset reads for all the requests. Defaults to a process-wide limiter (`TITILER_ASSET_MAX_READS` environment variable or `MAX_THREADS`).
+
     """
 
     reader: type[MultiBaseReader]  # type: ignore
 
+    # Number of assets read in parallel in a request
+    asset_threads: int = ASSET_THREADS
+
+    # Maximum number of concurrent asset reads, shared by all requests
+    asset_read_limiter: AssetReadLimiter | None = field(default=asset_read_limiter)
+
     # Assets/Expression dependency
     layer_dependency: type[DefaultDependency] = AssetsExprParams
 
@@ -1513,6 +2278,42 @@ class MultiBaseTilerFactory(TilerFactory):
         default=lambda obj: {}
     )
 
+    @contextlib.contextmanager
+    def open_reader(
+        self,
+        src_path: Any,
+        env: dict | None = None,
+        **kwargs: Any,
+    ) -> Iterator[MultiBaseReader]:
+        """Open the dataset with the factory's reader and limit concurrent asset reads.
+
+        Each asset is read within the reader's `ctx` context manager, which is wrapped
+        to hold a slot from the request's and the process' asset read limits.
+
+        """
+        # NOTE: `super()` cannot be used in decorated methods of slotted attrs classes
+        with TilerFactory.open_reader(self, src_path, env=env, **kwargs) as src_dst:
+            ctx = src_dst.ctx
+            request_limiter = threading.BoundedSemaphore(self.asset_threads)
+            process_limiter = self.asset_read_limiter
+
+            @contextlib.contextmanager
+            def limited_ctx(**options: Any) -> Iterator[None]:
+                with request_limiter:
+                    with (
+                        process_limiter.limit()
+                        if process_limiter
+                        else contextlib.nullcontext()
+                    ):
+                        with ctx(**options):
+                            yield
+
+            src_dst.ctx = limited_ctx
+            try:
+                yield src_dst
+            finally:
+                src_dst.ctx = ctx
+
     # Overwrite the `/info` endpoint to return the list of assets when no assets is passed.
     def info(self):
         """Register /info endpoint."""
@@ -1538,7 +2339,9 @@ class MultiBaseTilerFactory(TilerFactory):
             """Return dataset's basic info or the list of available assets."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     if asset_params.assets == [":all:"]:
                         asset_params.assets = src_dst.assets
 
@@ -1567,7 +2370,9 @@ class MultiBaseTilerFactory(TilerFactory):
             """Return dataset's basic info as a GeoJSON feature."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     if asset_params.assets == [":all:"]:
                         asset_params.assets = src_dst.assets
 
@@ -1595,7 +2400,9 @@ class MultiBaseTilerFactory(TilerFactory):
             """Return a list of supported assets."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     return src_dst.assets
 
     # Overwrite the `/statistics` endpoint because the MultiBaseReader output model is different (Dict[str, Dict[str, BandStatistics]])
@@ -1629,7 +2436,9 @@ class MultiBaseTilerFactory(TilerFactory):
             """Per Asset statistics"""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     if asset_params.assets == [":all:"]:
                         asset_params.assets = src_dst.assets
 
@@ -1670,7 +2479,9 @@ class MultiBaseTilerFactory(TilerFactory):
             """Merged assets statistics."""
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     if layer_params.assets == [":all:"]:
                         layer_params.assets = src_dst.assets
 
@@ -1727,7 +2538,9 @@ class MultiBaseTilerFactory(TilerFactory):
 
             with rasterio.Env(**env):
                 logger.info(f"opening data with reader: {self.reader}")
-                with self.reader(src_path, **reader_params.as_dict()) as src_dst:
+                with self.open_reader(
+                    src_path, env=env, **reader_params.as_dict()
+                ) as src_dst:
                     if layer_params.assets == [":all:"]:
                         layer_params.assets = src_dst.assets
 
@@ -2312,3 +3125,113 @@ class ColorMapFactory(BaseFactory):
                 data = {k: numpy.array(v).tolist() for k, v in cmap.items()}
 
             return data
+
+
+@define(kw_only=True)
+class MBTilesFactory(BaseFactory):
+    """Read-only endpoints for a pre-rendered MBTiles archive (e.g created with `titiler-seed`).
+
+    The archive metadata and TileMatrixSet are read when the factory is created,
+    and each thread re-uses its own read-only connection.
+
+    Attributes:
+        src_path (str): Path of the MBTiles file.
+        supported_tms (morecantile.defaults.TileMatrixSets): TileMatrixSets used to flip the tile rows.
+
+    """
+
+    src_path: str
+    supported_tms: TileMatrixSets = morecantile_tms
+
+    _metadata: dict[str, str] = field(init=False)
+    _tms: TileMatrixSet = field(init=False)
+    _local: threading.local = field(init=False, factory=threading.local)
+
+    def __attrs_post_init__(self):
+        """Read the archive metadata and register the routes."""
+        with contextlib.closing(self._open()) as db:
+            self._metadata = dict(db.execute("SELECT name, value FROM metadata"))
+
+        self._tms = self.supported_tms.get(
+            self._metadata.get("tileMatrixSetId", "WebMercatorQuad")
+        )
+        super().__attrs_post_init__()
+
+    def _open(self) -> sqlite3.Connection:
+        return sqlite3.connect(
+            f"file:{pathname2url(os.path.abspath(self.src_path))}?mode=ro",
+            uri=True,
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        """Read-only connection to the archive (one per thread)."""
+        if (db := getattr(self._local, "db", None)) is None:
+            db = self._local.db = self._open()
+
+        return db
+
+    def metadata(self) -> dict[str, str]:
+        """Archive metadata."""
+        return dict(self._metadata)
+
+    def register_routes(self):
+        """Register MBTiles routes."""
+
+        @self.router.get(
+            "/tiles/{z}/{x}/{y}",
+            response_class=Response,
+            responses={200: {"description": "Return a pre-rendered tile."}},
+            operation_id=f"{self.operation_prefix}getMBTile",
+        )
+        def tile(
+            z: Annotated[int, Path(description="Identifier (Z) of the TileMatrix")],
+            x: Annotated[int, Path(description="Column (X) of the Tile")],
+            y: Annotated[int, Path(description="Row (Y) of the Tile")],
+        ):
+            """Return a tile from the archive."""
+            height = self._tms.matrix(z).matrixHeight
+            if not 0 <= y < height:
+                raise TileOutsideBounds(f"Tile {z}/{x}/{y} is outside the archive.")
+
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT tile_data FROM tiles WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+                    (z, x, height - 1 - y),
+                )
+                .fetchone()
+            )
+            if row is None:
+                raise TileOutsideBounds(f"Tile {z}/{x}/{y} is not in the archive.")
+
+            fmt = self._metadata.get("format", "png")
+            media_type = (
+                ImageType[fmt].mediatype if fmt in ImageType.__members__ else None
+            )
+            return Response(bytes(row[0]), media_type=media_type)
+
+        @self.router.get(
+            "/tilejson.json",
+            response_model=TileJSON,
+            responses={200: {"description": "Return a tilejson"}},
+            response_model_exclude_none=True,
+            operation_id=f"{self.operation_prefix}getMBTilesTileJSON",
+        )
+        def tilejson(request: Request):
+            """Return TileJSON document for the archive."""
+            metadata = self._metadata
+            tiles_url = self.url_for(request, "tile", z="{z}", x="{x}", y="{y}")
+
+            tilejson: dict[str, Any] = {"tiles": [tiles_url]}
+            if name := metadata.get("name"):
+                tilejson["name"] = name
+            if description := metadata.get("description"):
+                tilejson["description"] = description
+            if bounds := metadata.get("bounds"):
+                tilejson["bounds"] = [float(v) for v in bounds.split(",")]
+            if (minzoom := metadata.get("minzoom")) is not None:
+                tilejson["minzoom"] = int(minzoom)
+            if (maxzoom := metadata.get("maxzoom")) is not None:
+                tilejson["maxzoom"] = int(maxzoom)
+
+            return tilejson
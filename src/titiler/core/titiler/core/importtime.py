@@ -0,0 +1,135 @@
+"""titiler.core importtime: profile the import time of a module (e.g an application)."""
+
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+from attrs import define
+
+IMPORTTIME_LINE = re.compile(
+    r"^import time:\s+(?P<self>\d+)\s+\|\s+(?P<cumulative>\d+)\s+\|(?P<indent>\s+)(?P<name>\S+)$"
+)
+
+
+@define
+class ImportTime:
+    """Import time of a module.
+
+    Attributes:
+        name (str): Module name.
+        self_time (int): Time (in microseconds) spent importing the module, excluding its imports.
+        cumulative_time (int): Time (in microseconds) spent importing the module and its imports.
+        level (int): Nesting level of the import (`0` for the modules imported by the profiled module's import statement).
+
+    """
+
+    name: str
+    self_time: int
+    cumulative_time: int
+    level: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """Parse the output of `python -X importtime`."""
+    imports = []
+    for line in output.splitlines():
+        if match := IMPORTTIME_LINE.match(line):
+            imports.append(
+                ImportTime(
+                    name=match["name"],
+                    self_time=int(match["self"]),
+                    cumulative_time=int(match["cumulative"]),
+                    level=(len(match["indent"]) - 1) // 2,
+                )
+            )
+
+    return imports
+
+
+def profile_imports(
+    module: str,
+    env: dict[str, str] | None = None,
+    python: str = sys.executable,
+) -> list[ImportTime]:
+    """Import a module in a new interpreter and return the import time of all the imported modules.
+
+    Args:
+        module (str): Module to import (e.g `titiler.application.main`).
+        env (dict, optional): Environment variables to set (e.g `{"TITILER_API_LAZY": "TRUE"}`).
+        python (str, optional): Python interpreter. Defaults to `sys.executable`.
+
+    """
+    result = subprocess.run(
+        [
+            python,
+            "-X",
+            "importtime",
+            "-c",
+            "import sys; __import__(sys.argv[1])",
+            module,
+        ],
+        env={**os.environ, **(env or {})},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        error = [line for line in result.stderr.splitlines() if line.strip()]
+        raise RuntimeError(
+            f"Could not import {module}: {error[-1] if error else result.returncode}"
+        )
+
+    return parse_importtime(result.stderr)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """titiler-importtime command line."""
+    parser = argparse.ArgumentParser(
+        prog="titiler-importtime",
+        description="Print the modules with the highest import cost when importing a module (e.g `titiler.application.main`).",
+    )
+    parser.add_argument("module", help="Module to import.")
+    parser.add_argument(
+        "--top", type=int, default=20, help="Number of modules to print."
+    )
+    parser.add_argument(
+        "--sort",
+        choices=["cumulative", "self"],
+        default="cumulative",
+        help="Sort modules by cumulative (including their imports) or self import time. Defaults to `cumulative`.",
+    )
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Environment variable to set (e.g `TITILER_API_LAZY=TRUE`). Can be repeated.",
+    )
+    args = parser.parse_args(argv)
+
+    env = dict(value.split("=", 1) for value in args.env)
+    try:
+        imports = profile_imports(args.module, env=env)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    total = sum(imp.cumulative_time for imp in imports if imp.level == 0)
+    print(f"{args.module}: {len(imports)} modules imported in {total / 1e6:.3f}s")
+    print(f"{'cumulative (ms)':>16} {'self (ms)':>10}  module")
+    key = f"{args.sort}_time"
+    imports = sorted(imports, key=lambda imp: getattr(imp, key), reverse=True)
+    for imp in imports[: args.top]:
+        print(
+            f"{imp.cumulative_time / 1e3:16.1f} {imp.self_time / 1e3:10.1f}  {imp.name}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,504 @@
+"""titiler.core loadtest: replay synthetic map viewer traces at multiple concurrency levels."""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+from collections import Counter
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+import numpy
+from attrs import define, field
+from morecantile import Tile, TileMatrixSet
+from morecantile import tms as morecantile_tms
+from starlette.applications import Starlette
+
+from titiler.core.executor import EndpointExecutor
+from titiler.core.factory import BaseFactory
+from titiler.core.seed import asgi_get, create_app
+
+# Tiles outside the dataset are expected when panning/zooming
+EMPTY_STATUS_CODES = [204, 404]
+
+
+@define
+class TraceGenerator:
+    """Synthesize pan/zoom tile requests from map viewers.
+
+    Each session simulates a map viewer:
+
+    - starting around one of the `hotspots` (chosen with a Zipf distribution, making a few areas very popular)
+    - looking at a `viewport` of tiles
+    - then, at each step, panning to a neighbouring position or zooming in/out over a few levels (zoom burst)
+
+    Tiles already seen in a session are not requested again (browser cache).
+
+    Attributes:
+        tms (morecantile.TileMatrixSet): TileMatrixSet.
+        bounds (tuple): Geographic bounds of the area of interest.
+        minzoom (int): Minimum zoom level.
+        maxzoom (int): Maximum zoom level.
+        hotspots (int): Number of points of interest. Defaults to `50`.
+        zipf_exponent (float): Zipf distribution exponent for the hotspots popularity. Defaults to `1.1`.
+        viewport (tuple): Number of tiles (columns, rows) visible in the viewer. Defaults to `(4, 3)`.
+        steps (int): Number of interactions (pan or zoom) per session. Defaults to `10`.
+        pan_probability (float): Probability of an interaction being a pan. Defaults to `0.7`.
+        zoom_burst (int): Maximum number of zoom levels changed in a single zoom interaction. Defaults to `3`.
+        seed (int, optional): Random generator seed.
+
+    """
+
+    tms: TileMatrixSet
+    bounds: tuple[float, float, float, float]
+    minzoom: int
+    maxzoom: int
+    hotspots: int = 50
+    zipf_exponent: float = 1.1
+    viewport: tuple[int, int] = (4, 3)
+    steps: int = 10
+    pan_probability: float = 0.7
+    zoom_burst: int = 3
+    seed: int | None = None
+
+    _rng: numpy.random.Generator = field(init=False)
+    _hotspots: numpy.ndarray = field(init=False)
+    _popularity: numpy.ndarray = field(init=False)
+
+    def __attrs_post_init__(self):
+        """Create random generator and hotspots."""
+        self._rng = numpy.random.default_rng(self.seed)
+        west, south, east, north = self.bounds
+        self._hotspots = numpy.column_stack(
+            [
+                self._rng.uniform(west, east, self.hotspots),
+                self._rng.uniform(south, north, self.hotspots),
+            ]
+        )
+        weights = 1.0 / numpy.arange(1, self.hotspots + 1) ** self.zipf_exponent
+        self._popularity = weights / weights.sum()
+
+    def _viewport(self, z: int, lon: float, lat: float) -> list[Tile]:
+        """Tiles visible in the viewport centered on (lon, lat)."""
+        center = self.tms.tile(lon, lat, z)
+        matrix = self.tms.matrix(z)
+        ncols, nrows = self.viewport
+        xmin = center.x - (ncols - 1) // 2
+        ymin = center.y - (nrows - 1) // 2
+        return [
+            Tile(x, y, z)
+            for y in range(max(ymin, 0), min(ymin + nrows, matrix.matrixHeight))
+            for x in range(max(xmin, 0), min(xmin + ncols, matrix.matrixWidth))
+        ]
+
+    def session(self) -> list[Tile]:
+        """Create the list of tiles requested by a map viewer."""
+        rng = self._rng
+        lon, lat = self._hotspots[rng.choice(self.hotspots, p=self._popularity)]
+        z = int(rng.integers(self.minzoom, self.maxzoom + 1))
+
+        seen: set[Tile] = set()
+        requests: list[Tile] = []
+
+        def _view():
+            for tile in self._viewport(z, lon, lat):
+                if tile not in seen:
+                    seen.add(tile)
+                    requests.append(tile)
+
+        _view()
+        for _ in range(self.steps):
+            if rng.random() < self.pan_probability:
+                # Move the center to a neighbouring tile
+                bounds = self.tms.xy_bounds(self.tms.tile(lon, lat, z))
+                width, height = bounds.right - bounds.left, bounds.top - bounds.bottom
+                dx, dy = 0, 0
+                while dx == 0 and dy == 0:
+                    dx, dy = rng.integers(-1, 2, size=2)
+
+                x, y = self.tms.xy(lon, lat)
+                lon, lat = self.tms.lnglat(x + dx * width, y - dy * height)
+                west, south, east, north = self.bounds
+                lon = min(max(lon, west), east)
+                lat = min(max(lat, south), north)
+                _view()
+
+            else:
+                direction = 1 if z == self.minzoom else -1 if z == self.maxzoom else 0
+                direction = direction or int(rng.choice([-1, 1]))
+                for _ in range(int(rng.integers(1, self.zoom_burst + 1))):
+                    new_z = z + direction
+                    if not self.minzoom <= new_z <= self.maxzoom:
+                        break
+
+                    z = new_z
+                    _view()
+
+        return requests
+
+    def sessions(self, count: int) -> list[list[Tile]]:
+        """Create `count` sessions."""
+        return [self.session() for _ in range(count)]
+
+
+@define
+class ASGITarget:
+    """In-process application target.
+
+    Attributes:
+        app (ASGI Application): Application.
+        executors (list): Endpoint executors used to report the CPU time per endpoint.
+
+    """
+
+    app: Callable
+    executors: list[EndpointExecutor] = field(factory=list)
+
+    async def get(self, path: str, query_string: str = "") -> tuple[int, bytes]:
+        """Send a GET request."""
+        status_code, _, body = await asgi_get(self.app, path, query_string)
+        return status_code, body
+
+    def close(self):
+        """Nothing to close."""
+        pass
+
+
+@define
+class HTTPTarget:
+    """HTTP server target (e.g a local `uvicorn` or `gunicorn` instance).
+
+    Attributes:
+        url (str): Server base URL (e.g `http://127.0.0.1:8000`).
+        timeout (float): Request timeout in seconds. Defaults to `30`.
+        max_connections (int): Maximum number of concurrent requests. Defaults to `512`.
+
+    """
+
+    url: str
+    timeout: float = 30.0
+    max_connections: int = 512
+    executors: list[EndpointExecutor] = field(factory=list, init=False)
+
+    _pool: ThreadPoolExecutor = field(init=False)
+
+    def __attrs_post_init__(self):
+        """Create the ThreadPool used to send the requests."""
+        self._pool = ThreadPoolExecutor(max_workers=self.max_connections)
+
+    def _get(self, url: str) -> tuple[int, bytes]:
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                return response.status, response.read()
+
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    async def get(self, path: str, query_string: str = "") -> tuple[int, bytes]:
+        """Send a GET request."""
+        url = self.url.rstrip("/") + path
+        if query_string:
+            url += f"?{query_string}"
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, self._get, url)
+
+    def close(self):
+        """Shutdown the ThreadPool."""
+        self._pool.shutdown(wait=False)
+
+
+Target = ASGITarget | HTTPTarget
+
+
+def load_target(target: str) -> Target:
+    """Create a target from a server URL or a Factory/Application `module:attribute` path."""
+    if target.startswith(("http://", "https://")):
+        return HTTPTarget(target)
+
+    module_name, _, attribute = target.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(
+            f"Invalid target {target}, should be an URL or a `module:attribute` path"
+        )
+
+    obj = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(obj, BaseFactory | Starlette) and callable(obj):
+        obj = obj()
+
+    if isinstance(obj, BaseFactory):
+        return ASGITarget(
+            create_app(obj),
+            executors=[obj.executor] if obj.executor is not None else [],
+        )
+
+    if isinstance(obj, Starlette):
+        return ASGITarget(obj)
+
+    raise ValueError(f"{target} is not a titiler Factory or an ASGI application")
+
+
+def _percentiles(latencies: Sequence[float]) -> dict[str, float | None]:
+    """Latency statistics (in milliseconds)."""
+    if not len(latencies):
+        return dict.fromkeys(["mean", "p50", "p90", "p95", "p99", "max"])
+
+    arr = numpy.asarray(latencies) * 1000
+    p50, p90, p95, p99 = numpy.percentile(arr, [50, 90, 95, 99])
+    return {
+        "mean": round(float(arr.mean()), 3),
+        "p50": round(float(p50), 3),
+        "p90": round(float(p90), 3),
+        "p95": round(float(p95), 3),
+        "p99": round(float(p99), 3),
+        "max": round(float(arr.max()), 3),
+    }
+
+
+async def replay(
+    target: Target,
+    sessions: Sequence[Sequence[Tile]],
+    concurrency: int,
+    path: str = "/tiles/WebMercatorQuad/{z}/{x}/{y}.png",
+    query_string: str = "",
+    max_requests: int | None = None,
+) -> dict[str, Any]:
+    """Replay sessions with `concurrency` concurrent map viewers.
+
+    Each viewer replays one session at a time (one request at a time) and
+    picks the next session when done, until all the sessions (or `max_requests`)
+    have been replayed.
+
+    Returns:
+        dict: Number of requests, throughput (requests/s), latency percentiles (ms),
+            status codes, error rate and CPU time (per endpoint, when available).
+
+    """
+    queue = iter(sessions)
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    nbytes = 0
+    budget = max_requests if max_requests is not None else sum(map(len, sessions))
+
+    cpu_before = [executor.stats()["cpu_time"] for executor in target.executors]
+    process_cpu = time.process_time()
+
+    async def viewer():
+        nonlocal budget, nbytes
+        for session in queue:
+            for tile in session:
+                if budget <= 0:
+                    return
+
+                budget -= 1
+                t0 = time.perf_counter()
+                try:
+                    status_code, body = await target.get(
+                        path.format(z=tile.z, x=tile.x, y=tile.y), query_string
+                    )
+                except Exception:  # noqa
+                    status_code, body = 0, b""
+
+                latencies.append(time.perf_counter() - t0)
+                statuses[status_code] += 1
+                nbytes += len(body)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[viewer() for _ in range(concurrency)])
+    duration = time.perf_counter() - start
+
+    requests = len(latencies)
+    errors = sum(
+        count
+        for status_code, count in statuses.items()
+        if status_code >= 400
+        and status_code not in EMPTY_STATUS_CODES
+        or status_code == 0
+    )
+
+    cpu_time: dict[str, float] = {}
+    for executor, before in zip(target.executors, cpu_before):
+        for name, value in executor.stats()["cpu_time"].items():
+            cpu_time[name] = cpu_time.get(name, 0.0) + value - before.get(name, 0.0)
+
+    result: dict[str, Any] = {
+        "concurrency": concurrency,
+        "requests": requests,
+        "duration": round(duration, 3),
+        "throughput": round(requests / duration, 3) if duration else None,
+        "latency": _percentiles(latencies),
+        "status": {str(k): v for k, v in sorted(statuses.items())},
+        "errors": errors,
+        "error_rate": round(errors / requests, 4) if requests else None,
+        "bytes": nbytes,
+    }
+
+    # CPU time is only known for in-process targets
+    if isinstance(target, ASGITarget):
+        result["process_cpu_time"] = round(time.process_time() - process_cpu, 3)
+        if target.executors:
+            result["cpu_time"] = {k: round(v, 3) for k, v in cpu_time.items()}
+
+    return result
+
+
+def sweep(
+    target: Target,
+    sessions: Sequence[Sequence[Tile]],
+    concurrency: Sequence[int],
+    progress: Callable[[dict[str, Any]], None] | None = None,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Replay the same sessions at each concurrency level.
+
+    Note: in-process caches (e.g `ReaderCache`) are kept between levels.
+
+    """
+    results = []
+    for c in concurrency:
+        result = asyncio.run(replay(target, sessions, c, **kwargs))
+        if progress:
+            progress(result)
+
+        results.append(result)
+
+    return results
+
+
+def _print_result(result: dict[str, Any]):
+    print(
+        f"concurrency={result['concurrency']} requests={result['requests']} "
+        f"throughput={result['throughput']}/s p50={result['latency']['p50']}ms "
+        f"p99={result['latency']['p99']}ms errors={result['errors']}",
+        file=sys.stderr,
+    )
+
+
+def _tilejson(target: Target, tms_id: str, query_string: str) -> dict:
+    """Get the dataset's TileJSON document."""
+
+    async def _get():
+        return await target.get(f"/{tms_id}/tilejson.json", query_string)
+
+    status_code, body = asyncio.run(_get())
+    if status_code != 200:
+        raise ValueError(f"Could not get dataset's TileJSON: {body.decode()}")
+
+    return json.loads(body)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """titiler-loadtest command line."""
+    parser = argparse.ArgumentParser(
+        prog="titiler-loadtest",
+        description="Replay synthetic map viewer traces against a TiTiler application at multiple concurrency levels.",
+    )
+    parser.add_argument(
+        "target",
+        help="Server URL (e.g `http://127.0.0.1:8000`) or Factory/Application `module:attribute` path (in-process).",
+    )
+    parser.add_argument(
+        "--query",
+        default="",
+        help="Tile endpoint query parameters (e.g `url=cog.tif&rescale=0,1000`).",
+    )
+    parser.add_argument(
+        "--tms",
+        default="WebMercatorQuad",
+        help="TileMatrixSet identifier. Defaults to `WebMercatorQuad`.",
+    )
+    parser.add_argument(
+        "--path",
+        default="/tiles/{tms}/{{z}}/{{x}}/{{y}}.{format}",
+        help="Tile endpoint path template. Defaults to `/tiles/{tms}/{{z}}/{{x}}/{{y}}.{format}`.",
+    )
+    parser.add_argument(
+        "--format", default="png", help="Tile format. Defaults to `png`."
+    )
+    parser.add_argument("--minzoom", type=int, help="Minimum zoom level.")
+    parser.add_argument("--maxzoom", type=int, help="Maximum zoom level.")
+    parser.add_argument(
+        "--bbox",
+        type=lambda v: tuple(map(float, v.split(","))),
+        help="Geographic bounding box `west,south,east,north`. Defaults to the dataset bounds.",
+    )
+    parser.add_argument(
+        "--sessions", type=int, default=100, help="Number of map viewer sessions."
+    )
+    parser.add_argument(
+        "--steps", type=int, default=10, help="Number of interactions per session."
+    )
+    parser.add_argument(
+        "--hotspots", type=int, default=50, help="Number of points of interest."
+    )
+    parser.add_argument(
+        "--zipf", type=float, default=1.1, help="Hotspots popularity Zipf exponent."
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Random seed.")
+    parser.add_argument(
+        "--concurrency",
+        type=lambda v: [int(c) for c in v.split(",")],
+        default=[1, 10, 50, 100],
+        help="Comma-separated concurrency levels. Defaults to `1,10,50,100`.",
+    )
+    parser.add_argument(
+        "--requests",
+        type=int,
+        help="Maximum number of requests per concurrency level. Defaults to all the requests of the sessions.",
+    )
+    parser.add_argument("--output", help="Write results to a JSON file.")
+    args = parser.parse_args(argv)
+
+    target = load_target(args.target)
+    try:
+        minzoom, maxzoom, bbox = args.minzoom, args.maxzoom, args.bbox
+        if bbox is None or minzoom is None or maxzoom is None:
+            tilejson = _tilejson(target, args.tms, args.query)
+            bbox = bbox or tuple(tilejson["bounds"])
+            minzoom = tilejson["minzoom"] if minzoom is None else minzoom
+            maxzoom = tilejson["maxzoom"] if maxzoom is None else maxzoom
+
+        sessions = TraceGenerator(
+            tms=morecantile_tms.get(args.tms),
+            bounds=bbox,
+            minzoom=minzoom,
+            maxzoom=maxzoom,
+            hotspots=args.hotspots,
+            zipf_exponent=args.zipf,
+            steps=args.steps,
+            seed=args.seed,
+        ).sessions(args.sessions)
+
+        results = sweep(
+            target,
+            sessions,
+            args.concurrency,
+            progress=_print_result,
+            path=args.path.format(tms=args.tms, format=args.format),
+            query_string=urlencode(parse_qsl(args.query)),
+            max_requests=args.requests,
+        )
+
+    finally:
+        target.close()
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    else:
+        print(output)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,17 +2,27 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
+import threading
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
-from urllib.parse import urlencode
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
 
-from starlette.datastructures import MutableHeaders
+from attrs import define
+from attrs import field as attrs_field
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
 from starlette.requests import Request
 from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from titiler.core import telemetry
+from titiler.core.cache import BaseResponseCache, CachedResponse
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -173,3 +183,416 @@ class LowerCaseQueryStringMiddleware:
             request.scope["query_string"] = query_string.encode(DECODE_FORMAT)
 
         await self.app(scope, receive, send)
+
+
+def canonical_request_key(scope: Scope) -> str:
+    """Create a canonical key for a request: `{method} {path}?{sorted query parameters}`.
+
+    Query parameter names are lowercased and sorted. When the path has no
+    file extension, the response format might be defined by the `Accept` header
+    so it is added to the key.
+
+    """
+    query_items = sorted(
+        (k.lower(), v)
+        for k, v in parse_qsl(
+            scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True
+        )
+    )
+    key = f"{scope['method']} {scope['path']}"
+    if query_items:
+        key += "?" + urlencode(query_items)
+
+    if "." not in scope["path"].rsplit("/", 1)[-1]:
+        if accept := Headers(scope=scope).get("accept"):
+            key += f" accept={accept}"
+
+    return key
+
+
+def _has_credentials(scope: Scope, headers: set[str]) -> bool:
+    """Check if the request carries one of the credential headers (e.g `Authorization`)."""
+    return any(k.decode("latin-1").lower() in headers for k, _ in scope["headers"])
+
+
+@dataclass(frozen=True)
+class TileCacheMiddleware:
+    """MiddleWare to cache encoded image responses.
+
+    Only `GET` requests returning a `200` response with a cacheable media type
+    (by default `image/*` and `application/x-binary`) are cached. The response
+    body is stored along its headers (e.g `Content-Type`, `Content-Bbox`, `Content-Crs`).
+
+    Requests carrying credentials (`private_headers`, by default `Authorization`
+    and `Cookie`) bypass the cache, as a cached response would be sent without
+    running the application's authentication. Cache backend errors are logged and
+    handled as cache misses.
+
+    Args:
+        app (ASGIApp): starlette/FastAPI application.
+        cache (BaseResponseCache): Response cache backend.
+        media_types (set): Media type prefixes of responses to cache.
+        exclude_path (set): Set of regex expression to use to filter the path.
+        exclude_headers (set): Response headers not to store in the cache.
+        private_headers (set): Request headers (lowercase) for which the cache is bypassed.
+
+    """
+
+    app: ASGIApp
+    cache: BaseResponseCache
+    media_types: set[str] = field(
+        default_factory=lambda: {"image/", "application/x-binary"}
+    )
+    exclude_path: set[str] = field(default_factory=set)
+    exclude_headers: set[str] = field(
+        default_factory=lambda: {"date", "server", "server-timing"}
+    )
+    private_headers: set[str] = field(
+        default_factory=lambda: {"authorization", "cookie"}
+    )
+
+    async def _call_cache(self, func, *args):
+        if self.cache.blocking:
+            return await run_in_threadpool(func, *args)
+
+        return func(*args)
+
+    def _cacheable(self, message: Message) -> bool:
+        if message["status"] != 200:
+            return False
+
+        headers = Headers(raw=message["headers"])
+        cachecontrol = headers.get("cache-control", "")
+        if "no-store" in cachecontrol or "private" in cachecontrol:
+            return False
+
+        media_type = headers.get("content-type", "")
+        return any(media_type.startswith(t) for t in self.media_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle call."""
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "GET"
+            or any(re.match(path, scope["path"]) for path in self.exclude_path)
+            or _has_credentials(scope, self.private_headers)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        key = canonical_request_key(scope)
+
+        try:
+            cached = await self._call_cache(self.cache.get, key)
+        except Exception as e:  # noqa
+            logger.warning(f"Could not get cached response: {e}")
+            cached = None
+
+        if cached:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": cached.status,
+                    "headers": [*cached.headers, (b"x-cache", b"HIT")],
+                }
+            )
+            await send({"type": "http.response.body", "body": cached.body})
+            return
+
+        start_message: Message = {}
+        body: list[bytes] = []
+        cacheable = False
+
+        async def send_wrapper(message: Message):
+            """Send Message."""
+            nonlocal start_message, cacheable
+
+            if message["type"] == "http.response.start":
+                cacheable = self._cacheable(message)
+                if cacheable:
+                    start_message = message
+                    MutableHeaders(scope=message).append("X-Cache", "MISS")
+
+            elif message["type"] == "http.response.body" and cacheable:
+                body.append(message.get("body", b""))
+
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if cacheable:
+            headers = [
+                (k, v)
+                for k, v in start_message["headers"]
+                if k.decode("latin-1").lower() not in {*self.exclude_headers, "x-cache"}
+            ]
+            response = CachedResponse(
+                status=start_message["status"], headers=headers, body=b"".join(body)
+            )
+            try:
+                await self._call_cache(self.cache.set, key, response)
+            except Exception as e:  # noqa
+                logger.warning(f"Could not cache response: {e}")
+
+
+@define
+class SingleFlight:
+    """Collapse concurrent calls with the same key onto one computation.
+
+    While a call for a key is in flight, other calls for the same key wait for
+    its result instead of running the function again.
+
+    """
+
+    calls: int = attrs_field(init=False, default=0)
+    coalesced: int = attrs_field(init=False, default=0)
+    failures: int = attrs_field(init=False, default=0)
+
+    _inflight: dict[str, asyncio.Future] = attrs_field(init=False, factory=dict)
+
+    async def do(
+        self, key: str, func: Callable[[], Awaitable[Any]]
+    ) -> tuple[Any, bool]:
+        """Run `func` or wait for the in-flight call for `key`.
+
+        Returns the result and whether the result was shared from another call.
+
+        """
+        if (future := self._inflight.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                return await asyncio.shield(future), True
+
+            except asyncio.CancelledError:
+                # If the in-flight call was cancelled (e.g. client disconnected)
+                # but not us, we run the function.
+                task = asyncio.current_task()
+                if not future.cancelled() or (task and task.cancelling()):
+                    raise
+
+                return await self.do(key, func)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        self.calls += 1
+        try:
+            result = await func()
+
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        except BaseException as e:
+            self.failures += 1
+            future.set_exception(e)
+            # Mark the exception as retrieved when there are no waiters
+            future.exception()
+            raise
+
+        else:
+            future.set_result(result)
+            return result, False
+
+        finally:
+            del self._inflight[key]
+
+    def stats(self) -> dict[str, int]:
+        """SingleFlight statistics."""
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "failures": self.failures,
+            "inflight": len(self._inflight),
+        }
+
+
+@dataclass(frozen=True)
+class RequestCoalescingMiddleware:
+    """MiddleWare to collapse identical concurrent `GET` requests.
+
+    Requests with the same canonical key (see `canonical_request_key`) arriving
+    while a first one is being processed wait for its response, which is then
+    sent to all of them. Responses are buffered in memory.
+
+    Only the paths matching one of the `include_path` expressions (by default the
+    tile endpoints) are coalesced. Requests carrying credentials (`private_headers`,
+    by default `Authorization` and `Cookie`) are never coalesced, as the key does not
+    identify the user. Streaming responses (sent in multiple body messages) are
+    passed through and the waiting requests are then processed separately.
+
+    Args:
+        app (ASGIApp): starlette/FastAPI application.
+        group (SingleFlight): SingleFlight instance (use it to access statistics).
+        include_path (set): Set of regex expression matching the paths to coalesce.
+        exclude_path (set): Set of regex expression to use to filter the path.
+        private_headers (set): Request headers (lowercase) for which requests are not coalesced.
+
+    """
+
+    app: ASGIApp
+    group: SingleFlight = field(default_factory=SingleFlight)
+    include_path: set[str] = field(default_factory=lambda: {r".*/tiles/"})
+    exclude_path: set[str] = field(default_factory=set)
+    private_headers: set[str] = field(
+        default_factory=lambda: {"authorization", "cookie"}
+    )
+
+    def _coalesce(self, scope: Scope) -> bool:
+        return (
+            scope["type"] == "http"
+            and scope["method"] == "GET"
+            and any(re.match(path, scope["path"]) for path in self.include_path)
+            and not any(re.match(path, scope["path"]) for path in self.exclude_path)
+            and not _has_credentials(scope, self.private_headers)
+        )
+
+    async def _call(
+        self, scope: Scope, receive: Receive, send: Send
+    ) -> list[Message] | None:
+        """Call the application and record its response messages.
+
+        Streaming responses are sent directly and `None` is returned.
+
+        """
+        messages: list[Message] = []
+        streaming = False
+
+        async def send_wrapper(message: Message):
+            """Record Message, or send it directly for streaming responses."""
+            nonlocal streaming
+
+            if not streaming and message.get("more_body", False):
+                streaming = True
+                for m in messages:
+                    await send(m)
+
+            if streaming:
+                await send(message)
+            else:
+                messages.append(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        # streaming responses can't be shared
+        return None if streaming else messages
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle call."""
+        if not self._coalesce(scope):
+            await self.app(scope, receive, send)
+            return
+
+        messages, shared = await self.group.do(
+            canonical_request_key(scope), lambda: self._call(scope, receive, send)
+        )
+        if messages is None:
+            if shared:
+                await self.app(scope, receive, send)
+
+            return
+
+        for message in messages:
+            # Outer middlewares might update the message, so we send copies
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": list(message.get("headers", []))}
+            else:
+                message = {**message}
+
+            await send(message)
+
+
+@define
+class LazyRouters:
+    """Endpoints added to an application on the first request to their path prefix.
+
+    Loaders are called with the application and should import the modules, and
+    add the routers (and exception handlers), they need.
+
+    Attributes:
+        loaders (dict): Loaders of the endpoints not yet added, by path prefix.
+        loaded (dict): Loading time (in seconds) of the added endpoints, by path prefix.
+
+    """
+
+    loaders: dict[str, Callable[[Any], Any]] = attrs_field(factory=dict)
+    loaded: dict[str, float] = attrs_field(init=False, factory=dict)
+
+    _lock: threading.Lock = attrs_field(init=False, factory=threading.Lock)
+
+    def register(self, prefix: str, loader: Callable[[Any], Any]):
+        """Register a loader for a path prefix (e.g `/cog`)."""
+        self.loaders[prefix.rstrip("/")] = loader
+
+    def match(self, path: str) -> list[str]:
+        """Prefixes of the loaders matching a path."""
+        return [
+            prefix
+            for prefix in self.loaders
+            if path == prefix or path.startswith(prefix + "/")
+        ]
+
+    def load(self, app: Any, prefixes: list[str]) -> bool:
+        """Call the loaders and return whether the application was updated."""
+        updated = False
+        with self._lock:
+            for prefix in prefixes:
+                if (loader := self.loaders.pop(prefix, None)) is None:
+                    continue
+
+                start = time.perf_counter()
+                try:
+                    loader(app)
+                except Exception:
+                    self.loaders[prefix] = loader
+                    raise
+
+                self.loaded[prefix] = time.perf_counter() - start
+                logger.info(f"Loaded {prefix} endpoints in {self.loaded[prefix]:.3f}s")
+                updated = True
+
+        if updated:
+            # Rebuild the middleware stack (with the new exception handlers)
+            # and the OpenAPI document on the next call
+            app.middleware_stack = None
+            app.openapi_schema = None
+
+        return updated
+
+
+@dataclass(frozen=True)
+class LazyRouterMiddleware:
+    """MiddleWare adding the endpoints of `LazyRouters` on the first request to their path.
+
+    All the endpoints are added when the OpenAPI document is requested. This
+    middleware should be added last, so the other middlewares are applied once
+    when the request is dispatched to the updated application.
+
+    Args:
+        app (ASGIApp): starlette/FastAPI application.
+        routers (LazyRouters): LazyRouters instance.
+
+    """
+
+    app: ASGIApp
+    routers: LazyRouters = field(default_factory=LazyRouters)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Handle call."""
+        if scope["type"] in ["http", "websocket"] and self.routers.loaders:
+            application = scope["app"]
+
+            path = scope["path"]
+            root_path = scope.get("root_path", "")
+            if root_path and path.startswith(root_path + "/"):
+                path = path[len(root_path) :]
+
+            if path == application.openapi_url:
+                prefixes = list(self.routers.loaders)
+            else:
+                prefixes = self.routers.match(path)
+
+            if prefixes and self.routers.load(application, prefixes):
+                await application(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
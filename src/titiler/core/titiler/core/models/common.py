@@ -2,7 +2,8 @@
 
 from typing import Annotated
 
-from pydantic import AnyUrl, BaseModel, Field
+from morecantile import Tile, TileMatrixSet
+from pydantic import AnyUrl, BaseModel, Field, model_validator
 
 
 class Link(BaseModel):
@@ -78,3 +79,61 @@ class Link(BaseModel):
     length: int | None = None
 
     model_config = {"use_enum_values": True}
+
+
+class TileBatch(BaseModel):
+    """List of tiles, defined either by their indexes or by a zoom range and a bounding box."""
+
+    tiles: Annotated[
+        list[tuple[int, int, int]] | None,
+        Field(description="List of tile indexes as `[z, x, y]`."),
+    ] = None
+    minzoom: Annotated[int | None, Field(ge=0, description="Minimum zoom level.")] = (
+        None
+    )
+    maxzoom: Annotated[int | None, Field(ge=0, description="Maximum zoom level.")] = (
+        None
+    )
+    bbox: Annotated[
+        tuple[float, float, float, float] | None,
+        Field(description="Bounding box (in geographic coordinates)."),
+    ] = None
+
+    @model_validator(mode="after")
+    def check_tiles(self):
+        """Check `tiles` or `minzoom/maxzoom/bbox` are set."""
+        if self.tiles is None:
+            if self.minzoom is None or self.maxzoom is None or self.bbox is None:
+                raise ValueError(
+                    "`tiles` or `minzoom`, `maxzoom` and `bbox` must be provided."
+                )
+
+            if self.minzoom > self.maxzoom:
+                raise ValueError("`minzoom` must be lower or equal to `maxzoom`.")
+
+        return self
+
+    def get_tiles(self, tms: TileMatrixSet, max_tiles: int) -> list[Tile]:
+        """Return the list of tiles.
+
+        Raises:
+            ValueError: if the number of tiles exceeds `max_tiles`.
+
+        """
+        if self.tiles is not None:
+            tiles = [Tile(x, y, z) for z, x, y in dict.fromkeys(self.tiles)]
+            if len(tiles) > max_tiles:
+                raise ValueError(f"Too many tiles requested (max: {max_tiles}).")
+
+            return tiles
+
+        tiles = []
+        for tile in tms.tiles(
+            *self.bbox,  # type: ignore
+            zooms=list(range(self.minzoom, self.maxzoom + 1)),  # type: ignore
+        ):
+            tiles.append(tile)
+            if len(tiles) > max_tiles:
+                raise ValueError(f"Too many tiles requested (max: {max_tiles}).")
+
+        return tiles
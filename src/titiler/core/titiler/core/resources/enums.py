@@ -32,6 +32,7 @@ class MediaType(str, Enum):
     openapi30_json = "application/vnd.oai.openapi+json;version=3.0"
     openapi30_yaml = "application/vnd.oai.openapi;version=3.0"
     gif = "image/gif"
+    tar = "application/x-tar"
 
 
 class ImageDriver(str, Enum):
@@ -84,3 +85,16 @@ class OptionalHeader(str, Enum):
     server_timing = "Server-Timing"
     x_assets = "X-Assets"
     projjson_crs = "PROJJSON-Crs"
+
+
+class VectorType(str, Enum):
+    """Available Output vector type."""
+
+    mvt = "mvt"
+    pbf = "pbf"
+    geojson = "geojson"
+
+    @DynamicClassAttribute
+    def mediatype(self):
+        """Return vector media type."""
+        return MediaType[self._name_].value
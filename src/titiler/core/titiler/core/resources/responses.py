@@ -23,6 +23,19 @@ class NumpyEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def dumps(content: Any) -> str:
+    """Serialize to JSON (compact, NaN replaced by null, numpy types support)."""
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        ignore_nan=True,
+        separators=(",", ":"),
+        cls=NumpyEncoder,
+    )
+
+
 class JSONResponse(responses.JSONResponse):
     """Custom JSON Response."""
 
@@ -31,15 +44,7 @@ class JSONResponse(responses.JSONResponse):
 
         Same defaults as starlette.responses.JSONResponse.render but allow NaN to be replaced by null using simplejson
         """
-        return json.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            ignore_nan=True,
-            separators=(",", ":"),
-            cls=NumpyEncoder,
-        ).encode("utf-8")
+        return dumps(content).encode("utf-8")
 
 
 class GeoJSONResponse(JSONResponse):
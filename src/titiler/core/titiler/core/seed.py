@@ -0,0 +1,543 @@
+"""titiler.core seed: pre-render tiles using a factory's endpoints."""
+
+from __future__ import annotations
+
+import abc
+import argparse
+import asyncio
+import importlib
+import json
+import logging
+import multiprocessing
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any
+from urllib.parse import parse_qsl, urlencode
+
+from attrs import define, field
+from fastapi import FastAPI
+from morecantile import Tile, TileMatrixSet
+from rio_tiler.errors import EmptyMosaicError, NoAssetFoundError
+from starlette import status
+
+from titiler.core.cache import ReaderCache
+from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
+from titiler.core.factory import BaseFactory
+from titiler.core.resources.enums import ImageType
+
+logger = logging.getLogger(__name__)
+
+SEED_STATUS_CODES = {
+    **DEFAULT_STATUS_CODES,
+    EmptyMosaicError: status.HTTP_204_NO_CONTENT,
+    NoAssetFoundError: status.HTTP_204_NO_CONTENT,
+}
+
+
+def import_factory(path: str) -> BaseFactory:
+    """Import a factory instance (or a function returning one) from a `module:attribute` path."""
+    module_name, _, attribute = path.partition(":")
+    if not module_name or not attribute:
+        raise ValueError(f"Invalid factory path {path}, should be `module:attribute`")
+
+    obj = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(obj, BaseFactory) and callable(obj):
+        obj = obj()
+
+    if not isinstance(obj, BaseFactory):
+        raise ValueError(f"{path} is not a titiler Factory")
+
+    return obj
+
+
+def create_app(factory: BaseFactory) -> FastAPI:
+    """Create an application with the factory's endpoints."""
+    app = FastAPI(openapi_url=None)
+    app.include_router(factory.router)
+    add_exception_handlers(app, SEED_STATUS_CODES)
+    return app
+
+
+async def asgi_get(
+    app: Callable,
+    path: str,
+    query_string: str = "",
+) -> tuple[int, dict[str, str], bytes]:
+    """Send a `GET` request to an ASGI application (without network)."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string.encode(),
+        "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 0),
+        "server": ("localhost", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    response: dict[str, Any] = {"status": 500, "headers": {}, "body": []}
+
+    async def send(message: dict):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = {
+                k.decode("latin-1"): v.decode("latin-1")
+                for k, v in message.get("headers", [])
+            }
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+
+    await app(scope, receive, send)
+
+    return response["status"], response["headers"], b"".join(response["body"])
+
+
+class TileWriter(metaclass=abc.ABCMeta):
+    """Tile archive writer."""
+
+    @abc.abstractmethod
+    def done(self) -> set[tuple[int, int, int]]:
+        """Return the tiles already in the archive (`(z, x, y)`)."""
+        ...
+
+    @abc.abstractmethod
+    def write(self, tile: Tile, data: bytes):
+        """Write a tile."""
+        ...
+
+    def flush(self):  # noqa: B027
+        """Persist written tiles."""
+        pass
+
+    def close(self):
+        """Close the archive."""
+        self.flush()
+
+    def __enter__(self):
+        """Support using with Context Managers."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Support using with Context Managers."""
+        self.close()
+
+
+@define
+class DirectoryWriter(TileWriter):
+    """Write tiles in a `{z}/{x}/{y}.{extension}` directory tree.
+
+    Attributes:
+        path (str): Output directory.
+        extension (str): Tiles file extension.
+
+    """
+
+    path: str
+    extension: str
+
+    def _tile_path(self, z: int, x: int, y: int) -> str:
+        return os.path.join(self.path, str(z), str(x), f"{y}.{self.extension}")
+
+    def done(self) -> set[tuple[int, int, int]]:
+        """Return the tiles already in the directory."""
+        tiles = set()
+        suffix = f".{self.extension}"
+        for root, _, files in os.walk(self.path):
+            parts = os.path.relpath(root, self.path).split(os.sep)
+            if len(parts) != 2 or not all(p.isdigit() for p in parts):
+                continue
+
+            z, x = map(int, parts)
+            for name in files:
+                y = name.removesuffix(suffix)
+                if name.endswith(suffix) and y.isdigit():
+                    tiles.add((z, x, int(y)))
+
+        return tiles
+
+    def write(self, tile: Tile, data: bytes):
+        """Write tile file (atomically)."""
+        path = self._tile_path(tile.z, tile.x, tile.y)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=directory, delete=False) as f:
+            f.write(data)
+
+        os.replace(f.name, path)
+
+
+@define
+class MBTilesWriter(TileWriter):
+    """Write tiles in a MBTiles (SQLite) archive.
+
+    Tiles rows are stored using the MBTiles convention (origin at the bottom-left).
+
+    Attributes:
+        path (str): Output MBTiles file.
+        tms (morecantile.TileMatrixSet): TileMatrixSet of the tiles.
+        metadata (dict): Archive metadata (e.g name, format, bounds, minzoom, maxzoom).
+        commit_every (int): Commit the transaction every `commit_every` tiles. Defaults to `100`.
+
+    """
+
+    path: str
+    tms: TileMatrixSet
+    metadata: dict[str, Any] = field(factory=dict)
+    commit_every: int = 100
+
+    _db: sqlite3.Connection = field(init=False)
+    _pending: int = field(init=False, default=0)
+
+    def __attrs_post_init__(self):
+        """Create the MBTiles tables."""
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS tiles (
+                zoom_level INTEGER,
+                tile_column INTEGER,
+                tile_row INTEGER,
+                tile_data BLOB
+            );
+            CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles (zoom_level, tile_column, tile_row);
+            """
+        )
+        self._db.executemany(
+            "INSERT OR REPLACE INTO metadata (name, value) VALUES (?, ?)",
+            [
+                (k, v if isinstance(v, str) else json.dumps(v))
+                for k, v in self.metadata.items()
+            ],
+        )
+        self._db.commit()
+
+    def _flip(self, z: int, y: int) -> int:
+        return self.tms.matrix(z).matrixHeight - 1 - y
+
+    def done(self) -> set[tuple[int, int, int]]:
+        """Return the tiles already in the archive."""
+        return {
+            (z, x, self._flip(z, row))
+            for z, x, row in self._db.execute(
+                "SELECT zoom_level, tile_column, tile_row FROM tiles"
+            )
+        }
+
+    def write(self, tile: Tile, data: bytes):
+        """Write tile."""
+        self._db.execute(
+            "INSERT OR REPLACE INTO tiles (zoom_level, tile_column, tile_row, tile_data) VALUES (?, ?, ?, ?)",
+            (tile.z, tile.x, self._flip(tile.z, tile.y), sqlite3.Binary(data)),
+        )
+        self._pending += 1
+        if self._pending >= self.commit_every:
+            self.flush()
+
+    def flush(self):
+        """Commit the transaction."""
+        self._db.commit()
+        self._pending = 0
+
+    def close(self):
+        """Commit and close the database."""
+        self.flush()
+        self._db.close()
+
+
+# Per-process state (application and event loop)
+_worker: dict[str, Any] = {}
+
+
+def _init_worker(factory: str, reader_cache: bool = True):
+    """Create the application (once per process)."""
+    tiler = import_factory(factory)
+    # Re-use dataset handles between the tiles rendered by the process
+    if reader_cache and getattr(tiler, "reader_cache", False) is None:
+        tiler.reader_cache = ReaderCache()  # type: ignore
+
+    _worker["app"] = create_app(tiler)
+    _worker["loop"] = asyncio.new_event_loop()
+
+
+def _render(path: str, query_string: str) -> tuple[int, bytes, str | None]:
+    """Render a tile."""
+    try:
+        status_code, _, body = _worker["loop"].run_until_complete(
+            asgi_get(_worker["app"], path, query_string)
+        )
+    except Exception as e:  # noqa
+        return 500, b"", f"{type(e).__name__}: {e}"
+
+    if status_code != 200:
+        return status_code, b"", body.decode(errors="replace") or None
+
+    return status_code, body, None
+
+
+@define
+class TileSeeder:
+    """Pre-render tiles using the `/tiles` endpoint of a Factory.
+
+    Tiles are rendered in-process (no HTTP server) by the factory endpoints,
+    meaning the reader, dependencies, algorithms, colormap and rendering
+    options are exactly the same as for the live endpoints.
+
+    Attributes:
+        factory (str): Factory `module:attribute` path (the factory is imported in each process).
+        tile_matrix_set_id (str): TileMatrixSet identifier. Defaults to `WebMercatorQuad`.
+        tile_format (str): Output format. Defaults to `png`.
+        params (list): Query parameters forwarded to the tile endpoint (e.g `url`, `rescale`, `colormap_name`).
+        processes (int): Number of processes. Defaults to `1` (render in the current process).
+        reader_cache (bool): Re-use opened datasets in each process (`TilerFactory.reader_cache`). Defaults to `True`.
+
+    """
+
+    factory: str
+    tile_matrix_set_id: str = "WebMercatorQuad"
+    tile_format: str = "png"
+    params: list[tuple[str, str]] = field(factory=list)
+    processes: int = 1
+    reader_cache: bool = True
+
+    _tiler: BaseFactory = field(init=False)
+
+    def __attrs_post_init__(self):
+        """Import factory."""
+        self._tiler = import_factory(self.factory)
+
+    @property
+    def tms(self) -> TileMatrixSet:
+        """TileMatrixSet."""
+        return self._tiler.supported_tms.get(self.tile_matrix_set_id)  # type: ignore
+
+    @property
+    def query_string(self) -> str:
+        """Tile endpoint query string."""
+        return urlencode(self.params)
+
+    def tile_path(self, tile: Tile) -> str:
+        """Tile endpoint path."""
+        return f"/tiles/{self.tile_matrix_set_id}/{tile.z}/{tile.x}/{tile.y}.{self.tile_format}"
+
+    def tilejson(self) -> dict:
+        """Get the TileJSON document for the dataset."""
+        app = create_app(self._tiler)
+        status_code, _, body = asyncio.run(
+            asgi_get(
+                app, f"/{self.tile_matrix_set_id}/tilejson.json", self.query_string
+            )
+        )
+        if status_code != 200:
+            raise ValueError(f"Could not get dataset's TileJSON: {body.decode()}")
+
+        return json.loads(body)
+
+    def tiles(
+        self,
+        minzoom: int,
+        maxzoom: int,
+        bbox: tuple[float, float, float, float],
+    ) -> Iterator[Tile]:
+        """List tiles covering the (geographic) bbox."""
+        yield from self.tms.tiles(*bbox, zooms=list(range(minzoom, maxzoom + 1)))
+
+    def render(
+        self, tiles: Iterable[Tile]
+    ) -> Iterator[tuple[Tile, tuple[int, bytes, str | None]]]:
+        """Render tiles (in the current process or in a process pool).
+
+        Yields `(tile, (status_code, content, error))` tuples, in completion order.
+
+        """
+        query_string = self.query_string
+
+        if self.processes <= 1:
+            _init_worker(self.factory, self.reader_cache)
+            try:
+                for tile in tiles:
+                    yield tile, _render(self.tile_path(tile), query_string)
+            finally:
+                _worker.pop("loop").close()
+                _worker.clear()
+
+            return
+
+        max_inflight = self.processes * 4
+        # `spawn` avoids sharing GDAL's file handles with forked processes
+        with ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(self.factory, self.reader_cache),
+        ) as executor:
+            inflight: dict[Future, Tile] = {}
+            for tile in tiles:
+                future = executor.submit(_render, self.tile_path(tile), query_string)
+                inflight[future] = tile
+                if len(inflight) >= max_inflight:
+                    completed, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        yield inflight.pop(future), future.result()
+
+            for future in wait(inflight).done:
+                yield inflight.pop(future), future.result()
+
+    def run(
+        self,
+        writer: TileWriter,
+        tiles: Iterable[Tile],
+        progress: Callable[[dict[str, int]], None] | None = None,
+    ) -> dict[str, int]:
+        """Render tiles and write them in the archive.
+
+        Tiles already in the archive are skipped (resumable). Empty tiles
+        (`204`/`404` responses) are not written and failures are logged.
+
+        Returns:
+            dict: Number of `rendered`, `skipped` (already in the archive), `empty` and `failed` tiles.
+
+        """
+        done = writer.done()
+        stats = {"rendered": 0, "skipped": 0, "empty": 0, "failed": 0}
+
+        def _todo() -> Iterator[Tile]:
+            for tile in tiles:
+                if (tile.z, tile.x, tile.y) in done:
+                    stats["skipped"] += 1
+                    continue
+
+                yield tile
+
+        for tile, (status_code, data, error) in self.render(_todo()):
+            if status_code == 200:
+                writer.write(tile, data)
+                stats["rendered"] += 1
+            elif status_code in [204, 404]:
+                stats["empty"] += 1
+            else:
+                logger.warning(f"Could not render tile {tile}: {error}")
+                stats["failed"] += 1
+
+            if progress:
+                progress(stats)
+
+        writer.flush()
+
+        return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    """titiler-seed command line."""
+    parser = argparse.ArgumentParser(
+        prog="titiler-seed",
+        description="Pre-render tiles using a TiTiler Factory and write them in a MBTiles file or a `{z}/{x}/{y}` directory.",
+    )
+    parser.add_argument(
+        "factory",
+        help="Factory `module:attribute` path (e.g `mypackage.tiler:cog`).",
+    )
+    parser.add_argument(
+        "output",
+        help="Output MBTiles file (`.mbtiles`) or directory.",
+    )
+    parser.add_argument(
+        "--tms",
+        default="WebMercatorQuad",
+        help="TileMatrixSet identifier. Defaults to `WebMercatorQuad`.",
+    )
+    parser.add_argument("--minzoom", type=int, help="Minimum zoom level.")
+    parser.add_argument("--maxzoom", type=int, help="Maximum zoom level.")
+    parser.add_argument(
+        "--bbox",
+        type=lambda v: tuple(map(float, v.split(","))),
+        help="Geographic bounding box `west,south,east,north`. Defaults to the dataset bounds.",
+    )
+    parser.add_argument(
+        "--format",
+        default="png",
+        choices=[t.name for t in ImageType],
+        help="Tile format. Defaults to `png`.",
+    )
+    parser.add_argument(
+        "--query",
+        default="",
+        help="Tile endpoint query parameters (e.g `url=cog.tif&rescale=0,1000&colormap_name=viridis`).",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes. Defaults to the number of CPUs.",
+    )
+    args = parser.parse_args(argv)
+
+    seeder = TileSeeder(
+        factory=args.factory,
+        tile_matrix_set_id=args.tms,
+        tile_format=args.format,
+        params=parse_qsl(args.query),
+        processes=args.processes,
+    )
+
+    bbox = args.bbox
+    minzoom, maxzoom = args.minzoom, args.maxzoom
+    if bbox is None or minzoom is None or maxzoom is None:
+        tilejson = seeder.tilejson()
+        bbox = bbox or tuple(tilejson["bounds"])
+        minzoom = tilejson["minzoom"] if minzoom is None else minzoom
+        maxzoom = tilejson["maxzoom"] if maxzoom is None else maxzoom
+
+    writer: TileWriter
+    if args.output.endswith(".mbtiles"):
+        writer = MBTilesWriter(
+            args.output,
+            tms=seeder.tms,
+            metadata={
+                "name": os.path.basename(args.output).removesuffix(".mbtiles"),
+                "format": args.format,
+                "type": "overlay",
+                "version": "1.3",
+                "bounds": ",".join(map(str, bbox)),
+                "minzoom": str(minzoom),
+                "maxzoom": str(maxzoom),
+                "tileMatrixSetId": args.tms,
+            },
+        )
+    else:
+        writer = DirectoryWriter(args.output, extension=args.format)
+
+    start = time.perf_counter()
+
+    def _progress(stats: dict[str, int]):
+        count = stats["rendered"] + stats["empty"] + stats["failed"]
+        if count % 100 == 0:
+            print(f"{count} tiles processed ({stats})", file=sys.stderr)
+
+    with writer:
+        stats = seeder.run(
+            writer,
+            seeder.tiles(minzoom, maxzoom, bbox),
+            progress=_progress,
+        )
+
+    elapsed = time.perf_counter() - start
+    print(json.dumps({**stats, "elapsed": round(elapsed, 2)}))
+
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import io
+import math
+import queue
 import re
+import tarfile
+import threading
+import time
 import warnings
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from contextlib import AbstractContextManager
 from typing import Any, TypedDict, TypeVar, cast
 from urllib.parse import urlencode
 
@@ -30,10 +37,15 @@ from fastapi.openapi.utils import (
 )
 from geojson_pydantic.geometries import MultiPolygon, Polygon
 from morecantile import TileMatrixSet
+from rasterio import windows
+from rasterio.crs import CRS
 from rasterio.dtypes import dtype_ranges
-from rio_tiler.colormap import apply_cmap
+from rasterio.features import bounds as featureBounds
+from rasterio.features import rasterize
+from rasterio.transform import Affine, array_bounds
+from rasterio.warp import transform_bounds, transform_geom
 from rio_tiler.errors import InvalidDatatypeWarning
-from rio_tiler.models import ImageData
+from rio_tiler.models import BandStatistics, ImageData
 from rio_tiler.types import BBox, ColorMapType, IntervalTuple
 from rio_tiler.utils import linear_rescale, render
 from starlette.requests import Request
@@ -41,17 +53,19 @@ from starlette.responses import Response
 from starlette.routing import Route, request_response
 from starlette.templating import Jinja2Templates, _TemplateResponse
 
+from titiler.core.algorithm.base import BaseAlgorithm
+from titiler.core.colormap import apply_colormap
 from titiler.core.resources.enums import ImageType, MediaType
 
 
-def rescale_array(
+def _rescale(
     array: numpy.ndarray,
-    mask: numpy.ndarray,
+    invalid: numpy.ndarray,
     in_range: Sequence[IntervalTuple],
     out_range: Sequence[IntervalTuple] = ((0, 255),),
     out_dtype: str | numpy.number = "uint8",
 ) -> numpy.ndarray:
-    """Rescale data array"""
+    """Rescale data array, setting `invalid` pixels to 0 (see `rescale_array`)."""
     if len(array.shape) < 3:
         array = numpy.expand_dims(array, axis=0)
 
@@ -62,16 +76,66 @@ def rescale_array(
     if len(out_range) != nbands:
         out_range = ((out_range[0]),) * nbands
 
-    for bdx in range(nbands):
-        array[bdx] = numpy.where(
-            mask[bdx],
-            linear_rescale(
-                array[bdx], in_range=in_range[bdx], out_range=out_range[bdx]
-            ),
-            0,
+    out = numpy.empty(array.shape, dtype=out_dtype)
+
+    # Values are cast to the input data type first (e.g float32 rounding),
+    # unless casting directly to the output type gives the same result.
+    direct = array.dtype == numpy.float64
+    if numpy.issubdtype(array.dtype, numpy.integer) and numpy.issubdtype(
+        out.dtype, numpy.integer
+    ):
+        in_info, out_info = numpy.iinfo(array.dtype), numpy.iinfo(out.dtype)
+        lower = min(0, *(omin for omin, _ in out_range))
+        upper = max(0, *(omax for _, omax in out_range))
+        direct = max(in_info.min, out_info.min) <= lower and upper <= min(
+            in_info.max, out_info.max
         )
 
-    return array.astype(out_dtype)
+    buffer = numpy.empty(array.shape[1:], dtype=numpy.float64)
+    cast_buffer = None if direct else numpy.empty(array.shape[1:], dtype=array.dtype)
+
+    for bdx, ((imin, imax), (omin, omax)) in enumerate(zip(in_range, out_range)):
+        numpy.clip(array[bdx], imin, imax, out=buffer, dtype=numpy.float64)
+        buffer -= imin
+        buffer /= numpy.float64(imax - imin)
+        buffer *= omax - omin
+        buffer += omin
+        numpy.copyto(buffer, 0, where=invalid[bdx] if invalid.ndim == 3 else invalid)
+
+        if cast_buffer is not None:
+            numpy.copyto(cast_buffer, buffer, casting="unsafe")
+            numpy.copyto(out[bdx], cast_buffer, casting="unsafe")
+        else:
+            numpy.copyto(out[bdx], buffer, casting="unsafe")
+
+    return out
+
+
+def rescale_array(
+    array: numpy.ndarray,
+    mask: numpy.ndarray,
+    in_range: Sequence[IntervalTuple],
+    out_range: Sequence[IntervalTuple] = ((0, 255),),
+    out_dtype: str | numpy.number = "uint8",
+) -> numpy.ndarray:
+    """Rescale data array.
+
+    Bands are rescaled (same arithmetic as `rio_tiler.utils.linear_rescale`) in
+    place in a single float64 band buffer, then cast into the preallocated
+    output array. The input array is not modified.
+
+    Args:
+        array (numpy.ndarray): Data array (bands, rows, columns).
+        mask (numpy.ndarray): Valid pixels mask (non-zero for valid pixels), either per band (bands, rows, columns) or for all bands (rows, columns). Invalid pixels are set to `0`.
+        in_range (sequence): Input min/max values for each band (or for all the bands).
+        out_range (sequence): Output min/max values for each band (or for all the bands). Defaults to `((0, 255),)`.
+        out_dtype (str): Output data type. Defaults to `uint8`.
+
+    Returns:
+        numpy.ndarray: rescaled array.
+
+    """
+    return _rescale(array, numpy.logical_not(mask), in_range, out_range, out_dtype)
 
 
 def render_image(  # noqa: C901
@@ -87,18 +151,37 @@ def render_image(  # noqa: C901
 
     This is adapted from https://github.com/cogeotiff/rio-tiler/blob/066878704f841a332a53027b74f7e0a97f10f4b2/rio_tiler/models.py#L698-L764
     """
-    if rescale:
-        image.rescale(rescale)
+    if rescale and not color_formula:
+        # Rescale directly into a new uint8 array (same output as `ImageData.rescale`)
+        array_mask = numpy.ma.getmaskarray(image.array)
+        data = _rescale(image.array.data, array_mask, in_range=rescale)
+        if image.alpha_mask is not None:
+            mask = linear_rescale(
+                image.alpha_mask,
+                in_range=dtype_ranges[str(image.alpha_mask.dtype)],
+                out_range=dtype_ranges["uint8"],
+            ).astype("uint8")
+        else:
+            # valid if any band is valid
+            mask = numpy.where(numpy.logical_and.reduce(array_mask), 0, 255).astype(
+                "uint8"
+            )
+
+    else:
+        if rescale:
+            image.rescale(rescale)
 
-    if color_formula:
-        image.apply_color_formula(color_formula)
+        if color_formula:
+            image.apply_color_formula(color_formula)
+
+        # NOTE: `data` and `mask` are not modified in place below
+        data, mask = image.data, image.mask
 
-    data, mask = image.data.copy(), image.mask.copy()
     input_range = dtype_ranges[str(data.dtype)]
     output_range = image.dataset_statistics or (input_range,)
 
     if colormap:
-        data, alpha_from_cmap = apply_cmap(data, colormap)
+        data, alpha_from_cmap = apply_colormap(data, colormap)
         output_range = (dtype_ranges[str(data.dtype)],)
         # Combine both Mask from dataset and Alpha band from Colormap
         mask = numpy.where(
@@ -549,3 +632,610 @@ def rio_crs_to_pyproj(crs: pyproj.CRS | rasterio.crs.CRS) -> pyproj.CRS:
 
     with rasterio.Env(OSR_WKT_FORMAT="WKT2_2018"):
         return pyproj.CRS.from_user_input(crs)
+
+
+def add_algorithm_halo(
+    options: dict[str, Any], post_process: BaseAlgorithm | None
+) -> dict[str, Any]:
+    """Add the pixels needed by the post-processing algorithm to the `buffer` option.
+
+    The algorithm crops its halo, so the output keeps the size requested by the user.
+
+    """
+    if post_process is not None and (halo := post_process.halo):
+        return {**options, "buffer": (options.get("buffer") or 0) + halo}
+
+    return options
+
+
+def media_type_to_extension(media_type: str) -> str:
+    """Get file extension for an image media type."""
+    for image_type in ImageType:
+        if image_type.mediatype == media_type:
+            return image_type.value
+
+    raise ValueError(f"No extension found for {media_type} media type")
+
+
+def tar_stream(files: Iterable[tuple[str, bytes]]) -> Iterator[bytes]:
+    """Create a TAR archive stream from `(name, content)` items."""
+    buffer = io.BytesIO()
+
+    def flush() -> bytes:
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+
+    with tarfile.open(fileobj=buffer, mode="w|") as tar:
+        for name, content in files:
+            info = tarfile.TarInfo(name)
+            info.size = len(content)
+            info.mtime = int(time.time())
+            tar.addfile(info, io.BytesIO(content))
+            if data := flush():
+                yield data
+
+    if data := flush():
+        yield data
+
+
+R = TypeVar("R")
+
+
+def threaded_batch(  # noqa: C901
+    open_dataset: Callable[[], AbstractContextManager],
+    func: Callable[[Any, T], R],
+    items: Sequence[T],
+    threads: int = 1,
+    env: dict | None = None,
+) -> Iterator[tuple[T, R | Exception]]:
+    """Apply `func(src_dst, item)` to items using a pool of threads.
+
+    GDAL dataset handles are not thread-safe so each thread opens its own
+    dataset (once) with `open_dataset` and processes a subset of the items
+    within its own `rasterio.Env`. Results are yielded as soon as they are
+    available (not in the input order) along with the input item. Exceptions
+    raised by `func` are yielded instead of the result.
+
+    """
+    threads = max(1, min(threads, len(items)))
+    results: queue.Queue = queue.Queue(maxsize=threads * 2)
+    done = object()
+    stop = threading.Event()
+
+    def put(value: Any):
+        while not stop.is_set():
+            try:
+                results.put(value, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def worker(chunk: Sequence[T]):
+        try:
+            with rasterio.Env(**(env or {})):
+                with open_dataset() as src_dst:
+                    for item in chunk:
+                        if stop.is_set():
+                            break
+
+                        try:
+                            put((item, func(src_dst, item)))
+                        except Exception as e:  # noqa
+                            put((item, e))
+
+        except Exception as e:  # noqa
+            # Could not open the dataset
+            for item in chunk:
+                put((item, e))
+
+        finally:
+            put(done)
+
+    workers = [
+        threading.Thread(target=worker, args=(items[i::threads],), daemon=True)
+        for i in range(threads)
+    ]
+    for t in workers:
+        t.start()
+
+    try:
+        running = threads
+        while running:
+            value = results.get()
+            if value is done:
+                running -= 1
+                continue
+
+            yield value
+
+    finally:
+        stop.set()
+        for t in workers:
+            t.join()
+
+
+def _morton_code(x: int, y: int) -> int:
+    """Interleave the bits of two 16 bits integers."""
+    code = 0
+    for i in range(16):
+        code |= ((x >> i) & 1) << (2 * i) | ((y >> i) & 1) << (2 * i + 1)
+    return code
+
+
+def group_bounds(
+    bounds: Sequence[BBox],
+    max_size: float,
+    min_density: float = 0.25,
+) -> list[list[int]]:
+    """Group nearby bounding boxes.
+
+    Bounding boxes are sorted along a Z-order curve (using their centers) and
+    consecutive ones are grouped as long as the union's width and height stay
+    lower than `max_size` and the union's area is not mostly empty (the sum of
+    the bounding boxes areas divided by the union's area >= `min_density`).
+
+    Args:
+        bounds (list): Bounding boxes (minx, miny, maxx, maxy).
+        max_size (float): Maximum width/height of a group union (in bounds units).
+        min_density (float): Minimum ratio between the sum of areas and the union's area.
+
+    Returns:
+        list: Groups of indexes.
+
+    """
+    if not bounds:
+        return []
+
+    minx = min(b[0] for b in bounds)
+    miny = min(b[1] for b in bounds)
+    scale = max(
+        max(b[2] for b in bounds) - minx,
+        max(b[3] for b in bounds) - miny,
+    )
+    scale = 65535 / scale if scale else 0
+
+    def _key(ix: int) -> int:
+        b = bounds[ix]
+        cx = int(((b[0] + b[2]) / 2 - minx) * scale)
+        cy = int(((b[1] + b[3]) / 2 - miny) * scale)
+        return _morton_code(cx, cy)
+
+    groups: list[list[int]] = []
+    group: list[int] = []
+    union: list[float] = []
+    area = 0.0
+    for ix in sorted(range(len(bounds)), key=_key):
+        b = bounds[ix]
+        b_area = (b[2] - b[0]) * (b[3] - b[1])
+        if group:
+            u = [
+                min(union[0], b[0]),
+                min(union[1], b[1]),
+                max(union[2], b[2]),
+                max(union[3], b[3]),
+            ]
+            u_width, u_height = u[2] - u[0], u[3] - u[1]
+            if (
+                u_width <= max_size
+                and u_height <= max_size
+                and (area + b_area) >= min_density * u_width * u_height
+            ):
+                group.append(ix)
+                union = u
+                area += b_area
+                continue
+
+            groups.append(group)
+
+        group = [ix]
+        union = list(b)
+        area = b_area
+
+    groups.append(group)
+
+    return groups
+
+
+def _feature_window(
+    image: ImageData,
+    shape: dict,
+    shape_crs: CRS,
+) -> tuple[dict, windows.Window]:
+    """Get the geometry (in the image's CRS) and the (pixel aligned) window of the image covering it.
+
+    As in rio-tiler's `Reader.feature` method, the window covers the
+    shape's bounds transformed to the image's CRS.
+
+    """
+    geom = shape["geometry"] if shape.get("type") == "Feature" else shape
+    bounds = featureBounds(geom)
+    if image.crs and image.crs != shape_crs:
+        bounds = transform_bounds(shape_crs, image.crs, *bounds, densify_pts=21)
+        geom = transform_geom(shape_crs, image.crs, geom)
+
+    window = windows.from_bounds(*bounds, transform=image.transform)
+    row_start = max(math.floor(round(window.row_off, 6)), 0)
+    col_start = max(math.floor(round(window.col_off, 6)), 0)
+    row_stop = min(math.ceil(round(window.row_off + window.height, 6)), image.height)
+    col_stop = min(math.ceil(round(window.col_off + window.width, 6)), image.width)
+    return geom, windows.Window(
+        col_start,
+        row_start,
+        max(col_stop - col_start, 0),
+        max(row_stop - row_start, 0),
+    )
+
+
+def clip_to_feature(image: ImageData, shape: dict, shape_crs: CRS) -> ImageData:
+    """Clip an ImageData to a GeoJSON Feature/Geometry.
+
+    Same as what rio-tiler's `Reader.feature` method does, but from already read data:
+    the image is clipped to the shape's bounds (pixels are not resampled) and
+    pixels outside the shape are masked.
+
+    """
+    geom, window = _feature_window(image, shape, shape_crs)
+    row_start, col_start = window.row_off, window.col_off
+    row_stop, col_stop = row_start + window.height, col_start + window.width
+    transform = windows.transform(window, image.transform)
+
+    alpha_mask: numpy.ndarray | None = None
+    if image.alpha_mask is not None:
+        alpha_mask = image.alpha_mask[row_start:row_stop, col_start:col_stop].copy()
+
+    img = ImageData(
+        image.array[:, row_start:row_stop, col_start:col_stop].copy(),
+        assets=image.assets,
+        crs=image.crs,
+        bounds=array_bounds(window.height, window.width, transform),
+        band_names=image.band_names,
+        band_descriptions=image.band_descriptions,
+        nodata=image.nodata,
+        scales=image.scales,
+        offsets=image.offsets,
+        metadata=image.metadata,
+        dataset_statistics=image.dataset_statistics,
+        alpha_mask=alpha_mask,
+    )
+
+    with warnings.catch_warnings():
+        warnings.filterwarnings(
+            "ignore", category=rasterio.errors.NotGeoreferencedWarning
+        )
+        cutline_mask = rasterize(
+            [geom],
+            out_shape=(img.height, img.width),
+            transform=img.transform,
+            all_touched=True,
+            default_value=0,
+            fill=1,
+            dtype="uint8",
+        ).astype("bool")
+
+    img.cutline_mask = cutline_mask
+    img.array.mask = numpy.where(~cutline_mask, img.array.mask, True)
+
+    return img
+
+
+def _zonal_histograms(  # noqa: C901
+    values: numpy.ndarray,
+    zones: numpy.ndarray,
+    starts: numpy.ndarray,
+    ends: numpy.ndarray,
+    **kwargs: Any,
+) -> list[list[list]]:
+    """Compute numpy's histograms for each zone.
+
+    `values` must be sorted by zone (using `starts` and `ends` offsets).
+
+    """
+    nzones = len(starts)
+    bins = kwargs.get("bins", 10)
+    hist_range = kwargs.get("range")
+
+    # Only `bins` and `range` options are vectorized
+    if set(kwargs) - {"bins", "range"} or isinstance(bins, str):
+        return [
+            [h.tolist() for h in numpy.histogram(values[s:e], **kwargs)]
+            for s, e in zip(starts, ends, strict=True)
+        ]
+
+    bin_type = (
+        values.dtype
+        if numpy.issubdtype(values.dtype, numpy.floating)
+        else numpy.float64
+    )
+
+    # Same bin edges for all the zones
+    if not isinstance(bins, int) or hist_range is not None:
+        if isinstance(bins, int) and hist_range is not None:
+            first, last = hist_range
+            edges = numpy.linspace(first, last, bins + 1, dtype=bin_type)
+        else:
+            edges = numpy.asarray(bins)
+            first, last = edges[0], edges[-1]
+
+        nbins = len(edges) - 1
+        keep = (values >= first) & (values <= last)
+        indexes = numpy.searchsorted(edges, values[keep], side="right") - 1
+        indexes[indexes == nbins] = nbins - 1
+        counts = numpy.bincount(
+            zones[keep] * nbins + indexes,
+            minlength=nzones * nbins,
+        ).reshape(nzones, nbins)
+        return [[c.tolist(), edges.tolist()] for c in counts]
+
+    # Bin edges from each zone's min/max values (same as `numpy.histogram`)
+    empty = ends == starts
+    first = numpy.where(empty, 0, values[numpy.minimum(starts, len(values) - 1)])
+    last = numpy.where(empty, 1, values[numpy.maximum(ends - 1, 0)])
+    if len(values) == 0:
+        first, last = numpy.zeros(nzones), numpy.ones(nzones)
+
+    equal = first == last
+    first = numpy.where(equal, first - 0.5, first)
+    last = numpy.where(equal, last + 0.5, last)
+    edges = numpy.linspace(first, last, bins + 1, axis=-1, dtype=bin_type)
+
+    # Same bins indexes computation and correction as `numpy.histogram`
+    data = values.astype(bin_type, copy=False)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        f_indexes = (data - first[zones]) / (last[zones] - first[zones]) * bins
+
+    indexes = f_indexes.astype(numpy.intp)
+    indexes[indexes == bins] -= 1
+    indexes[data < edges[zones, indexes]] -= 1
+    indexes[(data >= edges[zones, indexes + 1]) & (indexes != bins - 1)] += 1
+
+    counts = numpy.bincount(zones * bins + indexes, minlength=nzones * bins).reshape(
+        nzones, bins
+    )
+    return [[c.tolist(), e.tolist()] for c, e in zip(counts, edges, strict=True)]
+
+
+def _zonal_band_statistics(  # noqa: C901
+    values: numpy.ndarray,
+    zones: numpy.ndarray,
+    weights: numpy.ndarray,
+    window_pixels: numpy.ndarray,
+    coverage_pixels: numpy.ndarray,
+    categorical: bool = False,
+    categories: list[float] | None = None,
+    percentiles: Sequence[int] = (2, 98),
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """Compute statistics for each zone (see `rio_tiler.utils.get_array_statistics`)."""
+    nzones = len(window_pixels)
+
+    # Sort values by zone and value
+    order = numpy.lexsort((values, zones))
+    values, zones, weights = values[order], zones[order], weights[order]
+
+    valid_pixels = numpy.bincount(zones, minlength=nzones)
+    ends = numpy.cumsum(valid_pixels)
+    starts = ends - valid_pixels
+    valid = valid_pixels > 0
+
+    count = numpy.bincount(zones, weights=weights, minlength=nzones)
+    total = numpy.bincount(zones, weights=weights * values, minlength=nzones)
+    with numpy.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+        variance = (
+            numpy.bincount(
+                zones,
+                weights=weights * (values - mean[zones]) ** 2,
+                minlength=nzones,
+            )
+            / count
+        )
+        valid_percent = numpy.round(
+            numpy.minimum(valid_pixels / coverage_pixels, 1) * 100, 2
+        )
+
+    _min = numpy.full(nzones, numpy.nan)
+    _max = numpy.full(nzones, numpy.nan)
+    _min[valid] = values[starts[valid]]
+    _max[valid] = values[ends[valid] - 1]
+
+    # Weighted quantiles from the cumulative sum of coverage fractions
+    quantiles = numpy.full((len(percentiles) + 1, nzones), numpy.nan)
+    cumsum = numpy.concatenate(([0.0], numpy.cumsum(weights)))
+    base = cumsum[starts[valid]]
+    for ix, q in enumerate([p / 100.0 for p in percentiles] + [0.5]):
+        pos = numpy.searchsorted(
+            cumsum[1:], base + q * (cumsum[ends[valid]] - base), side="left"
+        )
+        pos = numpy.clip(pos, starts[valid], ends[valid] - 1)
+        quantiles[ix, valid] = values[pos]
+
+    # Runs of identical values
+    new_run = numpy.ones(len(values), dtype="bool")
+    new_run[1:] = (values[1:] != values[:-1]) | (zones[1:] != zones[:-1])
+    run_starts = numpy.flatnonzero(new_run)
+    run_counts = numpy.diff(numpy.append(run_starts, len(values)))
+    run_values = values[run_starts]
+    run_zones = zones[run_starts]
+
+    unique = numpy.bincount(run_zones, minlength=nzones)
+    run_ends = numpy.cumsum(unique)
+    run_offsets = run_ends - unique
+
+    majority = numpy.full(nzones, numpy.nan)
+    minority = numpy.full(nzones, numpy.nan)
+    order = numpy.lexsort((run_values, -run_counts, run_zones))
+    majority[valid] = run_values[order[run_offsets[valid]]]
+    order = numpy.lexsort((run_values, run_counts, run_zones))
+    minority[valid] = run_values[order[run_offsets[valid]]]
+
+    if categorical:
+        if categories:
+            keys = numpy.array(categories).astype(values.dtype)
+            counts = numpy.zeros((nzones, len(keys)), dtype="int64")
+            for ix, key in enumerate(keys):
+                match = run_values == key
+                counts[:, ix] = numpy.bincount(
+                    run_zones[match], weights=run_counts[match], minlength=nzones
+                )
+            histograms = [[c.tolist(), keys.tolist()] for c in counts]
+        else:
+            histograms = [
+                [run_counts[s:e].tolist(), run_values[s:e].tolist()]
+                for s, e in zip(run_offsets, run_ends, strict=True)
+            ]
+    else:
+        histograms = _zonal_histograms(values, zones, starts, ends, **kwargs)
+
+    percentiles_names = [f"percentile_{int(p)}" for p in percentiles]
+    return [
+        {
+            "min": float(_min[z]),
+            "max": float(_max[z]),
+            "mean": float(mean[z]) if valid[z] else numpy.nan,
+            "count": float(count[z]),
+            "sum": float(total[z]),
+            "std": float(math.sqrt(variance[z])) if valid[z] else numpy.nan,
+            "median": float(quantiles[-1, z]),
+            "majority": float(majority[z]),
+            "minority": float(minority[z]),
+            "unique": float(unique[z]),
+            **{
+                name: float(quantiles[ix, z])
+                for ix, name in enumerate(percentiles_names)
+            },
+            "histogram": histograms[z],
+            "valid_pixels": float(valid_pixels[z]),
+            "masked_pixels": float(window_pixels[z] - valid_pixels[z]),
+            "valid_percent": float(valid_percent[z]) if coverage_pixels[z] else 0.0,
+        }
+        for z in range(nzones)
+    ]
+
+
+def zonal_statistics(
+    image: ImageData,
+    shapes: Sequence[dict],
+    shape_crs: CRS,
+    cover_scale: int | None = None,
+    categorical: bool = False,
+    categories: list[float] | None = None,
+    percentiles: list[int] | None = None,
+    hist_options: dict | None = None,
+) -> list[dict[str, BandStatistics]]:
+    """Compute statistics for multiple GeoJSON Features/Geometries from one ImageData.
+
+    Instead of clipping the image for each feature, each feature is rasterized
+    (within its own window) into a list of pixel indexes labeled with the
+    feature's index (and the pixel coverage fraction when `cover_scale` is set).
+    Statistics for all the features are then computed at once using vectorized
+    reductions (e.g `numpy.bincount`). Overlapping features are supported.
+
+    Results are the same as `ImageData.statistics` applied to the image clipped
+    to each feature (see `clip_to_feature`).
+
+    Args:
+        image (rio_tiler.models.ImageData): Image covering all the features.
+        shapes (list): GeoJSON Features or Geometries.
+        shape_crs (rasterio.crs.CRS): Coordinate reference system of the shapes.
+        cover_scale (int, optional): Scale used when generating coverage estimates of each raster cell by the features.
+        categorical (bool): treat input data as categorical data. Defaults to `False`.
+        categories (list of numbers, optional): list of categories to return value for.
+        percentiles (list of numbers, optional): list of percentile values to calculate. Defaults to `[2, 98]`.
+        hist_options (dict, optional): options to forward to `numpy.histogram` function (only applies for non-categorical data).
+
+    Returns:
+        list: Statistics (per band) for each feature.
+
+    """
+    percentiles = percentiles or [2, 98]
+    hist_options = hist_options or {}
+
+    nzones = len(shapes)
+    window_pixels = numpy.zeros(nzones, dtype="int64")
+    coverage_pixels = numpy.zeros(nzones, dtype="int64")
+    indexes = [numpy.zeros(0, dtype="int64")]
+    labels = [numpy.zeros(0, dtype="int64")]
+    weights = [numpy.zeros(0, dtype="float64")]
+
+    for zone, shape in enumerate(shapes):
+        geom, window = _feature_window(image, shape, shape_crs)
+        height, width = int(window.height), int(window.width)
+        window_pixels[zone] = height * width
+        if not height or not width:
+            continue
+
+        transform = windows.transform(window, image.transform)
+        with warnings.catch_warnings():
+            warnings.filterwarnings(
+                "ignore", category=rasterio.errors.NotGeoreferencedWarning
+            )
+            inside = rasterize(
+                [geom],
+                out_shape=(height, width),
+                transform=transform,
+                all_touched=True,
+                default_value=1,
+                fill=0,
+                dtype="uint8",
+            ).astype("bool")
+
+            if cover_scale:
+                coverage = rasterize(
+                    [(geom, 1)],
+                    out_shape=(height * cover_scale, width * cover_scale),
+                    transform=transform * Affine.scale(1 / cover_scale),
+                    all_touched=True,
+                    fill=0,
+                    dtype="uint8",
+                )
+                coverage = coverage.reshape(
+                    (height, cover_scale, width, cover_scale)
+                ).sum(axis=(1, 3), dtype="float32") / (cover_scale**2)
+            else:
+                coverage = numpy.ones((height, width), dtype="float32")
+
+        coverage_pixels[zone] = numpy.count_nonzero(coverage)
+
+        rows, cols = numpy.nonzero(inside)
+        indexes.append((rows + window.row_off) * image.width + cols + window.col_off)
+        labels.append(numpy.full(len(rows), zone, dtype="int64"))
+        weights.append(coverage[rows, cols].astype("float64"))
+
+    index = numpy.concatenate(indexes)
+    label = numpy.concatenate(labels)
+    weight = numpy.concatenate(weights)
+
+    # Avoid non masked nan/inf values
+    data = numpy.ma.fix_invalid(image.array, copy=True)
+    mask = numpy.ma.getmaskarray(data)
+
+    stats = []
+    for b in range(image.count):
+        band_values = data.data[b].ravel()[index]
+        band_valid = ~mask[b].ravel()[index]
+        stats.append(
+            _zonal_band_statistics(
+                band_values[band_valid],
+                label[band_valid],
+                weight[band_valid],
+                window_pixels,
+                coverage_pixels,
+                categorical=categorical,
+                categories=categories,
+                percentiles=percentiles,
+                **hist_options,
+            )
+        )
+
+    return [
+        {
+            f"{image.band_names[b]}": BandStatistics(
+                **stats[b][zone],
+                description=image.band_descriptions[b],
+            )
+            for b in range(image.count)
+        }
+        for zone in range(nzones)
+    ]
@@ -1,5 +1,6 @@
 """Dependency validations."""
 
+import functools
 import re
 from json import JSONDecodeError, loads
 
@@ -7,6 +8,25 @@ from color_operations import parse_operations as parse_color_formula
 from rasterio.crs import CRS
 
 
+@functools.lru_cache(maxsize=512)
+def _validate_rescale(rescale_str: str) -> str:
+    """Validate and normalize one `min,max` rescale value (cached)."""
+    error_text = "invalid rescale format"
+    rescale_parts = [re.sub(r"[\[|\]]", "", part) for part in rescale_str.split(",")]
+    if len(rescale_parts) == 2:
+        try:
+            # Regex validation adds risk, given the different string
+            # formats that can be parsed to float, so simply attempt
+            # to parse.
+            min = float(rescale_parts[0])
+            max = float(rescale_parts[1])
+        except ValueError as e:
+            error_text = f"{error_text}: {e}"
+        else:
+            return f"{min},{max}"
+    raise ValueError(error_text)
+
+
 def validate_rescale(rescale_strs: list[str]) -> list[str]:
     """
     Verify that rescale input matches an accepted pattern.
@@ -15,26 +35,7 @@ def validate_rescale(rescale_strs: list[str]) -> list[str]:
     :return: Caller-provided rescale values if validated, otherwise an exception is raised.
     :rtype: list[str]
     """
-    validated_rescales: list[str] = []
-    for rescale_str in rescale_strs:
-        error_text = "invalid rescale format"
-        rescale_parts = [
-            re.sub(r"[\[|\]]", "", part) for part in rescale_str.split(",")
-        ]
-        if len(rescale_parts) == 2:
-            try:
-                # Regex validation adds risk, given the different string
-                # formats that can be parsed to float, so simply attempt
-                # to parse.
-                min = float(rescale_parts[0])
-                max = float(rescale_parts[1])
-            except ValueError as e:
-                error_text = f"{error_text}: {e}"
-            else:
-                validated_rescales.append(f"{min},{max}")
-                continue
-        raise ValueError(error_text)
-    return validated_rescales
+    return [_validate_rescale(rescale_str) for rescale_str in rescale_strs]
 
 
 def validate_crs(crs_str: str | None) -> str | None:
@@ -80,6 +81,17 @@ def validate_json(json_str: str | None) -> str | None:
         return json_str
 
 
+@functools.lru_cache(maxsize=512)
+def _validate_color_formula(color_formula_str: str) -> str:
+    """Validate one color formula (cached)."""
+    try:
+        parse_color_formula(color_formula_str)
+    except Exception as e:
+        raise ValueError("invalid color formula") from e
+    else:
+        return color_formula_str
+
+
 def validate_color_formula(color_formula_str: str | None) -> str | None:
     """
     Verify that color formula can be parsed.
@@ -90,12 +102,7 @@ def validate_color_formula(color_formula_str: str | None) -> str | None:
     """
     if color_formula_str is None:
         return None
-    try:
-        parse_color_formula(color_formula_str)
-    except Exception as e:
-        raise ValueError("invalid color formula") from e
-    else:
-        return color_formula_str
+    return _validate_color_formula(color_formula_str)
 
 
 def validate_bbox(bbox_str: str | None) -> str | None:
@@ -0,0 +1,140 @@
+"""titiler.core warm-up: materialize the TMS, colormaps and algorithms registries."""
+
+from __future__ import annotations
+
+import gc
+import logging
+import time
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from morecantile import tms as morecantile_tms
+from morecantile.defaults import TileMatrixSets
+from pydantic import ValidationError
+from rio_tiler.colormap import ColorMaps
+from rio_tiler.colormap import cmap as default_cmap
+
+from titiler.core.algorithm import Algorithms
+from titiler.core.algorithm import algorithms as available_algorithms
+from titiler.core.cache import freeze
+from titiler.core.dependencies import ColorMapParams
+
+logger = logging.getLogger(__name__)
+
+
+def warmup_tms(supported_tms: TileMatrixSets) -> int:
+    """Parse the TileMatrixSets and precompute their CRS, bounds and transformers.
+
+    `TileMatrixSets.get` returns a copy of the registered TMS, including the values
+    of its cached properties (and its cache key), while the CRS transformers are cached by morecantile.
+    """
+    identifiers = supported_tms.list()
+    for identifier in identifiers:
+        # Parse the TMS document and store the TileMatrixSet in the registry
+        supported_tms.get(identifier)
+
+        tms = supported_tms.tilematrixsets[identifier]
+        _ = (
+            tms.is_quadtree,
+            tms.is_variable,
+            tms.rasterio_crs,
+            tms.rasterio_geographic_crs,
+            tms._invert_axis,
+            tms.xy_bbox,
+            tms.bbox,
+            tms._to_geographic,
+            tms._from_geographic,
+        )
+        # cache key of the TMS (used by `ReaderCache`), kept by the copies
+        freeze(tms)
+
+    return len(identifiers)
+
+
+def warmup_colormaps(
+    supported_colormaps: ColorMaps,
+    colormap_dependencies: Sequence[Callable] = (),
+) -> int:
+    """Load the colormaps and compile them in the colormap dependencies."""
+    names = supported_colormaps.list()
+    for name in names:
+        supported_colormaps.get(name)
+
+    for dependency in colormap_dependencies:
+        if preload := getattr(dependency, "preload", None):
+            preload()
+
+    return len(names)
+
+
+def warmup_algorithms(supported_algorithms: Algorithms) -> int:
+    """Create the algorithms' JSON schema and default instance."""
+    names = supported_algorithms.list()
+    for name in names:
+        algorithm = supported_algorithms.get(name)
+        algorithm.model_json_schema()
+        try:
+            algorithm()
+        except ValidationError:
+            # algorithm with required parameters
+            pass
+
+    return len(names)
+
+
+def warmup(
+    supported_tms: TileMatrixSets = morecantile_tms,
+    supported_colormaps: ColorMaps = default_cmap,
+    supported_algorithms: Algorithms = available_algorithms,
+    colormap_dependencies: Sequence[Callable] = (ColorMapParams,),
+    freeze: bool = False,
+) -> dict[str, Any]:
+    """Materialize the TileMatrixSets, colormaps and algorithms registries.
+
+    The registries are otherwise loaded lazily, by the first requests of each
+    worker. When called in the parent process before forking workers (e.g. at
+    import time in the gunicorn master with `--preload`), the loaded objects are
+    shared copy-on-write by the workers.
+
+    Args:
+        supported_tms (morecantile.defaults.TileMatrixSets): TileMatrixSets registry. Defaults to `morecantile.tms`.
+        supported_colormaps (rio_tiler.colormap.ColorMaps): Colormaps registry. Defaults to `rio_tiler.colormap.cmap`.
+        supported_algorithms (titiler.core.algorithm.Algorithms): Algorithms registry. Defaults to `titiler.core.algorithm.algorithms`.
+        colormap_dependencies (sequence of callable): Colormap dependencies (see `titiler.core.dependencies.create_colormap_dependency`) to preload. Defaults to `(ColorMapParams,)`.
+        freeze (bool): Move all the objects to the garbage collector's permanent generation (`gc.freeze()`), so collections in the workers do not write to (and copy) the shared pages. Defaults to `False`.
+
+    Returns:
+        dict: number of objects and duration (in seconds) of each step.
+
+    """
+    start = time.perf_counter()
+    report: dict[str, Any] = {}
+
+    steps: dict[str, Callable[[], int]] = {
+        "tilematrixsets": lambda: warmup_tms(supported_tms),
+        "colormaps": lambda: warmup_colormaps(
+            supported_colormaps, colormap_dependencies
+        ),
+        "algorithms": lambda: warmup_algorithms(supported_algorithms),
+    }
+    for name, step in steps.items():
+        t = time.perf_counter()
+        count = step()
+        report[name] = {"count": count, "duration": time.perf_counter() - t}
+
+    if freeze:
+        gc.collect()
+        gc.freeze()
+
+    report["duration"] = time.perf_counter() - start
+
+    logger.info(
+        "Warm-up done in %.3fs (%s)",
+        report["duration"],
+        ", ".join(
+            f"{name}: {report[name]['count']} in {report[name]['duration']:.3f}s"
+            for name in steps
+        ),
+    )
+
+    return report
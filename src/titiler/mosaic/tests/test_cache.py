@@ -0,0 +1,206 @@
+"""Test titiler.mosaic.cache."""
+
+import os
+import random
+
+import pytest
+from cogeo_mosaic.backends import FileBackend
+from cogeo_mosaic.mosaic import MosaicJSON
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from titiler.core.resources.enums import OptionalHeader
+from titiler.mosaic.backends import CachedMosaicBackend, load_mosaic
+from titiler.mosaic.cache import MosaicCache, MosaicIndex, mosaic_cache
+from titiler.mosaic.extensions.cache import MosaicCacheExtension
+from titiler.mosaic.factory import MosaicTilerFactory
+from titiler.mosaic.settings import MosaicCacheSettings
+
+from .test_factory import assets, tmpmosaic
+
+
+def _random_mosaic(quadkey_zoom=6, n=200, seed=0):
+    """Create a MosaicJSON with random quadkeys."""
+    rng = random.Random(seed)
+    tiles = {}
+    for _ in range(n):
+        quadkey = "".join(rng.choice("0123") for _ in range(quadkey_zoom))
+        tiles[quadkey] = [f"{rng.randint(0, 50)}.tif" for _ in range(rng.randint(1, 3))]
+
+    return MosaicJSON(
+        mosaicjson="0.0.3",
+        minzoom=quadkey_zoom,
+        maxzoom=quadkey_zoom + 4,
+        quadkey_zoom=quadkey_zoom,
+        bounds=(-180, -85, 180, 85),
+        asset_prefix="s3://bucket/",
+        tiles=tiles,
+    )
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_index_get_assets(reverse):
+    """Should return the same assets as cogeo-mosaic."""
+    mosaic = _random_mosaic()
+    index = MosaicIndex(mosaic)
+    backend = FileBackend("mosaic.json", mosaic_def=mosaic)
+    assert len(index.quadkeys) == len(mosaic.tiles)
+    assert index.nbytes > 0
+
+    rng = random.Random(1)
+    for z in range(2, 10):
+        for _ in range(50):
+            x, y = rng.randrange(2**z), rng.randrange(2**z)
+            assert index.get_assets(x, y, z, reverse=reverse) == backend.get_assets(
+                x, y, z, reverse=reverse
+            )
+
+    for xmin, ymin, xmax, ymax in [
+        (-10, -10, 10, 10),
+        (-180, -85, 180, 85),
+        (100.5, 20.1, 101.0, 20.5),
+    ]:
+        assert index.assets_for_bbox(
+            xmin, ymin, xmax, ymax, reverse=reverse
+        ) == backend.assets_for_bbox(xmin, ymin, xmax, ymax, reverse=reverse)
+
+
+def test_cache(tmp_path):
+    """Should load mosaic once and reload it when the document changes."""
+    path = str(tmp_path / "mosaic.json")
+    mosaic = _random_mosaic()
+    with open(path, "w") as f:
+        f.write(mosaic.model_dump_json(exclude_none=True))
+
+    calls = []
+
+    def loader(src_path):
+        calls.append(src_path)
+        return load_mosaic(src_path)
+
+    cache = MosaicCache(revalidate=0)
+    index = cache.get(path, loader)
+    assert cache.get(path, loader) is index
+    assert len(calls) == 1
+    assert index.etag
+    assert cache.stats()["nbytes"] == index.nbytes
+    assert cache.entries()[0]["src_path"] == path
+
+    # Document updated
+    mosaic.tiles = {"000000": ["a.tif"]}
+    with open(path, "w") as f:
+        f.write(mosaic.model_dump_json(exclude_none=True))
+    os.utime(path, ns=(0, 0))
+
+    new = cache.get(path, loader)
+    assert new is not index
+    assert len(calls) == 2
+    assert new.get_assets(0, 0, 6) == ["s3://bucket/a.tif"]
+
+    # Never revalidated
+    cache = MosaicCache(revalidate=None)
+    index = cache.get(path, loader)
+    os.utime(path, ns=(1, 1))
+    assert cache.get(path, loader) is index
+
+    assert cache.invalidate(path)
+    assert not cache.invalidate(path)
+
+    # Too big to be cached
+    cache = MosaicCache(maxbytes=100)
+    cache.get(path, loader)
+    assert cache.stats()["size"] == 0
+
+
+def test_CachedMosaicBackend():
+    """Should share the mosaic definition between backend instances."""
+    cache = MosaicCache()
+    with tmpmosaic() as mosaic_file:
+        with CachedMosaicBackend(mosaic_file, cache=cache) as mosaic:
+            assert mosaic.mosaic_def is mosaic.index.mosaic_def
+            assert mosaic.mosaicid == mosaic.index.mosaicid
+            assert mosaic.assets_for_point(-71, 46) == assets
+            assert mosaic.assets_for_point(-71, 46, reverse=True) == assets[::-1]
+
+            with FileBackend(mosaic_file) as ref:
+                assert ref.mosaicid == mosaic.mosaicid
+                assert mosaic.assets_for_tile(37, 45, 7) == ref.assets_for_tile(
+                    37, 45, 7
+                )
+                bbox = (-75.9375, 43.06888777416962, -73.125, 45.089035564831015)
+                assert mosaic.assets_for_bbox(*bbox) == ref.assets_for_bbox(*bbox)
+                assert mosaic.assets_for_bbox(
+                    -8453323.83211421,
+                    5322463.153553393,
+                    -8140237.76425813,
+                    5635549.221409473,
+                    coord_crs="epsg:3857",
+                ) == ref.assets_for_bbox(
+                    -8453323.83211421,
+                    5322463.153553393,
+                    -8140237.76425813,
+                    5635549.221409473,
+                    coord_crs="epsg:3857",
+                )
+                assert mosaic.assets_for_bbox(10, 10, 11, 11) == []
+
+        with CachedMosaicBackend(mosaic_file, cache=cache) as other:
+            assert other.index is mosaic.index
+
+        with pytest.raises(NotImplementedError):
+            other.write()
+
+    with pytest.raises(ValueError):
+        CachedMosaicBackend("dynamodb://us-east-1/table:mosaic", cache=cache)
+
+
+def test_MosaicCacheExtension():
+    """Should add /cache endpoints."""
+    mosaic_cache.clear()
+    mosaic = MosaicTilerFactory(
+        backend=CachedMosaicBackend,
+        extensions=[MosaicCacheExtension()],
+        optional_headers=[OptionalHeader.x_assets],
+    )
+    app = FastAPI()
+    app.include_router(mosaic.router)
+    client = TestClient(app)
+
+    with tmpmosaic() as mosaic_file:
+        response = client.get(
+            "/tiles/WebMercatorQuad/7/37/45.png",
+            params={"url": mosaic_file, "rescale": "0,1000"},
+        )
+        assert response.status_code == 200
+        assert response.headers["X-Assets"]
+
+        response = client.get("/point/-71,46", params={"url": mosaic_file})
+        assert response.status_code == 200
+
+        response = client.get("/cache")
+        assert response.status_code == 200
+        body = response.json()
+        assert body["size"] == 1
+        assert body["entries"][0]["src_path"] == mosaic_file
+
+        response = client.delete("/cache")
+        assert response.status_code == 200
+        assert response.json()["size"] == 0
+
+
+def test_MosaicCacheSettings(monkeypatch):
+    """Should read the cache settings from TITILER_MOSAIC_CACHE_ environment variables."""
+    settings = MosaicCacheSettings()
+    assert settings.maxsize == 32
+    assert settings.maxbytes is None
+    assert settings.revalidate == 60
+
+    monkeypatch.setenv("TITILER_MOSAIC_CACHE_MAXSIZE", "4")
+    monkeypatch.setenv("TITILER_MOSAIC_CACHE_TTL", "300")
+    monkeypatch.setenv("MOSAIC_CACHE_MAXBYTES", "1")
+    settings = MosaicCacheSettings()
+    assert settings.maxsize == 4
+    assert settings.ttl == 300
+    assert settings.maxbytes is None
+
+    assert settings.index_maxsize == 32
@@ -2,6 +2,7 @@
 
 import json
 import os
+import tarfile
 import tempfile
 import xml.etree.ElementTree as ET
 from contextlib import contextmanager
@@ -1039,3 +1040,29 @@ def test_mosaic_statistics_featurecollection():
         stats_b = resp["features"][1]["properties"]["statistics"]
         assert len(stats_a) > 0
         assert len(stats_b) > 0
+
+
+def test_MosaicTilerFactory_batch():
+    """Test /tiles/{tileMatrixSetId}/batch endpoint."""
+    mosaic = MosaicTilerFactory(backend=MosaicJSONBackend, add_batch=True)
+    app = FastAPI()
+    app.include_router(mosaic.router)
+    add_exception_handlers(app, MOSAIC_STATUS_CODES)
+
+    with TestClient(app) as client:
+        with tmpmosaic() as mosaic_file:
+            response = client.post(
+                "/tiles/WebMercatorQuad/batch",
+                params={"url": mosaic_file, "format": "png"},
+                json={"tiles": [[7, 37, 45], [7, 36, 45], [7, 0, 0]]},
+            )
+            assert response.status_code == 200
+            assert response.headers["content-type"] == "application/x-tar"
+            with tarfile.open(fileobj=BytesIO(response.content)) as tar:
+                assert sorted(tar.getnames()) == ["7/36/45.png", "7/37/45.png"]
+                content = tar.extractfile("7/37/45.png").read()
+
+            response = client.get(
+                "/tiles/WebMercatorQuad/7/37/45.png", params={"url": mosaic_file}
+            )
+            assert response.content == content
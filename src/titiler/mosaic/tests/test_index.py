@@ -0,0 +1,194 @@
+"""Test titiler.mosaic.index."""
+
+import gzip
+import os
+import random
+
+import numpy
+import pytest
+from cogeo_mosaic.backends import FileBackend
+from cogeo_mosaic.mosaic import MosaicJSON
+from fastapi import FastAPI
+from rio_tiler.constants import WEB_MERCATOR_TMS
+from starlette.testclient import TestClient
+
+from titiler.core.errors import DEFAULT_STATUS_CODES, add_exception_handlers
+from titiler.core.resources.enums import OptionalHeader
+from titiler.mosaic.backends import CachedMosaicBackend
+from titiler.mosaic.extensions.index import MosaicIndexExtension
+from titiler.mosaic.factory import MosaicTilerFactory
+from titiler.mosaic.index import (
+    MemoryMappedIndex,
+    MosaicIndexBackend,
+    main,
+    open_index,
+    quadkey_to_int,
+    quadkeys_xy,
+    tile_quadkey,
+    write_index,
+)
+
+from .test_factory import MosaicJSONBackend, assets, tmpmosaic
+
+
+def _random_mosaic(quadkey_zoom=6, n=200, seed=0):
+    """Create a MosaicJSON with random quadkeys."""
+    rng = random.Random(seed)
+    tiles = {}
+    for _ in range(n):
+        quadkey = "".join(rng.choice("0123") for _ in range(quadkey_zoom))
+        tiles[quadkey] = [f"{rng.randint(0, 50)}.tif" for _ in range(rng.randint(1, 3))]
+
+    return MosaicJSON(
+        mosaicjson="0.0.3",
+        minzoom=quadkey_zoom,
+        maxzoom=quadkey_zoom + 4,
+        quadkey_zoom=quadkey_zoom,
+        bounds=(-180, -85, 180, 85),
+        asset_prefix="s3://bucket/",
+        tiles=tiles,
+    )
+
+
+def test_quadkeys_xy():
+    """Should decode integer quadkeys."""
+    quadkeys = list(_random_mosaic().tiles)
+    xs, ys = quadkeys_xy(numpy.array([quadkey_to_int(q) for q in quadkeys]), 6)
+    for quadkey, x, y in zip(quadkeys, xs, ys, strict=True):
+        tile = WEB_MERCATOR_TMS.quadkey_to_tile(quadkey)
+        assert (tile.x, tile.y) == (x, y)
+        assert tile_quadkey(tile.x, tile.y, tile.z) == quadkey
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_MemoryMappedIndex(tmp_path, reverse):
+    """Should return the same assets as cogeo-mosaic."""
+    mosaic = _random_mosaic()
+    path = str(tmp_path / "mosaic.index")
+    header = write_index(mosaic, path)
+    assert header["assets"] == len({a for v in mosaic.tiles.values() for a in v})
+
+    assert header["index_version"] == 1
+    assert header["version"] == mosaic.version
+
+    index = MemoryMappedIndex(path)
+    assert index.tms is index.tms
+    assert len(index.quadkeys) == len(mosaic.tiles)
+    assert index.nbytes == os.path.getsize(path)
+    assert index.asset_ids.dtype == numpy.dtype("<u2")
+    assert not index.quadkeys.flags.writeable
+
+    backend = FileBackend("mosaic.json", mosaic_def=mosaic)
+    rng = random.Random(1)
+    for z in range(2, 10):
+        for _ in range(50):
+            x, y = rng.randrange(2**z), rng.randrange(2**z)
+            assert index.get_assets(x, y, z, reverse=reverse) == backend.get_assets(
+                x, y, z, reverse=reverse
+            )
+
+    for bbox in [(-10, -10, 10, 10), (-180, -85, 180, 85), (100.5, 20.1, 101, 20.5)]:
+        assert index.assets_for_bbox(*bbox, reverse=reverse) == backend.assets_for_bbox(
+            *bbox, reverse=reverse
+        )
+
+    # Opened indexes are re-used until the file changes
+    assert open_index(path) is open_index(path)
+
+
+def test_invalid_index(tmp_path):
+    """Should raise error for non-index files."""
+    path = str(tmp_path / "mosaic.json")
+    with open(path, "w") as f:
+        f.write(_random_mosaic().model_dump_json())
+
+    with pytest.raises(ValueError):
+        MemoryMappedIndex(path)
+
+
+def test_index_version(tmp_path, monkeypatch):
+    """Should raise error for unsupported index versions."""
+    path = str(tmp_path / "mosaic.index")
+    write_index(_random_mosaic(), path)
+
+    monkeypatch.setattr("titiler.mosaic.index.VERSION", 2)
+    with pytest.raises(ValueError, match="index version"):
+        MemoryMappedIndex(path)
+
+
+def test_main(tmp_path, capsys):
+    """Should convert MosaicJSON files."""
+    with tmpmosaic() as mosaic_file:
+        output = str(tmp_path / "mosaic.index")
+        assert main([mosaic_file, output]) == 0
+        assert "2 assets" in capsys.readouterr().out
+
+        with gzip.open(mosaic_file) as f:
+            mosaic = MosaicJSON.model_validate_json(f.read())
+
+    with MosaicIndexBackend(output) as src_dst:
+        assert src_dst.bounds == mosaic.bounds
+        assert src_dst.minzoom == mosaic.minzoom
+        assert src_dst.maxzoom == mosaic.maxzoom
+        assert src_dst.assets_for_point(-71, 46) == assets
+        assert src_dst.assets_for_point(-71, 46, reverse=True) == assets[::-1]
+        assert src_dst.assets_for_tile(37, 45, 7)
+        assert src_dst.assets_for_bbox(10, 10, 11, 11) == []
+        info = src_dst.info()
+        assert info.quadkeys == len(mosaic.tiles)
+        assert info.assets == 2
+
+
+def test_MosaicIndexBackend_factory(tmp_path):
+    """Should work with MosaicTilerFactory."""
+    app = FastAPI()
+    for prefix, backend in [
+        ("/index", MosaicIndexBackend),
+        ("/cached", CachedMosaicBackend),
+        ("/mosaicjson", MosaicJSONBackend),
+    ]:
+        mosaic = MosaicTilerFactory(
+            backend=backend,
+            optional_headers=[OptionalHeader.x_assets],
+            extensions=[MosaicIndexExtension()],
+            router_prefix=prefix,
+        )
+        app.include_router(mosaic.router, prefix=prefix)
+
+    add_exception_handlers(app, DEFAULT_STATUS_CODES)
+    client = TestClient(app)
+
+    output = str(tmp_path / "mosaic.index")
+    with tmpmosaic() as mosaic_file:
+        main([mosaic_file, output])
+
+        response = client.get(
+            "/index/tiles/WebMercatorQuad/7/37/45.png",
+            params={"url": output, "rescale": "0,1000"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/png"
+
+        ref = client.get(
+            "/mosaicjson/tiles/WebMercatorQuad/7/37/45.png",
+            params={"url": mosaic_file, "rescale": "0,1000"},
+        )
+        assert response.content == ref.content
+        assert response.headers["X-Assets"] == ref.headers["X-Assets"]
+
+        response = client.get("/index/info", params={"url": output})
+        assert response.status_code == 200
+
+        response = client.get("/index/index", params={"url": output, "samples": 10})
+        assert response.status_code == 200
+        body = response.json()
+        assert body["type"] == "MemoryMappedIndex"
+        assert body["nbytes"] == os.path.getsize(output)
+        assert body["lookup"]["samples"] == 10
+
+        response = client.get("/cached/index", params={"url": mosaic_file})
+        assert response.status_code == 200
+        assert response.json()["type"] == "MosaicIndex"
+
+        response = client.get("/mosaicjson/index", params={"url": mosaic_file})
+        assert response.status_code == 400
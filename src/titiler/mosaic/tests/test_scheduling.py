@@ -0,0 +1,126 @@
+"""Test titiler.mosaic.scheduling."""
+
+import os
+
+import rasterio
+from fastapi import FastAPI
+from rasterio.warp import transform_bounds
+from rio_tiler.mosaic.methods import PixelSelectionMethod
+from starlette.testclient import TestClient
+
+from titiler.core.resources.enums import OptionalHeader
+from titiler.mosaic.factory import MosaicTilerFactory
+from titiler.mosaic.scheduling import (
+    CoverageScheduler,
+    TileSchedule,
+    get_asset_footprint,
+    tile_coverage,
+)
+
+from .conftest import DATA_DIR
+from .test_factory import MosaicJSONBackend, assets, tmpmosaic
+
+
+def _footprint(src_path):
+    with rasterio.open(src_path) as src_dst:
+        xmin, ymin, xmax, ymax = transform_bounds(
+            src_dst.crs, "epsg:4326", *src_dst.bounds
+        )
+
+    return {
+        "type": "Feature",
+        "properties": {},
+        "bbox": [xmin, ymin, xmax, ymax],
+        "geometry": None,
+    }
+
+
+footprints = {asset: get_asset_footprint(_footprint(asset)) for asset in assets}
+
+
+def test_coverage():
+    """Should estimate the tile coverage."""
+    bounds = (0, 0, 10, 10)
+    geom = {
+        "type": "Polygon",
+        "coordinates": [[(0, 0), (5, 0), (5, 10), (0, 10), (0, 0)]],
+    }
+    assert tile_coverage(geom, bounds) == 0.5
+    assert tile_coverage(geom, (20, 20, 30, 30)) == 0.0
+
+    assert get_asset_footprint({"type": "Feature", "geometry": geom}) == geom
+    assert get_asset_footprint(geom) == geom
+    assert get_asset_footprint("cog.tif") is None
+    assert get_asset_footprint({"type": "Feature", "geometry": None}) is None
+
+    scheduler = CoverageScheduler(footprint=lambda asset: asset)
+    ordered, coverage = scheduler.order(
+        [None, {**geom, "coordinates": [[(0, 0), (2, 0), (2, 2), (0, 0)]]}, geom],
+        bounds,
+    )
+    assert coverage[0] == 0.5
+    assert 0 < coverage[1] < 0.5
+    assert coverage[2] is None
+    assert ordered[0] == geom
+    assert ordered[-1] is None
+
+
+def test_skipped():
+    """Should return the assets of the waves not read."""
+    schedule = TileSchedule(assets=["a", "b", "c", "d", "e"], wave_size=2)
+    assert schedule.skipped(["a", "b"], done=True, threads=2) == ["c", "d", "e"]
+    assert schedule.skipped(["a", "c"], done=True, threads=2) == ["e"]
+    assert schedule.skipped(["a", "c"], done=True, threads=1) == ["d", "e"]
+    assert schedule.skipped(["a", "c"], done=False, threads=2) == []
+
+
+def test_MosaicTilerFactory_scheduler():
+    """Should read the assets covering the tile first."""
+    # cog2.tif covers the whole tile, cog1.tif only a part of it
+    tile = "/tiles/WebMercatorQuad/10/304/364.png"
+
+    mosaic = MosaicTilerFactory(
+        backend=MosaicJSONBackend,
+        optional_headers=[OptionalHeader.x_assets, OptionalHeader.server_timing],
+    )
+    app = FastAPI()
+    app.include_router(mosaic.router)
+    client = TestClient(app)
+
+    with tmpmosaic() as mosaic_file:
+        response = client.get(tile, params={"url": mosaic_file})
+        assert response.status_code == 200
+        assert response.headers["X-Assets"] == ",".join(assets)
+        assert "X-Assets-Skipped" not in response.headers
+        assert "scheduling" not in response.headers["Server-Timing"]
+
+    mosaic = MosaicTilerFactory(
+        backend=MosaicJSONBackend,
+        optional_headers=[OptionalHeader.x_assets, OptionalHeader.server_timing],
+        tile_scheduler=CoverageScheduler(wave_size=1, footprint=footprints.get),
+    )
+    app = FastAPI()
+    app.include_router(mosaic.router)
+    client = TestClient(app)
+
+    with tmpmosaic() as mosaic_file:
+        response = client.get(tile, params={"url": mosaic_file})
+        assert response.status_code == 200
+        assert response.headers["X-Assets"] == os.path.join(DATA_DIR, "cog2.tif")
+        assert response.headers["X-Assets-Skipped"] == os.path.join(
+            DATA_DIR, "cog1.tif"
+        )
+        assert "scheduling;dur=" in response.headers["Server-Timing"]
+        assert 'assets-skipped;desc="1"' in response.headers["Server-Timing"]
+
+        # Methods not stopping early read every assets
+        response = client.get(
+            tile,
+            params={
+                "url": mosaic_file,
+                "pixel_selection": PixelSelectionMethod.mean.name,
+            },
+        )
+        assert response.status_code == 200
+        assert response.headers["X-Assets"] == ",".join(assets[::-1])
+        assert response.headers["X-Assets-Skipped"] == ""
@@ -0,0 +1,122 @@
+"""titiler.mosaic backends.
+
+Note: requires `cogeo-mosaic` (`titiler.mosaic["mosaicjson"]`).
+
+"""
+
+import zlib
+from typing import Any
+from urllib.parse import urlparse
+
+import attr
+from cogeo_mosaic.backends import MosaicBackend
+from cogeo_mosaic.backends.base import MosaicJSONBackend
+from cogeo_mosaic.errors import MosaicNotFoundError
+from cogeo_mosaic.mosaic import MosaicJSON
+from rasterio.crs import CRS
+from rasterio.warp import transform_bounds
+
+from titiler.mosaic.cache import MosaicCache, MosaicIndex, mosaic_cache
+
+
+def load_mosaic(src_path: str) -> MosaicJSON:
+    """Load a MosaicJSON document.
+
+    Local files are read and parsed directly, other stores are read with the
+    cogeo-mosaic backend matching the path's scheme.
+
+    """
+    parsed = urlparse(src_path)
+    if parsed.scheme not in ["", "file", "http", "https", "s3", "gs", "az"]:
+        raise ValueError(f"'{parsed.scheme}' is not supported")
+
+    if parsed.scheme in ["", "file"]:
+        path = parsed.path if parsed.scheme else src_path
+        try:
+            with open(path, "rb") as f:
+                body = f.read()
+        except FileNotFoundError as e:
+            raise MosaicNotFoundError(str(e)) from e
+
+        if path.endswith(".gz"):
+            body = zlib.decompress(body, zlib.MAX_WBITS | 16)
+
+        return MosaicJSON.model_validate_json(body)
+
+    with MosaicBackend(src_path) as mosaic:
+        return mosaic.mosaic_def
+
+
+@attr.s
+class CachedMosaicBackend(MosaicJSONBackend):
+    """Read-Only MosaicJSON backend using a shared cache of parsed mosaic definitions.
+
+    The mosaic definition and its spatial index are loaded once and shared by all the
+    backend instances (e.g. every request to a `MosaicTilerFactory`) using the same
+    cache. Assets are found using the index instead of listing the quadkeys of each tile.
+
+    Supports local files and HTTP(S), S3, GCS and Azure hosted documents.
+
+    Attributes:
+        cache (titiler.mosaic.cache.MosaicCache): Mosaic definition cache. Defaults to `titiler.mosaic.cache.mosaic_cache`.
+        index (titiler.mosaic.cache.MosaicIndex): Mosaic definition and spatial index. **READ ONLY attribute**.
+
+    """
+
+    cache: MosaicCache = attr.ib(default=mosaic_cache)
+    index: MosaicIndex = attr.ib(init=False)
+
+    _backend_name = "Cached"
+
+    def __attrs_post_init__(self):
+        """Get the mosaic definition and its index from the cache."""
+        if self.mosaic_def is not None:
+            self.index = MosaicIndex(self.mosaic_def)
+        else:
+            self.index = self.cache.get(self.input, load_mosaic)
+            self.mosaic_def = self.index.mosaic_def
+
+        super().__attrs_post_init__()
+
+    def _read(self) -> MosaicJSON:  # type: ignore
+        """Get mosaicjson document."""
+        return self.index.mosaic_def
+
+    def write(self, overwrite: bool = True):
+        """Write mosaicjson document."""
+        raise NotImplementedError
+
+    def update(self, *args: Any, **kwargs: Any):
+        """Update the mosaicjson document."""
+        raise NotImplementedError
+
+    @property
+    def mosaicid(self) -> str:
+        """Return sha224 id of the mosaicjson document."""
+        return self.index.mosaicid
+
+    def get_assets(self, x: int, y: int, z: int, reverse: bool = False) -> list[str]:
+        """Find assets."""
+        return self.index.get_assets(x, y, z, reverse=reverse)
+
+    def assets_for_bbox(
+        self,
+        xmin: float,
+        ymin: float,
+        xmax: float,
+        ymax: float,
+        coord_crs: CRS | None = None,
+        reverse: bool = False,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Retrieve assets for bbox."""
+        mosaic_crs = self.index.tms.rasterio_geographic_crs
+
+        # default coord_crs should be the TMS's geographic CRS
+        coord_crs = coord_crs or self.tms.rasterio_geographic_crs
+        if coord_crs != mosaic_crs:
+            xmin, ymin, xmax, ymax = transform_bounds(
+                coord_crs, mosaic_crs, xmin, ymin, xmax, ymax
+            )
+
+        return self.index.assets_for_bbox(xmin, ymin, xmax, ymax, reverse=reverse)
@@ -0,0 +1,260 @@
+"""titiler.mosaic mosaic definition cache."""
+
+from __future__ import annotations
+
+import hashlib
+import itertools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.request
+from collections.abc import Callable, Iterable
+from typing import Any
+from urllib.parse import urlparse
+
+import numpy
+from attrs import define, field
+from morecantile import TileMatrixSet
+from rio_tiler.constants import WEB_MERCATOR_TMS
+
+from titiler.core.cache import LRUCache
+from titiler.mosaic.index import QuadkeyIndex, quadkey_to_int, quadkeys_xy
+from titiler.mosaic.settings import MosaicCacheSettings
+
+logger = logging.getLogger(__name__)
+
+
+def mosaic_nbytes(mosaic_def: Any) -> int:
+    """Estimate the memory used by the `tiles` of a parsed mosaic definition."""
+    return sys.getsizeof(mosaic_def.tiles) + sum(
+        sys.getsizeof(quadkey)
+        + sys.getsizeof(assets)
+        + sum(sys.getsizeof(asset) for asset in assets)
+        for quadkey, assets in mosaic_def.tiles.items()
+    )
+
+
+@define(eq=False)
+class MosaicIndex(QuadkeyIndex):
+    """Parsed mosaic definition and its spatial index.
+
+    Attributes:
+        mosaic_def (cogeo_mosaic.mosaic.MosaicJSON): Mosaic definition.
+        etag (str, optional): Version of the mosaic document when it was loaded.
+        assets (list): Assets of each quadkey (in `quadkeys` order).
+
+    """
+
+    mosaic_def: Any
+    etag: str | None = None
+    assets: list[list[str]] = field(init=False)
+
+    loaded: float = field(init=False, factory=time.monotonic)
+    checked: float = field(init=False, factory=time.monotonic)
+
+    _nbytes: int = field(init=False, default=0)
+    _mosaicid: str | None = field(init=False, default=None)
+
+    def __attrs_post_init__(self):
+        """Create the index."""
+        qz = self.quadkey_zoom
+        keys = sorted(k for k in self.mosaic_def.tiles if len(k) == qz)
+        self.quadkeys = numpy.array([quadkey_to_int(k) for k in keys], dtype="uint64")
+        self.xs, self.ys = quadkeys_xy(self.quadkeys, qz)
+        self.assets = [self.mosaic_def.tiles[k] for k in keys]
+
+        self._nbytes = (
+            mosaic_nbytes(self.mosaic_def)
+            + self.quadkeys.nbytes
+            + self.xs.nbytes
+            + self.ys.nbytes
+            + sys.getsizeof(self.assets)
+        )
+
+    @property
+    def tms(self) -> TileMatrixSet:
+        """Mosaic TileMatrixSet."""
+        return self.mosaic_def.tilematrixset or WEB_MERCATOR_TMS
+
+    @property
+    def quadkey_zoom(self) -> int:
+        """Zoom level of the mosaic quadkeys."""
+        return self.mosaic_def.quadkey_zoom or self.mosaic_def.minzoom
+
+    @property
+    def asset_prefix(self) -> str | None:
+        """Prefix added to the assets."""
+        return self.mosaic_def.asset_prefix
+
+    @property
+    def nbytes(self) -> int:
+        """Estimated memory used by the definition and the index."""
+        return self._nbytes
+
+    @property
+    def mosaicid(self) -> str:
+        """Return sha224 id of the mosaic definition (computed once)."""
+        if self._mosaicid is None:
+            self._mosaicid = hashlib.sha224(
+                json.dumps(
+                    self.mosaic_def.model_dump(exclude_none=True),
+                    sort_keys=True,
+                    default=str,
+                ).encode()
+            ).hexdigest()
+
+        return self._mosaicid
+
+    def _assets(self, indexes: Iterable[int]) -> list[str]:
+        """Unique assets of quadkeys, in quadkey order."""
+        return list(
+            dict.fromkeys(
+                itertools.chain.from_iterable(self.assets[i] for i in indexes)
+            )
+        )
+
+
+def get_etag(src_path: str) -> str | None:
+    """Get the version of a mosaic document.
+
+    Uses the modification time and size of local files, and the `ETag` (or
+    `Last-Modified`) header of HTTP(S) documents. Returns `None` for other
+    stores or when the version is not available.
+
+    """
+    parsed = urlparse(src_path)
+    if parsed.scheme in ["", "file"]:
+        try:
+            stat = os.stat(parsed.path if parsed.scheme else src_path)
+        except OSError:
+            return None
+
+        return f"{stat.st_mtime_ns:x}-{stat.st_size:x}"
+
+    if parsed.scheme in ["http", "https"]:
+        request = urllib.request.Request(src_path, method="HEAD")
+        try:
+            with urllib.request.urlopen(request, timeout=5) as response:
+                return response.headers.get("ETag") or response.headers.get(
+                    "Last-Modified"
+                )
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not get version of {src_path}: {e}")
+            return None
+
+    return None
+
+
+@define
+class MosaicCache:
+    """Cache of parsed mosaic definitions and their spatial index.
+
+    Definitions are identified by the mosaic path and shared between requests
+    (and between all the factories using the same cache). Each definition is
+    revalidated every `revalidate` seconds by comparing the document's version
+    (see `get_etag`) with the one it was loaded with, and reloaded when it changed.
+
+    Attributes:
+        maxsize (int, optional): Maximum number of mosaics in the cache. Defaults to `32`.
+        maxbytes (int, optional): Maximum estimated size (in bytes) of the mosaics in the cache.
+        ttl (float, optional): Number of seconds a mosaic stays valid after being loaded.
+        revalidate (float, optional): Number of seconds between two checks of the mosaic document's version. Set to `None` to never check. Defaults to `60`.
+        get_etag (Callable): Function returning the version of a mosaic document. Defaults to `get_etag`.
+
+    """
+
+    maxsize: int | None = 32
+    maxbytes: int | None = None
+    ttl: float | None = None
+    revalidate: float | None = 60.0
+    get_etag: Callable[[str], str | None] = field(default=get_etag)
+
+    _cache: LRUCache = field(init=False)
+    _loading: dict[str, threading.Lock] = field(init=False, factory=dict)
+    _lock: threading.RLock = field(init=False, factory=threading.RLock)
+
+    def __attrs_post_init__(self):
+        """Create the LRU cache."""
+        self._cache = LRUCache(
+            maxsize=self.maxsize,
+            ttl=self.ttl,
+            maxbytes=self.maxbytes,
+            getsizeof=lambda index: index.nbytes,
+        )
+
+    def _is_valid(self, src_path: str, index: MosaicIndex) -> bool:
+        """Check if the mosaic document changed since it was loaded."""
+        now = time.monotonic()
+        if self.revalidate is None or now - index.checked < self.revalidate:
+            return True
+
+        index.checked = now
+        etag = self.get_etag(src_path)
+        return etag is None or etag == index.etag
+
+    def get(self, src_path: str, loader: Callable[[str], Any]) -> MosaicIndex:
+        """Get a mosaic from the cache or load it with `loader` (and add it to the cache)."""
+        index = self._cache.get(src_path)
+        if index is not None and self._is_valid(src_path, index):
+            return index
+
+        with self._lock:
+            lock = self._loading.setdefault(src_path, threading.Lock())
+
+        # Only one request loads a mosaic, concurrent requests wait for it
+        with lock:
+            current = self._cache.get(src_path)
+            if current is not None and current is not index:
+                return current
+
+            try:
+                etag = self.get_etag(src_path)
+                index = MosaicIndex(loader(src_path), etag=etag)
+                self._cache.set(src_path, index)
+            finally:
+                with self._lock:
+                    self._loading.pop(src_path, None)
+
+        return index
+
+    def invalidate(self, src_path: str) -> bool:
+        """Remove a mosaic from the cache."""
+        return self._cache.pop(src_path) is not None
+
+    def clear(self):
+        """Remove all mosaics from the cache."""
+        self._cache.clear()
+
+    def entries(self) -> list[dict[str, Any]]:
+        """List cached mosaics (from least to most recently used)."""
+        now = time.monotonic()
+        return [
+            {
+                "src_path": src_path,
+                "etag": index.etag,
+                "quadkeys": len(index.quadkeys),
+                "nbytes": index.nbytes,
+                "age": round(now - index.loaded, 3),
+            }
+            for src_path, index in self._cache.items()
+        ]
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        return {
+            **self._cache.stats(),
+            "nbytes": sum(index.nbytes for _, index in self._cache.items()),
+        }
+
+
+# Default mosaic cache, shared by all `titiler.mosaic.backends.CachedMosaicBackend`
+cache_settings = MosaicCacheSettings()
+mosaic_cache = MosaicCache(
+    maxsize=cache_settings.maxsize,
+    maxbytes=cache_settings.maxbytes,
+    ttl=cache_settings.ttl,
+    revalidate=cache_settings.revalidate,
+)
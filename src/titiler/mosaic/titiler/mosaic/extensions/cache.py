@@ -0,0 +1,41 @@
+"""titiler.mosaic cache extension."""
+
+from attrs import define
+
+from titiler.core.factory import FactoryExtension
+from titiler.mosaic.cache import MosaicCache, mosaic_cache
+from titiler.mosaic.factory import MosaicTilerFactory
+
+
+@define
+class MosaicCacheExtension(FactoryExtension):
+    """Add /cache endpoints to inspect and flush the mosaic definition cache."""
+
+    cache: MosaicCache = mosaic_cache
+
+    def register(self, factory: MosaicTilerFactory):  # type: ignore [override]
+        """Register endpoint to the tiler factory."""
+
+        @factory.router.get(
+            "/cache",
+            responses={
+                200: {"description": "Return mosaic cache statistics and entries."}
+            },
+            operation_id=f"{factory.operation_prefix}getCache",
+        )
+        def cache_info():
+            """Return mosaic cache statistics and entries."""
+            return {
+                **self.cache.stats(),
+                "entries": self.cache.entries(),
+            }
+
+        @factory.router.delete(
+            "/cache",
+            responses={200: {"description": "Flush the mosaic cache."}},
+            operation_id=f"{factory.operation_prefix}deleteCache",
+        )
+        def cache_clear():
+            """Flush the mosaic cache."""
+            self.cache.clear()
+            return self.cache.stats()
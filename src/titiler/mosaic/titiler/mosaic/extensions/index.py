@@ -0,0 +1,97 @@
+"""titiler.mosaic index extension."""
+
+import logging
+import time
+from typing import Annotated
+
+import numpy
+import rasterio
+from attrs import define
+from fastapi import Depends, Query
+
+from titiler.core.errors import BadRequestError
+from titiler.core.factory import FactoryExtension
+from titiler.mosaic.factory import MosaicTilerFactory
+from titiler.mosaic.index import QuadkeyIndex
+from titiler.mosaic.models.responses import IndexLookup, MosaicIndexInfo
+
+logger = logging.getLogger(__name__)
+
+
+@define
+class MosaicIndexExtension(FactoryExtension):
+    """Add /index endpoint reporting the mosaic index size and lookup latency.
+
+    Supports backends with a `titiler.mosaic.index.QuadkeyIndex` `index` attribute
+    (e.g `titiler.mosaic.backends.CachedMosaicBackend` or `titiler.mosaic.index.MosaicIndexBackend`).
+
+    """
+
+    def register(self, factory: MosaicTilerFactory):  # type: ignore [override]
+        """Register endpoint to the tiler factory."""
+
+        @factory.router.get(
+            "/index",
+            response_model=MosaicIndexInfo,
+            responses={
+                200: {"description": "Return mosaic index size and lookup latency."}
+            },
+            operation_id=f"{factory.operation_prefix}getIndex",
+        )
+        def index_info(
+            src_path=Depends(factory.path_dependency),
+            samples: Annotated[
+                int,
+                Query(
+                    ge=0,
+                    le=100000,
+                    description="Number of random tile lookups used to measure the latency.",
+                ),
+            ] = 1000,
+            backend_params=Depends(factory.backend_dependency),
+            reader_params=Depends(factory.reader_dependency),
+            env=Depends(factory.environment_dependency),
+        ):
+            """Return mosaic index size and lookup latency."""
+            with rasterio.Env(**env):
+                logger.info(
+                    f"opening data with backend: {factory.backend} and reader {factory.dataset_reader}"
+                )
+                with factory.backend(
+                    src_path,
+                    reader=factory.dataset_reader,
+                    reader_options=reader_params.as_dict(),
+                    **backend_params.as_dict(),
+                ) as src_dst:
+                    index = getattr(src_dst, "index", None)
+
+            if not isinstance(index, QuadkeyIndex):
+                raise BadRequestError(f"{factory.backend} does not use a mosaic index")
+
+            lookup = None
+            if samples and len(index.quadkeys):
+                rng = numpy.random.default_rng(0)
+                timings = []
+                for i in rng.integers(0, len(index.quadkeys), samples):
+                    x, y = int(index.xs[i]), int(index.ys[i])
+                    start = time.perf_counter()
+                    index.get_assets(x, y, index.quadkey_zoom)
+                    timings.append((time.perf_counter() - start) * 1000)
+
+                p50, p95, p99 = numpy.percentile(timings, [50, 95, 99])
+                lookup = IndexLookup(
+                    samples=samples,
+                    mean=float(numpy.mean(timings)),
+                    p50=float(p50),
+                    p95=float(p95),
+                    p99=float(p99),
+                    max=float(numpy.max(timings)),
+                )
+
+            return MosaicIndexInfo(
+                type=type(index).__name__,
+                quadkeys=len(index.quadkeys),
+                quadkey_zoom=index.quadkey_zoom,
+                nbytes=index.nbytes,
+                lookup=lookup,
+            )
@@ -12,10 +12,12 @@ from attrs import define, field
 from fastapi import Body, Depends, HTTPException, Path, Query
 from geojson_pydantic.features import Feature, FeatureCollection
 from geojson_pydantic.geometries import Polygon
+from morecantile import Tile
 from morecantile import tms as morecantile_tms
 from morecantile.defaults import TileMatrixSets
 from pydantic import Field
 from rio_tiler.constants import MAX_THREADS, WGS84_CRS
+from rio_tiler.errors import EmptyMosaicError, NoAssetFoundError, TileOutsideBounds
 from rio_tiler.io import BaseReader, MultiBaseReader, Reader
 from rio_tiler.mosaic.backend import BaseBackend, MosaicInfo
 from rio_tiler.mosaic.methods import PixelSelectionMethod
@@ -23,7 +25,7 @@ from rio_tiler.mosaic.methods.base import MosaicMethodBase
 from rio_tiler.types import ColorMapType
 from rio_tiler.utils import CRS_to_uri
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, Response
+from starlette.responses import HTMLResponse, Response, StreamingResponse
 from starlette.routing import NoMatchFound
 
 from titiler.core.algorithm import BaseAlgorithm
@@ -44,7 +46,9 @@ from titiler.core.dependencies import (
     StatisticsParams,
     TileParams,
 )
+from titiler.core.errors import BadRequestError
 from titiler.core.factory import BaseFactory, img_endpoint_params
+from titiler.core.models.common import TileBatch
 from titiler.core.models.mapbox import TileJSON
 from titiler.core.models.OGC import TileSet, TileSetList
 from titiler.core.models.responses import StatisticsGeoJSON
@@ -52,12 +56,17 @@ from titiler.core.resources.enums import ImageType, MediaType, OptionalHeader
 from titiler.core.resources.responses import GeoJSONResponse, JSONResponse
 from titiler.core.utils import (
     accept_media_type,
+    add_algorithm_halo,
     bounds_to_geometry,
     create_html_response,
+    media_type_to_extension,
     render_image,
+    tar_stream,
+    threaded_batch,
     tms_limits,
 )
 from titiler.mosaic.models.responses import Point
+from titiler.mosaic.scheduling import CoverageScheduler
 
 MOSAIC_THREADS = int(os.getenv("MOSAIC_CONCURRENCY", MAX_THREADS))
 MOSAIC_STRICT_ZOOM = str(os.getenv("MOSAIC_STRICT_ZOOM", False)).lower() in [
@@ -146,6 +155,14 @@ class MosaicTilerFactory(BaseFactory):
     add_statistics: bool = False
     add_part: bool = False
     add_ogc_maps: bool = False
+    add_batch: bool = False
+
+    # Batch tiles options
+    max_batch_tiles: int = 1000
+    batch_threads: int = MAX_THREADS
+
+    # Order the tile's assets by footprint coverage and read them in waves
+    tile_scheduler: CoverageScheduler | None = field(default=None)
 
     conforms_to: set[str] = field(
         factory=lambda: {
@@ -182,6 +199,9 @@ class MosaicTilerFactory(BaseFactory):
         if self.add_ogc_maps:
             self.ogc_maps()
 
+        if self.add_batch:
+            self.batch()
+
     ############################################################################
     # /info
     ############################################################################
@@ -574,7 +594,7 @@ class MosaicTilerFactory(BaseFactory):
             operation_id=f"{self.operation_prefix}getTileWithFormat",
             **img_endpoint_params,
         )
-        def tile(
+        def tile(  # noqa: C901
             z: Annotated[
                 int,
                 Path(
@@ -643,18 +663,35 @@ class MosaicTilerFactory(BaseFactory):
                             f"Invalid ZOOM level {z}. Should be between {src_dst.minzoom} and {src_dst.maxzoom}",
                         )
 
-                    image, assets = src_dst.tile(
-                        x,
-                        y,
-                        z,
-                        tilesize=tilesize,
-                        search_options=assets_accessor_params.as_dict(),
-                        pixel_selection=pixel_selection,
-                        threads=MOSAIC_THREADS,
-                        **tile_params.as_dict(),
-                        **layer_params.as_dict(),
-                        **dataset_params.as_dict(),
-                    )
+                    if self.tile_scheduler:
+                        image, assets, skipped = self.tile_scheduler.tile(
+                            src_dst,
+                            x,
+                            y,
+                            z,
+                            tilesize=tilesize,
+                            search_options=assets_accessor_params.as_dict(),
+                            pixel_selection=pixel_selection,
+                            threads=MOSAIC_THREADS,
+                            **add_algorithm_halo(tile_params.as_dict(), post_process),
+                            **layer_params.as_dict(),
+                            **dataset_params.as_dict(),
+                        )
+
+                    else:
+                        skipped = None
+                        image, assets = src_dst.tile(
+                            x,
+                            y,
+                            z,
+                            tilesize=tilesize,
+                            search_options=assets_accessor_params.as_dict(),
+                            pixel_selection=pixel_selection,
+                            threads=MOSAIC_THREADS,
+                            **add_algorithm_halo(tile_params.as_dict(), post_process),
+                            **layer_params.as_dict(),
+                            **dataset_params.as_dict(),
+                        )
 
             if post_process:
                 image = post_process(image)
@@ -669,6 +706,8 @@ class MosaicTilerFactory(BaseFactory):
             headers: dict[str, str] = {}
             if OptionalHeader.x_assets in self.optional_headers:
                 headers["X-Assets"] = ",".join(assets)
+                if skipped is not None:
+                    headers["X-Assets-Skipped"] = ",".join(skipped)
 
             if image.bounds is not None:
                 headers["Content-Bbox"] = ",".join(map(str, image.bounds))
@@ -684,12 +723,136 @@ class MosaicTilerFactory(BaseFactory):
                 OptionalHeader.server_timing in self.optional_headers
                 and image.metadata.get("timings")
             ):
-                headers["Server-Timing"] = ", ".join(
-                    [f"{name};dur={time}" for (name, time) in image.metadata["timings"]]
-                )
+                timings = [
+                    f"{name};dur={time}" for (name, time) in image.metadata["timings"]
+                ]
+                if skipped is not None:
+                    timings.append(f'assets-skipped;desc="{len(skipped)}"')
+
+                headers["Server-Timing"] = ", ".join(timings)
 
             return Response(content, media_type=media_type, headers=headers)
 
+    def batch(self):  # noqa: C901
+        """Register /tiles/{tileMatrixSetId}/batch endpoint."""
+
+        @self.router.post(
+            "/tiles/{tileMatrixSetId}/batch",
+            operation_id=f"{self.operation_prefix}getTileBatch",
+            response_class=StreamingResponse,
+            responses={
+                200: {
+                    "content": {MediaType.tar.value: {}},
+                    "description": "Return a TAR archive of tiles (`{z}/{x}/{y}.{format}`).",
+                }
+            },
+        )
+        def batch(  # noqa: C901
+            tiles: Annotated[TileBatch, Body(description="Tiles to create.")],
+            tileMatrixSetId: Annotated[
+                Literal[tuple(self.supported_tms.list())],
+                Path(
+                    description="Identifier selecting one of the TileMatrixSetId supported."
+                ),
+            ],
+            format: Annotated[
+                ImageType | None,
+                Query(
+                    description="Default will be automatically defined if the output image needs a mask (png) or not (jpeg).",
+                ),
+            ] = None,
+            tilesize: Annotated[
+                int | None,
+                Query(gt=0, description="Tilesize in pixels."),
+            ] = None,
+            src_path=Depends(self.path_dependency),
+            backend_params=Depends(self.backend_dependency),
+            reader_params=Depends(self.reader_dependency),
+            assets_accessor_params=Depends(self.assets_accessor_dependency),
+            layer_params=Depends(self.layer_dependency),
+            dataset_params=Depends(self.dataset_dependency),
+            pixel_selection=Depends(self.pixel_selection_dependency),
+            tile_params=Depends(self.tile_dependency),
+            post_process=Depends(self.process_dependency),
+            colormap=Depends(self.colormap_dependency),
+            render_params=Depends(self.render_dependency),
+            env=Depends(self.environment_dependency),
+        ):
+            """Create multiple map tiles from a Mosaic.
+
+            Tiles outside the mosaic bounds or without assets are skipped. If other errors happen,
+            an `errors.json` file listing the failed tiles is added to the archive.
+
+            """
+            tms = self.supported_tms.get(tileMatrixSetId)
+            try:
+                tile_list = tiles.get_tiles(tms, self.max_batch_tiles)
+            except ValueError as e:
+                raise BadRequestError(str(e)) from e
+
+            def _tile(src_dst: BaseBackend, tile: Tile) -> tuple[bytes, str] | None:
+                if MOSAIC_STRICT_ZOOM and (
+                    tile.z < src_dst.minzoom or tile.z > src_dst.maxzoom
+                ):
+                    return None
+
+                try:
+                    image, _ = src_dst.tile(
+                        tile.x,
+                        tile.y,
+                        tile.z,
+                        tilesize=tilesize,
+                        search_options=assets_accessor_params.as_dict(),
+                        pixel_selection=pixel_selection,
+                        threads=MOSAIC_THREADS,
+                        **add_algorithm_halo(tile_params.as_dict(), post_process),
+                        **layer_params.as_dict(),
+                        **dataset_params.as_dict(),
+                    )
+                except (TileOutsideBounds, NoAssetFoundError, EmptyMosaicError):
+                    return None
+
+                if post_process:
+                    image = post_process(image)
+
+                return self.render_func(
+                    image,
+                    output_format=format,
+                    colormap=colormap,
+                    **render_params.as_dict(),
+                )
+
+            def _files():
+                errors = {}
+                for tile, result in threaded_batch(
+                    lambda: self.backend(
+                        src_path,
+                        tms=tms,
+                        reader=self.dataset_reader,
+                        reader_options=reader_params.as_dict(),
+                        **backend_params.as_dict(),
+                    ),
+                    _tile,
+                    tile_list,
+                    threads=self.batch_threads,
+                    env=env,
+                ):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Could not create tile {tile}: {result}")
+                        errors[f"{tile.z}/{tile.x}/{tile.y}"] = str(result)
+                    elif result is not None:
+                        content, media_type = result
+                        ext = media_type_to_extension(media_type)
+                        yield f"{tile.z}/{tile.x}/{tile.y}.{ext}", content
+
+                if errors:
+                    yield "errors.json", json.dumps(errors).encode()
+
+            return StreamingResponse(
+                tar_stream(_files()),
+                media_type=MediaType.tar.value,
+            )
+
     def tilejson(self):  # noqa: C901
         """Add tilejson endpoint."""
 
@@ -1097,7 +1260,7 @@ class MosaicTilerFactory(BaseFactory):
                         threads=MOSAIC_THREADS,
                         **layer_params.as_dict(),
                         **dataset_params.as_dict(),
-                        **image_params.as_dict(),
+                        **add_algorithm_halo(image_params.as_dict(), post_process),
                     )
                     dst_colormap = getattr(src_dst, "colormap", None)
 
@@ -1192,7 +1355,7 @@ class MosaicTilerFactory(BaseFactory):
                         pixel_selection=pixel_selection,
                         threads=MOSAIC_THREADS,
                         **layer_params.as_dict(),
-                        **image_params.as_dict(),
+                        **add_algorithm_halo(image_params.as_dict(), post_process),
                         **dataset_params.as_dict(),
                     )
 
@@ -0,0 +1,516 @@
+"""titiler.mosaic compact mosaic index.
+
+Binary, memory-mapped, representation of a MosaicJSON `tiles` mapping:
+
+    magic (8 bytes) | header length (uint64) | JSON header | sections
+
+Sections (8 bytes aligned, little-endian) are described in the header with their
+offset, length and data type:
+
+- `quadkeys`: sorted quadkeys, as integers (2 bits per zoom level)
+- `xs`, `ys`: tile column and row of each quadkey
+- `offsets`: start of each quadkey's assets in `asset_ids` (`len(quadkeys) + 1` values)
+- `asset_ids`: assets of each quadkey, as indexes in the string table
+- `string_offsets`: start of each asset in `strings` (`len(assets) + 1` values)
+- `strings`: deduplicated assets (UTF-8)
+
+Because the file is memory-mapped (read-only), its pages are shared by all the
+processes opening the same index.
+
+"""
+
+from __future__ import annotations
+
+import abc
+import argparse
+import gzip
+import itertools
+import json
+import logging
+import mmap
+import os
+import struct
+from collections.abc import Iterable
+from typing import Any
+
+import attr
+import numpy
+from attrs import define, field
+from morecantile import Tile, TileMatrixSet
+from rasterio.crs import CRS
+from rasterio.warp import transform, transform_bounds
+from rio_tiler.constants import WEB_MERCATOR_TMS
+from rio_tiler.mosaic.backend import BaseBackend, MosaicInfo
+from rio_tiler.utils import CRS_to_uri
+
+from titiler.core.cache import LRUCache
+from titiler.mosaic.settings import MosaicCacheSettings
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TMINDEX\x01"
+VERSION = 1
+
+
+def tile_quadkey(x: int, y: int, z: int) -> str:
+    """Quadkey of a tile (for TileMatrixSets with quadtree tile matrices)."""
+    return "".join(
+        str(((x >> i) & 1) + 2 * ((y >> i) & 1)) for i in range(z - 1, -1, -1)
+    )
+
+
+def quadkey_to_int(quadkey: str) -> int:
+    """Integer representation of a quadkey (base 4)."""
+    return int(quadkey, 4) if quadkey else 0
+
+
+def quadkeys_xy(
+    quadkeys: numpy.ndarray, zoom: int
+) -> tuple[numpy.ndarray, numpy.ndarray]:
+    """Tile column and row of integer quadkeys."""
+    quadkeys = quadkeys.astype("uint64")
+    xs = numpy.zeros(len(quadkeys), dtype="uint32")
+    ys = numpy.zeros(len(quadkeys), dtype="uint32")
+    for i in range(zoom):
+        digits = (quadkeys >> numpy.uint64(2 * i)) & numpy.uint64(3)
+        xs |= ((digits & numpy.uint64(1)) << numpy.uint64(i)).astype("uint32")
+        ys |= ((digits >> numpy.uint64(1)) << numpy.uint64(i)).astype("uint32")
+
+    return xs, ys
+
+
+@define
+class QuadkeyIndex(metaclass=abc.ABCMeta):
+    """Spatial index of a mosaic's quadkeys.
+
+    Quadkeys (all at the mosaic's `quadkey_zoom`) are stored sorted as integers,
+    along with their tile column and row. Because a tile's quadkey is the prefix of
+    its children's quadkeys, the quadkeys covered by a lower zoom tile are found with
+    a binary search, and the quadkeys intersecting a bounding box are selected with
+    a vectorized comparison of the tile indexes, instead of listing every candidate
+    tile. Assets are returned in the same order as cogeo-mosaic's backends.
+
+    Attributes:
+        quadkeys (numpy.ndarray): Sorted quadkeys (uint64).
+        xs (numpy.ndarray): Tile column of each quadkey.
+        ys (numpy.ndarray): Tile row of each quadkey.
+
+    """
+
+    quadkeys: numpy.ndarray = field(init=False)
+    xs: numpy.ndarray = field(init=False)
+    ys: numpy.ndarray = field(init=False)
+
+    @property
+    @abc.abstractmethod
+    def quadkey_zoom(self) -> int:
+        """Zoom level of the mosaic quadkeys."""
+        ...
+
+    @property
+    @abc.abstractmethod
+    def tms(self) -> TileMatrixSet:
+        """Mosaic TileMatrixSet."""
+        ...
+
+    @property
+    @abc.abstractmethod
+    def asset_prefix(self) -> str | None:
+        """Prefix added to the assets."""
+        ...
+
+    @property
+    @abc.abstractmethod
+    def nbytes(self) -> int:
+        """Size (in bytes) of the index."""
+        ...
+
+    @abc.abstractmethod
+    def _assets(self, indexes: Iterable[int]) -> list[str]:
+        """Unique assets of quadkeys, in quadkey order."""
+        ...
+
+    def _get(self, indexes: Iterable[int], reverse: bool = False) -> list[str]:
+        assets = self._assets(indexes)
+        if prefix := self.asset_prefix:
+            assets = [prefix + asset for asset in assets]
+
+        if reverse:
+            assets.reverse()
+
+        return assets
+
+    def get_assets(self, x: int, y: int, z: int, reverse: bool = False) -> list[str]:
+        """Find assets for a tile of the mosaic TileMatrixSet."""
+        qz = self.quadkey_zoom
+        if z >= qz:
+            depth = z - qz
+            quadkey = numpy.uint64(
+                quadkey_to_int(tile_quadkey(x >> depth, y >> depth, qz))
+            )
+            i = int(numpy.searchsorted(self.quadkeys, quadkey))
+            if i < len(self.quadkeys) and self.quadkeys[i] == quadkey:
+                return self._get([i], reverse=reverse)
+
+            return []
+
+        # Children quadkeys share the tile's quadkey as prefix
+        depth = 2 * (qz - z)
+        prefix = quadkey_to_int(tile_quadkey(x, y, z))
+        start, stop = numpy.searchsorted(
+            self.quadkeys,
+            numpy.array([prefix << depth, (prefix + 1) << depth], dtype="uint64"),
+        )
+        return self._get(range(start, stop), reverse=reverse)
+
+    def assets_for_bbox(
+        self,
+        xmin: float,
+        ymin: float,
+        xmax: float,
+        ymax: float,
+        reverse: bool = False,
+    ) -> list[str]:
+        """Find assets for a bounding box (in the mosaic TileMatrixSet's geographic CRS)."""
+        qz = self.quadkey_zoom
+        tl_tile = self.tms.tile(xmin, ymax, qz)
+        br_tile = self.tms.tile(xmax, ymin, qz)
+
+        indexes = numpy.flatnonzero(
+            (self.xs >= tl_tile.x)
+            & (self.xs <= br_tile.x)
+            & (self.ys >= tl_tile.y)
+            & (self.ys <= br_tile.y)
+        )
+        # column major order
+        indexes = indexes[numpy.lexsort((self.ys[indexes], self.xs[indexes]))]
+        if not reverse:
+            return self._get(indexes)
+
+        # assets are reversed for each quadkey (same as cogeo-mosaic)
+        return list(
+            dict.fromkeys(
+                itertools.chain.from_iterable(
+                    self._get([i], reverse=True) for i in indexes
+                )
+            )
+        )
+
+
+def _section(array: numpy.ndarray) -> dict[str, Any]:
+    return {"dtype": array.dtype.str, "count": len(array)}
+
+
+def _uint(maxvalue: int) -> str:
+    """Smallest unsigned integer type for values up to `maxvalue`."""
+    for dtype in ["<u2", "<u4"]:
+        if maxvalue <= numpy.iinfo(dtype).max:
+            return dtype
+
+    return "<u8"
+
+
+def write_index(mosaic: Any, path: str) -> dict[str, Any]:
+    """Write a MosaicJSON document (dict or `cogeo_mosaic.mosaic.MosaicJSON`) as a compact mosaic index.
+
+    Returns:
+        dict: Index header.
+
+    """
+    if hasattr(mosaic, "model_dump"):
+        mosaic = mosaic.model_dump(mode="json", exclude_none=True)
+
+    qz = mosaic.get("quadkey_zoom") or mosaic["minzoom"]
+    if qz > 31:
+        raise ValueError(f"Quadkey zoom ({qz}) must be lower than 32")
+
+    tiles = mosaic["tiles"]
+    keys = sorted(k for k in tiles if len(k) == qz)
+    if len(keys) != len(tiles):
+        logger.warning(f"{len(tiles) - len(keys)} quadkeys not at zoom {qz} ignored")
+
+    strings: dict[str, int] = {}
+    ids = [strings.setdefault(asset, len(strings)) for k in keys for asset in tiles[k]]
+    encoded = [asset.encode() for asset in strings]
+
+    quadkeys = numpy.array([quadkey_to_int(k) for k in keys], dtype="<u8")
+    xs, ys = quadkeys_xy(quadkeys, qz)
+    sections = {
+        "quadkeys": quadkeys,
+        "xs": xs.astype("<u4"),
+        "ys": ys.astype("<u4"),
+        "offsets": numpy.cumsum(
+            [0] + [len(tiles[k]) for k in keys], dtype="uint64"
+        ).astype(_uint(len(ids))),
+        "asset_ids": numpy.array(ids, dtype=_uint(len(strings))),
+        "string_offsets": numpy.cumsum(
+            [0] + [len(s) for s in encoded], dtype="uint64"
+        ).astype("<u8"),
+        "strings": numpy.frombuffer(b"".join(encoded), dtype="u1"),
+    }
+
+    header = {
+        **{k: v for k, v in mosaic.items() if k != "tiles"},
+        # the mosaic has its own `version`
+        "index_version": VERSION,
+        "quadkey_zoom": qz,
+        "assets": len(strings),
+        "sections": {name: _section(array) for name, array in sections.items()},
+    }
+
+    # Sections offsets depend on the header size
+    while True:
+        body = json.dumps(header).encode()
+        offset = len(MAGIC) + 8 + len(body)
+        for name, array in sections.items():
+            offset += -offset % 8
+            header["sections"][name]["offset"] = offset
+            offset += array.nbytes
+
+        if json.dumps(header).encode() == body:
+            break
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        f.write(struct.pack("<Q", len(body)))
+        f.write(body)
+        for name, array in sections.items():
+            f.write(b"\x00" * (header["sections"][name]["offset"] - f.tell()))
+            f.write(array.tobytes())
+
+    return header
+
+
+@define(eq=False)
+class MemoryMappedIndex(QuadkeyIndex):
+    """Compact mosaic index, memory-mapped from a file written by `write_index`.
+
+    Attributes:
+        path (str): Index file path.
+        header (dict): Index header (mosaic metadata and sections).
+
+    """
+
+    path: str
+    header: dict = field(init=False)
+    offsets: numpy.ndarray = field(init=False)
+    asset_ids: numpy.ndarray = field(init=False)
+    string_offsets: numpy.ndarray = field(init=False)
+    strings: numpy.ndarray = field(init=False)
+
+    _tms: TileMatrixSet = field(init=False)
+    _mmap: mmap.mmap = field(init=False)
+    _size: int = field(init=False)
+
+    def __attrs_post_init__(self):
+        """Memory-map the index."""
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{self.path} is not a mosaic index")
+
+            (length,) = struct.unpack("<Q", f.read(8))
+            self.header = json.loads(f.read(length))
+            if (version := self.header.get("index_version")) != VERSION:
+                raise ValueError(
+                    f"{self.path} index version ({version}) is not supported (expected {VERSION})"
+                )
+
+            self._size = os.fstat(f.fileno()).st_size
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        for name, section in self.header["sections"].items():
+            array = numpy.frombuffer(
+                self._mmap,
+                dtype=section["dtype"],
+                count=section["count"],
+                offset=section["offset"],
+            )
+            setattr(self, name, array)
+
+        if tms := self.header.get("tilematrixset"):
+            self._tms = TileMatrixSet.model_validate(tms)
+        else:
+            self._tms = WEB_MERCATOR_TMS
+
+    @property
+    def quadkey_zoom(self) -> int:
+        """Zoom level of the mosaic quadkeys."""
+        return self.header["quadkey_zoom"]
+
+    @property
+    def tms(self) -> TileMatrixSet:
+        """Mosaic TileMatrixSet."""
+        return self._tms
+
+    @property
+    def asset_prefix(self) -> str | None:
+        """Prefix added to the assets."""
+        return self.header.get("asset_prefix")
+
+    @property
+    def nbytes(self) -> int:
+        """Size (in bytes) of the index file."""
+        return self._size
+
+    def asset(self, i: int) -> str:
+        """Decode asset from the string table."""
+        start, stop = self.string_offsets[i : i + 2]
+        return self.strings[start:stop].tobytes().decode()
+
+    def _assets(self, indexes: Iterable[int]) -> list[str]:
+        """Unique assets of quadkeys, in quadkey order."""
+        ids = dict.fromkeys(
+            itertools.chain.from_iterable(
+                self.asset_ids[self.offsets[i] : self.offsets[i + 1]].tolist()
+                for i in indexes
+            )
+        )
+        return [self.asset(i) for i in ids]
+
+
+# Opened indexes, shared by the backend instances
+_indexes: LRUCache = LRUCache(maxsize=MosaicCacheSettings().index_maxsize)
+
+
+def open_index(path: str) -> MemoryMappedIndex:
+    """Open a mosaic index (re-using the index opened by previous calls if the file did not change)."""
+    stat = os.stat(path)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    if (index := _indexes.get(key)) is None:
+        index = MemoryMappedIndex(path)
+        _indexes.set(key, index)
+
+    return index
+
+
+@attr.s
+class MosaicIndexBackend(BaseBackend):
+    """Mosaic backend for compact mosaic index files (see `write_index`).
+
+    Attributes:
+        input (str): Index file path.
+        minzoom (int): mosaic Min zoom level. Defaults to tms or mosaic minzoom.
+        maxzoom (int): mosaic Max zoom level. Defaults to tms or mosaic maxzoom.
+        index (titiler.mosaic.index.MemoryMappedIndex): Memory-mapped index. **READ ONLY attribute**.
+
+    """
+
+    minzoom: int = attr.ib(default=None)
+    maxzoom: int = attr.ib(default=None)
+
+    index: MemoryMappedIndex = attr.ib(init=False)
+
+    def __attrs_post_init__(self):
+        """Open the index."""
+        self.index = open_index(self.input)
+        header = self.index.header
+        self.bounds = tuple(header["bounds"])
+
+        # By mosaic definition, its `bounds` is defined using the mosaic's TMS
+        # Geographic CRS.
+        mosaic_tms = self.index.tms
+        self.crs = mosaic_tms.rasterio_geographic_crs
+
+        if self.minzoom is None:
+            self.minzoom = (
+                header["minzoom"] if mosaic_tms == self.tms else self.tms.minzoom
+            )
+
+        if self.maxzoom is None:
+            self.maxzoom = (
+                header["maxzoom"] if mosaic_tms == self.tms else self.tms.maxzoom
+            )
+
+    def assets_for_tile(self, x: int, y: int, z: int, **kwargs: Any) -> list[str]:
+        """Retrieve assets for tile."""
+        if self.tms == self.index.tms:
+            return self.index.get_assets(x, y, z, **kwargs)
+
+        # If TMS are different, then use Tile's geographic coordinates
+        # and `assets_for_bbox` to get the assets
+        xmin, ymin, xmax, ymax = self.tms.bounds(Tile(x, y, z))
+        return self.assets_for_bbox(
+            xmin,
+            ymin,
+            xmax,
+            ymax,
+            coord_crs=self.tms.rasterio_geographic_crs,
+            **kwargs,
+        )
+
+    def assets_for_point(
+        self,
+        lng: float,
+        lat: float,
+        coord_crs: CRS | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Retrieve assets for point."""
+        mosaic_tms = self.index.tms
+        mosaic_crs = mosaic_tms.rasterio_geographic_crs
+
+        # default coord_crs should be the TMS's geographic CRS
+        coord_crs = coord_crs or self.tms.rasterio_geographic_crs
+        if coord_crs != mosaic_crs:
+            xs, ys = transform(coord_crs, mosaic_crs, [lng], [lat])
+            lng, lat = xs[0], ys[0]
+
+        tile = mosaic_tms.tile(lng, lat, self.index.quadkey_zoom)
+        return self.index.get_assets(tile.x, tile.y, tile.z, **kwargs)
+
+    def assets_for_bbox(
+        self,
+        xmin: float,
+        ymin: float,
+        xmax: float,
+        ymax: float,
+        coord_crs: CRS | None = None,
+        **kwargs: Any,
+    ) -> list[str]:
+        """Retrieve assets for bbox."""
+        mosaic_crs = self.index.tms.rasterio_geographic_crs
+
+        # default coord_crs should be the TMS's geographic CRS
+        coord_crs = coord_crs or self.tms.rasterio_geographic_crs
+        if coord_crs != mosaic_crs:
+            xmin, ymin, xmax, ymax = transform_bounds(
+                coord_crs, mosaic_crs, xmin, ymin, xmax, ymax
+            )
+
+        return self.index.assets_for_bbox(xmin, ymin, xmax, ymax, **kwargs)
+
+    def info(self) -> MosaicInfo:  # type: ignore
+        """Mosaic info."""
+        header = self.index.header
+        return MosaicInfo(
+            bounds=self.bounds,
+            crs=CRS_to_uri(self.crs) or self.crs.to_wkt(),
+            name=header.get("name") or "mosaic",
+            quadkeys=len(self.index.quadkeys),
+            assets=header["assets"],
+            mosaic_tilematrixset=repr(self.index.tms),
+            mosaic_minzoom=header["minzoom"],
+            mosaic_maxzoom=header["maxzoom"],
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """titiler-mosaic-index command line."""
+    parser = argparse.ArgumentParser(
+        prog="titiler-mosaic-index",
+        description="Convert a MosaicJSON document to a compact, memory-mapped, mosaic index.",
+    )
+    parser.add_argument("input", help="MosaicJSON file (`.json` or `.json.gz`).")
+    parser.add_argument("output", help="Output mosaic index file.")
+    args = parser.parse_args(argv)
+
+    opener = gzip.open if args.input.endswith(".gz") else open
+    with opener(args.input, "rb") as f:
+        mosaic = json.load(f)
+
+    header = write_index(mosaic, args.output)
+    print(
+        f"{args.output}: {header['sections']['quadkeys']['count']} quadkeys, "
+        f"{header['assets']} assets, {os.path.getsize(args.output)} bytes"
+    )
+    return 0
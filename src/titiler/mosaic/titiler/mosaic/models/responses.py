@@ -22,3 +22,29 @@ class Point(BaseModel):
 
     coordinates: list[float]
     assets: list[AssetPoint]
+
+
+class IndexLookup(BaseModel):
+    """Lookup latency (in ms) for tiles at the mosaic's quadkey zoom."""
+
+    samples: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+class MosaicIndexInfo(BaseModel):
+    """
+    Mosaic index model.
+
+    response model for `/index` endpoint
+
+    """
+
+    type: str
+    quadkeys: int
+    quadkey_zoom: int
+    nbytes: int
+    lookup: IndexLookup | None = None
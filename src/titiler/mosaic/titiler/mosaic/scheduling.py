@@ -0,0 +1,221 @@
+"""titiler.mosaic asset scheduling."""
+
+import contextlib
+from collections.abc import Callable, Iterator, Sequence
+from typing import Any
+
+import numpy
+from attrs import define, field
+from morecantile import Tile
+from rasterio.features import bounds as featureBounds
+from rasterio.features import rasterize
+from rasterio.transform import from_bounds
+from rio_tiler.models import ImageData
+from rio_tiler.mosaic.backend import BaseBackend
+from rio_tiler.mosaic.methods.base import MosaicMethodBase
+from rio_tiler.types import BBox
+from rio_tiler.utils import Timer
+
+
+def get_asset_footprint(asset: Any) -> dict | None:
+    """Get the footprint (GeoJSON geometry in WGS84) of an asset from the mosaic index.
+
+    Supports GeoJSON Features (e.g STAC Items) with a `geometry` or a `bbox`, GeoJSON
+    geometries and objects implementing the `__geo_interface__` protocol. Returns
+    `None` for other assets (e.g URLs).
+
+    """
+    if hasattr(asset, "__geo_interface__"):
+        asset = asset.__geo_interface__
+
+    if not isinstance(asset, dict):
+        return None
+
+    if asset.get("type") == "Feature":
+        if geometry := asset.get("geometry"):
+            return geometry
+
+        if bbox := asset.get("bbox"):
+            xmin, ymin, xmax, ymax = bbox[0], bbox[1], bbox[-2], bbox[-1]
+            return {
+                "type": "Polygon",
+                "coordinates": [
+                    [
+                        (xmin, ymin),
+                        (xmax, ymin),
+                        (xmax, ymax),
+                        (xmin, ymax),
+                        (xmin, ymin),
+                    ]
+                ],
+            }
+
+        return None
+
+    if "coordinates" in asset or "geometries" in asset:
+        return asset
+
+    return None
+
+
+def tile_coverage(geometry: dict, bounds: BBox, resolution: int = 16) -> float:
+    """Estimate the fraction of the tile bounds covered by a geometry.
+
+    The geometry is rasterized on a `resolution x resolution` grid over the bounds.
+
+    """
+    xmin, ymin, xmax, ymax = featureBounds(geometry)
+    if xmin >= bounds[2] or xmax <= bounds[0] or ymin >= bounds[3] or ymax <= bounds[1]:
+        return 0.0
+
+    mask = rasterize(
+        [geometry],
+        out_shape=(resolution, resolution),
+        transform=from_bounds(*bounds, resolution, resolution),
+        fill=0,
+        default_value=1,
+        dtype="uint8",
+    )
+    return float(numpy.mean(mask))
+
+
+@define
+class TileSchedule:
+    """Assets scheduled for a tile.
+
+    Attributes:
+        assets (list): Asset names, in read order.
+        coverage (list): Estimated tile coverage of each asset (`None` when the footprint is unknown).
+        wave_size (int): Number of assets read concurrently.
+        elapsed (float): Time spent ordering the assets (in ms).
+
+    """
+
+    assets: list[str] = field(factory=list)
+    coverage: list[float | None] = field(factory=list)
+    wave_size: int = 1
+    elapsed: float = 0.0
+
+    def skipped(
+        self, assets_used: Sequence[str], done: bool, threads: int
+    ) -> list[str]:
+        """Assets not read because the tile was filled by previous waves.
+
+        Args:
+            assets_used (list): Asset names returned by the backend.
+            done (bool): Pixel selection method's `is_done` status.
+            threads (int): Number of threads used by the backend.
+
+        """
+        if not done or not assets_used or assets_used[-1] not in self.assets:
+            return []
+
+        last = self.assets.index(assets_used[-1])
+        if threads > 1:
+            # every asset of the last wave is read
+            read = min(len(self.assets), (last // self.wave_size + 1) * self.wave_size)
+        else:
+            read = last + 1
+
+        return self.assets[read:]
+
+
+@define
+class CoverageScheduler:
+    """Read the assets with the largest footprint coverage of the tile first.
+
+    Candidate assets are ordered by their estimated coverage of the tile (from the
+    footprints stored in the mosaic index), assets with an unknown footprint last,
+    and are read in waves of `wave_size` assets. With pixel selection methods able to
+    stop early (e.g `first`), the remaining waves are skipped once the tile is filled.
+
+    Note: the assets order defines the pixels precedence for order dependent methods
+    (e.g `first`).
+
+    Attributes:
+        wave_size (int): Number of assets read concurrently. Defaults to `4`.
+        footprint (Callable): Function returning the asset's footprint (GeoJSON geometry in WGS84) or `None`. Defaults to `get_asset_footprint`.
+        resolution (int): Size of the grid used to estimate the coverage. Defaults to `16`.
+
+    """
+
+    wave_size: int = 4
+    footprint: Callable[[Any], dict | None] = get_asset_footprint
+    resolution: int = 16
+
+    def order(self, assets: Sequence, bounds: BBox) -> tuple[list, list[float | None]]:
+        """Order assets by decreasing coverage of the bounds."""
+        coverage: list[float | None] = []
+        for asset in assets:
+            geometry = self.footprint(asset)
+            coverage.append(
+                tile_coverage(geometry, bounds, resolution=self.resolution)
+                if geometry
+                else None
+            )
+
+        # stable sort: assets with the same coverage keep the backend order
+        keys = [-c if c is not None else 1.0 for c in coverage]
+        order = sorted(range(len(assets)), key=keys.__getitem__)
+        return [assets[i] for i in order], [coverage[i] for i in order]
+
+    @contextlib.contextmanager
+    def schedule(self, backend: BaseBackend) -> Iterator[TileSchedule]:
+        """Order the assets returned by the backend's `assets_for_tile` method."""
+        schedule = TileSchedule(wave_size=self.wave_size)
+        assets_for_tile = backend.assets_for_tile
+
+        def _assets_for_tile(x: int, y: int, z: int, **kwargs: Any) -> list[Any]:
+            assets = assets_for_tile(x, y, z, **kwargs)
+            with Timer() as t:
+                assets, schedule.coverage = self.order(
+                    assets, backend.tms.bounds(Tile(x, y, z))
+                )
+                schedule.assets = [backend.asset_name(asset) for asset in assets]
+            schedule.elapsed = round(t.elapsed * 1000, 2)
+            return assets
+
+        backend.assets_for_tile = _assets_for_tile  # type: ignore
+        try:
+            yield schedule
+        finally:
+            del backend.assets_for_tile
+
+    def tile(
+        self,
+        backend: BaseBackend,
+        x: int,
+        y: int,
+        z: int,
+        pixel_selection: type[MosaicMethodBase] | MosaicMethodBase,
+        threads: int,
+        **kwargs: Any,
+    ) -> tuple[ImageData, list[str], list[str]]:
+        """Create a tile from the backend's assets, in coverage order.
+
+        Returns:
+            tuple: ImageData, assets used and assets skipped.
+
+        """
+        method = (
+            pixel_selection() if isinstance(pixel_selection, type) else pixel_selection
+        )
+
+        with self.schedule(backend) as schedule:
+            image, assets = backend.tile(
+                x,
+                y,
+                z,
+                pixel_selection=method,
+                threads=threads,
+                chunk_size=self.wave_size,
+                **kwargs,
+            )
+
+        skipped = schedule.skipped(assets, done=method.is_done, threads=threads)
+        metadata = image.metadata if image.metadata is not None else {}
+        metadata["mosaic_assets_skipped"] = len(skipped)
+        metadata.setdefault("timings", []).append(("scheduling", schedule.elapsed))
+        image.metadata = metadata
+
+        return image, assets, skipped
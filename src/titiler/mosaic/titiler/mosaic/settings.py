@@ -0,0 +1,19 @@
+"""titiler.mosaic settings."""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MosaicCacheSettings(BaseSettings):
+    """Default mosaic cache settings."""
+
+    maxsize: int | None = 32
+    maxbytes: int | None = None
+    ttl: float | None = None
+    revalidate: float | None = 60.0
+
+    # number of opened `titiler.mosaic.index.MemoryMappedIndex`
+    index_maxsize: int | None = 32
+
+    model_config = SettingsConfigDict(
+        env_prefix="TITILER_MOSAIC_CACHE_", env_file=".env", extra="ignore"
+    )
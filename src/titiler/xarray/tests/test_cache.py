@@ -0,0 +1,169 @@
+"""test titiler.xarray.cache."""
+
+import os
+import time
+
+import numpy
+import pytest
+from fastapi import FastAPI
+from starlette.testclient import TestClient
+
+from titiler.xarray.cache import ChunkCache, DatasetCache, dataset_cache
+from titiler.xarray.extensions import DatasetCacheExtension
+from titiler.xarray.factory import TilerFactory
+from titiler.xarray.io import Reader, open_zarr
+
+prefix = os.path.join(os.path.dirname(__file__), "fixtures")
+ZARR = os.path.join(prefix, "dataset_3d.zarr")
+PYRAMID = os.path.join(prefix, "pyramid.zarr")
+
+
+def test_dataset_cache():
+    """Should share opened datasets and only close them when not used."""
+    closed = []
+
+    def opener(src_path, **kwargs):
+        ds = open_zarr(src_path, **kwargs)
+        ds.set_close(lambda: closed.append(src_path))
+        return ds
+
+    cache = DatasetCache(maxsize=1)
+
+    ds = cache.open(opener, ZARR)
+    assert cache.open(opener, ZARR) is ds
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["in_use"] == 1
+    assert cache.entries()[0]["refcount"] == 2
+
+    # Different options means a different dataset
+    ds_group = cache.open(opener, PYRAMID, group="0")
+    assert cache.stats()["evictions"] == 1
+
+    # Evicted dataset is still in use
+    assert not closed
+    assert cache.release(ds)
+    assert not closed
+    assert cache.release(ds)
+    assert closed == [ZARR]
+
+    # Cached dataset is not closed when released
+    assert cache.release(ds_group)
+    assert closed == [ZARR]
+    assert cache.stats()["in_use"] == 0
+
+    # Dataset not opened by the cache
+    assert not cache.release(open_zarr(ZARR))
+
+    cache.clear()
+    assert closed == [ZARR, PYRAMID]
+    assert cache.stats()["size"] == 0
+
+
+def test_dataset_cache_limits():
+    """Should expire datasets and skip datasets too big."""
+    cache = DatasetCache(ttl=0.01)
+    ds = cache.open(open_zarr, ZARR)
+    cache.release(ds)
+    time.sleep(0.02)
+    assert cache.open(open_zarr, ZARR) is not ds
+    assert cache.stats()["evictions"] == 1
+
+    cache = DatasetCache(maxbytes=1)
+    ds = cache.open(open_zarr, ZARR)
+    assert cache.stats()["size"] == 0
+    assert cache.open(open_zarr, ZARR) is not ds
+
+
+def test_reader_dataset_cache():
+    """Should re-use and release datasets in the Reader."""
+    cache = DatasetCache()
+
+    with Reader(ZARR, variable="dataset", cache=cache) as src:
+        assert src.info()
+        ds = src.ds
+
+    with Reader(ZARR, variable="dataset", cache=cache) as src:
+        assert src.ds is ds
+        assert cache.stats()["in_use"] == 1
+        # close is idempotent
+        src.close()
+
+    assert cache.stats()["in_use"] == 0
+    assert cache.stats()["hits"] == 1
+
+    # Dataset is released on error
+    with pytest.raises(KeyError):
+        with Reader(ZARR, variable="not_a_variable", cache=cache):
+            pass
+
+    assert cache.stats()["in_use"] == 0
+
+
+def test_dataset_cache_extension():
+    """Should add /cache endpoints."""
+    # Default cache used by the Reader
+    dataset_cache.clear()
+
+    md = TilerFactory(extensions=[DatasetCacheExtension()])
+    app = FastAPI()
+    app.include_router(md.router)
+    client = TestClient(app)
+
+    response = client.get("/info", params={"url": ZARR, "variable": "dataset"})
+    assert response.status_code == 200
+
+    response = client.get("/cache")
+    assert response.status_code == 200
+    resp = response.json()
+    assert resp["size"] == 1
+    assert resp["entries"][0]["src_path"] == ZARR
+    assert resp["entries"][0]["refcount"] == 0
+
+    response = client.delete("/cache")
+    assert response.status_code == 200
+    assert response.json()["size"] == 0
+
+
+def test_chunk_cache():
+    """Should cache Zarr chunks."""
+    cache = ChunkCache()
+
+    with Reader(
+        ZARR,
+        variable="dataset",
+        cache=None,
+        opener_options={"chunk_cache": cache},
+    ) as src:
+        img = src.tile(0, 0, 0)
+
+    stats = cache.stats()
+    assert stats["misses"]
+    assert stats["nbytes"] > 0
+    # Metadata documents are not cached
+    keys = [key for key, _ in cache._cache.items()]
+    assert all(not key[1].endswith("zarr.json") for key in keys)
+    assert all(key[0].endswith("dataset_3d.zarr") for key in keys)
+
+    with Reader(
+        ZARR,
+        variable="dataset",
+        cache=None,
+        opener_options={"chunk_cache": cache},
+    ) as src:
+        img_cached = src.tile(0, 0, 0)
+
+    numpy.testing.assert_array_equal(img.array, img_cached.array)
+    # Every chunk is read from the cache
+    new_stats = cache.stats()
+    assert new_stats["misses"] == stats["misses"]
+    assert new_stats["hits"] >= stats["hits"] + stats["misses"]
+    assert new_stats["hit_rate"] > stats["hit_rate"]
+
+    # Cache is bounded
+    cache = ChunkCache(maxbytes=1)
+    with open_zarr(ZARR, chunk_cache=cache) as ds:
+        ds["dataset"].load()
+
+    assert cache.stats()["nbytes"] == 0
@@ -0,0 +1,298 @@
+"""titiler.xarray dataset cache."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable, Hashable
+from typing import Any
+
+import xarray
+from attrs import define, field
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from zarr.abc.buffer import Buffer
+from zarr.abc.store import ByteRequest, Store
+from zarr.core.buffer import BufferPrototype
+from zarr.storage import WrapperStore
+
+from titiler.core.cache import LRUCache, freeze
+
+logger = logging.getLogger(__name__)
+
+
+def dataset_nbytes(ds: xarray.Dataset) -> int:
+    """Estimate the memory used by an opened Dataset.
+
+    Only variables already loaded in memory (e.g coordinates/indexes) are
+    taken into account, lazily loaded variables are not.
+
+    """
+    return sum(var.nbytes for var in ds.variables.values() if var._in_memory)
+
+
+def _close(ds: xarray.Dataset):
+    """Close a Dataset."""
+    try:
+        ds.close()
+    except Exception as e:  # noqa
+        logger.warning(f"Error while closing dataset: {e}")
+
+
+@define
+class _Handle:
+    """Cached Dataset and its number of active users."""
+
+    dataset: xarray.Dataset
+    key: tuple
+    nbytes: int = 0
+    refcount: int = 0
+    evicted: bool = False
+
+
+@define
+class DatasetCache:
+    """Cache of opened Xarray Datasets.
+
+    Datasets are shared between requests (Xarray Datasets opened with Zarr/obstore
+    are thread-safe for reading). Each user must `release` the dataset when
+    done with it: the dataset is only closed when it has been evicted from the
+    cache **and** it is not used anymore.
+
+    Datasets are identified by the opener function, the input path and the
+    opener options.
+
+    Attributes:
+        maxsize (int, optional): Maximum number of datasets in the cache. Defaults to `128`.
+        maxbytes (int, optional): Maximum estimated size (in bytes) of the datasets in the cache.
+        ttl (float, optional): Number of seconds a dataset stays valid after being opened.
+        getsizeof (Callable): Function returning the estimated size of a Dataset. Defaults to `dataset_nbytes`.
+
+    """
+
+    maxsize: int | None = 128
+    maxbytes: int | None = None
+    ttl: float | None = None
+    getsizeof: Callable[[xarray.Dataset], int] = field(default=dataset_nbytes)
+
+    _cache: LRUCache = field(init=False)
+    _handles: dict[int, _Handle] = field(init=False, factory=dict)
+    _lock: threading.RLock = field(init=False, factory=threading.RLock)
+
+    def __attrs_post_init__(self):
+        """Create the LRU cache."""
+        self._cache = LRUCache(
+            maxsize=self.maxsize,
+            ttl=self.ttl,
+            maxbytes=self.maxbytes,
+            getsizeof=lambda handle: handle.nbytes,
+            on_evict=self._on_evict,
+        )
+
+    def _on_evict(self, key: tuple, handle: _Handle):
+        """Close evicted dataset if not used anymore."""
+        handle.evicted = True
+        if handle.refcount == 0:
+            self._handles.pop(id(handle.dataset), None)
+            _close(handle.dataset)
+
+    def open(
+        self,
+        opener: Callable[..., xarray.Dataset],
+        src_path: str,
+        **kwargs: Any,
+    ) -> xarray.Dataset:
+        """Get a Dataset from the cache or open it (and add it to the cache)."""
+        key = (opener, src_path, freeze(kwargs))
+        with self._lock:
+            handle = self._cache.get(key)
+            if handle is not None:
+                handle.refcount += 1
+                return handle.dataset
+
+        ds = opener(src_path, **kwargs)
+        handle = _Handle(ds, key=key, nbytes=self.getsizeof(ds), refcount=1)
+
+        with self._lock:
+            # Dataset opened by a concurrent request
+            if (previous := self._cache.pop(key)) is not None:
+                self._on_evict(key, previous)
+
+            self._cache.set(key, handle)
+            # Dataset too big to be cached
+            if key not in self._cache:
+                handle.evicted = True
+
+            self._handles[id(ds)] = handle
+
+        return ds
+
+    def release(self, ds: xarray.Dataset) -> bool:
+        """Release a Dataset returned by `open`.
+
+        Returns `False` if the dataset was not opened by the cache.
+
+        """
+        with self._lock:
+            handle = self._handles.get(id(ds))
+            if handle is None or handle.dataset is not ds:
+                return False
+
+            handle.refcount -= 1
+            if handle.refcount > 0:
+                return True
+
+            if not handle.evicted:
+                return True
+
+            del self._handles[id(ds)]
+
+        _close(ds)
+        return True
+
+    def clear(self):
+        """Evict all datasets (datasets still in use are closed when released)."""
+        with self._lock:
+            self._cache.clear()
+
+    def entries(self) -> list[dict[str, Any]]:
+        """List cached datasets (from least to most recently used)."""
+        with self._lock:
+            return [
+                {
+                    "src_path": handle.key[1],
+                    "options": dict(handle.key[2]),
+                    "nbytes": handle.nbytes,
+                    "refcount": handle.refcount,
+                }
+                for _, handle in self._cache.items()
+            ]
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        with self._lock:
+            return {
+                **self._cache.stats(),
+                "in_use": sum(1 for h in self._handles.values() if h.refcount),
+            }
+
+
+# Zarr metadata documents (not cached)
+ZARR_METADATA_KEYS = ("zarr.json", ".zarray", ".zattrs", ".zgroup", ".zmetadata")
+
+
+@define(eq=False)
+class ChunkCache:
+    """Byte-bounded LRU cache of Zarr chunks.
+
+    Chunks are cached as stored (encoded), avoiding repeated requests to the
+    object store for the chunks shared by neighbouring tiles.
+
+    Attributes:
+        maxbytes (int): Maximum size (in bytes) of the chunks in the cache. Defaults to `256MB`.
+        ttl (float, optional): Number of seconds a chunk stays valid after being cached.
+
+    """
+
+    maxbytes: int = 256 * 1024 * 1024
+    ttl: float | None = None
+
+    _cache: LRUCache = field(init=False)
+
+    def __attrs_post_init__(self):
+        """Create the LRU cache."""
+        self._cache = LRUCache(maxsize=None, ttl=self.ttl, maxbytes=self.maxbytes)
+
+    def get(self, key: Hashable) -> bytes | None:
+        """Get chunk from the cache."""
+        return self._cache.get(key)
+
+    def set(self, key: Hashable, value: bytes):
+        """Add chunk to the cache."""
+        self._cache.set(key, value)
+
+    def clear(self):
+        """Remove all chunks from the cache."""
+        self._cache.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Cache statistics."""
+        stats = self._cache.stats()
+        requests = stats["hits"] + stats["misses"]
+        return {
+            **stats,
+            "hit_rate": stats["hits"] / requests if requests else None,
+        }
+
+
+class ChunkCacheStore(WrapperStore):
+    """Zarr Store wrapper caching chunks in a `ChunkCache`.
+
+    Chunks are identified by the store URL, the key (array path + chunk key)
+    and the requested byte range. Metadata documents are not cached.
+
+    """
+
+    def __init__(self, store: Store, cache: ChunkCache, url: str):
+        """Wrap store."""
+        super().__init__(store)
+        self.cache = cache
+        self.url = url
+
+    def _with_store(self, store: Store) -> ChunkCacheStore:
+        return type(self)(store, cache=self.cache, url=self.url)
+
+    async def get(
+        self,
+        key: str,
+        prototype: BufferPrototype,
+        byte_range: ByteRequest | None = None,
+    ) -> Buffer | None:
+        """Get value from the cache or from the wrapped store."""
+        if key.endswith(ZARR_METADATA_KEYS):
+            return await self._store.get(key, prototype, byte_range)
+
+        cache_key = (self.url, key, byte_range)
+        if (value := self.cache.get(cache_key)) is not None:
+            return prototype.buffer.from_bytes(value)
+
+        buffer = await self._store.get(key, prototype, byte_range)
+        if buffer is not None:
+            self.cache.set(cache_key, buffer.to_bytes())
+
+        return buffer
+
+
+class DatasetCacheSettings(BaseSettings):
+    """Default Dataset cache settings."""
+
+    maxsize: int | None = 128
+    maxbytes: int | None = None
+    ttl: float | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="TITILER_XARRAY_DATASET_CACHE_", env_file=".env", extra="ignore"
+    )
+
+
+class ChunkCacheSettings(BaseSettings):
+    """Default Chunk cache settings."""
+
+    maxbytes: int = 0
+    ttl: float | None = None
+
+    model_config = SettingsConfigDict(
+        env_prefix="TITILER_XARRAY_CHUNK_CACHE_", env_file=".env", extra="ignore"
+    )
+
+
+# Default Dataset cache used by `titiler.xarray.io.Reader`
+dataset_cache = DatasetCache(**DatasetCacheSettings().model_dump())
+
+# Default Chunk cache used by `titiler.xarray.io.open_zarr` and `titiler.xarray.io.fs_open_dataset`
+# (disabled unless `TITILER_XARRAY_CHUNK_CACHE_MAXBYTES` is set)
+chunk_cache_settings = ChunkCacheSettings()
+chunk_cache: ChunkCache | None = (
+    ChunkCache(**chunk_cache_settings.model_dump())
+    if chunk_cache_settings.maxbytes
+    else None
+)
@@ -14,6 +14,9 @@ from starlette.responses import HTMLResponse
 from titiler.core.dependencies import DefaultDependency
 from titiler.core.factory import FactoryExtension
 from titiler.core.resources.enums import MediaType
+from titiler.xarray.cache import ChunkCache, DatasetCache
+from titiler.xarray.cache import chunk_cache as default_chunk_cache
+from titiler.xarray.cache import dataset_cache
 from titiler.xarray.dependencies import XarrayIOParams
 from titiler.xarray.factory import TilerFactory
 from titiler.xarray.io import X_DIM_NAMES, Y_DIM_NAMES, open_zarr
@@ -233,3 +236,43 @@ class ValidateExtension(FactoryExtension):
             with self.dataset_opener(src_path, **io_params.as_dict()) as dst:
                 variables = variables or list(dst.data_vars)  # type: ignore
                 return {v: self._validate_variable(dst[v]) for v in variables}
+
+
+@define
+class DatasetCacheExtension(FactoryExtension):
+    """Add /cache endpoints to inspect and flush the Xarray Dataset and Chunk caches."""
+
+    cache: DatasetCache = dataset_cache
+    chunk_cache: ChunkCache | None = default_chunk_cache
+
+    def register(self, factory: TilerFactory):  # type: ignore [override]
+        """Register endpoint to the tiler factory."""
+
+        @factory.router.get(
+            "/cache",
+            responses={
+                200: {"description": "Return Dataset cache statistics and entries."}
+            },
+        )
+        def cache_info():
+            """Return Dataset cache statistics and entries."""
+            return {
+                **self.cache.stats(),
+                "entries": self.cache.entries(),
+                "chunks": self.chunk_cache.stats() if self.chunk_cache else None,
+            }
+
+        @factory.router.delete(
+            "/cache",
+            responses={200: {"description": "Flush the Dataset and Chunk caches."}},
+        )
+        def cache_clear():
+            """Flush the Dataset and Chunk caches."""
+            self.cache.clear()
+            if self.chunk_cache:
+                self.chunk_cache.clear()
+
+            return {
+                **self.cache.stats(),
+                "chunks": self.chunk_cache.stats() if self.chunk_cache else None,
+            }
@@ -5,7 +5,6 @@ from __future__ import annotations
 import os
 import re
 from collections.abc import Callable
-from functools import cache
 from pathlib import Path
 from typing import Any, Literal, TypedDict
 from urllib.parse import urlparse
@@ -18,8 +17,17 @@ import zarr
 from morecantile import TileMatrixSet
 from rio_tiler.constants import WEB_MERCATOR_TMS
 from rio_tiler.io.xarray import Options, XarrayReader
+from zarr.abc.store import Store
 from zarr.storage import ObjectStore
 
+from titiler.xarray.cache import (
+    ChunkCache,
+    ChunkCacheStore,
+    DatasetCache,
+    chunk_cache,
+    dataset_cache,
+)
+
 X_DIM_NAMES = ["lon", "longitude", "LON", "LONGITUDE", "Lon", "Longitude"]
 Y_DIM_NAMES = ["lat", "latitude", "LAT", "LATITUDE", "Lat", "Latitude"]
 
@@ -30,13 +38,13 @@ def _find_bucket_region(bucket: str, use_https: bool = True) -> str | None:
     return response.headers.get("x-amz-bucket-region")
 
 
-@cache
 def open_zarr(  # noqa: C901
     src_path: str,
     group: str | None = None,
     decode_times: bool = True,
     decode_coords: str = "all",
     infer_region: bool = True,
+    chunk_cache: ChunkCache | None = chunk_cache,
     **kwargs: Any,
 ) -> xarray.Dataset:
     """Open Xarray dataset with fsspec.
@@ -45,6 +53,7 @@ def open_zarr(  # noqa: C901
         src_path (str): dataset path.
         group (Optional, str): path to the netCDF/Zarr group in the given file to open given as a str.
         decode_times (bool):  If True, decode times encoded in the standard NetCDF datetime format into datetime objects. Otherwise, leave them encoded as numbers.
+        chunk_cache (titiler.xarray.cache.ChunkCache, optional): Zarr chunks cache. Defaults to `titiler.xarray.cache.chunk_cache`.
 
     Returns:
         xarray.Dataset
@@ -100,7 +109,10 @@ def open_zarr(  # noqa: C901
                         )
 
     store = obstore.store.from_url(src_path, config=config)  # type: ignore
-    zarr_store = ObjectStore(store=store, read_only=True)
+    zarr_store: Store = ObjectStore(store=store, read_only=True)
+    if chunk_cache is not None:
+        zarr_store = ChunkCacheStore(zarr_store, cache=chunk_cache, url=src_path)
+
     ds = xarray.open_dataset(zarr_store, **xr_open_args)  # type: ignore [arg-type]
 
     return ds
@@ -260,6 +272,9 @@ class Reader(XarrayReader):
     opener: Callable[..., xarray.Dataset] = attr.ib(default=open_zarr)
     opener_options: dict = attr.ib(factory=dict)
 
+    # Opened datasets cache (set to `None` to disable)
+    cache: DatasetCache | None = attr.ib(default=dataset_cache)
+
     group: str | None = attr.ib(default=None)
     decode_times: bool = attr.ib(default=True)
 
@@ -277,6 +292,7 @@ class Reader(XarrayReader):
     input: xarray.DataArray = attr.ib(init=False)
 
     _dims: list = attr.ib(init=False, factory=list)
+    _closed: bool = attr.ib(init=False, default=False)
 
     @options.default
     def _options_default(self):
@@ -290,17 +306,30 @@ class Reader(XarrayReader):
             **self.opener_options,
         }
 
-        self.ds = self.opener(self.src_path, **opener_options)
-        self.input = get_variable(
-            self.ds,
-            self.variable,
-            sel=self.sel,
-        )
-        super().__attrs_post_init__()
+        if self.cache is not None:
+            self.ds = self.cache.open(self.opener, self.src_path, **opener_options)
+        else:
+            self.ds = self.opener(self.src_path, **opener_options)
+
+        try:
+            self.input = get_variable(
+                self.ds,
+                self.variable,
+                sel=self.sel,
+            )
+            super().__attrs_post_init__()
+        except Exception:
+            self.close()
+            raise
 
     def close(self):
-        """Close xarray dataset."""
-        self.ds.close()
+        """Close xarray dataset (or release it when using a dataset cache)."""
+        if self._closed:
+            return
+
+        self._closed = True
+        if self.cache is None or not self.cache.release(self.ds):
+            self.ds.close()
 
     def __exit__(self, exc_type, exc_value, traceback):
         """Support using with Context Managers."""
@@ -312,6 +341,7 @@ def fs_open_dataset(  # noqa: C901
     group: str | None = None,
     decode_times: bool = True,
     decode_coords: str = "all",
+    chunk_cache: ChunkCache | None = chunk_cache,
     **kwargs,
 ) -> xarray.Dataset:
     """Open Xarray dataset with fsspec.
@@ -320,6 +350,7 @@ def fs_open_dataset(  # noqa: C901
         src_path (str): dataset path.
         group (Optional, str): path to the netCDF/Zarr group in the given file to open given as a str.
         decode_times (bool):  If True, decode times encoded in the standard NetCDF datetime format into datetime objects. Otherwise, leave them encoded as numbers.
+        chunk_cache (titiler.xarray.cache.ChunkCache, optional): Zarr chunks cache (not used for NetCDF). Defaults to `titiler.xarray.cache.chunk_cache`.
 
     Returns:
         xarray.Dataset
@@ -363,9 +394,12 @@ def fs_open_dataset(  # noqa: C901
 
     # Fallback to Zarr
     else:
-        store = zarr.storage.FsspecStore.from_url(
+        store: Store = zarr.storage.FsspecStore.from_url(
             src_path, storage_options={"asynchronous": True, **kwargs}
         )
+        if chunk_cache is not None:
+            store = ChunkCacheStore(store, cache=chunk_cache, url=src_path)
+
         ds = xarray.open_zarr(store, **xr_open_args)
 
     return ds
@@ -380,3 +414,4 @@ class FsReader(Reader):
     """Reader with fs_open_dataset opener"""
 
     opener: Callable[..., xarray.Dataset] = attr.ib(default=fs_open_dataset)
+    cache: DatasetCache | None = attr.ib(default=None)
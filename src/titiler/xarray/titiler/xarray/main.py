@@ -29,8 +29,13 @@ from titiler.core.middleware import (
 from titiler.core.models.OGC import Conformance, Landing
 from titiler.core.resources.enums import MediaType
 from titiler.core.utils import accept_media_type, create_html_response, update_openapi
+from titiler.core.warmup import warmup
 from titiler.xarray import __version__ as titiler_version
-from titiler.xarray.extensions import DatasetMetadataExtension, ValidateExtension
+from titiler.xarray.extensions import (
+    DatasetCacheExtension,
+    DatasetMetadataExtension,
+    ValidateExtension,
+)
 from titiler.xarray.factory import TilerFactory
 
 logging.getLogger("rasterio.session").setLevel(logging.ERROR)
@@ -62,6 +67,13 @@ class ApiSettings(BaseSettings):
 
     telemetry_enabled: bool = False
 
+    # add `/cache` endpoints to inspect and flush the Dataset cache
+    dataset_cache_admin: bool = False
+
+    # load the TMS, colormaps and algorithms when the application is imported
+    # (e.g in the gunicorn master with `--preload`), see `titiler.core.warmup`
+    warmup: bool = False
+
     # an API key required to access any endpoint, passed via the ?access_token= query parameter
     global_access_token: str | None = None
 
@@ -146,11 +158,15 @@ TITILER_CONFORMS_TO = {
 }
 
 
+extensions = [
+    DatasetMetadataExtension(),
+    ValidateExtension(),
+]
+if api_settings.dataset_cache_admin:
+    extensions.append(DatasetCacheExtension())
+
 md = TilerFactory(
-    extensions=[
-        DatasetMetadataExtension(),
-        ValidateExtension(),
-    ],
+    extensions=extensions,
     enable_telemetry=api_settings.telemetry_enabled,
     templates=titiler_templates,
 )
@@ -277,6 +293,12 @@ if api_settings.debug:
     )
 
 
+###############################################################################
+# Warm-up the TMS, colormaps and algorithms registries. When the module is imported
+# before forking the workers (e.g `gunicorn --preload`), the workers share them.
+startup = warmup(freeze=True) if api_settings.warmup else None
+
+
 @app.get(
     "/healthz",
     description="Health Check.",
@@ -286,17 +308,19 @@ if api_settings.debug:
 )
 def application_health_check():
     """Health check."""
-    return {
-        "versions": {
-            "titiler": titiler_version,
-            "rasterio": rasterio.__version__,
-            "gdal": rasterio.__gdal_version__,
-            "proj": rasterio.__proj_version__,
-            "geos": rasterio.__geos_version__,
-            "xarray": xarray.__version__,
-            "zarr": zarr.__version__,
-        }
+    versions = {
+        "titiler": titiler_version,
+        "rasterio": rasterio.__version__,
+        "gdal": rasterio.__gdal_version__,
+        "proj": rasterio.__proj_version__,
+        "geos": rasterio.__geos_version__,
+        "xarray": xarray.__version__,
+        "zarr": zarr.__version__,
     }
+    if startup:
+        return {"versions": versions, "warmup": startup}
+
+    return {"versions": versions}
 
 
 @app.get(